@@ -0,0 +1,357 @@
+"""Headless operations on the festival database (no PyQt6 import).
+
+Usage (from the project root):
+    python -m app.cli health
+    python -m app.cli count asistencia funcion
+    python -m app.cli export asistencia asistencias.csv
+    python -m app.cli import asistente asistentes.csv
+    python -m app.cli seed                 # the demo rows of app/scripts/seed_data_via_repos.py
+    python -m app.cli seed --scale 100k    # a synthetic festival (benchmarks/synthetic.py)
+    python -m app.cli bench --repeat 5
+    python -m app.cli delete funcion 12 13 --dry-run   # cascade over the FK graph
+    python -m app.cli awards 2025 --desempate evaluaciones,primera
+    python -m app.cli assign-jury --por-funcion 3 --desde 2025-11-01 --dry-run
+    python -m app.cli program 2025-11-01 2025-11-10 --por-pelicula 2 --dry-run
+
+Every command takes ``--settings`` (default ``config/settings.json``).
+Nothing under ``app.ui`` / ``app.viewmodels`` (and so no PyQt6) is imported,
+and the database driver is only loaded by the command that connects, so cron
+jobs start in a fraction of the GUI's start-up time. Exit code 0 means
+success; ``health`` and ``bench`` return 1 when a table cannot be read, and
+``seed --scale`` returns 2 when a target table already has rows.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+from app.infrastructure.repositories.registry import ENTITY_KEYS
+from app.scripts import export_table, import_table
+
+DEFAULT_SETTINGS = Path("config/settings.json")
+
+
+def _connection(args: argparse.Namespace):
+    from app.infrastructure.database.backend import create_connection_factory
+
+    return create_connection_factory(args.settings)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
+def cmd_count(args: argparse.Namespace) -> int:
+    from app.infrastructure.repositories.registry import create_repository
+
+    connection = _connection(args)
+    for entity in args.entities or ENTITY_KEYS:
+        print(f"{entity}\t{create_repository(entity, connection).count()}")
+    return 0
+
+
+def cmd_health(args: argparse.Namespace) -> int:
+    from app.infrastructure.database.backend import configured_backend
+    from app.infrastructure.database.schema import load_schema
+
+    backend = configured_backend(args.settings)
+    started = time.perf_counter()
+    try:
+        connection = _connection(args)
+        with connection.get_connection() as conn:
+            connected = time.perf_counter()
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM DUAL")
+                cursor.fetchone()
+    except Exception as exc:  # pragma: no cover - interacts with DB
+        print(f"[ERROR] conexión ({backend}): {exc}")
+        return 1
+    done = time.perf_counter()
+    print(f"[OK] conexión ({backend}) en {_ms(connected - started)}, ida y vuelta {_ms(done - connected)}")
+
+    failed = 0
+    with connection.get_connection() as conn:
+        with conn.cursor() as cursor:
+            for table in load_schema().tables:
+                try:
+                    # parsed, planned and checked against the dictionary, but reads no rows
+                    cursor.execute(f"SELECT * FROM {table} WHERE 1 = 0")
+                    cursor.fetchall()
+                except Exception as exc:  # pragma: no cover - interacts with DB
+                    failed += 1
+                    print(f"[ERROR] tabla {table}: {exc}")
+    if not failed:
+        print(f"[OK] {len(load_schema().tables)} tablas de sql/script.sql accesibles")
+    return 1 if failed else 0
+
+
+def cmd_seed(args: argparse.Namespace) -> int:
+    if args.scale is None:
+        from app.scripts import seed_data_via_repos
+
+        seed_data_via_repos.main(args.settings)
+        return 0
+
+    from app.infrastructure.database.unit_of_work import UnitOfWork
+    from app.infrastructure.repositories.streaming import count_rows
+    from benchmarks.synthetic import GENERATORS, SCALES, FestivalSize, populate
+
+    if args.scale not in SCALES:
+        print(f"Escala desconocida: {args.scale} (use {', '.join(SCALES)})", file=sys.stderr)
+        return 2
+
+    connection = _connection(args)
+    # the synthetic ids start at 1: on top of existing rows they collide with them
+    counts = {table: count_rows(connection, table) for table in GENERATORS}
+    occupied = {table: count for table, count in counts.items() if count}
+    if occupied:
+        listed = ", ".join(f"{table} ({count})" for table, count in occupied.items())
+        print(f"La base de datos ya tiene datos en: {listed}. El festival sintético requiere tablas vacías.",
+              file=sys.stderr)
+        return 2
+
+    def report(table: str, count: int) -> None:
+        print(f"\r{table}: {count} filas", end="", file=sys.stderr, flush=True)
+
+    try:
+        # one transaction: a rejected row leaves the tables as they were
+        with UnitOfWork(connection) as uow:
+            written = populate(uow, FestivalSize.for_rows(SCALES[args.scale]), progress=report)
+    except Exception as exc:  # pragma: no cover - interacts with DB
+        print(file=sys.stderr)
+        print(f"[ERROR] seed --scale {args.scale}: {exc} (no se escribió nada)", file=sys.stderr)
+        return 1
+    print(file=sys.stderr)
+    for table, count in written.items():
+        print(f"{table}\t{count}")
+    return 0
+
+
+def cmd_delete(args: argparse.Namespace) -> int:
+    from app.infrastructure.repositories.cascade_delete import CascadeDeletePlanner
+
+    result = CascadeDeletePlanner(_connection(args)).delete(args.entity, args.keys, dry_run=args.dry_run)
+    for table, count in result.rows.items():
+        print(f"{table}\t{count}")
+    if args.dry_run:
+        print("(simulación: no se eliminó nada)", file=sys.stderr)
+    return 0
+
+
+def cmd_awards(args: argparse.Namespace) -> int:
+    from app.infrastructure.repositories.awards import AwardsEngine
+
+    try:
+        engine = AwardsEngine(
+            _connection(args),
+            score=args.puntaje,
+            tie_breakers=[name for name in args.desempate.split(",") if name],
+            min_evaluaciones=args.min_evaluaciones,
+        )
+        result = engine.award(args.edicion, dry_run=args.dry_run)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for award in result.awards:
+        print(f"{award.categoria}\t{award.posicion}\t{award.id_pelicula}\t{award.puntaje:.2f}\t{award.evaluaciones}")
+    if args.dry_run:
+        print("(simulación: no se escribió nada)", file=sys.stderr)
+    elif not result.awards:
+        print(f"Sin evaluaciones para la edición {args.edicion}", file=sys.stderr)
+    else:
+        print(f"{result.written} premios escritos, {result.removed} eliminados", file=sys.stderr)
+    return 0
+
+
+def cmd_assign_jury(args: argparse.Namespace) -> int:
+    from app.infrastructure.repositories.jury_assignment import JuryAssigner
+
+    try:
+        assigner = JuryAssigner(
+            _connection(args),
+            per_funcion=args.por_funcion,
+            gap_minutes=args.descanso,
+            max_per_jurado=args.max_por_jurado,
+        )
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    plan = assigner.assign(args.desde, args.hasta, dry_run=args.dry_run)
+    for row in plan.rows:
+        print(f"{row['id_funcion']}\t{row['id_jurado']}\t{row['rol_participacion']}")
+    low, high = plan.spread
+    print(f"{len(plan.rows)} asignaciones, carga por jurado {low}-{high}", file=sys.stderr)
+    if plan.short:
+        print(f"{len(plan.short)} funciones sin jurados suficientes: {sorted(plan.short)[:20]}", file=sys.stderr)
+    if plan.skipped:
+        print(f"{len(plan.skipped)} funciones con hora ilegible: {plan.skipped[:20]}", file=sys.stderr)
+    for offset, message in plan.errors:
+        print(f"[ERROR] fila {offset}: {message}", file=sys.stderr)
+    if args.dry_run:
+        print("(simulación: no se escribió nada)", file=sys.stderr)
+    return 1 if plan.errors else 0
+
+
+def _hora(value: str):
+    from app.infrastructure.repositories.jury_assignment import parse_hora
+
+    parsed = parse_hora(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"hora inválida: {value} (use HH:MM)")
+    return parsed
+
+
+def cmd_program(args: argparse.Namespace) -> int:
+    from app.infrastructure.repositories.festival_scheduler import FestivalScheduler
+
+    try:
+        scheduler = FestivalScheduler(
+            _connection(args),
+            funciones_por_pelicula=args.por_pelicula,
+            apertura=args.apertura,
+            cierre=args.cierre,
+            limpieza_minutes=args.limpieza,
+            precio_entrada=args.precio,
+        )
+        plan = scheduler.schedule(args.desde, args.hasta, args.peliculas, dry_run=args.dry_run)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for screening in plan.screenings:
+        print(f"{screening.inicio.date()}\t{screening.hora}\t{screening.id_sede}\t{screening.id_pelicula}")
+    print(f"{len(plan.screenings)} funciones, ocupación {plan.utilization:.0%}", file=sys.stderr)
+    if plan.unscheduled:
+        print(f"{sum(plan.unscheduled.values())} funciones no caben ({len(plan.unscheduled)} películas)", file=sys.stderr)
+    if args.dry_run:
+        print("(simulación: no se escribió nada)", file=sys.stderr)
+    elif plan.error:
+        print(f"[ERROR] {plan.error} ({plan.funciones_written} funciones ya guardadas)", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _median_time(call: Callable[[], object], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """Read-only timings (median of ``--repeat``) of ``count()`` and ``get_all()`` per repository."""
+    from app.infrastructure.repositories.registry import create_repository
+
+    connection = _connection(args)
+    failed = 0
+    print("tabla\tfilas\tcount()\tget_all()")
+    for entity in args.entities or ENTITY_KEYS:
+        repository = create_repository(entity, connection)
+        try:
+            rows = repository.count()
+            count_time = _median_time(repository.count, args.repeat)
+            get_all_time = _median_time(repository.get_all, args.repeat)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            failed += 1
+            print(f"{entity}\t[ERROR] {exc}")
+            continue
+        print(f"{entity}\t{rows}\t{_ms(count_time)}\t{_ms(get_all_time)}")
+    return 1 if failed else 0
+
+
+def _entity(value: str) -> str:
+    # a type rather than ``choices``: argparse rejects an empty ``nargs="*"`` list against choices
+    if value not in ENTITY_KEYS:
+        raise argparse.ArgumentTypeError(f"tabla desconocida: {value} (use {', '.join(ENTITY_KEYS)})")
+    return value
+
+
+def _add_settings(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument("--settings", type=Path, default=DEFAULT_SETTINGS)
+    return parser
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Operaciones sin interfaz gráfica")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="comando")
+
+    count = _add_settings(commands.add_parser("count", help="Cuenta las filas de las tablas"))
+    count.add_argument("entities", nargs="*", type=_entity, metavar="tabla", help="Por defecto, todas")
+    count.set_defaults(handler=cmd_count)
+
+    export = export_table.add_arguments(commands.add_parser("export", help="Exporta una tabla a CSV o JSONL"))
+    export.set_defaults(handler=export_table.run)
+
+    load = import_table.add_arguments(commands.add_parser("import", help="Importa un archivo CSV o JSONL"))
+    load.set_defaults(handler=import_table.run)
+
+    seed = _add_settings(commands.add_parser("seed", help="Inserta datos de ejemplo"))
+    seed.add_argument("--scale", default=None, help="Festival sintético de benchmarks/synthetic.py (1k, 100k, 1m)")
+    seed.set_defaults(handler=cmd_seed)
+
+    health = _add_settings(commands.add_parser("health", help="Verifica la conexión y las tablas"))
+    health.set_defaults(handler=cmd_health)
+
+    delete = _add_settings(commands.add_parser("delete", help="Elimina filas y sus registros relacionados"))
+    delete.add_argument("entity", type=_entity, metavar="tabla")
+    delete.add_argument("keys", nargs="+", type=int, metavar="id", help="Claves primarias a eliminar")
+    delete.add_argument("--dry-run", action="store_true", help="Solo contar las filas afectadas")
+    delete.set_defaults(handler=cmd_delete)
+
+    awards = _add_settings(commands.add_parser("awards", help="Calcula los premios de una edición desde las evaluaciones"))
+    awards.add_argument("edicion", type=int, help="Año de la edición (evaluaciones fechadas en ese año)")
+    awards.add_argument("--puntaje", default="promedio", help="promedio o suma de las puntuaciones")
+    awards.add_argument(
+        "--desempate",
+        default="evaluaciones,maxima",
+        help="Criterios en orden, separados por comas: evaluaciones, maxima, minima, primera",
+    )
+    awards.add_argument("--min-evaluaciones", type=int, default=1, help="Evaluaciones mínimas para competir")
+    awards.add_argument("--dry-run", action="store_true", help="Solo mostrar el podio")
+    awards.set_defaults(handler=cmd_awards)
+
+    assign = _add_settings(commands.add_parser("assign-jury", help="Asigna jurados a las funciones programadas"))
+    assign.add_argument("--por-funcion", type=int, default=3, help="Jurados por función")
+    assign.add_argument("--descanso", type=float, default=30, help="Minutos libres entre dos funciones de un jurado")
+    assign.add_argument("--max-por-jurado", type=int, default=None, help="Funciones máximas por jurado")
+    assign.add_argument("--desde", type=date.fromisoformat, default=None, help="Primera fecha (AAAA-MM-DD)")
+    assign.add_argument("--hasta", type=date.fromisoformat, default=None, help="Fecha límite, excluida (AAAA-MM-DD)")
+    assign.add_argument("--dry-run", action="store_true", help="Solo mostrar las asignaciones")
+    assign.set_defaults(handler=cmd_assign_jury)
+
+    program = _add_settings(commands.add_parser("program", help="Genera funciones y proyecciones del festival"))
+    program.add_argument("desde", type=date.fromisoformat, help="Primer día (AAAA-MM-DD)")
+    program.add_argument("hasta", type=date.fromisoformat, help="Último día, incluido (AAAA-MM-DD)")
+    program.add_argument("--peliculas", nargs="+", type=int, default=None, metavar="id", help="Por defecto, todas")
+    program.add_argument("--por-pelicula", type=int, default=2, help="Funciones por película")
+    program.add_argument("--apertura", type=_hora, default="10:00", help="Inicio de la jornada (HH:MM)")
+    program.add_argument("--cierre", type=_hora, default="23:30", help="Fin de la última función (HH:MM)")
+    program.add_argument("--limpieza", type=int, default=20, help="Minutos entre dos funciones de una sede")
+    program.add_argument("--precio", type=int, default=5000, help="precio_entrada de las funciones")
+    program.add_argument("--dry-run", action="store_true", help="Solo mostrar la programación")
+    program.set_defaults(handler=cmd_program)
+
+    bench = _add_settings(commands.add_parser("bench", help="Mide count() y get_all() de cada repositorio"))
+    bench.add_argument("entities", nargs="*", type=_entity, metavar="tabla", help="Por defecto, todas")
+    bench.add_argument("--repeat", type=int, default=3, help="Repeticiones por medición (se usa la mediana)")
+    bench.set_defaults(handler=cmd_bench)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except KeyboardInterrupt:
+        print("\nInterrumpido", file=sys.stderr)
+        return 130
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
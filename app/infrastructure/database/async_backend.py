@@ -0,0 +1,186 @@
+"""Async connection pools for the repositories in ``async_repositories``.
+
+``"backend": "oracle"`` uses ``oracledb.create_pool_async`` (python-oracledb
+2.x, thin mode). ``"backend": "sqlite"`` uses :class:`AsyncSqlitePool`, a
+stand-in driver with the same calling conventions that runs each SQLite call
+on a small thread pool, so the async layer can be used and tested offline::
+
+    async with pool.acquire() as conn:
+        with conn.cursor() as cursor:
+            await cursor.execute(sql, binds)
+            rows = await cursor.fetchall()
+        await conn.commit()
+
+Pools are bound to the event loop that first uses them (in the app, the loop
+of ``AsyncBridge``). The maximum number of connections is ``"async_pool_max"``
+in ``settings.json`` (default 4).
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Protocol
+
+from app.infrastructure.database.backend import configured_backend
+from app.infrastructure.database.sqlite_connection import SqliteConnection, SqliteCursor, SqliteDbConnection
+
+DEFAULT_POOL_MAX = 4
+
+
+class AsyncPool(Protocol):
+    """What async repositories need from a backend."""
+
+    dialect: str
+
+    def acquire(self) -> Any:
+        """Async context manager yielding a connection (returned to the pool on exit)."""
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class OracleAsyncPool:
+    """``oracledb`` async pool; created on first use inside the running loop."""
+
+    dialect = "oracle"
+
+    def __init__(self, connection_params: Dict[str, Any], max_size: int = DEFAULT_POOL_MAX) -> None:
+        self._params = connection_params
+        self._max_size = max_size
+        self._pool: Any = None
+
+    def acquire(self) -> Any:
+        if self._pool is None:
+            import oracledb
+
+            self._pool = oracledb.create_pool_async(min=1, max=self._max_size, increment=1, **self._params)
+        return self._pool.acquire()
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+
+# ------------------------------------------------------------- SQLite stand-in
+
+_Run = Callable[..., Any]
+
+
+class AsyncSqliteCursor:
+    """Awaitable wrapper over :class:`SqliteCursor` (``with`` stays synchronous, as in oracledb)."""
+
+    def __init__(self, cursor: SqliteCursor, run: _Run) -> None:
+        self._cursor = cursor
+        self._run = run
+
+    def __enter__(self) -> "AsyncSqliteCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    def var(self, type_: Any = None, *args, **kwargs) -> Any:
+        return self._cursor.var(type_, *args, **kwargs)
+
+    async def execute(self, sql: str, parameters: Any = None, **kwargs: Any) -> None:
+        await self._run(self._cursor.execute, sql, parameters, **kwargs)
+
+    async def executemany(self, sql: str, seq_of_parameters: Any, **kwargs: Any) -> None:
+        await self._run(self._cursor.executemany, sql, seq_of_parameters, **kwargs)
+
+    async def fetchone(self):
+        return await self._run(self._cursor.fetchone)
+
+    async def fetchmany(self, size: Optional[int] = None):
+        return await self._run(self._cursor.fetchmany, size)
+
+    async def fetchall(self):
+        return await self._run(self._cursor.fetchall)
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class AsyncSqliteConnection:
+    def __init__(self, connection: SqliteDbConnection, run: _Run) -> None:
+        self._connection = connection
+        self._run = run
+
+    def cursor(self) -> AsyncSqliteCursor:
+        return AsyncSqliteCursor(self._connection.cursor(), self._run)
+
+    async def commit(self) -> None:
+        await self._run(self._connection.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self._connection.rollback)
+
+
+class AsyncSqlitePool:
+    """Stand-in for ``oracledb.AsyncConnectionPool`` over a :class:`SqliteConnection`.
+
+    Up to ``max_size`` connections are handed out at once; each one is used by
+    a single task at a time, and every blocking call runs on the executor.
+    Uncommitted work is rolled back when a connection goes back to the pool.
+    """
+
+    dialect = "sqlite"
+
+    def __init__(self, connection_factory: SqliteConnection, max_size: int = DEFAULT_POOL_MAX) -> None:
+        self._factory = connection_factory
+        self._max_size = max_size
+        self._executor = ThreadPoolExecutor(max_workers=max_size, thread_name_prefix="async-sqlite")
+        self._idle: List[SqliteDbConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[AsyncSqliteConnection]:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_size)
+        async with self._slots:
+            raw = self._idle.pop() if self._idle else await self._run(self._factory.get_connection)
+            try:
+                yield AsyncSqliteConnection(raw, self._run)
+            finally:
+                await self._run(raw.rollback)
+                self._idle.append(raw)
+
+    async def _run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await self._run(connection.close)
+        self._executor.shutdown(wait=False)
+
+
+def create_async_pool(settings_path: Path) -> AsyncPool:
+    """Build the async pool for the configured backend."""
+    settings_path = Path(settings_path)
+    data: Dict[str, Any] = {}
+    if settings_path.exists():
+        with settings_path.open("r", encoding="utf-8") as file:
+            data = json.load(file)
+    max_size = int(data.get("async_pool_max") or DEFAULT_POOL_MAX)
+    if configured_backend(settings_path) == "sqlite":
+        return AsyncSqlitePool(SqliteConnection.from_settings(settings_path), max_size)
+
+    from app.infrastructure.database.oracle_connection import OracleConnection
+
+    return OracleAsyncPool(OracleConnection.from_settings(settings_path).connection_params(), max_size)
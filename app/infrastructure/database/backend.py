@@ -0,0 +1,56 @@
+"""Chooses the database driver configured in `settings.json`.
+
+``"backend": "oracle"`` (default) uses :class:`OracleConnection`;
+``"backend": "sqlite"`` uses :class:`SqliteConnection` with the file given by
+``"sqlite_path"`` (relative to the settings file, or ``":memory:"``). The
+``FESTIVAL_DB_BACKEND`` environment variable overrides the setting, which is
+how the e2e scripts and benchmarks are run offline.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Protocol
+
+BACKENDS = ("oracle", "sqlite")
+BACKEND_ENV_VAR = "FESTIVAL_DB_BACKEND"
+
+
+class ConnectionFactory(Protocol):
+    """What repositories need from a backend: a DB-API style connection per call."""
+
+    def get_connection(self) -> Any:
+        ...
+
+
+def configured_backend(settings_path: Path) -> str:
+    """Return the backend name selected by the environment or ``settings_path``."""
+    backend = os.environ.get(BACKEND_ENV_VAR)
+    if not backend and settings_path.exists():
+        with settings_path.open("r", encoding="utf-8") as file:
+            backend = json.load(file).get("backend")
+    backend = (backend or "oracle").lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de base de datos desconocido: {backend}")
+    return backend
+
+
+def create_connection_factory(settings_path: Path) -> ConnectionFactory:
+    """Build the connection factory for the configured backend."""
+    settings_path = Path(settings_path)
+    if configured_backend(settings_path) == "sqlite":
+        from app.infrastructure.database.sqlite_connection import SqliteConnection
+
+        return SqliteConnection.from_settings(settings_path)
+
+    # imported lazily so the SQLite backend works without oracledb installed
+    from app.infrastructure.database.oracle_connection import OracleConnection
+
+    return OracleConnection.from_settings(settings_path)
+
+
+def dialect_of(connection_factory: Any) -> str:
+    """``"oracle"`` or ``"sqlite"``; unknown factories are treated as Oracle."""
+    dialect = getattr(connection_factory, "dialect", None)
+    return dialect if dialect in BACKENDS else "oracle"
@@ -0,0 +1,431 @@
+"""Per-query timing for repositories and an in-process metrics registry.
+
+``InstrumentedConnectionFactory`` wraps any connection factory and times, for
+every statement, the execute and fetch phases together with bind count, rows
+and round trips. ``instrument_repository`` wraps a repository so each public
+call also records connect time and the time spent outside the driver (mapping
+rows to domain objects). Everything lands in ``METRICS``; statements slower
+than ``MetricsRegistry.slow_threshold`` are written to the
+``festival.slow_query`` logger, which ``configure_slow_query_log`` sends to
+``config/slow_queries.log``.
+
+Round trips are estimated as one per execute plus one per ``arraysize`` rows
+fetched, which is how the Oracle driver pages results (drivers reporting an
+``arraysize`` below 2, like sqlite3, are counted with python-oracledb's 100).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SLOW_QUERY_ENV_VAR = "FESTIVAL_SLOW_QUERY_MS"
+DEFAULT_SLOW_QUERY_MS = 500.0
+SLOW_QUERY_LOG_FILENAME = "slow_queries.log"
+DEFAULT_ARRAYSIZE = 100
+
+slow_query_logger = logging.getLogger("festival.slow_query")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def sql_id(sql: str) -> str:
+    """Stable short id for a statement text (whitespace-insensitive)."""
+    return hashlib.sha1(normalize_sql(sql).encode("utf-8")).hexdigest()[:10]
+
+
+def _bind_count(binds: Any) -> int:
+    if binds is None:
+        return 0
+    try:
+        return len(binds)
+    except TypeError:
+        return 0
+
+
+@dataclass
+class StatementStats:
+    """Aggregated timings (seconds) of one SQL text."""
+
+    sql_id: str
+    sql: str
+    executions: int = 0
+    binds: int = 0
+    rows: int = 0
+    round_trips: int = 0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    max_time: float = 0.0
+    slow: int = 0
+
+    @property
+    def total_time(self) -> float:
+        return self.execute_time + self.fetch_time
+
+
+@dataclass
+class CallStats:
+    """Aggregated timings (seconds) of one repository method."""
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    rows: int = 0
+    round_trips: int = 0
+    connect_time: float = 0.0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    mapping_time: float = 0.0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+@dataclass
+class _CallContext:
+    """Driver time accumulated by the repository call running on this thread."""
+
+    name: str
+    connect_time: float = 0.0
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    rows: int = 0
+    round_trips: int = 0
+
+
+class MetricsRegistry:
+    """Thread-safe store of statement and repository-call metrics."""
+
+    def __init__(self, slow_threshold: float = DEFAULT_SLOW_QUERY_MS / 1000) -> None:
+        self.slow_threshold = slow_threshold
+        self._lock = threading.Lock()
+        self._statements: Dict[str, StatementStats] = {}
+        self._calls: Dict[str, CallStats] = {}
+        self._local = threading.local()
+
+    # -- recording ---------------------------------------------------------
+    def current_call(self) -> Optional[_CallContext]:
+        return getattr(self._local, "call", None)
+
+    def record_connect(self, elapsed: float) -> None:
+        call = self.current_call()
+        if call is not None:
+            call.connect_time += elapsed
+
+    def record_statement(
+        self,
+        sql: str,
+        binds: int,
+        rows: int,
+        round_trips: int,
+        execute_time: float,
+        fetch_time: float,
+    ) -> None:
+        key = sql_id(sql)
+        elapsed = execute_time + fetch_time
+        slow = elapsed >= self.slow_threshold
+        call = self.current_call()
+        if call is not None:
+            call.execute_time += execute_time
+            call.fetch_time += fetch_time
+            call.rows += rows
+            call.round_trips += round_trips
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = StatementStats(key, normalize_sql(sql))
+            stats.executions += 1
+            stats.binds = binds
+            stats.rows += rows
+            stats.round_trips += round_trips
+            stats.execute_time += execute_time
+            stats.fetch_time += fetch_time
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.slow += slow
+        if slow:
+            slow_query_logger.warning(
+                "%.1f ms sql_id=%s call=%s binds=%d rows=%d round_trips=%d execute=%.1f ms fetch=%.1f ms | %s",
+                elapsed * 1000,
+                key,
+                call.name if call is not None else "-",
+                binds,
+                rows,
+                round_trips,
+                execute_time * 1000,
+                fetch_time * 1000,
+                stats.sql,
+            )
+
+    def timed_call(self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``func`` as repository call ``name``; nested calls are folded into the outer one."""
+        if self.current_call() is not None:
+            return func(*args, **kwargs)
+        call = self._local.call = _CallContext(name)
+        started = time.perf_counter()
+        failed = False
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            total = time.perf_counter() - started
+            self._local.call = None
+            driver = call.connect_time + call.execute_time + call.fetch_time
+            with self._lock:
+                stats = self._calls.get(name)
+                if stats is None:
+                    stats = self._calls[name] = CallStats(name)
+                stats.calls += 1
+                stats.errors += failed
+                stats.rows += call.rows
+                stats.round_trips += call.round_trips
+                stats.connect_time += call.connect_time
+                stats.execute_time += call.execute_time
+                stats.fetch_time += call.fetch_time
+                stats.mapping_time += max(total - driver, 0.0)
+                stats.total_time += total
+                stats.max_time = max(stats.max_time, total)
+
+    # -- reading -----------------------------------------------------------
+    def top_statements(self, limit: int = 20) -> List[StatementStats]:
+        """Statements with the highest accumulated time (copies)."""
+        with self._lock:
+            stats = [replace(s) for s in self._statements.values()]
+        return sorted(stats, key=lambda s: s.total_time, reverse=True)[:limit]
+
+    def top_calls(self, limit: int = 20) -> List[CallStats]:
+        """Repository calls with the highest accumulated time (copies)."""
+        with self._lock:
+            stats = [replace(c) for c in self._calls.values()]
+        return sorted(stats, key=lambda c: c.total_time, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._calls.clear()
+
+
+METRICS = MetricsRegistry()
+
+
+class _InstrumentedCursor:
+    """Cursor proxy that times execute/fetch and reports each statement once."""
+
+    def __init__(self, cursor: Any, registry: MetricsRegistry) -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_pending", None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    @property
+    def wrapped(self) -> Any:
+        """Driver cursor (e.g. to bind it as a REF CURSOR out variable)."""
+        return self._cursor
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # e.g. ``cursor.arraysize = n`` must reach the driver cursor
+        setattr(self._cursor, name, value)
+
+    def __enter__(self) -> "_InstrumentedCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def execute(self, sql: str, parameters: Any = None, **kwargs: Any) -> Any:
+        self._flush()
+        started = time.perf_counter()
+        try:
+            if parameters is None:
+                return self._cursor.execute(sql, **kwargs)
+            return self._cursor.execute(sql, parameters, **kwargs)
+        finally:
+            pending = _Pending(sql, _bind_count(parameters if parameters is not None else kwargs))
+            pending.execute_time = time.perf_counter() - started
+            object.__setattr__(self, "_pending", pending)
+
+    def executemany(self, sql: str, parameters: Any, **kwargs: Any) -> Any:
+        self._flush()
+        rows = list(parameters)
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(sql, rows, **kwargs)
+        finally:
+            pending = _Pending(sql, _bind_count(rows[0]) if rows else 0)
+            pending.execute_time = time.perf_counter() - started
+            pending.rows = len(rows)
+            object.__setattr__(self, "_pending", pending)
+
+    def fetchone(self) -> Any:
+        return self._fetch(self._cursor.fetchone, single=True)
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        if size is None:
+            return self._fetch(self._cursor.fetchmany)
+        return self._fetch(lambda: self._cursor.fetchmany(size))
+
+    def fetchall(self) -> List[Any]:
+        return self._fetch(self._cursor.fetchall)
+
+    def close(self) -> None:
+        self._flush()
+        self._cursor.close()
+
+    def _fetch(self, fetch: Callable[[], Any], single: bool = False) -> Any:
+        started = time.perf_counter()
+        result = fetch()
+        pending = self._pending
+        if pending is not None:
+            pending.fetch_time += time.perf_counter() - started
+            count = (0 if result is None else 1) if single else len(result)
+            pending.rows += count
+            pending.fetched += count
+            pending.fetches += 1
+        return result
+
+    def _flush(self) -> None:
+        pending = self._pending
+        if pending is None:
+            return
+        object.__setattr__(self, "_pending", None)
+        if not pending.fetches:
+            rowcount = getattr(self._cursor, "rowcount", -1)
+            if isinstance(rowcount, int) and rowcount > pending.rows:
+                pending.rows = rowcount
+        arraysize = getattr(self._cursor, "arraysize", 0)
+        if not isinstance(arraysize, int) or arraysize < 2:
+            arraysize = DEFAULT_ARRAYSIZE
+        round_trips = 1 + (math.ceil(pending.fetched / arraysize) if pending.fetches else 0)
+        self._registry.record_statement(
+            pending.sql, pending.binds, pending.rows, round_trips, pending.execute_time, pending.fetch_time
+        )
+
+
+@dataclass
+class _Pending:
+    sql: str
+    binds: int
+    execute_time: float = 0.0
+    fetch_time: float = 0.0
+    rows: int = 0
+    fetched: int = 0
+    fetches: int = 0
+
+
+class _InstrumentedConnection:
+    def __init__(self, connection: Any, registry: MetricsRegistry) -> None:
+        self._connection = connection
+        self._registry = registry
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> "_InstrumentedConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def cursor(self) -> _InstrumentedCursor:
+        return _InstrumentedCursor(self._connection.cursor(), self._registry)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class InstrumentedConnectionFactory:
+    """Connection factory proxy that feeds ``registry`` (``METRICS`` by default)."""
+
+    def __init__(self, factory: Any, registry: MetricsRegistry = METRICS) -> None:
+        self._factory = factory
+        self._registry = registry
+
+    def __getattr__(self, name: str) -> Any:
+        # dialect, path, ... of the wrapped factory
+        return getattr(self._factory, name)
+
+    @property
+    def wrapped(self) -> Any:
+        return self._factory
+
+    def get_connection(self) -> _InstrumentedConnection:
+        started = time.perf_counter()
+        connection = self._factory.get_connection()
+        self._registry.record_connect(time.perf_counter() - started)
+        return _InstrumentedConnection(connection, self._registry)
+
+
+class InstrumentedRepository:
+    """Repository proxy that records every public method call in ``registry``."""
+
+    def __init__(self, repository: Any, registry: MetricsRegistry = METRICS) -> None:
+        self._repository = repository
+        self._registry = registry
+
+    @property
+    def wrapped(self) -> Any:
+        return self._repository
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        label = f"{type(self._repository).__name__}.{name}"
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._registry.timed_call(label, attribute, *args, **kwargs)
+
+        return call
+
+
+def instrument_repository(repository: Any, registry: MetricsRegistry = METRICS) -> InstrumentedRepository:
+    return InstrumentedRepository(repository, registry)
+
+
+def configure_slow_query_log(settings_path: Path, registry: MetricsRegistry = METRICS) -> Path:
+    """Set the slow-query threshold and log file from ``settings_path``.
+
+    Reads ``"slow_query_ms"`` (default 500; ``FESTIVAL_SLOW_QUERY_MS``
+    overrides it) and ``"slow_query_log"`` (relative to the settings file).
+    Returns the log path.
+    """
+    settings_path = Path(settings_path)
+    data: Dict[str, Any] = {}
+    if settings_path.exists():
+        with settings_path.open("r", encoding="utf-8") as file:
+            data = json.load(file)
+    threshold_ms = float(os.environ.get(SLOW_QUERY_ENV_VAR) or data.get("slow_query_ms") or DEFAULT_SLOW_QUERY_MS)
+    registry.slow_threshold = threshold_ms / 1000
+
+    log_path = Path(data.get("slow_query_log") or SLOW_QUERY_LOG_FILENAME)
+    if not log_path.is_absolute():
+        log_path = settings_path.parent / log_path
+    for handler in slow_query_logger.handlers:
+        if isinstance(handler, logging.FileHandler) and Path(handler.baseFilename) == log_path.resolve():
+            return log_path
+    handler = logging.FileHandler(log_path, encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+    return log_path
@@ -0,0 +1,129 @@
+"""On-disk SQLite copy of the reference tables (ciudad, sede, pelicula, jurado).
+
+Repositories read the mirror first so grids open without a round trip to
+Autonomous DB, then refresh it with a delta sync:
+
+* rows changed since the last sync are fetched with ``ORA_ROWSCN > :scn`` and
+  upserted (``ORA_ROWSCN`` is block-granular unless the table was created with
+  ``ROWDEPENDENCIES``, so this may return a few unchanged rows, never fewer);
+* deletions are detected by diffing the primary keys still present upstream.
+
+If the database cannot be reached the last synced rows are served instead.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+MIRROR_FILENAME = "local_mirror.sqlite3"
+
+logger = logging.getLogger(__name__)
+
+
+class LocalMirror:
+    """Thread-safe SQLite mirror; one file shared by every mirrored table."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS _mirror_meta ("
+            " table_name TEXT PRIMARY KEY, scn INTEGER NOT NULL, synced_at TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    @classmethod
+    def for_settings(cls, settings_path: Path) -> Optional["LocalMirror"]:
+        """Open the mirror stored next to ``settings_path``; None if it cannot be created."""
+        try:
+            return cls(Path(settings_path).parent / MIRROR_FILENAME)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Local mirror disabled: %s", exc)
+            return None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def cached_rows(self, table: str, columns: Sequence[str]) -> Optional[List[tuple]]:
+        """Return the mirrored rows ordered by the first column, or None if never synced."""
+        with self._lock:
+            if self._last_scn(table) is None:
+                return None
+            return self._db.execute(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY {columns[0]}"
+            ).fetchall()
+
+    def sync(self, table: str, columns: Sequence[str], connection_factory) -> int:
+        """Pull changes for ``table`` into the mirror; returns rows upserted + deleted.
+
+        ``columns[0]`` must be the table's primary key.
+        """
+        key = columns[0]
+        with self._lock:
+            last_scn = self._last_scn(table)
+        if connection_factory is None:
+            raise ConnectionError("No hay conexión configurada")
+
+        with connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT ORA_ROWSCN, {', '.join(columns)} FROM {table} WHERE ORA_ROWSCN > :scn",
+                    {"scn": last_scn or 0},
+                )
+                changed = cursor.fetchall()
+                upstream_ids = None
+                if last_scn is not None:
+                    cursor.execute(f"SELECT {key} FROM {table}")
+                    upstream_ids = {row[0] for row in cursor.fetchall()}
+
+        with self._lock:
+            self._ensure_table(table, columns)
+            placeholders = ", ".join("?" for _ in columns)
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                [row[1:] for row in changed],
+            )
+            deleted = 0
+            if upstream_ids is not None:
+                local_ids = [row[0] for row in self._db.execute(f"SELECT {key} FROM {table}")]
+                gone = [(i,) for i in local_ids if i not in upstream_ids]
+                self._db.executemany(f"DELETE FROM {table} WHERE {key} = ?", gone)
+                deleted = len(gone)
+            new_scn = max([row[0] for row in changed if row[0] is not None], default=last_scn or 0)
+            self._db.execute(
+                "INSERT OR REPLACE INTO _mirror_meta (table_name, scn, synced_at) VALUES (?, ?, ?)",
+                (table, max(new_scn, last_scn or 0), datetime.now().isoformat(timespec="seconds")),
+            )
+            self._db.commit()
+        return len(changed) + deleted
+
+    def fetch(self, table: str, columns: Sequence[str], connection_factory) -> List[tuple]:
+        """Sync ``table`` and return its rows; falls back to the last copy when offline."""
+        try:
+            self.sync(table, columns, connection_factory)
+        except Exception as exc:
+            cached = self.cached_rows(table, columns)
+            if cached is None:
+                raise
+            logger.warning("Using local mirror for %s (database unavailable: %s)", table, exc)
+            return cached
+        return self.cached_rows(table, columns) or []
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _last_scn(self, table: str) -> Optional[int]:
+        row = self._db.execute("SELECT scn FROM _mirror_meta WHERE table_name = ?", (table,)).fetchone()
+        return row[0] if row else None
+
+    def _ensure_table(self, table: str, columns: Sequence[str]) -> None:
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ({columns[0]} PRIMARY KEY, {', '.join(columns[1:])})"
+        )
@@ -2,14 +2,27 @@
 from __future__ import annotations
 
 import json
+import logging
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import oracledb
 
+logger = logging.getLogger(__name__)
+
+# connections kept by the session pool ("pool_max" in settings.json, 0 disables it)
+DEFAULT_POOL_MAX = 4
+
 
 class OracleConnection:
-    """Encapsulates connection management to Oracle Autonomous Database."""
+    """Encapsulates connection management to Oracle Autonomous Database.
+
+    With ``pool_max > 0`` connections come from an ``oracledb`` session pool
+    created on first use; closing one (leaving ``with``) returns it to the pool.
+    """
+
+    dialect = "oracle"
 
     def __init__(
         self,
@@ -18,20 +31,19 @@ class OracleConnection:
         dsn: str,
         config_dir: Optional[str] = None,
         wallet_password: Optional[str] = None,
+        pool_max: int = 0,
     ) -> None:
         self._user = user
         self._password = password
         self._dsn = dsn
         self._config_dir = config_dir
         self._wallet_password = wallet_password
+        self._pool_max = pool_max
+        self._pool: Optional[oracledb.ConnectionPool] = None
+        self._pool_lock = threading.Lock()
 
-    def get_connection(self) -> oracledb.Connection:
-        """Return a new Oracle connection instance.
-
-        Raises:
-            oracledb.Error: If the connection cannot be established.
-        """
-
+    def connection_params(self) -> Dict[str, Optional[str]]:
+        """Keyword arguments for ``oracledb.connect`` / ``oracledb.create_pool_async``."""
         connection_kwargs: Dict[str, Optional[str]] = {
             "user": self._user,
             "password": self._password,
@@ -42,14 +54,48 @@ class OracleConnection:
             connection_kwargs["wallet_location"] = self._config_dir
         if self._wallet_password:
             connection_kwargs["wallet_password"] = self._wallet_password
+        return connection_kwargs
+
+    def get_connection(self) -> oracledb.Connection:
+        """Return an Oracle connection (a pooled session when the pool is enabled).
 
+        Raises:
+            oracledb.Error: If the connection cannot be established.
+        """
         try:
-            db = oracledb.connect(**connection_kwargs)
+            if self._pool_max > 0:
+                return self._session_pool().acquire()
+            db = oracledb.connect(**self.connection_params())
             return db
         except oracledb.Error as exc:  # pragma: no cover - requires DB
-            print(f"Error connecting to Oracle DB: {exc}")
+            logger.error("Error connecting to Oracle DB: %s", exc)
             raise ConnectionError("No se pudo conectar a Oracle Autonomous Database") from exc
-        
+
+    def warm_up(self) -> None:
+        """Open the pool's first session ahead of use (one connect round trip).
+
+        Without a pool this just checks that a connection can be established.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM DUAL")
+                cursor.fetchone()
+
+    def close(self) -> None:
+        """Close the session pool, if any."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close(force=True)
+
+    def _session_pool(self) -> oracledb.ConnectionPool:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = oracledb.create_pool(
+                    min=1, max=self._pool_max, increment=1, **self.connection_params()
+                )
+            return self._pool
+
     @classmethod
     def from_settings(cls, settings_path: Path) -> "OracleConnection":
         """Create an instance from a JSON settings file."""
@@ -88,4 +134,5 @@ class OracleConnection:
             dsn=dsn,
             config_dir=resolved_wallet_dir,
             wallet_password=wallet_password or None,
+            pool_max=int(data.get("pool_max", DEFAULT_POOL_MAX)),
         )
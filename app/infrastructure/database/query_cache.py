@@ -0,0 +1,482 @@
+"""Result cache for repeated SELECTs, invalidated by the writes that go through it.
+
+``CachingConnectionFactory`` wraps any connection factory. A ``SELECT`` on a
+known table is answered from ``QueryCache`` when the same statement text ran
+before with the same binds; otherwise it runs and, once its rows have been
+read (up to ``max_entry_rows``), they are stored. Each entry is tagged with
+the tables the statement mentions. ``INSERT`` / ``UPDATE`` / ``DELETE`` /
+``MERGE`` drop the entries tagged with their table, at execute time and again
+when the connection commits, rolls back or closes; PL/SQL and anything else
+not understood drops everything. Entries are evicted least recently used
+first once their estimated size passes ``max_bytes``.
+
+Not cached, so they always reach the database:
+
+* ``ORA_ROWSCN`` probes (``ChangeToken``, ``changed_since``), ``SYSDATE`` and
+  other volatile expressions, ``FOR UPDATE`` and ``FROM DUAL``;
+* statements on objects that are not tables of ``sql/script.sql``;
+* reads on a connection with uncommitted writes (a ``UnitOfWork`` mid-way).
+
+Only writes made through the cache are seen. Writes from other sessions are
+caught by the change tokens: ``fetch_change_token`` reports every probe to
+:meth:`QueryCache.observe_token`, which drops a table's entries when its
+token differs from the one seen before them, so a ``ChangeTracker`` never
+pairs a fresh token with rows cached under an older one. The GUI's
+*Recargar* also drops the current table.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+from app.infrastructure.database.schema import load_schema
+
+QUERY_CACHE_SETTING = "query_cache_mb"
+DEFAULT_QUERY_CACHE_MB = 64.0
+DEFAULT_MAX_ENTRY_ROWS = 20_000
+# rows read per fetchmany while buffering a result to store
+_FILL_BATCH = 1000
+# tag of statements whose tables are unknown: invalidates every entry
+ALL_TABLES = "*"
+
+_VOLATILE_RE = re.compile(
+    r"\b(?:ORA_ROWSCN|SYSDATE|SYSTIMESTAMP|CURRENT_DATE|CURRENT_TIMESTAMP|LOCALTIMESTAMP|NEXTVAL|CURRVAL"
+    r"|DBMS_RANDOM|SYS_GUID|USERENV|SYS_CONTEXT|DUAL)\b|\bFOR\s+UPDATE\b",
+    re.IGNORECASE,
+)
+_SOURCE_RE = re.compile(r"\b(?:FROM|JOIN)\s+(?:\w+\.)?(\w+)", re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+")
+_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT\s+INTO|UPDATE|DELETE(?:\s+FROM)?|MERGE\s+INTO|TRUNCATE\s+TABLE)\s+(?:\w+\.)?(\w+)",
+    re.IGNORECASE,
+)
+# transaction control: neither reads nor writes a table
+_SESSION_RE = re.compile(r"^\s*(?:SAVEPOINT|RELEASE|ROLLBACK|COMMIT|SET\s|ALTER\s+SESSION)\b", re.IGNORECASE)
+# anonymous block that only opens REF CURSORs (AggregateLoader): a read, not cached
+_OPEN_FOR_RE = re.compile(r"^\s*BEGIN\s+(?:OPEN\s+:\w+\s+FOR\s+SELECT\b[^;]*;\s*)+END;\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def classify(sql: str) -> Tuple[str, FrozenSet[str]]:
+    """``("read", tables)`` for a cacheable SELECT, ``("write", tables)`` or ``("other", {})``.
+
+    A write on unknown tables is tagged :data:`ALL_TABLES`.
+    """
+    known = load_schema().tables
+    if sql.lstrip()[:6].upper().startswith(("SELECT", "WITH")):
+        if _VOLATILE_RE.search(sql):
+            return "other", frozenset()
+        if any(source.lower() not in known for source in _SOURCE_RE.findall(sql)):
+            return "other", frozenset()
+        tables = frozenset(word for word in _WORD_RE.findall(sql.lower()) if word in known)
+        return ("read", tables) if tables else ("other", frozenset())
+    if _SESSION_RE.match(sql) or _OPEN_FOR_RE.match(sql):
+        return "other", frozenset()
+    written = _WRITE_RE.match(sql)
+    if written and written.group(1).lower() in known:
+        return "write", frozenset((written.group(1).lower(),))
+    return "write", frozenset((ALL_TABLES,))
+
+
+def _bind_key(parameters: Any, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    """Hashable form of the binds (value types included: ``1`` and ``True`` differ); None if impossible."""
+    binds = parameters if parameters is not None else kwargs
+    try:
+        if not binds:
+            return ()
+        if isinstance(binds, dict):
+            key: Hashable = tuple(sorted((name, type(value), value) for name, value in binds.items()))
+        else:
+            key = tuple((type(value), value) for value in binds)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _estimate_bytes(rows: List[Any]) -> int:
+    """Rough size of ``rows`` from a sample (shared values are counted once per row)."""
+    if not rows:
+        return sys.getsizeof(rows)
+    step = max(1, len(rows) // 16)
+    sample = rows[::step][:16]
+    per_row = sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in sample) / len(sample)
+    return sys.getsizeof(rows) + int(per_row * len(rows))
+
+
+@dataclass
+class CacheStats:
+    """Counters since the last ``reset_stats`` plus the current size."""
+
+    hits: int = 0
+    misses: int = 0
+    # reads that could not use the cache (see the module docstring)
+    bypassed: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    description: Any
+    rows: List[Any]
+    tables: FrozenSet[str]
+    size: int
+
+
+class QueryCache:
+    """Thread-safe LRU of SELECT results keyed by (SQL text, binds), bounded by ``max_bytes``."""
+
+    def __init__(self, max_bytes: int = int(DEFAULT_QUERY_CACHE_MB * 1024 * 1024),
+                 max_entry_rows: int = DEFAULT_MAX_ENTRY_ROWS) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_rows = max_entry_rows
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_table: Dict[str, Set[Hashable]] = {}
+        # bumped on every invalidation of a table (ALL_TABLES: of everything), so a
+        # result read while a write was in flight is not stored
+        self._versions: Dict[str, int] = {}
+        # last ChangeToken seen per table (observe_token)
+        self._tokens: Dict[str, Hashable] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    # -- reads -------------------------------------------------------------
+    def get(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return entry
+
+    def bypass(self) -> None:
+        with self._lock:
+            self._stats.bypassed += 1
+
+    def version(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return (self._versions.get(ALL_TABLES, 0),) + tuple(self._versions.get(t, 0) for t in sorted(tables))
+
+    def put(self, key: Hashable, tables: FrozenSet[str], version: Tuple[int, ...], description: Any,
+            rows: List[Any]) -> bool:
+        """Store ``rows`` unless a table was invalidated since ``version`` or they are too big."""
+        size = _estimate_bytes(rows)
+        if size > self.max_bytes // 4:
+            return False
+        with self._lock:
+            current = (self._versions.get(ALL_TABLES, 0),) + tuple(self._versions.get(t, 0) for t in sorted(tables))
+            if current != version:
+                return False
+            self._discard(key)
+            self._entries[key] = _Entry(description, rows, tables, size)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+            self._stats.stores += 1
+            while self._bytes > self.max_bytes and self._entries:
+                self._discard(next(iter(self._entries)))
+                self._stats.evictions += 1
+            return True
+
+    # -- invalidation --------------------------------------------------------
+    def invalidate(self, *tables: str) -> None:
+        """Drop the entries that read ``tables`` (:data:`ALL_TABLES`: every entry)."""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                keys = list(self._entries) if table == ALL_TABLES else list(self._by_table.get(table, ()))
+                for key in keys:
+                    self._discard(key)
+                self._stats.invalidations += len(keys)
+
+    def observe_token(self, table: str, token: Hashable) -> bool:
+        """Record the change token just read for ``table``; drop its entries if it moved.
+
+        The first token seen for a table also drops them: they may predate it.
+        Returns True when entries were invalidated.
+        """
+        with self._lock:
+            changed = self._tokens.get(table) != token
+            self._tokens[table] = token
+        if changed:
+            self.invalidate(table)
+        return changed
+
+    def clear(self) -> None:
+        self.invalidate(ALL_TABLES)
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= entry.size
+        for table in entry.tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+
+    # -- metrics ---------------------------------------------------------------
+    def stats(self) -> CacheStats:
+        with self._lock:
+            stats = CacheStats(**vars(self._stats))
+            stats.entries = len(self._entries)
+            stats.bytes = self._bytes
+            return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = CacheStats()
+
+
+QUERY_CACHE = QueryCache()
+
+
+class _CachingCursor:
+    """Cursor proxy answering cached SELECTs and reporting writes to its connection."""
+
+    def __init__(self, cursor: Any, connection: "_CachingConnection") -> None:
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_connection", connection)
+        object.__setattr__(self, "_rows", None)
+        object.__setattr__(self, "_position", 0)
+        object.__setattr__(self, "_description", None)
+        # the driver cursor still has rows after the buffered ones
+        object.__setattr__(self, "_tail", False)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # e.g. ``cursor.arraysize = n`` must reach the driver cursor
+        setattr(self._cursor, name, value)
+
+    @property
+    def wrapped(self) -> Any:
+        """Driver cursor (e.g. to bind it as a REF CURSOR out variable), below any other proxy."""
+        return getattr(self._cursor, "wrapped", self._cursor)
+
+    @property
+    def description(self) -> Any:
+        return self._description if self._rows is not None else self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._position if self._rows is not None and not self._tail else self._cursor.rowcount
+
+    def __enter__(self) -> "_CachingCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+    def execute(self, sql: str, parameters: Any = None, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_rows", None)
+        cache = self._connection.cache
+        kind, tables = classify(sql)
+        if kind == "write":
+            self._connection.wrote(tables)
+            return self._run(sql, parameters, kwargs)
+        key = _bind_key(parameters, kwargs) if kind == "read" else None
+        if key is None or not cache.enabled or self._connection.dirty:
+            if kind == "read":
+                cache.bypass()
+            return self._run(sql, parameters, kwargs)
+
+        key = (sql, key)
+        entry = cache.get(key)
+        if entry is not None:
+            self._serve(entry.description, entry.rows, tail=False)
+            return self
+        version = cache.version(tables)
+        self._run(sql, parameters, kwargs)
+        rows: List[Any] = []
+        complete = False
+        while len(rows) <= cache.max_entry_rows:
+            batch = self._cursor.fetchmany(_FILL_BATCH)
+            rows.extend(batch)
+            if len(batch) < _FILL_BATCH:
+                complete = True
+                break
+        description = self._cursor.description
+        if complete:
+            cache.put(key, tables, version, description, rows)
+        self._serve(description, rows, tail=not complete)
+        return self
+
+    def executemany(self, sql: str, parameters: Any, **kwargs: Any) -> Any:
+        object.__setattr__(self, "_rows", None)
+        kind, tables = classify(sql)
+        self._connection.wrote(tables if kind == "write" else frozenset((ALL_TABLES,)))
+        return self._cursor.executemany(sql, parameters, **kwargs)
+
+    def callproc(self, *args: Any, **kwargs: Any) -> Any:
+        self._connection.wrote(frozenset((ALL_TABLES,)))
+        return self._cursor.callproc(*args, **kwargs)
+
+    def callfunc(self, *args: Any, **kwargs: Any) -> Any:
+        self._connection.wrote(frozenset((ALL_TABLES,)))
+        return self._cursor.callfunc(*args, **kwargs)
+
+    def fetchone(self) -> Any:
+        rows = self._rows
+        if rows is None:
+            return self._cursor.fetchone()
+        if self._position < len(rows):
+            object.__setattr__(self, "_position", self._position + 1)
+            return rows[self._position - 1]
+        return self._cursor.fetchone() if self._tail else None
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        rows = self._rows
+        if rows is None:
+            return self._cursor.fetchmany() if size is None else self._cursor.fetchmany(size)
+        size = size if size is not None else self._cursor.arraysize
+        batch = rows[self._position:self._position + size]
+        object.__setattr__(self, "_position", self._position + len(batch))
+        if len(batch) < size and self._tail:
+            batch.extend(self._cursor.fetchmany(size - len(batch)))
+        return batch
+
+    def fetchall(self) -> List[Any]:
+        rows = self._rows
+        if rows is None:
+            return self._cursor.fetchall()
+        batch = rows[self._position:]
+        object.__setattr__(self, "_position", len(rows))
+        if self._tail:
+            batch.extend(self._cursor.fetchall())
+        return batch
+
+    def close(self) -> None:
+        object.__setattr__(self, "_rows", None)
+        self._cursor.close()
+
+    def _run(self, sql: str, parameters: Any, kwargs: Dict[str, Any]) -> Any:
+        if parameters is None:
+            result = self._cursor.execute(sql, **kwargs)
+        else:
+            result = self._cursor.execute(sql, parameters, **kwargs)
+        # drivers returning the cursor itself (sqlite3, oracledb queries): keep the proxy in front
+        return self if result is not None else None
+
+    def _serve(self, description: Any, rows: List[Any], tail: bool) -> None:
+        object.__setattr__(self, "_description", description)
+        object.__setattr__(self, "_rows", rows)
+        object.__setattr__(self, "_position", 0)
+        object.__setattr__(self, "_tail", tail)
+
+
+class _CachingConnection:
+    """Connection proxy tracking the tables written in its open transaction."""
+
+    def __init__(self, connection: Any, cache: QueryCache) -> None:
+        self._connection = connection
+        self.cache = cache
+        self._written: Set[str] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> "_CachingConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._written)
+
+    def wrote(self, tables: FrozenSet[str]) -> None:
+        self._written.update(tables)
+        self.cache.invalidate(*tables)
+
+    def cursor(self) -> _CachingCursor:
+        return _CachingCursor(self._connection.cursor(), self)
+
+    def commit(self) -> None:
+        try:
+            self._connection.commit()
+        finally:
+            self._end_transaction()
+
+    def rollback(self) -> None:
+        try:
+            self._connection.rollback()
+        finally:
+            self._end_transaction()
+
+    def close(self) -> None:
+        try:
+            self._connection.close()
+        finally:
+            self._end_transaction()
+
+    def _end_transaction(self) -> None:
+        # readers sharing the session may have cached rows written (or undone) meanwhile
+        if self._written:
+            written, self._written = self._written, set()
+            self.cache.invalidate(*written)
+
+
+class CachingConnectionFactory:
+    """Connection factory proxy serving repeated SELECTs from ``cache`` (``QUERY_CACHE`` by default)."""
+
+    def __init__(self, factory: Any, cache: QueryCache = QUERY_CACHE) -> None:
+        self._factory = factory
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        # dialect, path, ... of the wrapped factory
+        return getattr(self._factory, name)
+
+    @property
+    def wrapped(self) -> Any:
+        return self._factory
+
+    def get_connection(self) -> _CachingConnection:
+        return _CachingConnection(self._factory.get_connection(), self.cache)
+
+
+def configure_query_cache(settings_path: Path, cache: QueryCache = QUERY_CACHE) -> QueryCache:
+    """Size ``cache`` from ``"query_cache_mb"`` in ``settings_path`` (default 64; 0 disables it)."""
+    settings_path = Path(settings_path)
+    data: Dict[str, Any] = {}
+    if settings_path.exists():
+        with settings_path.open("r", encoding="utf-8") as file:
+            data = json.load(file)
+    megabytes = data.get(QUERY_CACHE_SETTING)
+    cache.max_bytes = int(float(DEFAULT_QUERY_CACHE_MB if megabytes is None else megabytes) * 1024 * 1024)
+    if not cache.enabled:
+        cache.clear()
+    return cache
@@ -0,0 +1,289 @@
+"""Validates and coerces raw records against a table declared in `sql/script.sql`.
+
+Catches the errors Oracle would otherwise report one round trip at a time:
+NOT NULL, VARCHAR2 length, the simple CHECK constraints used in the script and
+duplicate PRIMARY KEY / UNIQUE keys inside the same batch of input.
+
+The per-column rules are compiled once per table and column list into a
+straight-line Python function (``exec`` of generated source): no loop over
+column objects, no predicate lambdas, the ``IN`` lists as frozensets and the
+comparison literals inlined. :func:`check_rows` runs the batch variant, with
+the loop over the rows inside the generated function, before the bulk writes
+send anything; :func:`check_record` is what the form dialogs call.
+"""
+from __future__ import annotations
+
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from app.infrastructure.database.schema import Column, Table, load_schema
+
+_COMPARISON_RE = re.compile(r"^(\w+)\s*(>=|<=|<>|!=|=|>|<)\s*('(?:[^']|'')*'|-?\d+(?:\.\d+)?)$")
+_IN_RE = re.compile(r"^(\w+)\s+IN\s*\((.*)\)$", re.IGNORECASE | re.DOTALL)
+_LITERAL_RE = re.compile(r"'((?:[^']|'')*)'|(-?\d+(?:\.\d+)?)")
+
+# classes bound as they are, without calling coerce_value
+_FAST_TYPES: Dict[str, Tuple[str, ...]] = {"NUMBER": ("int", "float"), "DATE": ("date", "datetime")}
+# stands for a value coerce_value rejected, so the NOT NULL test does not report it twice
+_INVALID = object()
+
+# CHECK operator -> Python operator in the generated source
+_OPERATORS: Dict[str, str] = {">": ">", ">=": ">=", "<": "<", "<=": "<=", "=": "==", "<>": "!=", "!=": "!="}
+
+# (column, operator, operand): operator is a key of _OPERATORS, or "IN" with a frozenset operand
+Clause = Tuple[str, str, Any]
+# coerce mode: record -> (row ready to bind or None, errors)
+RecordCheck = Callable[[Mapping[str, Any]], Tuple[Optional[Dict[str, Any]], List[str]]]
+# batch mode: rows -> [(offset, "; "-joined errors)] for the rows that fail
+BatchCheck = Callable[[Sequence[Mapping[str, Any]]], List[Tuple[int, str]]]
+
+
+class RowValidationError(ValueError):
+    """Raised when a record violates one or more constraints."""
+
+
+def _literal(text: str) -> Any:
+    if text.startswith("'"):
+        return text[1:-1].replace("''", "'")
+    return float(text) if "." in text else int(text)
+
+
+def _parse_check(expression: str) -> Optional[List[Clause]]:
+    """Split ``a > 0 AND a <= 9`` / ``a IN ('x', 'y')`` into clauses.
+
+    Returns None for expressions outside that subset; Oracle still enforces them.
+    """
+    clauses: List[Clause] = []
+    for clause in re.split(r"\s+AND\s+", expression.strip(), flags=re.IGNORECASE):
+        clause = clause.strip()
+        in_match = _IN_RE.match(clause)
+        if in_match:
+            allowed = frozenset(
+                _literal(m.group(0)) for m in _LITERAL_RE.finditer(in_match.group(2))
+            )
+            clauses.append((in_match.group(1).lower(), "IN", allowed))
+            continue
+        comparison = _COMPARISON_RE.match(clause)
+        if not comparison:
+            return None
+        clauses.append((comparison.group(1).lower(), comparison.group(2), _literal(comparison.group(3))))
+    return clauses
+
+
+def coerce_value(column: Column, value: Any) -> Any:
+    """Convert ``value`` (often a CSV string) to the Python type bound for ``column``."""
+    if isinstance(value, str):
+        value = value.strip()
+        if value == "":
+            return None
+    if value is None:
+        return None
+    if column.type == "NUMBER":
+        if isinstance(value, bool):
+            raise ValueError("no es numérico")
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str) and value.isascii() and value.isdigit():
+            return int(value)
+        try:
+            number = Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError("no es numérico") from None
+        return int(number) if number == number.to_integral_value() else float(number)
+    if column.type == "DATE":
+        if isinstance(value, (date, datetime)):
+            return value
+        text = str(value)
+        try:
+            return date.fromisoformat(text) if len(text) == 10 else datetime.fromisoformat(text)
+        except ValueError:
+            raise ValueError("fecha inválida (use YYYY-MM-DD)") from None
+    return str(value)
+
+
+def _column_lines(table: Table, columns: Sequence[str], coerce: bool, namespace: Dict[str, Any]) -> List[str]:
+    lines: List[str] = []
+    for i, name in enumerate(columns):
+        column = table.columns[name]
+        v = f"v{i}"
+        if not coerce:
+            lines.append(f"{v} = record[{name!r}]")
+        else:
+            lines += [f"{v} = record.get({name!r})", f"if {v}.__class__ is str:", f"    {v} = {v}.strip() or None"]
+            fast = _FAST_TYPES.get(column.type)
+            if fast:
+                namespace[f"c{i}"] = column
+                classes = " and ".join(f"{v}.__class__ is not {cls}" for cls in fast)
+                lines += [
+                    f"if {v} is not None and {classes}:",
+                    "    try:",
+                    f"        {v} = coerce_value(c{i}, {v})",
+                    "    except ValueError as exc:",
+                    f"        errors.append({name + ': '!r} + str(exc))",
+                    f"        {v} = INVALID",
+                ]
+            else:
+                lines += [f"elif {v} is not None:", f"    {v} = str({v})"]
+            if column.default is not None:
+                namespace[f"d{i}"] = column.default
+                call = "()" if callable(column.default) else ""
+                lines += [f"if {v} is None:", f"    {v} = d{i}{call}"]
+        if not column.nullable and not column.identity and not (coerce and column.default is not None):
+            lines += [f"if {v} is None:", f"    errors.append({name + ': es obligatorio'!r})"]
+        if column.type == "VARCHAR2" and column.size:
+            size = column.size
+            # characters <= UTF-8 bytes: only non-ASCII text within the limit needs encoding
+            lines += [
+                f"if {v}.__class__ is str and (len({v}) > {size} or "
+                f"(not {v}.isascii() and len({v}.encode('utf-8')) > {size})):",
+                f"    errors.append({name + f': supera {size} bytes'!r})",
+            ]
+    return lines
+
+
+def _check_lines(table: Table, columns: Sequence[str], coerce: bool, namespace: Dict[str, Any]) -> List[str]:
+    position = {name: i for i, name in enumerate(columns)}
+    lines: List[str] = []
+    for check in table.checks:
+        clauses = [c for c in _parse_check(check.expression) or () if c[0] in position]
+        if not clauses:
+            continue
+        lines.append("try:")
+        for n, (column, operator, operand) in enumerate(clauses):
+            v = f"v{position[column]}"
+            if operator == "IN":
+                constant = f"k{len(namespace)}"
+                namespace[constant] = operand
+                failed = f"{v} not in {constant}"
+            else:
+                failed = f"not ({v} {_OPERATORS[operator]} {operand!r})"
+            message = f"{check.name}: valor no permitido en {column} (%r)"
+            lines += [
+                f"    {'elif' if n else 'if'} {v} is not None and {failed}:",
+                f"        errors.append({message!r} % ({v},))",
+            ]
+        if coerce:
+            lines += ["except TypeError:", f"    errors.append({check.name + ': tipo de dato no comparable'!r})"]
+        else:
+            # e.g. a numeric string: the database converts it before checking
+            lines += ["except TypeError:", "    pass"]
+    return lines
+
+
+def _define(source: str, name: str, namespace: Dict[str, Any], table: Table) -> Callable:
+    namespace.update(coerce_value=coerce_value, INVALID=_INVALID, date=date, datetime=datetime)
+    exec(compile(source, f"<{name} {table.name}>", "exec"), namespace)
+    function = namespace[name]
+    function.source = source
+    return function
+
+
+def _indent(lines: List[str], depth: int) -> List[str]:
+    return ["    " * depth + line for line in lines]
+
+
+def compile_validator(table: Table, columns: Sequence[str]) -> RecordCheck:
+    """``validate(record) -> (row, errors)`` for ``columns`` of ``table``.
+
+    Coerces like :func:`coerce_value`, fills DEFAULTs and checks NOT NULL,
+    VARCHAR2 byte length and the CHECK constraints (those only when the rest
+    passed). ``row`` is None when ``errors`` is not empty.
+    """
+    namespace: Dict[str, Any] = {}
+    body = _column_lines(table, columns, True, namespace)
+    body += ["if errors:", "    return None, errors"]
+    body += _check_lines(table, columns, True, namespace)
+    body += ["if errors:", "    return None, errors"]
+    body.append("return {" + ", ".join(f"{name!r}: v{i}" for i, name in enumerate(columns)) + "}, errors")
+    source = "\n".join(["def validate(record):", "    errors = []", *_indent(body, 1)])
+    return _define(source, "validate", namespace, table)
+
+
+def compile_batch_check(table: Table, columns: Sequence[str]) -> BatchCheck:
+    """``check(rows) -> [(offset, message)]`` for rows already typed for binding.
+
+    Nothing is coerced or defaulted: a None in a NOT NULL column is an
+    error, as it would be for the database. Only ``columns`` are read (by
+    key); CHECK clauses on other columns, and values a clause cannot
+    compare, are left to the database.
+    """
+    namespace: Dict[str, Any] = {}
+    body = ["errors = []"] + _column_lines(table, columns, False, namespace)
+    body += ["if not errors:", *_indent(_check_lines(table, columns, False, namespace) or ["pass"], 1)]
+    body += ["if errors:", "    failed.append((offset, '; '.join(errors)))"]
+    source = "\n".join(
+        ["def check(rows):", "    failed = []", "    for offset, record in enumerate(rows):", *_indent(body, 2), "    return failed"]
+    )
+    return _define(source, "check", namespace, table)
+
+
+def _known_columns(table_name: str, names: Sequence[str]) -> Tuple[Table, Tuple[str, ...]]:
+    table = load_schema().table(table_name)
+    return table, tuple(name for name in names if name in table.columns)
+
+
+@lru_cache(maxsize=None)
+def _record_check(table_name: str, names: Tuple[str, ...]) -> RecordCheck:
+    return compile_validator(*_known_columns(table_name, names))
+
+
+@lru_cache(maxsize=None)
+def _batch_check(table_name: str, names: Tuple[str, ...]) -> BatchCheck:
+    return compile_batch_check(*_known_columns(table_name, names))
+
+
+def check_record(table_name: str, record: Mapping[str, Any]) -> List[str]:
+    """Constraint errors of one form record; keys that are not columns of the table are ignored."""
+    return _record_check(table_name, tuple(record))(record)[1]
+
+
+def check_rows(table_name: str, rows: Sequence[Mapping[str, Any]]) -> List[Tuple[int, str]]:
+    """``(offset, message)`` for each of ``rows`` (same keys as ``rows[0]``) that breaks a constraint."""
+    if not rows:
+        return []
+    return _batch_check(table_name, tuple(rows[0]))(rows)
+
+class RowValidator:
+    """Checks records for one table and returns them ready to bind.
+
+    Uniqueness is tracked across every record validated by the same instance,
+    so one validator should be used per import run.
+    """
+
+    def __init__(self, table: Table, include_identity: bool = False) -> None:
+        self._table = table
+        self._columns = [table.columns[name] for name in table.insert_columns(include_identity)]
+        self._validate = compile_validator(table, self.columns)
+        keys = {}
+        if table.primary_key and (include_identity or table.identity_column not in table.primary_key):
+            keys[f"pk_{table.name}"] = table.primary_key
+        keys.update(table.unique)
+        self._unique_keys: Dict[str, Tuple[str, ...]] = keys
+        self._seen: Dict[str, Set[tuple]] = {name: set() for name in keys}
+
+    @property
+    def columns(self) -> List[str]:
+        return [column.name for column in self._columns]
+
+    def validate(self, record: Mapping[str, Any]) -> Dict[str, Any]:
+        """Return a coerced copy of ``record`` or raise :class:`RowValidationError`."""
+        row, errors = self._validate(record)
+
+        keys: List[Tuple[str, tuple]] = []
+        if not errors:
+            for name, columns in self._unique_keys.items():
+                key = tuple(row.get(c) for c in columns)
+                if any(v is None for v in key):
+                    continue
+                if key in self._seen[name]:
+                    errors.append(f"{name}: clave duplicada {key}")
+                keys.append((name, key))
+
+        if errors:
+            raise RowValidationError("; ".join(errors))
+        for name, key in keys:
+            self._seen[name].add(key)
+        return row
@@ -0,0 +1,206 @@
+"""Reads the table definitions declared in `sql/script.sql`.
+
+Only the subset of Oracle DDL used by the project is understood: column types,
+NOT NULL, DEFAULT, identity columns, the PRIMARY KEY / UNIQUE / FOREIGN KEY /
+CHECK table constraints and ``CREATE INDEX`` (including function-based keys).
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SCRIPT_PATH = Path(__file__).resolve().parents[3] / "sql" / "script.sql"
+
+# A CREATE TABLE block that does not itself contain another CREATE TABLE
+# (the script wraps the first table twice).
+_TABLE_RE = re.compile(
+    r"CREATE\s+TABLE\s+(\w+)\s*\(((?:(?!CREATE\s+TABLE).)*?)\n\s*\)\s*;",
+    re.IGNORECASE | re.DOTALL,
+)
+_COLUMN_RE = re.compile(
+    r"^(?P<name>\w+)\s+(?P<type>NUMBER|VARCHAR2|DATE)(?:\s*\((?P<size>\d+)\))?(?P<rest>.*)$",
+    re.IGNORECASE,
+)
+_DEFAULT_RE = re.compile(r"DEFAULT\s+('(?:[^']|'')*'|[\w.+-]+)", re.IGNORECASE)
+_CONSTRAINT_RE = re.compile(
+    r"^CONSTRAINT\s+(?P<name>\w+)\s+(?P<kind>PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK)\s*(?P<body>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_FK_RE = re.compile(r"\(([^)]*)\)\s*REFERENCES\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE)
+_INDEX_RE = re.compile(
+    r"CREATE\s+INDEX\s+(\w+)\s+ON\s+(\w+)\s*\((.*?)\)\s*;",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    type: str
+    size: Optional[int] = None
+    nullable: bool = True
+    default: Any = None
+    identity: bool = False
+
+    @property
+    def has_default(self) -> bool:
+        return self.default is not None
+
+
+@dataclass(frozen=True)
+class CheckConstraint:
+    name: str
+    expression: str
+
+
+@dataclass(frozen=True)
+class ForeignKey:
+    name: str
+    columns: Tuple[str, ...]
+    ref_table: str
+    ref_columns: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Index:
+    name: str
+    table: str
+    # column names or expressions such as ``lower(titulo)``
+    keys: Tuple[str, ...]
+
+
+@dataclass
+class Table:
+    name: str
+    columns: Dict[str, Column] = field(default_factory=dict)
+    primary_key: Tuple[str, ...] = ()
+    unique: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    foreign_keys: List[ForeignKey] = field(default_factory=list)
+    checks: List[CheckConstraint] = field(default_factory=list)
+
+    @property
+    def identity_column(self) -> Optional[str]:
+        for column in self.columns.values():
+            if column.identity:
+                return column.name
+        return None
+
+    def insert_columns(self, include_identity: bool = False) -> List[str]:
+        """Columns an INSERT should bind, in declaration order."""
+        return [c.name for c in self.columns.values() if include_identity or not c.identity]
+
+
+@dataclass
+class Schema:
+    tables: Dict[str, Table]
+    indexes: List[Index] = field(default_factory=list)
+
+    def table(self, name: str) -> Table:
+        try:
+            return self.tables[name.lower()]
+        except KeyError:
+            raise KeyError(f"La tabla '{name}' no está definida en sql/script.sql") from None
+
+
+def _split_top_level(body: str) -> List[str]:
+    """Split a CREATE TABLE body on commas that are not inside parentheses or quotes."""
+    parts: List[str] = []
+    depth = 0
+    in_quote = False
+    current: List[str] = []
+    for ch in body:
+        if ch == "'":
+            in_quote = not in_quote
+        elif not in_quote:
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+            elif ch == "," and depth == 0:
+                parts.append("".join(current).strip())
+                current = []
+                continue
+        current.append(ch)
+    tail = "".join(current).strip()
+    if tail:
+        parts.append(tail)
+    return parts
+
+
+def _names(text: str) -> Tuple[str, ...]:
+    return tuple(part.strip().lower() for part in text.split(",") if part.strip())
+
+
+def _parse_default(raw: str, column_type: str) -> Any:
+    if raw.startswith("'"):
+        return raw[1:-1].replace("''", "'")
+    if raw.upper() == "SYSDATE":
+        return date.today
+    if column_type == "NUMBER":
+        return float(raw) if "." in raw else int(raw)
+    return raw
+
+
+def _parse_table(name: str, body: str) -> Table:
+    table = Table(name=name.lower())
+    for item in _split_top_level(body):
+        item = " ".join(item.split())
+        constraint = _CONSTRAINT_RE.match(item)
+        if constraint:
+            kind = constraint.group("kind").upper().replace("  ", " ")
+            cname = constraint.group("name").lower()
+            rest = constraint.group("body").strip()
+            if kind.startswith("PRIMARY"):
+                table.primary_key = _names(rest.strip("() "))
+            elif kind == "UNIQUE":
+                table.unique[cname] = _names(rest.strip("() "))
+            elif kind.startswith("FOREIGN"):
+                fk = _FK_RE.search(rest)
+                if fk:
+                    table.foreign_keys.append(
+                        ForeignKey(cname, _names(fk.group(1)), fk.group(2).lower(), _names(fk.group(3)))
+                    )
+            else:
+                table.checks.append(CheckConstraint(cname, rest[1:-1].strip()))
+            continue
+
+        column = _COLUMN_RE.match(item)
+        if not column:
+            continue
+        column_type = column.group("type").upper()
+        rest = column.group("rest")
+        identity = "AS IDENTITY" in rest.upper()
+        default_match = None if identity else _DEFAULT_RE.search(rest)
+        table.columns[column.group("name").lower()] = Column(
+            name=column.group("name").lower(),
+            type=column_type,
+            size=int(column.group("size")) if column.group("size") else None,
+            nullable="NOT NULL" not in rest.upper(),
+            default=_parse_default(default_match.group(1), column_type) if default_match else None,
+            identity=identity,
+        )
+    return table
+
+
+def parse_schema(ddl: str) -> Schema:
+    """Parse DDL text into a :class:`Schema`."""
+    tables: Dict[str, Table] = {}
+    for match in _TABLE_RE.finditer(ddl):
+        table = _parse_table(match.group(1), match.group(2))
+        tables[table.name] = table
+    indexes = [
+        Index(name.lower(), table.lower(), tuple(" ".join(key.split()).lower() for key in _split_top_level(keys)))
+        for name, table, keys in _INDEX_RE.findall(ddl)
+    ]
+    return Schema(tables=tables, indexes=indexes)
+
+
+@lru_cache(maxsize=None)
+def load_schema(path: Optional[Path] = None) -> Schema:
+    """Parse `sql/script.sql` (or ``path``) once per process."""
+    script = Path(path) if path else DEFAULT_SCRIPT_PATH
+    return parse_schema(script.read_text(encoding="utf-8"))
@@ -0,0 +1,381 @@
+"""Embedded SQLite backend that mirrors the schema in `sql/script.sql`.
+
+Lets the app, the e2e scripts and the benchmarks run without Autonomous DB.
+The connection and cursor wrappers expose the subset of the ``oracledb`` API
+the repositories use (context managers, named binds, ``cursor.var()`` with
+``RETURNING ... INTO``, ``executemany(batcherrors=True)``), and the few Oracle
+constructs found in our SQL are rewritten on the fly:
+
+* ``ORA_ROWSCN`` reads a per-row change counter kept by triggers (the
+  whole-table ``COUNT(*), MAX(ORA_ROWSCN)`` change token reads the counters
+  of the table at once instead of looking one up per row);
+* ``user_tab_columns`` is a view over ``pragma_table_info``;
+* ``SYSDATE``, ``NVL``, ``FROM DUAL`` and ``FETCH FIRST n ROWS ONLY``.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.infrastructure.database.schema import Schema, Table, load_schema
+
+DEFAULT_SQLITE_FILENAME = "festival.sqlite3"
+
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_adapter(Decimal, lambda value: int(value) if value == value.to_integral_value() else float(value))
+
+
+def _convert_date(raw: bytes) -> Any:
+    # Oracle DATE values come back as datetime
+    text = raw.decode()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+
+sqlite3.register_converter("DATE", _convert_date)
+
+
+# --------------------------------------------------------------------------- DDL
+
+def _column_ddl(table: Table, name: str, inline_pk: bool) -> str:
+    column = table.columns[name]
+    if inline_pk:
+        return f"{name} INTEGER PRIMARY KEY"
+    parts = [name, f"VARCHAR2({column.size})" if column.type == "VARCHAR2" and column.size else column.type]
+    if column.default is not None:
+        if callable(column.default):
+            parts.append("DEFAULT (datetime('now', 'localtime'))")
+        elif isinstance(column.default, str):
+            parts.append("DEFAULT '" + column.default.replace("'", "''") + "'")
+        else:
+            parts.append(f"DEFAULT {column.default}")
+    if not column.nullable:
+        parts.append("NOT NULL")
+    if column.type == "VARCHAR2" and column.size:
+        parts.append(f"CHECK (length({name}) <= {column.size})")
+    return " ".join(parts)
+
+
+def _scn_triggers(table: str) -> List[str]:
+    bump = "UPDATE _scn_counter SET value = value + 1;"
+    track = (
+        "INSERT OR REPLACE INTO _rowscn (table_name, rid, scn) "
+        f"VALUES ('{table}', NEW.rowid, (SELECT value FROM _scn_counter));"
+    )
+    forget = f"DELETE FROM _rowscn WHERE table_name = '{table}' AND rid = OLD.rowid;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS _scn_{table}_ins AFTER INSERT ON {table} BEGIN {bump} {track} END",
+        f"CREATE TRIGGER IF NOT EXISTS _scn_{table}_upd AFTER UPDATE ON {table} BEGIN {forget} {bump} {track} END",
+        f"CREATE TRIGGER IF NOT EXISTS _scn_{table}_del AFTER DELETE ON {table} BEGIN {forget} END",
+    ]
+
+
+def sqlite_ddl(schema: Schema) -> List[str]:
+    """Translate the parsed Oracle schema into SQLite statements (idempotent)."""
+    statements = [
+        "CREATE TABLE IF NOT EXISTS _scn_counter (value INTEGER NOT NULL)",
+        "INSERT INTO _scn_counter (value) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM _scn_counter)",
+        "CREATE TABLE IF NOT EXISTS _rowscn ("
+        " table_name TEXT NOT NULL, rid INTEGER NOT NULL, scn INTEGER NOT NULL,"
+        " PRIMARY KEY (table_name, rid)) WITHOUT ROWID",
+    ]
+    for table in schema.tables.values():
+        identity = table.identity_column
+        inline_pk = identity is not None and table.primary_key == (identity,)
+        lines = [_column_ddl(table, name, inline_pk and name == identity) for name in table.columns]
+        if table.primary_key and not inline_pk:
+            lines.append(f"CONSTRAINT pk_{table.name} PRIMARY KEY ({', '.join(table.primary_key)})")
+        for name, columns in table.unique.items():
+            lines.append(f"CONSTRAINT {name} UNIQUE ({', '.join(columns)})")
+        for fk in table.foreign_keys:
+            lines.append(
+                f"CONSTRAINT {fk.name} FOREIGN KEY ({', '.join(fk.columns)}) "
+                f"REFERENCES {fk.ref_table} ({', '.join(fk.ref_columns)})"
+            )
+        for check in table.checks:
+            lines.append(f"CONSTRAINT {check.name} CHECK ({check.expression})")
+        statements.append(f"CREATE TABLE IF NOT EXISTS {table.name} (\n    " + ",\n    ".join(lines) + "\n)")
+        statements.extend(_scn_triggers(table.name))
+    for index in schema.indexes:
+        statements.append(f"CREATE INDEX IF NOT EXISTS {index.name} ON {index.table} ({', '.join(index.keys)})")
+    statements.append(
+        "CREATE VIEW IF NOT EXISTS user_tab_columns AS "
+        "SELECT upper(m.name) AS table_name, upper(p.name) AS column_name, "
+        "upper(p.type) AS data_type, p.cid + 1 AS column_id "
+        "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+        "WHERE m.type = 'table' AND substr(m.name, 1, 1) <> '_' AND m.name NOT LIKE 'sqlite%'"
+    )
+    return statements
+
+
+# ----------------------------------------------------------------- SQL rewrite
+
+class _Translation(NamedTuple):
+    sql: str
+    returning_bind: Optional[str]
+
+
+_RETURNING_RE = re.compile(r"\s+RETURNING\s+\w+\s+INTO\s+:(\w+)\s*$", re.IGNORECASE)
+_FROM_RE = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"^\s*SELECT\s+COUNT\(\*\)\s*,\s*MAX\(\s*ORA_ROWSCN\s*\)\s+FROM\s+(\w+)\s*$", re.IGNORECASE)
+_REWRITES: Sequence[Tuple[re.Pattern, str]] = (
+    (re.compile(r"\s+FROM\s+DUAL\b", re.IGNORECASE), ""),
+    (re.compile(r"\bSYSDATE\b", re.IGNORECASE), "datetime('now', 'localtime')"),
+    (re.compile(r"\bNVL\s*\(", re.IGNORECASE), "IFNULL("),
+    (re.compile(r"\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+ONLY\b", re.IGNORECASE), r"LIMIT \1"),
+)
+
+
+@lru_cache(maxsize=512)
+def translate(sql: str) -> _Translation:
+    """Rewrite the Oracle-only parts of ``sql`` for SQLite."""
+    returning_bind = None
+    match = _RETURNING_RE.search(sql)
+    if match:
+        returning_bind = match.group(1)
+        sql = sql[: match.start()]
+    for pattern, replacement in _REWRITES:
+        sql = pattern.sub(replacement, sql)
+    token = _TOKEN_RE.match(sql)
+    if token:
+        # _rowscn holds one counter per live row, so its maximum is the table's
+        table = token.group(1).lower()
+        sql = f"SELECT COUNT(*), (SELECT MAX(_r.scn) FROM _rowscn _r WHERE _r.table_name = '{table}') FROM {table}"
+    elif re.search(r"\bORA_ROWSCN\b", sql, re.IGNORECASE):
+        source = _FROM_RE.search(sql)
+        if source:
+            table = source.group(1).lower()
+            sql = re.sub(
+                r"\bORA_ROWSCN\b",
+                f"(SELECT _r.scn FROM _rowscn _r WHERE _r.table_name = '{table}' AND _r.rid = {table}.rowid)",
+                sql,
+                flags=re.IGNORECASE,
+            )
+    return _Translation(sql, returning_bind)
+
+
+# ------------------------------------------------------------ driver wrappers
+
+class BatchError(NamedTuple):
+    """Same shape as the entries of ``oracledb.Cursor.getbatcherrors()``."""
+
+    offset: int
+    message: str
+
+
+class _Var:
+    """Stand-in for ``oracledb.Var`` used by ``RETURNING ... INTO``."""
+
+    def __init__(self, type_: Any = None) -> None:
+        self.type = type_
+        self._value: Any = None
+
+    def getvalue(self, pos: int = 0) -> Any:
+        return self._value
+
+    def setvalue(self, pos: int, value: Any) -> None:
+        self._value = value
+
+
+class SqliteCursor:
+    """Cursor wrapper with the ``oracledb`` calling conventions used by the repositories."""
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+        self._batch_errors: List[BatchError] = []
+
+    def __enter__(self) -> "SqliteCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def arraysize(self) -> int:
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value: int) -> None:
+        self._cursor.arraysize = value
+
+    def var(self, type_: Any = None, *args, **kwargs) -> _Var:
+        return _Var(type_)
+
+    def execute(self, sql: str, parameters: Any = None, **kwargs: Any) -> "SqliteCursor":
+        translation = translate(sql)
+        binds = parameters if parameters is not None else kwargs
+        out_var = None
+        if isinstance(binds, dict):
+            if translation.returning_bind:
+                out_var = binds.get(translation.returning_bind)
+            binds = {k: v for k, v in binds.items() if not isinstance(v, _Var)}
+        self._cursor.execute(translation.sql, binds if binds else ())
+        if out_var is not None:
+            out_var.setvalue(0, [self._cursor.lastrowid])
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any], batcherrors: bool = False, **kwargs: Any) -> None:
+        translation = translate(sql)
+        rows = list(seq_of_parameters)
+        self._batch_errors = []
+        if not batcherrors:
+            self._cursor.executemany(translation.sql, rows)
+            return
+        connection = self._cursor.connection
+        if not connection.in_transaction:
+            self._cursor.execute("BEGIN")
+        self._cursor.execute("SAVEPOINT batch")
+        try:
+            self._cursor.executemany(translation.sql, rows)
+            self._cursor.execute("RELEASE batch")
+            return
+        except sqlite3.DatabaseError:
+            self._cursor.execute("ROLLBACK TO batch")
+            self._cursor.execute("RELEASE batch")
+        # slow path: find the offending rows one by one, keep the rest
+        for offset, row in enumerate(rows):
+            self._cursor.execute("SAVEPOINT batch_row")
+            try:
+                self._cursor.execute(translation.sql, row)
+            except sqlite3.DatabaseError as exc:
+                self._cursor.execute("ROLLBACK TO batch_row")
+                self._batch_errors.append(BatchError(offset, str(exc)))
+            self._cursor.execute("RELEASE batch_row")
+
+    def getbatcherrors(self) -> List[BatchError]:
+        return list(self._batch_errors)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchmany(self, size: Optional[int] = None):
+        return self._cursor.fetchmany(size if size is not None else self._cursor.arraysize)
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def close(self) -> None:
+        self._cursor.close()
+
+
+class SqliteDbConnection:
+    """Connection wrapper; closing on ``__exit__`` like ``oracledb.Connection``."""
+
+    version = sqlite3.sqlite_version
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection = connection
+
+    def __enter__(self) -> "SqliteDbConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def cursor(self) -> SqliteCursor:
+        return SqliteCursor(self._connection.cursor())
+
+    def commit(self) -> None:
+        self._connection.commit()
+
+    def rollback(self) -> None:
+        self._connection.rollback()
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class SqliteConnection:
+    """Connection factory for a local SQLite database (``":memory:"`` is supported)."""
+
+    dialect = "sqlite"
+    _initialized: set = set()
+    _init_lock = threading.Lock()
+
+    def __init__(self, path: Path | str = ":memory:", schema: Optional[Schema] = None) -> None:
+        self._anchor: Optional[sqlite3.Connection] = None
+        if str(path) == ":memory:":
+            # shared-cache URI so every get_connection() sees the same database;
+            # the anchor connection keeps it alive for the lifetime of this object
+            self._target = f"file:festival-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            self._uri = True
+            self._anchor = self._connect()
+        else:
+            self._target = str(Path(path).resolve())
+            self._uri = False
+        self._ensure_schema(schema or load_schema())
+
+    @classmethod
+    def from_settings(cls, settings_path: Path) -> "SqliteConnection":
+        """Create an instance from ``sqlite_path`` in the settings file (relative to it)."""
+        data: Dict[str, Any] = {}
+        if settings_path.exists():
+            with settings_path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        raw_path = data.get("sqlite_path") or DEFAULT_SQLITE_FILENAME
+        if raw_path == ":memory:":
+            return cls(raw_path)
+        path = Path(raw_path)
+        if not path.is_absolute():
+            path = settings_path.parent / path
+        return cls(path)
+
+    @property
+    def path(self) -> str:
+        return self._target
+
+    def get_connection(self) -> SqliteDbConnection:
+        return SqliteDbConnection(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._target,
+            uri=self._uri,
+            timeout=30,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    def _ensure_schema(self, schema: Schema) -> None:
+        key = (self._target, id(schema))
+        with self._init_lock:
+            if key in self._initialized:
+                return
+            connection = self._connect()
+            try:
+                if not self._uri:
+                    connection.execute("PRAGMA journal_mode = WAL")
+                for statement in sqlite_ddl(schema):
+                    connection.execute(statement)
+                connection.commit()
+            finally:
+                connection.close()
+            self._initialized.add(key)
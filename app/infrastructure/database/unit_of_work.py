@@ -0,0 +1,205 @@
+"""One connection and one transaction shared by several repositories.
+
+:class:`UnitOfWork` is itself a connection factory, so any repository is
+enlisted by being built on it instead of on the application's factory::
+
+    with UnitOfWork(connection_factory) as uow:
+        id_funcion = FuncionRepository(uow).add(funcion)
+        proyecciones = ProyeccionRepository(uow)
+        for orden, id_pelicula in enumerate(peliculas, start=1):
+            proyecciones.add(Proyeccion(id_funcion, id_pelicula, orden))
+    # committed once here; rolled back if the block raised
+
+Every ``get_connection()`` returns the same session (a pooled one when the
+factory pools): leaving the repository's ``with`` does not close it, and the
+repository's ``commit()`` is deferred to the end of the unit, so N writes
+cost one connect and one commit instead of N of each.
+
+``savepoint()`` nests a partial rollback point (``SAVEPOINT`` /
+``ROLLBACK TO SAVEPOINT``, valid on Oracle and SQLite). Several repositories
+log and swallow their errors, so the unit watches the statements itself: a
+statement that fails, or a repository ``rollback()``, marks the innermost
+savepoint as failed (it is rolled back when its block ends) or, outside any
+savepoint, aborts the unit: everything is rolled back and ``commit()``
+raises :class:`TransactionAborted` instead of committing what remains.
+"""
+from __future__ import annotations
+
+import itertools
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional
+
+from app.infrastructure.database.backend import ConnectionFactory
+
+_savepoint_names = itertools.count(1)
+
+
+class TransactionAborted(RuntimeError):
+    """The unit of work was rolled back by one of its repositories and cannot commit."""
+
+
+@dataclass
+class Savepoint:
+    name: str
+    # a statement inside it failed or a repository rolled back: undone when the block ends
+    failed: bool = False
+
+
+class _SharedCursor:
+    """Cursor that reports failed statements to its unit of work."""
+
+    def __init__(self, unit: "UnitOfWork", cursor: Any) -> None:
+        self._unit = unit
+        self._cursor = cursor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __enter__(self) -> "_SharedCursor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._cursor.close()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return self._cursor.execute(*args, **kwargs)
+        except Exception:
+            self._unit._statement_failed()
+            raise
+
+    def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return self._cursor.executemany(*args, **kwargs)
+        except Exception:
+            self._unit._statement_failed()
+            raise
+
+
+class _SharedConnection:
+    """The unit's session as seen by a repository: ``close`` and ``commit`` are deferred."""
+
+    def __init__(self, unit: "UnitOfWork", connection: Any) -> None:
+        self._unit = unit
+        self._connection = connection
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> "_SharedConnection":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def cursor(self) -> _SharedCursor:
+        return _SharedCursor(self._unit, self._connection.cursor())
+
+    def commit(self) -> None:
+        self._unit.deferred_commits += 1
+
+    def rollback(self) -> None:
+        self._unit._statement_failed()
+
+    def close(self) -> None:
+        pass
+
+
+class UnitOfWork:
+    """Connection factory proxy running every repository call in one transaction."""
+
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
+        self._factory = connection_factory
+        self._connection: Optional[Any] = None
+        self._savepoints: List[Savepoint] = []
+        self._aborted = False
+        # repository commit() calls folded into the final commit
+        self.deferred_commits = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # dialect, path, ... of the wrapped factory
+        return getattr(self._factory, name)
+
+    @property
+    def wrapped(self) -> ConnectionFactory:
+        return self._factory
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+
+    def get_connection(self) -> _SharedConnection:
+        return _SharedConnection(self, self._connection_or_open())
+
+    def commit(self) -> None:
+        """Commit everything done so far; the unit can be reused afterwards."""
+        if self._aborted:
+            raise TransactionAborted("La transacción fue revertida por un error previo; no se confirmó nada")
+        if self._connection is not None:
+            self._connection.commit()
+        self._savepoints.clear()
+
+    def rollback(self) -> None:
+        """Undo everything since the last commit."""
+        if self._connection is not None:
+            self._connection.rollback()
+        self._savepoints.clear()
+        self._aborted = False
+
+    def close(self) -> None:
+        """Return the session to its factory (uncommitted work is rolled back by the driver)."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+    @contextmanager
+    def savepoint(self, name: Optional[str] = None) -> Iterator[Savepoint]:
+        """Roll back to this point if the block raises or one of its statements failed.
+
+        An exception propagates; a swallowed failure is reported by the
+        yielded :class:`Savepoint` (``failed``) and the unit goes on.
+        """
+        savepoint = Savepoint(name or f"uow_sp{next(_savepoint_names)}")
+        self._execute(f"SAVEPOINT {savepoint.name}")
+        self._savepoints.append(savepoint)
+        try:
+            yield savepoint
+        except BaseException:
+            savepoint.failed = True
+            raise
+        finally:
+            # commit()/rollback() inside the block already released it
+            active = any(sp is savepoint for sp in self._savepoints)
+            if active:
+                del self._savepoints[[id(sp) for sp in self._savepoints].index(id(savepoint)):]
+            if active and savepoint.failed and self._connection is not None:
+                self._execute(f"ROLLBACK TO SAVEPOINT {savepoint.name}")
+
+    def _statement_failed(self) -> None:
+        if self._savepoints:
+            self._savepoints[-1].failed = True
+            return
+        if self._connection is not None:
+            self._connection.rollback()
+        self._aborted = True
+
+    def _execute(self, sql: str) -> None:
+        with self._connection_or_open().cursor() as cursor:
+            cursor.execute(sql)
+
+    def _connection_or_open(self) -> Any:
+        if self._connection is None:
+            self._connection = self._factory.get_connection()
+        return self._connection
@@ -0,0 +1,184 @@
+"""Opt-in cProfile + tracemalloc sessions around UI actions.
+
+Enabled with ``"profile": true`` in ``settings.json`` or ``FESTIVAL_PROFILE=1``.
+Each profiled action (``MainWindow._set_entity``, viewmodel loads and the
+add/update/delete calls made when a dialog is submitted) writes two files to
+``"profile_dir"`` (``config/profiles`` by default):
+
+* ``<timestamp>_<action>.txt``: wall time, peak traced memory, the top
+  functions by cumulative time and the lines that allocated the most;
+* ``<timestamp>_<action>.prof``: raw ``pstats`` data for snakeviz & co.
+
+Only one session runs at a time: actions started while another one is being
+profiled (e.g. the ``load_*`` inside ``_set_entity``, or a background thread)
+run unprofiled and show up inside the outer report. When profiling is off the
+wrappers cost one attribute check per call.
+"""
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+PROFILE_ENV_VAR = "FESTIVAL_PROFILE"
+DEFAULT_PROFILE_DIR = "profiles"
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 15
+# frames kept per allocation; 1 keeps tracemalloc's overhead low
+TRACEMALLOC_FRAMES = 1
+# viewmodel methods profiled as actions: loads, Recargar and dialog submissions
+VIEWMODEL_ACTIONS = ("load_", "refresh_", "add_", "update_", "delete_")
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_UNSAFE_FILENAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+class Profiler:
+    """Holds the profiling switch and output directory; runs one session at a time."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output_dir = Path(DEFAULT_PROFILE_DIR)
+        self._busy = threading.Lock()
+
+    def configure(self, settings_path: Path) -> None:
+        """Read ``profile`` / ``profile_dir`` from ``settings_path`` (env var wins)."""
+        settings_path = Path(settings_path)
+        data: Dict[str, Any] = {}
+        if settings_path.exists():
+            with settings_path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        env = os.environ.get(PROFILE_ENV_VAR)
+        self.enabled = env.lower() not in ("", "0", "false", "no") if env is not None else bool(data.get("profile"))
+        output_dir = Path(data.get("profile_dir") or DEFAULT_PROFILE_DIR)
+        if not output_dir.is_absolute():
+            output_dir = settings_path.parent / output_dir
+        self.output_dir = output_dir
+        if self.enabled:
+            logger.info("Profiling enabled; reports in %s", self.output_dir)
+
+    def run(self, action: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``func`` inside a profiling session named ``action`` (if none is running)."""
+        if not self._busy.acquire(blocking=False):
+            return func(*args, **kwargs)
+        try:
+            return self._session(action, func, args, kwargs)
+        finally:
+            self._busy.release()
+
+    def _session(self, action: str, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            if started_tracing:
+                tracemalloc.stop()
+            try:
+                self._write_report(action, elapsed, peak, before, after, profile, error)
+            except OSError as exc:
+                logger.warning("Could not write profile for %s: %s", action, exc)
+
+    def _write_report(
+        self,
+        action: str,
+        elapsed: float,
+        peak: int,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+        profile: cProfile.Profile,
+        error: Optional[BaseException],
+    ) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{datetime.now():%Y%m%d-%H%M%S-%f}_{_UNSAFE_FILENAME.sub('_', action)}"
+        report_path = self.output_dir / f"{stem}.txt"
+        profile.dump_stats(str(self.output_dir / f"{stem}.prof"))
+
+        # snapshots exclude tracemalloc's own bookkeeping
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        net = sum(stat.size_diff for stat in diff)
+
+        stats_text = io.StringIO()
+        stats = pstats.Stats(profile, stream=stats_text)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+
+        lines = [
+            f"Acción: {action}",
+            f"Fecha: {datetime.now().isoformat(timespec='seconds')}",
+            f"Tiempo total: {elapsed * 1000:.1f} ms",
+            f"Pico de memoria (tracemalloc): {peak / 1024:.1f} KiB",
+            f"Memoria neta asignada: {net / 1024:+.1f} KiB",
+        ]
+        if error is not None:
+            lines.append(f"Error: {type(error).__name__}: {error}")
+        lines += ["", f"== Funciones (top {TOP_FUNCTIONS} por tiempo acumulado) ==", stats_text.getvalue().strip(), ""]
+        lines.append(f"== Asignaciones (top {TOP_ALLOCATIONS} por tamaño neto) ==")
+        for stat in diff[:TOP_ALLOCATIONS]:
+            lines.append(str(stat))
+        report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        logger.info("Profile for %s: %.1f ms -> %s", action, elapsed * 1000, report_path)
+        return report_path
+
+
+PROFILER = Profiler()
+
+
+def profiled(action: Optional[str] = None, detail: Optional[Callable[..., str]] = None) -> Callable[[F], F]:
+    """Decorator profiling calls of a function while ``PROFILER.enabled``.
+
+    ``action`` defaults to the qualified name; ``detail(*args, **kwargs)`` may
+    add a suffix from the arguments (e.g. the entity being opened).
+    """
+
+    def decorate(func: F) -> F:
+        name = action or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            label = f"{name}.{detail(*args, **kwargs)}" if detail is not None else name
+            return PROFILER.run(label, func, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def profile_actions(*prefixes: str) -> Callable[[type], type]:
+    """Class decorator applying :func:`profiled` to methods starting with ``prefixes``."""
+
+    def decorate(cls: type) -> type:
+        for name, member in list(vars(cls).items()):
+            if callable(member) and name.startswith(prefixes):
+                setattr(cls, name, profiled(f"{cls.__name__}.{name}")(member))
+        return cls
+
+    return decorate
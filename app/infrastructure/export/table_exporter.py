@@ -0,0 +1,113 @@
+"""Streams repository rows to CSV or JSON Lines files in constant memory."""
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+EXPORT_FORMATS = ("csv", "jsonl")
+
+ProgressCallback = Callable[[int, int], None]
+CancelCheck = Callable[[], bool]
+
+
+@dataclass
+class ExportResult:
+    """Outcome of an export run."""
+
+    path: Path
+    rows: int
+    cancelled: bool = False
+
+
+def format_from_path(path: Path) -> str:
+    """Guess the export format from the file extension (defaults to CSV)."""
+    return "jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv"
+
+
+def _to_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return str(value)
+
+
+def export_table(
+    repository,
+    destination: Path,
+    fmt: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    is_cancelled: Optional[CancelCheck] = None,
+) -> ExportResult:
+    """Write every row served by ``repository.stream_rows()`` to ``destination``.
+
+    Rows go from the cursor to the file one ``fetchmany`` batch at a time, so
+    memory use does not depend on the table size. ``progress`` receives
+    ``(rows_written, total_rows)`` after each batch; ``total_rows`` is 0 when the
+    repository cannot count. If ``is_cancelled`` returns True the partial file is
+    removed and the result is flagged as cancelled.
+    """
+    destination = Path(destination)
+    fmt = (fmt or format_from_path(destination)).lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportación no soportado: {fmt}")
+
+    total = 0
+    if progress is not None and hasattr(repository, "count"):
+        try:
+            total = repository.count()
+        except Exception:
+            total = 0
+
+    tmp_path = destination.with_name(destination.name + ".part")
+    written = 0
+    cancelled = False
+    try:
+        with repository.stream_rows(batch_size=batch_size) as stream, tmp_path.open(
+            "w", encoding="utf-8", newline=""
+        ) as out:
+            columns = stream.columns
+            if fmt == "csv":
+                writer = csv.writer(out)
+                writer.writerow(columns)
+            for batch in stream.batches():
+                if is_cancelled is not None and is_cancelled():
+                    cancelled = True
+                    break
+                if fmt == "csv":
+                    writer.writerows([_to_text(v) for v in row] for row in batch)
+                else:
+                    out.writelines(
+                        json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + "\n"
+                        for row in batch
+                    )
+                written += len(batch)
+                if progress is not None:
+                    progress(written, total)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if cancelled:
+        tmp_path.unlink(missing_ok=True)
+        return ExportResult(path=destination, rows=written, cancelled=True)
+
+    os.replace(tmp_path, destination)
+    return ExportResult(path=destination, rows=written)
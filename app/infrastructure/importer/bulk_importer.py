@@ -0,0 +1,164 @@
+"""Streams CSV / JSON Lines files into a repository in validated batches."""
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.infrastructure.database.row_validator import RowValidationError, RowValidator
+from app.infrastructure.database.schema import load_schema
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+IMPORT_FORMATS = ("csv", "jsonl")
+ERROR_FIELD = "_error"
+
+ProgressCallback = Callable[[int, int, int], None]
+CancelCheck = Callable[[], bool]
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import run."""
+
+    source: Path
+    read: int = 0
+    inserted: int = 0
+    rejected: int = 0
+    errors_path: Optional[Path] = None
+    cancelled: bool = False
+
+
+def format_from_path(path: Path) -> str:
+    """Guess the input format from the file extension (defaults to CSV)."""
+    return "jsonl" if path.suffix.lower() in (".jsonl", ".ndjson") else "csv"
+
+
+def read_records(path: Path, fmt: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per record without loading the whole file.
+
+    Keys are lower-cased so headers written by ``export_table`` or by hand
+    (``ID_CIUDAD``) both match the schema.
+    """
+    fmt = (fmt or format_from_path(path)).lower()
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Formato de importación no soportado: {fmt}")
+    with Path(path).open("r", encoding="utf-8-sig", newline="") as handle:
+        if fmt == "csv":
+            for record in csv.DictReader(handle):
+                yield {(k or "").strip().lower(): v for k, v in record.items()}
+        else:
+            for line_no, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as exc:
+                    yield {ERROR_FIELD: f"línea {line_no}: JSON inválido ({exc.msg})", "_raw": line.rstrip("\n")}
+                    continue
+                yield {str(k).lower(): v for k, v in record.items()}
+
+
+class _ErrorWriter:
+    """Appends rejected records to a side file, opened only on the first error."""
+
+    def __init__(self, path: Path, fmt: str) -> None:
+        self.path = path
+        self._fmt = fmt
+        self._handle = None
+        self._writer = None
+        self.count = 0
+
+    def write(self, record: Dict[str, Any], message: str) -> None:
+        row = {k: v for k, v in record.items() if k != ERROR_FIELD}
+        row[ERROR_FIELD] = message
+        if self._handle is None:
+            self._handle = self.path.open("w", encoding="utf-8", newline="")
+            if self._fmt == "csv":
+                self._writer = csv.DictWriter(self._handle, fieldnames=list(row), extrasaction="ignore")
+                self._writer.writeheader()
+        if self._fmt == "csv":
+            self._writer.writerow(row)
+        else:
+            self._handle.write(json.dumps(row, default=str, ensure_ascii=False) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+
+def default_errors_path(source: Path) -> Path:
+    source = Path(source)
+    return source.with_name(f"{source.stem}.errors{source.suffix or '.csv'}")
+
+
+def import_table(
+    repository,
+    table: str,
+    source: Path,
+    fmt: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    errors_path: Optional[Path] = None,
+    keep_ids: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    is_cancelled: Optional[CancelCheck] = None,
+    on_duplicate: Optional[str] = None,
+) -> ImportResult:
+    """Validate the records in ``source`` and insert them through ``repository.add_many``.
+
+    Records are read lazily and checked against the DDL of ``table`` before
+    they reach the database; each batch is a single ``executemany`` with one
+    commit, and rows the database still rejects do not abort the batch. Every
+    rejected record is written to ``errors_path`` (default
+    ``<nombre>.errors.<ext>``) with the reason in an ``_error`` column.
+    Identity columns are ignored unless ``keep_ids`` is True. ``progress``
+    receives ``(read, inserted, rejected)`` after each batch. ``on_duplicate``
+    is passed to repositories that pre-screen unique keys (``"reject"`` or
+    ``"merge"``; merged rows count as inserted).
+    """
+    source = Path(source)
+    fmt = (fmt or format_from_path(source)).lower()
+    validator = RowValidator(load_schema().table(table), include_identity=keep_ids)
+    errors = _ErrorWriter(Path(errors_path) if errors_path else default_errors_path(source), fmt)
+    result = ImportResult(source=source)
+    batch: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    options = {"on_duplicate": on_duplicate} if on_duplicate else {}
+
+    def flush() -> None:
+        if not batch:
+            return
+        rejected = repository.add_many([row for row, _ in batch], **options)
+        for offset, message in rejected:
+            errors.write(batch[offset][1], message)
+        result.inserted += len(batch) - len(rejected)
+        batch.clear()
+        if progress is not None:
+            progress(result.read, result.inserted, errors.count)
+
+    try:
+        for record in read_records(source, fmt):
+            result.read += 1
+            if ERROR_FIELD in record:
+                errors.write(record, record[ERROR_FIELD])
+                continue
+            try:
+                batch.append((validator.validate(record), record))
+            except RowValidationError as exc:
+                errors.write(record, str(exc))
+                continue
+            if len(batch) >= batch_size:
+                if is_cancelled is not None and is_cancelled():
+                    result.cancelled = True
+                    break
+                flush()
+        if not result.cancelled:
+            flush()
+    finally:
+        errors.close()
+
+    result.rejected = errors.count
+    if errors.count:
+        result.errors_path = errors.path
+    return result
@@ -0,0 +1,182 @@
+"""Loads a root row plus its child collections for the detail dialogs.
+
+On Oracle the root and every child query are opened as ``SYS_REFCURSOR`` out
+binds of one anonymous PL/SQL block. Each REF CURSOR is a driver cursor with
+``prefetchrows`` set before the call, so its first ``CHILD_PREFETCH_ROWS``
+rows come back with the block's single round trip. Other backends (the local
+SQLite file) run the same SELECTs one after another on one connection.
+
+Children are returned as display rows (headers + tuples, joined with the
+names the user recognises), not domain objects: the dialogs only list them.
+Child queries on ``evaluacion`` name its película FK ``{evaluacion_fk}``;
+it is resolved per schema like ``EvaluacionRepository`` does.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory, dialect_of
+from app.infrastructure.repositories.table_metadata import TABLE_METADATA, resolve_evaluacion_columns
+
+# rows of each child returned with the PL/SQL round trip; more are fetched on demand
+CHILD_PREFETCH_ROWS = 500
+
+
+@dataclass(frozen=True)
+class ChildQuery:
+    """One child collection: ``sql`` selects display columns for the root ``:id``.
+
+    ``{evaluacion_fk}`` in ``sql`` stands for ``evaluacion``'s película FK column.
+    """
+
+    name: str
+    title: str
+    headers: Tuple[str, ...]
+    sql: str
+
+
+@dataclass
+class ChildRows:
+    title: str
+    headers: Tuple[str, ...]
+    rows: List[Tuple[Any, ...]]
+
+
+@dataclass
+class Aggregate:
+    entity: str
+    key: Any
+    root: Optional[Any]
+    children: Dict[str, ChildRows] = field(default_factory=dict)
+
+
+AGGREGATES: Dict[str, Tuple[ChildQuery, ...]] = {
+    "funcion": (
+        ChildQuery(
+            "proyecciones", "Películas proyectadas", ("Orden", "ID Película", "Título", "Comentarios"),
+            "SELECT p.orden_proyeccion, p.id_pelicula, pe.titulo, p.comentarios "
+            "FROM proyeccion p JOIN pelicula pe ON pe.id_pelicula = p.id_pelicula "
+            "WHERE p.id_funcion = :id ORDER BY p.orden_proyeccion, p.id_pelicula",
+        ),
+        ChildQuery(
+            "asistencias", "Asistencias", ("ID Asistente", "Nombre", "Entradas", "Fecha compra", "Método de pago"),
+            "SELECT a.id_asistente, s.nombre, a.entradas, a.fecha_compra, a.metodo_pago "
+            "FROM asistencia a JOIN asistente s ON s.id_asistente = a.id_asistente "
+            "WHERE a.id_funcion = :id ORDER BY a.fecha_compra DESC, a.id_asistente",
+        ),
+        ChildQuery(
+            "jurados", "Jurados", ("ID Jurado", "Nombre", "Rol", "Comentarios"),
+            "SELECT pj.id_jurado, j.nombre, pj.rol_participacion, pj.comentarios "
+            "FROM participacion_jurado pj JOIN jurado j ON j.id_jurado = pj.id_jurado "
+            "WHERE pj.id_funcion = :id ORDER BY j.nombre",
+        ),
+    ),
+    "pelicula": (
+        ChildQuery(
+            "funciones", "Funciones", ("ID Función", "Fecha", "Hora", "Estado", "ID Sede"),
+            "SELECT f.id_funcion, f.fecha, f.hora, f.estado_funcion, f.id_sede "
+            "FROM proyeccion p JOIN funcion f ON f.id_funcion = p.id_funcion "
+            "WHERE p.id_pelicula = :id ORDER BY f.fecha, f.hora",
+        ),
+        ChildQuery(
+            "evaluaciones", "Evaluaciones", ("ID Jurado", "Jurado", "Puntuación", "Categoría", "Comentario"),
+            "SELECT e.id_jurado, j.nombre, e.puntuacion, e.categoria_evaluada, e.comentario "
+            "FROM evaluacion e JOIN jurado j ON j.id_jurado = e.id_jurado "
+            "WHERE e.{evaluacion_fk} = :id ORDER BY e.puntuacion DESC, j.nombre",
+        ),
+        ChildQuery(
+            "premios", "Premios", ("Edición", "Categoría", "Posición", "Descripción"),
+            "SELECT edicion, categoria, posicion, descripcion FROM premiacion "
+            "WHERE id_pelicula = :id ORDER BY edicion DESC, posicion",
+        ),
+    ),
+    "jurado": (
+        ChildQuery(
+            "participaciones", "Funciones", ("ID Función", "Fecha", "Hora", "Rol"),
+            "SELECT f.id_funcion, f.fecha, f.hora, pj.rol_participacion "
+            "FROM participacion_jurado pj JOIN funcion f ON f.id_funcion = pj.id_funcion "
+            "WHERE pj.id_jurado = :id ORDER BY f.fecha, f.hora",
+        ),
+        ChildQuery(
+            "evaluaciones", "Evaluaciones", ("ID Película", "Título", "Puntuación", "Categoría", "Comentario"),
+            "SELECT e.{evaluacion_fk}, p.titulo, e.puntuacion, e.categoria_evaluada, e.comentario "
+            "FROM evaluacion e JOIN pelicula p ON p.id_pelicula = e.{evaluacion_fk} "
+            "WHERE e.id_jurado = :id ORDER BY p.titulo",
+        ),
+    ),
+}
+
+
+class AggregateLoader:
+    """Fetches ``AGGREGATES[entity]`` for one root key."""
+
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
+        self._connection_factory = connection_factory
+        # evaluacion's película FK column, looked up once per loader
+        self._evaluacion_fk: Optional[str] = None
+
+    @staticmethod
+    def supports(entity: str) -> bool:
+        return entity in AGGREGATES
+
+    def load(self, entity: str, key: Any) -> Aggregate:
+        try:
+            children = AGGREGATES[entity]
+        except KeyError:
+            raise ValueError(f"Sin detalle agregado para: {entity}") from None
+        table = TABLE_METADATA[entity]
+        root_sql = f"SELECT {', '.join(table.columns)} FROM {table.table} WHERE {table.key_columns[0]} = :id"
+        with self._connection_factory.get_connection() as conn:
+            queries = [root_sql] + self._child_sql(conn, children)
+            if dialect_of(self._connection_factory) == "oracle":
+                results = self._fetch_ref_cursors(conn, queries, key)
+            else:
+                results = self._fetch_each(conn, queries, key)
+        root_rows, child_rows = results[0], results[1:]
+        return Aggregate(
+            entity=entity,
+            key=key,
+            root=table.map_row(root_rows[0]) if root_rows else None,
+            children={
+                child.name: ChildRows(child.title, child.headers, [tuple(r) for r in rows])
+                for child, rows in zip(children, child_rows)
+            },
+        )
+
+    def _child_sql(self, conn: Any, children: Sequence[ChildQuery]) -> List[str]:
+        if not any("{evaluacion_fk}" in child.sql for child in children):
+            return [child.sql for child in children]
+        if self._evaluacion_fk is None:
+            with conn.cursor() as cursor:
+                self._evaluacion_fk, _ = resolve_evaluacion_columns(cursor)
+        return [child.sql.replace("{evaluacion_fk}", self._evaluacion_fk) for child in children]
+
+    @staticmethod
+    def _fetch_ref_cursors(conn: Any, queries: Sequence[str], key: Any) -> List[List[Any]]:
+        block = "BEGIN " + " ".join(f"OPEN :c{i} FOR {sql};" for i, sql in enumerate(queries)) + " END;"
+        ref_cursors = []
+        for _ in queries:
+            ref = conn.cursor()
+            # set before the call so the rows ride along with the execute round trip
+            ref.prefetchrows = CHILD_PREFETCH_ROWS
+            ref.arraysize = CHILD_PREFETCH_ROWS
+            ref_cursors.append(ref)
+        binds: Dict[str, Any] = {"id": key}
+        binds.update({f"c{i}": getattr(ref, "wrapped", ref) for i, ref in enumerate(ref_cursors)})
+        with conn.cursor() as cursor:
+            cursor.execute(block, binds)
+        try:
+            return [ref.fetchall() for ref in ref_cursors]
+        finally:
+            for ref in ref_cursors:
+                ref.close()
+
+    @staticmethod
+    def _fetch_each(conn: Any, queries: Sequence[str], key: Any) -> List[List[Any]]:
+        results = []
+        with conn.cursor() as cursor:
+            for sql in queries:
+                cursor.execute(sql, {"id": key})
+                results.append(cursor.fetchall())
+        return results
@@ -1,13 +1,16 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 from datetime import date
 from app.domain.models.asistencia import Asistencia
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class AsistenciaRepository:
     """Repository for gestionar operaciones de Asistencia en la BD."""
 
-    def __init__(self, connection_factory: OracleConnection):
+    def __init__(self, connection_factory: ConnectionFactory):
         self._connection_factory = connection_factory
 
     def get_all(self) -> List[Asistencia]:
@@ -42,6 +45,17 @@ class AsistenciaRepository:
         except Exception as e:
             raise Exception(f"Error al obtener asistencia: {str(e)}")
 
+    def precios_por_funcion(self) -> Dict[int, float]:
+        """Precio de entrada de cada función (recaudación del pie de la tabla)."""
+        try:
+            with self._connection_factory.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT id_funcion, precio_entrada FROM funcion")
+                    rows = cursor.fetchall()
+            return {int(row[0]): float(row[1]) for row in rows if row[1] is not None}
+        except Exception as e:
+            raise Exception(f"Error al obtener precios: {str(e)}")
+
     def add(self, asistencia: Asistencia) -> bool:
         """Inserta una nueva asistencia."""
         try:
@@ -110,6 +124,26 @@ class AsistenciaRepository:
         except Exception as e:
             raise Exception(f"Error al eliminar asistencias: {str(e)}")
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `asistencia` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_funcion, id_asistente, entradas, fecha_compra, metodo_pago, comentarios FROM asistencia",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `asistencia`."""
+        return count_rows(self._connection_factory, "asistencia")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `asistencia` in one round trip."""
+        return fetch_change_token(self._connection_factory, "asistencia")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `asistencia` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "asistencia", rows)
+
     def _map_row(self, row: tuple) -> Asistencia:
         """Map a database row to an Asistencia object."""
         return Asistencia(
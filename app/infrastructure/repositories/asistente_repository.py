@@ -1,19 +1,24 @@
 """Repository layer for Asistente entity (wraps `asistente` table)."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Sequence
-
-import oracledb
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from app.domain.models.asistente import Asistente
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_screened
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.lookup import SEARCH_LIMIT, LookupItem, search_prefix
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
+from app.infrastructure.repositories.uniqueness import UniquenessIndex
 
 
 class AsistenteRepository:
     """Handles CRUD operations over `asistente` table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
+        # correo / telefono already taken, (re)loaded by add_many when the table changed
+        self.unique_index = UniquenessIndex.for_table("asistente")
 
     def get_all(self) -> List[Asistente]:
         with self._connection_factory.get_connection() as conn:
@@ -61,7 +66,9 @@ class AsistenteRepository:
                 raw = id_var.getvalue()
                 if isinstance(raw, (list, tuple)):
                     raw = raw[0]
-                return int(raw)
+                new_id = int(raw)
+        self.unique_index.add({"correo": asistente.correo, "telefono": asistente.telefono}, new_id)
+        return new_id
 
     def update(self, asistente: Asistente) -> None:
         if asistente.id is None:
@@ -84,6 +91,7 @@ class AsistenteRepository:
                     },
                 )
                 conn.commit()
+        self.unique_index.invalidate()
 
     def delete_many(self, asistente_ids: Iterable[int]) -> None:
         ids = [aid for aid in asistente_ids if aid is not None]
@@ -95,6 +103,53 @@ class AsistenteRepository:
                 for asistente_id in ids:
                     cursor.execute("DELETE FROM asistente WHERE id_asistente = :id", {"id": asistente_id})
                 conn.commit()
+        self.unique_index.invalidate()
+
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `asistente` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_asistente, nombre, correo, telefono, edad, ciudad_residencia, tipo_asistente FROM asistente",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `asistente`."""
+        return count_rows(self._connection_factory, "asistente")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `asistente` in one round trip."""
+        return fetch_change_token(self._connection_factory, "asistente")
+
+    def get_changed_since(self, scn: int) -> List[Asistente]:
+        """Return the rows whose ``ORA_ROWSCN`` is newer than ``scn`` (inserts and updates)."""
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id_asistente, nombre, correo, telefono, edad, ciudad_residencia, tipo_asistente FROM asistente WHERE ORA_ROWSCN > :scn",
+                    {"scn": scn},
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(row) for row in rows]
+
+    def add_many(self, rows: Sequence[Dict[str, Any]], on_duplicate: str = "reject") -> BatchErrors:
+        """Insert validated `asistente` rows in one batch; returns rejected ``(offset, message)``.
+
+        Rows whose correo / telefono already exist are screened out before the
+        round trip (``on_duplicate="merge"`` updates the existing asistente).
+        """
+        return insert_screened(self._connection_factory, self.unique_index, rows, on_duplicate)
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> List[LookupItem]:
+        """Asistentes whose correo starts with ``text`` (case-insensitive), for the FK pickers."""
+        return search_prefix(
+            self._connection_factory,
+            "SELECT id_asistente, nombre, correo, LOWER(correo) FROM asistente",
+            "LOWER(correo)",
+            text,
+            limit,
+            lambda row: f"{row[2]} — {row[1]} (#{row[0]})",
+        )
 
     @staticmethod
     def _map_row(row: Sequence) -> Asistente:
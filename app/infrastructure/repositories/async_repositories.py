@@ -0,0 +1,254 @@
+"""Async (``await``-able) read side of every repository.
+
+Each ``Async*Repository`` issues the same SELECTs as its synchronous
+counterpart over an :class:`~app.infrastructure.database.async_backend.AsyncPool`
+and reuses that counterpart's ``_map_row``, so domain objects are identical.
+Because every call only holds a pooled connection while it awaits the
+database, one event loop can keep a grid load, FK lookups and counts in flight
+at the same time::
+
+    funciones, total, sede = await asyncio.gather(
+        AsyncFuncionRepository(pool).get_all(),
+        AsyncAsistenciaRepository(pool).count(),
+        AsyncSedeRepository(pool).get_by_id(3),
+    )
+
+Writes other than ``delete_many`` stay on the synchronous repositories, which
+own the RETURNING / batch error handling.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from app.infrastructure.database.async_backend import AsyncPool
+from app.infrastructure.repositories.change_token import ChangeToken
+from app.infrastructure.repositories.evaluacion_repository import EvaluacionRepository
+from app.infrastructure.repositories.predicate import Predicate
+from app.infrastructure.repositories.table_metadata import (
+    TABLE_METADATA,
+    TableMetadata,
+    pick_evaluacion_columns,
+)
+
+
+class AsyncRepository:
+    """Generic async reads over one table; subclasses set the class attributes."""
+
+    TABLE = ""
+    COLUMNS: Tuple[str, ...] = ()
+    ORDER_BY = ""
+    KEY_COLUMNS: Tuple[str, ...] = ()
+    # columns a Predicate may reference; defaults to every selected column
+    FILTER_COLUMNS: Optional[Mapping[str, str]] = None
+    # shared description of the table (table_metadata.py); fills the attributes above and _map_row
+    METADATA: Optional[TableMetadata] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        metadata = cls.__dict__.get("METADATA")
+        if metadata is not None:
+            cls.TABLE = metadata.table
+            cls.COLUMNS = metadata.columns
+            cls.ORDER_BY = metadata.order_by
+            cls.KEY_COLUMNS = metadata.key_columns
+            cls.FILTER_COLUMNS = metadata.filter_columns
+            cls._map_row = metadata.row_mapper
+
+    def __init__(self, pool: AsyncPool) -> None:
+        self._pool = pool
+
+    def _map_row(self, row: Sequence) -> Any:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    # -- helpers ----------------------------------------------------------
+    async def _columns(self) -> str:
+        return ", ".join(self.COLUMNS)
+
+    async def _fetchall(self, sql: str, binds: Optional[Dict[str, Any]] = None) -> List[Sequence]:
+        async with self._pool.acquire() as conn:
+            with conn.cursor() as cursor:
+                await cursor.execute(sql, binds or {})
+                return await cursor.fetchall()
+
+    async def _fetchone(self, sql: str, binds: Optional[Dict[str, Any]] = None) -> Optional[Sequence]:
+        async with self._pool.acquire() as conn:
+            with conn.cursor() as cursor:
+                await cursor.execute(sql, binds or {})
+                return await cursor.fetchone()
+
+    def _key_clause(self, key: Any) -> Tuple[str, Dict[str, Any]]:
+        values = tuple(key) if isinstance(key, (list, tuple)) else (key,)
+        if len(values) != len(self.KEY_COLUMNS):
+            raise ValueError(f"{self.TABLE}: se esperaba una clave de {len(self.KEY_COLUMNS)} columna(s)")
+        binds = {f"k{i}": value for i, value in enumerate(values)}
+        return " AND ".join(f"{column} = :k{i}" for i, column in enumerate(self.KEY_COLUMNS)), binds
+
+    def _filter_columns(self) -> Mapping[str, str]:
+        return self.FILTER_COLUMNS if self.FILTER_COLUMNS is not None else {c: c for c in self.COLUMNS}
+
+    # -- reads ------------------------------------------------------------
+    async def get_all(self) -> List[Any]:
+        rows = await self._fetchall(f"SELECT {await self._columns()} FROM {self.TABLE} ORDER BY {self.ORDER_BY}")
+        return [self._map_row(row) for row in rows]
+
+    async def get_by_id(self, key: Any) -> Optional[Any]:
+        """Row with primary key ``key`` (a tuple for composite keys), or None."""
+        where, binds = self._key_clause(key)
+        row = await self._fetchone(f"SELECT {await self._columns()} FROM {self.TABLE} WHERE {where}", binds)
+        return self._map_row(row) if row else None
+
+    async def get_where(self, predicate: Predicate) -> List[Any]:
+        where, binds = predicate.to_sql(self._filter_columns(), self.KEY_COLUMNS)
+        rows = await self._fetchall(
+            f"SELECT {await self._columns()} FROM {self.TABLE} WHERE {where} ORDER BY {self.ORDER_BY}", binds
+        )
+        return [self._map_row(row) for row in rows]
+
+    async def count_where(self, predicate: Predicate) -> int:
+        where, binds = predicate.to_sql(self._filter_columns(), self.KEY_COLUMNS)
+        row = await self._fetchone(f"SELECT COUNT(*) FROM {self.TABLE} WHERE {where}", binds)
+        return int(row[0]) if row else 0
+
+    async def count(self) -> int:
+        row = await self._fetchone(f"SELECT COUNT(*) FROM {self.TABLE}")
+        return int(row[0]) if row else 0
+
+    async def change_token(self) -> ChangeToken:
+        row = await self._fetchone(f"SELECT COUNT(*), MAX(ORA_ROWSCN) FROM {self.TABLE}")
+        if not row:
+            return ChangeToken(0, None)
+        return ChangeToken(int(row[0]), int(row[1]) if row[1] is not None else None)
+
+    async def get_changed_since(self, scn: int) -> List[Any]:
+        rows = await self._fetchall(
+            f"SELECT {await self._columns()} FROM {self.TABLE} WHERE ORA_ROWSCN > :scn", {"scn": scn}
+        )
+        return [self._map_row(row) for row in rows]
+
+    # -- writes -----------------------------------------------------------
+    async def delete_many(self, keys: Iterable[Any]) -> None:
+        """Delete the rows with the given primary keys in one batch and commit."""
+        batch = []
+        for key in keys:
+            if key is None:
+                continue
+            where, binds = self._key_clause(key)
+            batch.append(binds)
+        if not batch:
+            return
+        async with self._pool.acquire() as conn:
+            with conn.cursor() as cursor:
+                await cursor.executemany(f"DELETE FROM {self.TABLE} WHERE {where}", batch)
+            await conn.commit()
+
+
+class AsyncAsistenteRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["asistente"]
+
+
+class AsyncCiudadRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["ciudad"]
+
+
+class AsyncSedeRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["sede"]
+
+
+class AsyncPeliculaRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["pelicula"]
+
+
+class AsyncFuncionRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["funcion"]
+
+
+class AsyncProyeccionRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["proyeccion"]
+
+
+class AsyncAsistenciaRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["asistencia"]
+
+
+class AsyncJuradoRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["jurado"]
+
+
+class AsyncParticipacionJuradoRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["participacion_jurado"]
+
+
+class AsyncPremiacionRepository(AsyncRepository):
+    METADATA = TABLE_METADATA["premiacion"]
+
+
+class AsyncEvaluacionRepository(AsyncRepository):
+    """``evaluacion`` has schema variants (FK / fecha column); resolved once, like the sync repository."""
+
+    TABLE = "evaluacion"
+
+    def __init__(self, pool: AsyncPool) -> None:
+        super().__init__(pool)
+        self._resolved: Optional[Tuple[str, Optional[str]]] = None
+
+    async def _resolve(self) -> Tuple[str, Optional[str]]:
+        if self._resolved is None:
+            rows = await self._fetchall(
+                "SELECT column_name FROM user_tab_columns WHERE table_name = :table", {"table": "EVALUACION"}
+            )
+            self._resolved = pick_evaluacion_columns(row[0] for row in rows)
+        return self._resolved
+
+    async def _columns(self) -> str:
+        fk, fecha = await self._resolve()
+        middle = [fecha] if fecha else []
+        columns = ["id_jurado", fk, "puntuacion", "comentario", *middle, "categoria_evaluada"]
+        self.COLUMNS = tuple(columns)
+        self.KEY_COLUMNS = ("id_jurado", fk)
+        self.ORDER_BY = f"id_jurado, {fk}"
+        return ", ".join(columns)
+
+    def _map_row(self, row: Sequence) -> Any:
+        if len(row) == 6:
+            return EvaluacionRepository._map_row_with_fecha(self, row)  # type: ignore[arg-type]
+        return EvaluacionRepository._map_row_without_fecha(self, row)  # type: ignore[arg-type]
+
+    async def get_by_id(self, key: Any) -> Optional[Any]:
+        await self._columns()
+        return await super().get_by_id(key)
+
+    async def get_where(self, predicate: Predicate) -> List[Any]:
+        await self._columns()
+        return await super().get_where(predicate)
+
+    async def count_where(self, predicate: Predicate) -> int:
+        await self._columns()
+        return await super().count_where(predicate)
+
+    async def delete_many(self, keys: Iterable[Any]) -> None:
+        await self._columns()
+        await super().delete_many(keys)
+
+
+ASYNC_REPOSITORY_CLASSES: Dict[str, type] = {
+    "ciudad": AsyncCiudadRepository,
+    "sede": AsyncSedeRepository,
+    "pelicula": AsyncPeliculaRepository,
+    "funcion": AsyncFuncionRepository,
+    "proyeccion": AsyncProyeccionRepository,
+    "asistente": AsyncAsistenteRepository,
+    "asistencia": AsyncAsistenciaRepository,
+    "jurado": AsyncJuradoRepository,
+    "participacion_jurado": AsyncParticipacionJuradoRepository,
+    "evaluacion": AsyncEvaluacionRepository,
+    "premiacion": AsyncPremiacionRepository,
+}
+
+
+def create_async_repository(entity: str, pool: AsyncPool) -> AsyncRepository:
+    """Instantiate the async repository registered for ``entity``."""
+    try:
+        repository_cls = ASYNC_REPOSITORY_CLASSES[entity]
+    except KeyError:
+        raise ValueError(f"Unknown entity: {entity}") from None
+    return repository_cls(pool)
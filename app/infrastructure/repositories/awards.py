@@ -0,0 +1,232 @@
+"""Computes the awards of an edition from the evaluations and writes them to ``premiacion``.
+
+For edition ``N`` (the festival year) the evaluations dated in ``N`` are
+grouped per ``categoria_evaluada`` and película, and ranked with one
+``ROW_NUMBER()`` window per category: by the score (average or total
+``puntuacion``) and then by the configured tie-breakers, ``id_pelicula`` last
+so the order is always total. The top three of each category become the
+``premiacion`` rows ``(categoria, edicion, posicion)`` in one set-based
+statement, a ``MERGE`` on Oracle::
+
+    MERGE INTO premiacion p
+    USING (<top three per category>) w
+    ON (p.categoria = w.categoria AND p.edicion = :edicion AND p.posicion = w.posicion)
+    WHEN MATCHED THEN UPDATE SET ...
+    WHEN NOT MATCHED THEN INSERT ...
+
+and ``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` (the same upsert on
+``uq_premio_categoria_edicion``) on SQLite. ``evaluacion``'s película FK and
+date columns vary between schemas; they are resolved once per engine like
+``EvaluacionRepository`` does, and a schema without a date column is refused
+with a clear message (the edition cannot be told apart). Positions of those categories
+left over from an earlier run (a category now with fewer than three ranked
+películas) are deleted in the same transaction. The ranking runs in the
+database: nothing but the winners is fetched, whatever the number of
+evaluations.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory, dialect_of
+from app.infrastructure.repositories.table_metadata import EVALUACION_FECHA_CANDIDATES, resolve_evaluacion_columns
+
+# evaluacion.categoria_evaluada -> premiacion.categoria
+AWARD_CATEGORIES: Mapping[str, str] = {
+    "General": "Mejor Película",
+    "Direccion": "Mejor Dirección",
+    "Actuacion": "Mejor Actuación",
+    "Guion": "Mejor Guion",
+    "Fotografia": "Mejor Fotografía",
+    "Sonido": "Mejor Sonido",
+}
+PODIUM = 3
+# ranking score per película and category
+SCORES: Mapping[str, str] = {"promedio": "AVG(puntuacion)", "suma": "SUM(puntuacion)"}
+# applied in order when scores tie; id_pelicula always decides last ({fecha}: evaluacion's date column)
+TIE_BREAKERS: Mapping[str, str] = {
+    "evaluaciones": "COUNT(*) DESC",
+    "maxima": "MAX(puntuacion) DESC",
+    "minima": "MIN(puntuacion) DESC",
+    "primera": "MIN({fecha}) ASC",
+}
+DEFAULT_TIE_BREAKERS: Tuple[str, ...] = ("evaluaciones", "maxima")
+
+
+@dataclass(frozen=True)
+class Award:
+    categoria: str
+    posicion: int
+    id_pelicula: int
+    puntaje: float
+    evaluaciones: int
+
+
+@dataclass
+class AwardsResult:
+    """Winners of an edition and what was written (nothing on a dry run)."""
+
+    edicion: int
+    awards: List[Award] = field(default_factory=list)
+    # rows inserted or updated, and stale positions removed
+    written: int = 0
+    removed: int = 0
+    dry_run: bool = False
+
+    def by_category(self) -> Dict[str, List[Award]]:
+        grouped: Dict[str, List[Award]] = {}
+        for award in self.awards:
+            grouped.setdefault(award.categoria, []).append(award)
+        return grouped
+
+
+def edition_window(edicion: int) -> Tuple[date, date]:
+    """``[1 January, next 1 January)`` of the edition's year."""
+    return date(edicion, 1, 1), date(edicion + 1, 1, 1)
+
+
+class AwardsEngine:
+    """Ranks películas per category for an edition and writes the podiums to ``premiacion``."""
+
+    def __init__(
+        self,
+        connection_factory: ConnectionFactory,
+        categories: Mapping[str, str] = AWARD_CATEGORIES,
+        score: str = "promedio",
+        tie_breakers: Sequence[str] = DEFAULT_TIE_BREAKERS,
+        min_evaluaciones: int = 1,
+    ) -> None:
+        if score not in SCORES:
+            raise ValueError(f"Puntaje desconocido: {score} (use {', '.join(SCORES)})")
+        unknown = [name for name in tie_breakers if name not in TIE_BREAKERS]
+        if unknown:
+            raise ValueError(f"Criterio de desempate desconocido: {', '.join(unknown)} (use {', '.join(TIE_BREAKERS)})")
+        if not categories:
+            raise ValueError("Se requiere al menos una categoría")
+        self._connection_factory = connection_factory
+        self.categories = dict(categories)
+        self.score = score
+        self.tie_breakers = tuple(tie_breakers)
+        self.min_evaluaciones = min_evaluaciones
+        # evaluacion's (película FK, date) column names, resolved on first use
+        self._columns: Optional[Tuple[str, str]] = None
+
+    def _resolve_columns(self, cursor: Any) -> None:
+        if self._columns is not None:
+            return
+        fk, fecha = resolve_evaluacion_columns(cursor)
+        if fecha is None:
+            raise ValueError(
+                f"evaluacion no tiene columna de fecha ({', '.join(EVALUACION_FECHA_CANDIDATES)}): "
+                f"no se pueden separar las evaluaciones por edición"
+            )
+        self._columns = (fk, fecha)
+
+    # -- SQL ---------------------------------------------------------------------
+    def _winners_sql(self) -> str:
+        """Top PODIUM per category: categoria, id_pelicula, posicion, puntaje, evaluaciones, descripcion."""
+        # resolved by rank(), which award() runs before writing
+        fk, fecha = self._columns
+        names = " ".join(f"WHEN :e{i} THEN :p{i}" for i in range(len(self.categories)))
+        evaluated = ", ".join(f":e{i}" for i in range(len(self.categories)))
+        order = ", ".join(
+            [f"{SCORES[self.score]} DESC"] + [TIE_BREAKERS[t].format(fecha=fecha) for t in self.tie_breakers] + [fk]
+        )
+        return (
+            f"SELECT CASE categoria_evaluada {names} END AS categoria, id_pelicula, posicion, puntaje, evaluaciones, "
+            f"'Puntaje {self.score} ' || ROUND(puntaje, 2) || ' en ' || evaluaciones || ' evaluaciones' AS descripcion "
+            f"FROM ("
+            f"SELECT categoria_evaluada, {fk} AS id_pelicula, {SCORES[self.score]} AS puntaje, COUNT(*) AS evaluaciones, "
+            f"ROW_NUMBER() OVER (PARTITION BY categoria_evaluada ORDER BY {order}) AS posicion "
+            f"FROM evaluacion "
+            f"WHERE {fecha} >= :desde AND {fecha} < :hasta AND categoria_evaluada IN ({evaluated}) "
+            f"GROUP BY categoria_evaluada, {fk} "
+            f"HAVING COUNT(*) >= :min_evaluaciones"
+            f") ranked WHERE posicion <= {PODIUM}"
+        )
+
+    def _upsert_sql(self, dialect: str) -> str:
+        winners = self._winners_sql()
+        if dialect == "oracle":
+            return (
+                f"MERGE INTO premiacion p USING ({winners}) w "
+                f"ON (p.categoria = w.categoria AND p.edicion = :edicion AND p.posicion = w.posicion) "
+                f"WHEN MATCHED THEN UPDATE SET p.id_pelicula = w.id_pelicula, p.descripcion = w.descripcion, "
+                f"p.fecha_premiacion = :fecha "
+                f"WHEN NOT MATCHED THEN INSERT (id_pelicula, categoria, edicion, posicion, descripcion, fecha_premiacion) "
+                f"VALUES (w.id_pelicula, w.categoria, :edicion, w.posicion, w.descripcion, :fecha)"
+            )
+        # the WHERE keeps SQLite from parsing ON CONFLICT as the join constraint of the FROM
+        return (
+            f"INSERT INTO premiacion (id_pelicula, categoria, edicion, posicion, descripcion, fecha_premiacion) "
+            f"SELECT id_pelicula, categoria, :edicion, posicion, descripcion, :fecha FROM ({winners}) w WHERE 1 = 1 "
+            f"ON CONFLICT (categoria, edicion, posicion) DO UPDATE SET id_pelicula = excluded.id_pelicula, "
+            f"descripcion = excluded.descripcion, fecha_premiacion = excluded.fecha_premiacion"
+        )
+
+    def _prune_sql(self) -> str:
+        winners = self._winners_sql()
+        return (
+            f"DELETE FROM premiacion WHERE edicion = :edicion "
+            f"AND categoria IN (SELECT categoria FROM ({winners}) w) "
+            f"AND (categoria, posicion) NOT IN (SELECT categoria, posicion FROM ({winners}) w)"
+        )
+
+    def _binds(self, edicion: int, desde: Optional[date], hasta: Optional[date]) -> Dict[str, Any]:
+        start, end = edition_window(edicion)
+        binds: Dict[str, Any] = {
+            "desde": desde or start,
+            "hasta": hasta or end,
+            "min_evaluaciones": self.min_evaluaciones,
+        }
+        for i, (evaluated, award) in enumerate(self.categories.items()):
+            binds[f"e{i}"] = evaluated
+            binds[f"p{i}"] = award
+        return binds
+
+    # -- API -----------------------------------------------------------------------
+    def rank(self, edicion: int, desde: Optional[date] = None, hasta: Optional[date] = None) -> List[Award]:
+        """The podium of every category for ``edicion`` (evaluations from ``desde`` to before ``hasta``)."""
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                self._resolve_columns(cursor)
+                cursor.execute(
+                    f"SELECT categoria, posicion, id_pelicula, puntaje, evaluaciones FROM ({self._winners_sql()}) w "
+                    f"ORDER BY categoria, posicion",
+                    self._binds(edicion, desde, hasta),
+                )
+                rows = cursor.fetchall()
+        return [Award(row[0], int(row[1]), int(row[2]), float(row[3]), int(row[4])) for row in rows]
+
+    def award(
+        self,
+        edicion: int,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        dry_run: bool = False,
+    ) -> AwardsResult:
+        """Write the podiums of ``edicion`` to ``premiacion`` in one transaction."""
+        if edicion < 1:
+            raise ValueError("La edición debe ser mayor a 0")
+        result = AwardsResult(edicion, self.rank(edicion, desde, hasta), dry_run=dry_run)
+        if dry_run or not result.awards:
+            return result
+        binds = self._binds(edicion, desde, hasta)
+        binds["edicion"] = edicion
+        with self._connection_factory.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        self._upsert_sql(dialect_of(self._connection_factory)),
+                        dict(binds, fecha=datetime.now().replace(microsecond=0)),
+                    )
+                    result.written = max(cursor.rowcount, 0)
+                    cursor.execute(self._prune_sql(), binds)
+                    result.removed = max(cursor.rowcount, 0)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return result
@@ -0,0 +1,166 @@
+"""``executemany`` helpers shared by the repositories' bulk write paths."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+from app.infrastructure.database.row_validator import check_rows
+
+if TYPE_CHECKING:
+    from app.infrastructure.repositories.uniqueness import UniquenessIndex
+
+BatchErrors = List[Tuple[int, str]]
+# what insert_screened does with a row whose unique key already exists
+DUPLICATE_POLICIES = ("reject", "merge")
+
+
+def _screen(table: str, rows: Sequence[Dict[str, Any]]) -> Tuple[BatchErrors, Sequence[Dict[str, Any]], List[int]]:
+    """Split off the rows the compiled DDL checks reject, before any SQL is sent.
+
+    Returns those errors, the rows to send and, when some were dropped, the
+    offset in ``rows`` of each row sent (empty list: the rows are unchanged).
+    """
+    invalid = check_rows(table, rows)
+    if not invalid:
+        return invalid, rows, []
+    rejected = {offset for offset, _ in invalid}
+    offsets = [offset for offset in range(len(rows)) if offset not in rejected]
+    return invalid, [rows[offset] for offset in offsets], offsets
+
+
+def _merge(invalid: BatchErrors, errors: BatchErrors, offsets: List[int]) -> BatchErrors:
+    # database offsets refer to the rows sent; map them back when some were held back
+    if not invalid:
+        return errors
+    return sorted(invalid + [(offsets[position], message) for position, message in errors])
+
+
+def insert_many(connection_factory, table: str, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+    """Insert ``rows`` into ``table`` with one ``executemany`` and one commit.
+
+    Every row must carry the same keys; they are used both as column names and
+    bind names. Rows that break a NOT NULL, length or CHECK constraint of
+    ``sql/script.sql`` are not sent; they and the rows rejected by the
+    database are returned as ``(offset, message)`` pairs and the rest are
+    committed.
+    """
+    if not rows:
+        return []
+    invalid, rows, offsets = _screen(table, rows)
+    if not rows:
+        return invalid
+    columns = list(rows[0])
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(':' + c for c in columns)})"
+    )
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, list(rows), batcherrors=True)
+            errors = [(error.offset, error.message) for error in cursor.getbatcherrors()]
+        conn.commit()
+    return _merge(invalid, errors, offsets)
+
+
+def update_many(connection_factory, table: str, key_column: str, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+    """``UPDATE table SET ... WHERE key_column = :key_column`` for each row, in one batch and one commit.
+
+    Rows are checked against the DDL like in :func:`insert_many`.
+    """
+    if not rows:
+        return []
+    invalid, rows, offsets = _screen(table, rows)
+    if not rows:
+        return invalid
+    columns = [c for c in rows[0] if c != key_column]
+    sql = (
+        f"UPDATE {table} SET {', '.join(f'{c} = :{c}' for c in columns)} "
+        f"WHERE {key_column} = :{key_column}"
+    )
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, list(rows), batcherrors=True)
+            errors = [(error.offset, error.message) for error in cursor.getbatcherrors()]
+        conn.commit()
+    return _merge(invalid, errors, offsets)
+
+
+def _existing_ids(connection_factory, table: str, id_column: str, ids: Sequence[int]) -> set:
+    """Which of ``ids`` are still in ``table`` (IN lists of at most 1000, Oracle's limit)."""
+    found: set = set()
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            for start in range(0, len(ids), 1000):
+                chunk = ids[start:start + 1000]
+                binds = {f"id{i}": value for i, value in enumerate(chunk)}
+                cursor.execute(
+                    f"SELECT {id_column} FROM {table} WHERE {id_column} IN ({', '.join(':' + b for b in binds)})",
+                    binds,
+                )
+                found.update(row[0] for row in cursor.fetchall())
+    return found
+
+
+def insert_screened(
+    connection_factory,
+    index: "UniquenessIndex",
+    rows: Sequence[Dict[str, Any]],
+    on_duplicate: str = "reject",
+) -> BatchErrors:
+    """:func:`insert_many` after checking ``rows`` against ``index`` client-side.
+
+    The index is reloaded first when the table's change token moved since it
+    was loaded. Rows whose unique key already exists never reach the
+    database. With ``on_duplicate="reject"`` they are returned as errors
+    naming the constraint; with ``"merge"`` a row matching exactly one
+    existing row updates that row's other columns instead (its unique keys
+    are left as they are), rows matching several rows are rejected, and so
+    are rows whose target row was deleted before the update reached it.
+    Inserted rows are added to the index, and rows the database still
+    rejects (or that were never written because the insert raised) are taken
+    out. Offsets in the result refer to ``rows``.
+    """
+    if on_duplicate not in DUPLICATE_POLICIES:
+        raise ValueError(f"on_duplicate debe ser uno de {DUPLICATE_POLICIES}: {on_duplicate}")
+    if not rows:
+        return []
+    index.refresh(connection_factory)
+    errors: BatchErrors = []
+    fresh: List[Tuple[int, Dict[str, Any]]] = []
+    merges: List[Tuple[int, Dict[str, Any]]] = []
+    key_columns = set(index.key_columns)
+    for offset, row in enumerate(rows):
+        conflicts = index.claim(row)
+        if not conflicts:
+            fresh.append((offset, row))
+            continue
+        owners = set(conflicts.values())
+        if on_duplicate == "merge" and len(owners) == 1 and None not in owners:
+            update = {c: v for c, v in row.items() if c not in key_columns and c != index.id_column}
+            if update:
+                update[index.id_column] = owners.pop()
+                merges.append((offset, update))
+        else:
+            errors.append((offset, index.describe(conflicts, row, index.keys)))
+
+    try:
+        rejected = insert_many(connection_factory, index.table, [row for _, row in fresh])
+    except Exception:
+        for _, row in fresh:
+            index.discard(row)
+        raise
+    for position, message in rejected:
+        offset, row = fresh[position]
+        index.discard(row)
+        errors.append((offset, message))
+    if merges:
+        failed = dict(update_many(connection_factory, index.table, index.id_column, [row for _, row in merges]))
+        targets = [row[index.id_column] for position, (_, row) in enumerate(merges) if position not in failed]
+        existing = _existing_ids(connection_factory, index.table, index.id_column, targets)
+        for position, (offset, row) in enumerate(merges):
+            if position in failed:
+                errors.append((offset, failed[position]))
+            elif row[index.id_column] not in existing:
+                errors.append((offset, f"{index.table} {row[index.id_column]} ya no existe; la fila no se actualizó"))
+                index.invalidate()
+    index.settle(connection_factory, len(fresh) - len(rejected))
+    return sorted(errors)
@@ -0,0 +1,165 @@
+"""Deletes rows together with everything that references them, table by table.
+
+The foreign keys come from `sql/script.sql` (:func:`load_schema`). For a root
+table and a set of keys the planner walks the FK graph and emits one
+set-based statement per dependent table, children first::
+
+    DELETE FROM proyeccion WHERE id_funcion IN (SELECT id_funcion FROM funcion WHERE id_sede IN (:k0, :k1))
+    DELETE FROM asistencia WHERE id_funcion IN (SELECT id_funcion FROM funcion WHERE id_sede IN (:k0, :k1))
+    ...
+    DELETE FROM funcion WHERE id_sede IN (:k0, :k1)
+    DELETE FROM sede WHERE id_sede IN (:k0, :k1)
+
+A table reached through several paths gets a single statement whose
+predicates are OR-ed. Tables are ordered by their longest distance from the
+root, so every child is emptied while the parent rows its subquery reads
+still exist. Root keys are bound in chunks of ``IN_LIST_LIMIT`` (Oracle's
+expression-list limit) and every chunk runs in one transaction. The root rows
+can also be given as a WHERE clause with its binds (a "select all matching"
+selection, from ``Predicate.to_sql``): :meth:`CascadeDeletePlanner.delete_where`
+then reaches the children through ``SELECT id FROM root WHERE <clause>``
+subqueries and runs the plan once.
+``dry_run=True`` runs the same predicates as ``SELECT COUNT(*)`` instead.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.schema import Schema, load_schema
+
+# Oracle rejects IN lists with more than 1000 expressions (ORA-01795)
+IN_LIST_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class CascadeStep:
+    table: str
+    # WHERE clause over the root key binds :k0, :k1, ... or the root WHERE's own binds
+    where: str
+
+
+@dataclass
+class CascadeResult:
+    """Rows deleted (or, on a dry run, that would be deleted) per table, in execution order."""
+
+    root: str
+    rows: Dict[str, int] = field(default_factory=dict)
+    dry_run: bool = False
+
+    @property
+    def dependent_rows(self) -> int:
+        return sum(count for table, count in self.rows.items() if table != self.root)
+
+    def summary(self) -> str:
+        return ", ".join(f"{count} {table}" for table, count in self.rows.items() if count)
+
+
+def _column_list(columns: Sequence[str]) -> str:
+    return columns[0] if len(columns) == 1 else f"({', '.join(columns)})"
+
+
+class CascadeDeletePlanner:
+    """Plans and runs cascading deletes over the FK graph of ``schema``."""
+
+    def __init__(self, connection_factory: ConnectionFactory, schema: Optional[Schema] = None) -> None:
+        self._connection_factory = connection_factory
+        self._schema = schema or load_schema()
+        # parent table -> [(child table, child columns, parent columns)]
+        self._children: Dict[str, List[Tuple[str, Tuple[str, ...], Tuple[str, ...]]]] = {}
+        for table in self._schema.tables.values():
+            for fk in table.foreign_keys:
+                self._children.setdefault(fk.ref_table, []).append((table.name, fk.columns, fk.ref_columns))
+
+    def has_dependents(self, table: str) -> bool:
+        """True if other tables reference ``table`` (a plain delete may hit an FK error)."""
+        return bool(self._children.get(table.lower()))
+
+    def plan(self, table: str, key_count: int = 0, where: Optional[str] = None) -> List[CascadeStep]:
+        """Statements deleting root rows of ``table`` and their dependents, in order.
+
+        The root rows are ``key_count`` keys bound as ``:k0, :k1, ...`` or,
+        when ``where`` is given, the rows matching that clause.
+        """
+        root = self._schema.table(table)
+        root_keys = None
+        if where is None:
+            if len(root.primary_key) != 1:
+                raise ValueError(f"El borrado en cascada requiere una clave primaria simple: {root.name}")
+            binds = ", ".join(f":k{i}" for i in range(key_count))
+            where = f"{root.primary_key[0]} IN ({binds})"
+            root_keys = (root.primary_key, binds)
+        predicates: Dict[str, List[str]] = {root.name: [where]}
+        depth: Dict[str, int] = {root.name: 0}
+        self._walk(root.name, where, (root.name,), predicates, depth, root_keys)
+        order = sorted(predicates, key=lambda name: -depth[name])
+        return [CascadeStep(name, " OR ".join(f"({p})" for p in predicates[name])
+                            if len(predicates[name]) > 1 else predicates[name][0]) for name in order]
+
+    def _walk(
+        self,
+        parent: str,
+        parent_where: str,
+        path: Tuple[str, ...],
+        predicates: Dict[str, List[str]],
+        depth: Dict[str, int],
+        root_keys: Optional[Tuple[Tuple[str, ...], str]] = None,
+    ) -> None:
+        for child, columns, ref_columns in self._children.get(parent, ()):
+            if child in path:
+                raise ValueError(f"Ciclo de claves foráneas: {' -> '.join(path + (child,))}")
+            if root_keys is not None and ref_columns == root_keys[0]:
+                # references the root key itself: bind the key list, no subquery on the root
+                where = f"{_column_list(columns)} IN ({root_keys[1]})"
+            else:
+                where = (
+                    f"{_column_list(columns)} IN "
+                    f"(SELECT {', '.join(ref_columns)} FROM {parent} WHERE {parent_where})"
+                )
+            predicates.setdefault(child, []).append(where)
+            depth[child] = max(depth.get(child, 0), len(path))
+            self._walk(child, where, path + (child,), predicates, depth)
+
+    def delete(self, table: str, keys: Sequence[Any], dry_run: bool = False) -> CascadeResult:
+        """Delete ``keys`` of ``table`` and every row depending on them, in one transaction.
+
+        With ``dry_run`` nothing is changed and the result holds the row
+        counts the delete would affect. Database errors roll everything back
+        and are raised.
+        """
+        keys = list(dict.fromkeys(keys))
+        chunks = []
+        for start in range(0, len(keys), IN_LIST_LIMIT):
+            chunk = keys[start:start + IN_LIST_LIMIT]
+            chunks.append((self.plan(table, len(chunk)), {f"k{i}": key for i, key in enumerate(chunk)}))
+        return self._run(table, chunks, dry_run)
+
+    def delete_where(self, table: str, where: str, binds: Dict[str, Any], dry_run: bool = False) -> CascadeResult:
+        """Like :meth:`delete` for the rows of ``table`` matching ``where`` (bound with ``binds``)."""
+        return self._run(table, [(self.plan(table, where=where), binds)], dry_run)
+
+    def _run(
+        self, table: str, chunks: List[Tuple[List[CascadeStep], Dict[str, Any]]], dry_run: bool
+    ) -> CascadeResult:
+        result = CascadeResult(self._schema.table(table).name, dry_run=dry_run)
+        if not chunks:
+            return result
+        with self._connection_factory.get_connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    for steps, binds in chunks:
+                        for step in steps:
+                            if dry_run:
+                                cursor.execute(f"SELECT COUNT(*) FROM {step.table} WHERE {step.where}", binds)
+                                affected = int(cursor.fetchone()[0])
+                            else:
+                                cursor.execute(f"DELETE FROM {step.table} WHERE {step.where}", binds)
+                                affected = cursor.rowcount
+                            result.rows[step.table] = result.rows.get(step.table, 0) + affected
+                if not dry_run:
+                    conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return result
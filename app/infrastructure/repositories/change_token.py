@@ -0,0 +1,35 @@
+"""Cheap per-table change detection for refresh-without-refetch."""
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+
+class ChangeToken(NamedTuple):
+    """``COUNT(*)`` and ``MAX(ORA_ROWSCN)`` of a table at one point in time.
+
+    Any committed insert, update or delete moves at least one of the two, so
+    equal tokens mean the table can be assumed unchanged.
+    """
+
+    count: int
+    scn: Optional[int]
+
+
+def fetch_change_token(connection_factory, table: str) -> ChangeToken:
+    """Return the :class:`ChangeToken` of ``table`` in one small round trip.
+
+    Behind a ``CachingConnectionFactory`` the token is also handed to its
+    cache, which drops the table's results when it changed: the rows fetched
+    next then belong to this token, not to an older one.
+    """
+    if connection_factory is None:
+        return ChangeToken(0, None)
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*), MAX(ORA_ROWSCN) FROM {table}")
+            row = cursor.fetchone()
+    token = ChangeToken(int(row[0]), int(row[1]) if row[1] is not None else None) if row else ChangeToken(0, None)
+    cache = getattr(connection_factory, "cache", None)
+    if cache is not None:
+        cache.observe_token(table, token)
+    return token
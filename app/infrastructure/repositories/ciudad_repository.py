@@ -1,21 +1,29 @@
 """Repository layer for Ciudad entity (wraps `ciudad` table)."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Sequence
-
-import oracledb
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from app.domain.models.ciudad import Ciudad
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.local_mirror import LocalMirror
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class CiudadRepository:
     """Handles CRUD operations over `ciudad` table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    MIRROR_COLUMNS = ("id_ciudad", "nombre", "region", "pais", "observaciones")
+
+    def __init__(self, connection_factory: ConnectionFactory, mirror: Optional[LocalMirror] = None) -> None:
         self._connection_factory = connection_factory
+        self._mirror = mirror
 
     def get_all(self) -> List[Ciudad]:
+        if self._mirror is not None:
+            rows = self._mirror.fetch("ciudad", self.MIRROR_COLUMNS, self._connection_factory)
+            return [self._map_row(row) for row in rows]
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -25,6 +33,13 @@ class CiudadRepository:
 
         return [self._map_row(row) for row in rows]
 
+    def get_cached(self) -> Optional[List[Ciudad]]:
+        """Return the locally mirrored rows without touching the database (None if unavailable)."""
+        if self._mirror is None:
+            return None
+        rows = self._mirror.cached_rows("ciudad", self.MIRROR_COLUMNS)
+        return None if rows is None else [self._map_row(row) for row in rows]
+
     def get_by_id(self, ciudad_id: int) -> Optional[Ciudad]:
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
@@ -85,6 +100,26 @@ class CiudadRepository:
                     cursor.execute("DELETE FROM ciudad WHERE id_ciudad = :id", {"id": ciudad_id})
                 conn.commit()
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `ciudad` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_ciudad, nombre, region, pais, observaciones FROM ciudad",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `ciudad`."""
+        return count_rows(self._connection_factory, "ciudad")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `ciudad` in one round trip."""
+        return fetch_change_token(self._connection_factory, "ciudad")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `ciudad` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "ciudad", rows)
+
     @staticmethod
     def _map_row(row: Sequence) -> Ciudad:
         return Ciudad(
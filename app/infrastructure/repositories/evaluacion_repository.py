@@ -1,14 +1,17 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 from datetime import date
 
 from app.domain.models.evaluacion import Evaluacion
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class EvaluacionRepository:
     """CRUD operations for evaluacion table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
         # cached resolved fecha column name for this repository (None if no date column)
         self._fecha_column_name: str | None = None
@@ -190,6 +193,44 @@ class EvaluacionRepository:
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `evaluacion` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT * FROM evaluacion",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `evaluacion`."""
+        return count_rows(self._connection_factory, "evaluacion")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `evaluacion` in one round trip."""
+        return fetch_change_token(self._connection_factory, "evaluacion")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `evaluacion` rows in one batch; returns rejected ``(offset, message)``.
+
+        Rows use the script's column names; they are renamed to the FK/fecha
+        columns this database actually has (see `_ensure_fk_column`).
+        """
+        if not rows:
+            return []
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                self._ensure_fk_column(cursor)
+                self._ensure_fecha_column(cursor)
+        renames = {"id_pelicula": (self._fk_column_name or "id_pelicula").lower()}
+        fecha_col = self._fecha_column_name.lower() if self._fecha_column_name else None
+        mapped = []
+        for row in rows:
+            out = {renames.get(k, k): v for k, v in row.items() if k != "fecha_evaluacion"}
+            if fecha_col and "fecha_evaluacion" in row:
+                out[fecha_col] = row["fecha_evaluacion"]
+            mapped.append(out)
+        return insert_many(self._connection_factory, "evaluacion", mapped)
+
     # legacy compat wrapper
     def _map_row(self, row: tuple) -> Evaluacion:
         return self._map_row_with_fecha(row)
@@ -0,0 +1,359 @@
+"""Generates the festival programme: packs película screenings into the sedes' days and writes them.
+
+Every active sede (``estado = 'Activa'``) offers one room per festival day,
+open from ``apertura`` to ``cierre``. Each película needs
+``funciones_por_pelicula`` screenings of ``duracion_minutos``, each followed
+by ``limpieza_minutes`` to empty and clean the room, starting on a
+``paso_minutes`` boundary (the ``hora`` of the funcion).
+
+:func:`pack` is a longest-processing-time heuristic over a heap of rooms::
+
+    for screening in (first showings, then second showings, ...) longest first:
+        pop the room with the most time left (larger capacidad_maxima on ties)
+        skip rooms without a free gap long enough (until one fits or none is left)
+        prefer, among the next LOOKAHEAD rooms, one on a day the película is not shown yet
+        book it at the start of the room's first gap that fits; push the room back
+
+Long films go first while rooms are empty, so short ones fill the gaps
+left at the end of the days; first showings are placed before repeats and
+so land in the biggest sedes. Each screening costs ``O(log R)`` for ``R``
+rooms (sedes times days) plus a scan of the room's free gaps while the first
+rooms popped fit it; one that fits only in a small gap (or nowhere) pops
+further, up to every room. Funciones
+already in the range (not cancelled) keep their place: they are blocked
+intervals of their room (padded by the cleaning time on both sides, merged
+like the participaciones in ``jury_assignment``), new screenings are packed
+in the gaps before, between and after them, and their películas need fewer
+new screenings.
+
+:class:`FestivalScheduler` reads películas, sedes and existing funciones in
+three queries and writes the plan in batches of ``batch_size`` funciones,
+each batch one :class:`UnitOfWork` (every funcion through
+``FuncionRepository.add`` for its id, the proyecciones with one
+``insert_many``).
+"""
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.domain.models.funcion import Funcion
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.repositories.bulk import insert_many
+from app.infrastructure.repositories.funcion_repository import FuncionRepository
+from app.infrastructure.repositories.jury_assignment import slot_of
+
+DEFAULT_APERTURA = time(10, 0)
+DEFAULT_CIERRE = time(23, 30)
+DEFAULT_LIMPIEZA_MINUTES = 20
+DEFAULT_PASO_MINUTES = 15
+DEFAULT_FUNCIONES_POR_PELICULA = 2
+DEFAULT_PRECIO = 5000
+DEFAULT_BATCH_SIZE = 200
+# rooms examined per screening before settling for a day that already shows the película
+LOOKAHEAD = 16
+OBSERVACIONES = "Programación automática"
+
+
+@dataclass(frozen=True)
+class Room:
+    """One sede on one festival day, with the ``(inicio, fin)`` of the funciones it already has."""
+
+    id_sede: int
+    dia: date
+    capacidad: int
+    abre: datetime
+    cierra: datetime
+    blocked: Tuple[Tuple[datetime, datetime], ...] = ()
+
+
+@dataclass(frozen=True)
+class Screening:
+    id_pelicula: int
+    id_sede: int
+    inicio: datetime
+    fin: datetime
+
+    @property
+    def hora(self) -> str:
+        return self.inicio.strftime("%H:%M")
+
+
+@dataclass
+class ProgramPlan:
+    """Screenings to create, what did not fit, and what was written."""
+
+    screenings: List[Screening] = field(default_factory=list)
+    # id_pelicula -> screenings that did not fit
+    unscheduled: Dict[int, int] = field(default_factory=dict)
+    # booked minutes (screening and cleaning) over the rooms' free minutes (not taken by existing funciones)
+    utilization: float = 0.0
+    funciones_written: int = 0
+    proyecciones_written: int = 0
+    # first error that stopped the writes (earlier batches stay committed)
+    error: Optional[str] = None
+    dry_run: bool = False
+
+
+def _ceil_to(moment: datetime, step: int) -> datetime:
+    minutes = moment.hour * 60 + moment.minute + (moment.second > 0 or moment.microsecond > 0)
+    rounded = math.ceil(minutes / step) * step
+    return datetime.combine(moment.date(), time()) + timedelta(minutes=rounded)
+
+
+def _free_gaps(room: Room, cleaning: timedelta) -> List[List[datetime]]:
+    """``[start, end]`` gaps of ``room`` around its blocked funciones, earliest first.
+
+    A gap before a blocked funcion ends ``cleaning`` ahead of it, so a
+    screening ending by ``end`` still leaves time to clean; the last gap ends
+    at ``cierra`` and, as before, its cleaning may run past the close.
+    """
+    merged: List[List[datetime]] = []
+    for start, end in sorted(room.blocked):
+        start, end = start - cleaning, end + cleaning
+        if merged and start < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    gaps: List[List[datetime]] = []
+    cursor = room.abre
+    for start, end in merged:
+        if start > cursor:
+            gaps.append([cursor, min(start, room.cierra)])
+        cursor = max(cursor, end)
+        if cursor >= room.cierra:
+            break
+    if cursor < room.cierra:
+        gaps.append([cursor, room.cierra])
+    return [gap for gap in gaps if gap[1] > gap[0]]
+
+
+def _minutes(gaps: Sequence[Sequence[datetime]]) -> float:
+    return sum((end - start).total_seconds() for start, end in gaps) / 60
+
+
+def _first_fit(gaps: Sequence[List[datetime]], length: timedelta, paso_minutes: int) -> Optional[Tuple[List[datetime], datetime]]:
+    """The earliest gap ``length`` fits in, and the boundary the screening starts on."""
+    for gap in gaps:
+        start = _ceil_to(gap[0], paso_minutes)
+        if start + length <= gap[1]:
+            return gap, start
+    return None
+
+
+def pack(
+    films: Sequence[Tuple[int, int]],
+    rooms: Sequence[Room],
+    needed: Dict[int, int],
+    shown: Optional[Dict[int, Set[date]]] = None,
+    limpieza_minutes: int = DEFAULT_LIMPIEZA_MINUTES,
+    paso_minutes: int = DEFAULT_PASO_MINUTES,
+) -> ProgramPlan:
+    """Place ``needed[id_pelicula]`` screenings of each ``(id_pelicula, duracion_minutos)`` in ``rooms``.
+
+    ``shown`` maps a película to the days it already screens on (avoided when
+    another room fits).
+    """
+    cleaning = timedelta(minutes=limpieza_minutes)
+    days: Dict[int, Set[date]] = {film: set(shown.get(film, ())) for film, _ in films} if shown else {}
+    jobs = [
+        (showing, -duration, film)
+        for film, duration in films
+        for showing in range(needed.get(film, 0))
+    ]
+    jobs.sort()
+
+    # (-minutes left, -capacidad, dia, id_sede); the free gaps of each room live in ``free``
+    heap: List[Tuple[float, int, date, int]] = []
+    free: Dict[Tuple[date, int], List[List[datetime]]] = {}
+    open_minutes = 0.0
+    for room in rooms:
+        gaps = _free_gaps(room, cleaning)
+        if not gaps:
+            continue
+        left = _minutes(gaps)
+        open_minutes += left
+        free[room.dia, room.id_sede] = gaps
+        heap.append((-left, -room.capacidad, room.dia, room.id_sede))
+    heapq.heapify(heap)
+
+    plan = ProgramPlan()
+    booked = 0.0
+    for _, negative_duration, film in jobs:
+        length = timedelta(minutes=-negative_duration)
+        film_days = days.setdefault(film, set())
+        examined: List[Tuple[float, int, date, int]] = []
+        fallback = None
+        choice = None
+        while heap:
+            entry = heapq.heappop(heap)
+            examined.append(entry)
+            # the most time left does not mean the longest gap: rooms that cannot
+            # fit the screening never end the search, only a fallback found in time does
+            fit = _first_fit(free[entry[2], entry[3]], length, paso_minutes)
+            if fit is None:
+                continue
+            if entry[2] not in film_days:
+                choice = (entry, fit)
+                break
+            if fallback is None:
+                fallback = (entry, fit)
+            if len(examined) >= LOOKAHEAD:
+                break
+        choice = choice or fallback
+        if choice is None:
+            plan.unscheduled[film] = plan.unscheduled.get(film, 0) + 1
+        else:
+            entry, (gap, start) = choice
+            examined.remove(entry)
+            gaps = free[entry[2], entry[3]]
+            end = start + length
+            plan.screenings.append(Screening(film, entry[3], start, end))
+            film_days.add(entry[2])
+            booked += (min(end + cleaning, gap[1]) - gap[0]).total_seconds() / 60
+            if end + cleaning < gap[1]:
+                gap[0] = end + cleaning
+            else:
+                gaps.remove(gap)
+            if gaps:
+                heapq.heappush(heap, (-_minutes(gaps), entry[1], entry[2], entry[3]))
+        for entry in examined:
+            heapq.heappush(heap, entry)
+    plan.utilization = min(booked / open_minutes, 1.0) if open_minutes else 0.0
+    plan.screenings.sort(key=lambda s: (s.inicio, s.id_sede))
+    return plan
+
+
+class FestivalScheduler:
+    """Programmes screenings of the películas in the active sedes from ``desde`` to ``hasta`` (inclusive)."""
+
+    def __init__(
+        self,
+        connection_factory: ConnectionFactory,
+        funciones_por_pelicula: int = DEFAULT_FUNCIONES_POR_PELICULA,
+        apertura: time = DEFAULT_APERTURA,
+        cierre: time = DEFAULT_CIERRE,
+        limpieza_minutes: int = DEFAULT_LIMPIEZA_MINUTES,
+        paso_minutes: int = DEFAULT_PASO_MINUTES,
+        precio_entrada: int = DEFAULT_PRECIO,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if funciones_por_pelicula < 1:
+            raise ValueError("Se requiere al menos una función por película")
+        if cierre <= apertura:
+            raise ValueError("El cierre debe ser posterior a la apertura")
+        if paso_minutes < 1 or limpieza_minutes < 0:
+            raise ValueError("El paso debe ser positivo y la limpieza no negativa")
+        self._connection_factory = connection_factory
+        self.funciones_por_pelicula = funciones_por_pelicula
+        self.apertura = apertura
+        self.cierre = cierre
+        self.limpieza_minutes = limpieza_minutes
+        self.paso_minutes = paso_minutes
+        self.precio_entrada = precio_entrada
+        self.batch_size = batch_size
+
+    def plan(self, desde: date, hasta: date, peliculas: Optional[Sequence[int]] = None) -> ProgramPlan:
+        """Screenings for ``peliculas`` (every película when None) on the festival days."""
+        if hasta < desde:
+            raise ValueError("La fecha final es anterior a la inicial")
+        wanted = set(peliculas) if peliculas is not None else None
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT id_pelicula, duracion_minutos FROM pelicula")
+                films = [(int(row[0]), int(row[1])) for row in cursor.fetchall() if wanted is None or int(row[0]) in wanted]
+                cursor.execute("SELECT id_sede, capacidad_maxima FROM sede WHERE estado = 'Activa'")
+                sedes = [(int(row[0]), int(row[1])) for row in cursor.fetchall()]
+                cursor.execute(
+                    "SELECT f.id_funcion, f.fecha, f.hora, f.id_sede, pr.id_pelicula, p.duracion_minutos "
+                    "FROM funcion f "
+                    "LEFT JOIN proyeccion pr ON pr.id_funcion = f.id_funcion "
+                    "LEFT JOIN pelicula p ON p.id_pelicula = pr.id_pelicula "
+                    "WHERE f.fecha >= :desde AND f.fecha < :despues AND f.estado_funcion <> 'Cancelada'",
+                    {"desde": desde, "despues": hasta + timedelta(days=1)},
+                )
+                existing = cursor.fetchall()
+
+        # existing funciones: total length, sede and day, and the películas they show
+        funciones: Dict[int, List[Any]] = {}
+        for id_funcion, fecha, hora, id_sede, id_pelicula, duracion in existing:
+            entry = funciones.setdefault(id_funcion, [fecha, hora, id_sede, 0, []])
+            if id_pelicula is not None:
+                entry[3] += duracion or 0
+                entry[4].append(int(id_pelicula))
+        blocked: Dict[Tuple[date, int], List[Tuple[datetime, datetime]]] = {}
+        screened: Counter = Counter()
+        shown: Dict[int, Set[date]] = {}
+        for id_funcion, (fecha, hora, id_sede, minutes, films_shown) in funciones.items():
+            slot = slot_of(id_funcion, fecha, hora, id_sede, minutes or None)
+            if slot is None:
+                continue
+            blocked.setdefault((slot.inicio.date(), int(id_sede)), []).append((slot.inicio, slot.fin))
+            for film in films_shown:
+                screened[film] += 1
+                shown.setdefault(film, set()).add(slot.inicio.date())
+
+        rooms: List[Room] = []
+        for offset in range((hasta - desde).days + 1):
+            dia = desde + timedelta(days=offset)
+            opens, closes = datetime.combine(dia, self.apertura), datetime.combine(dia, self.cierre)
+            for id_sede, capacidad in sedes:
+                rooms.append(Room(id_sede, dia, capacidad, opens, closes, tuple(blocked.get((dia, id_sede), ()))))
+        needed = {film: max(self.funciones_por_pelicula - screened[film], 0) for film, _ in films}
+        return pack(films, rooms, needed, shown, self.limpieza_minutes, self.paso_minutes)
+
+    def write(self, plan: ProgramPlan) -> ProgramPlan:
+        """Create a funcion and its proyeccion per screening, ``batch_size`` funciones per transaction."""
+        for start in range(0, len(plan.screenings), self.batch_size):
+            batch = plan.screenings[start:start + self.batch_size]
+            try:
+                with UnitOfWork(self._connection_factory) as uow:
+                    funciones = FuncionRepository(uow)
+                    proyecciones = []
+                    for screening in batch:
+                        id_funcion = funciones.add(Funcion(
+                            id=None,
+                            fecha=screening.inicio.date(),
+                            hora=screening.hora,
+                            precio_entrada=self.precio_entrada,
+                            estado_funcion="Programada",
+                            observaciones=OBSERVACIONES,
+                            id_sede=screening.id_sede,
+                        ))
+                        if id_funcion is None:
+                            raise RuntimeError(f"No se pudo crear la función de la película {screening.id_pelicula}")
+                        proyecciones.append({
+                            "id_funcion": id_funcion,
+                            "id_pelicula": screening.id_pelicula,
+                            "orden_proyeccion": 1,
+                            "comentarios": "Sin comentarios",
+                        })
+                    errors = insert_many(uow, "proyeccion", proyecciones)
+                    if errors:
+                        raise RuntimeError(f"Proyección rechazada: {errors[0][1]}")
+            except Exception as exc:
+                # driver errors and TransactionAborted alike: the unit rolled the batch back
+                plan.error = str(exc)
+                break
+            plan.funciones_written += len(batch)
+            plan.proyecciones_written += len(batch)
+        return plan
+
+    def schedule(
+        self,
+        desde: date,
+        hasta: date,
+        peliculas: Optional[Sequence[int]] = None,
+        dry_run: bool = False,
+    ) -> ProgramPlan:
+        """Plan the programme and, unless ``dry_run``, write it."""
+        plan = self.plan(desde, hasta, peliculas)
+        plan.dry_run = dry_run
+        if dry_run or not plan.screenings:
+            return plan
+        return self.write(plan)
@@ -1,18 +1,39 @@
 """Repository for Funcion (Función)."""
-from typing import List, Optional
+import logging
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.domain.models.funcion import Funcion
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.lookup import SEARCH_LIMIT, LookupItem, search_prefix
+from app.infrastructure.repositories.predicate import Predicate
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
+
+logger = logging.getLogger(__name__)
 
 
 class FuncionRepository:
     """Repository for FUNCION table."""
 
-    def __init__(self, connection: Optional[OracleConnection] = None):
+    SELECT_COLUMNS = "id_funcion, fecha, hora, precio_entrada, estado_funcion, observaciones, id_sede"
+    # columns a Predicate may reference (name -> SQL expression)
+    FILTER_COLUMNS = {
+        "id_funcion": "id_funcion",
+        "hora": "hora",
+        "precio_entrada": "precio_entrada",
+        "estado_funcion": "estado_funcion",
+        "observaciones": "observaciones",
+        "id_sede": "id_sede",
+    }
+    TEXT_COLUMNS = ("hora", "estado_funcion", "observaciones")
+    KEY_COLUMNS = ("id_funcion",)
+
+    def __init__(self, connection: Optional[ConnectionFactory] = None):
         """Initialize FuncionRepository.
 
         Args:
-            connection: OracleConnection instance. If None, a new one is created.
+            connection: Connection factory (see `app.infrastructure.database.backend`).
         """
         self.connection = connection
 
@@ -31,27 +52,57 @@ class FuncionRepository:
             ORDER BY fecha DESC, hora ASC
         """
         try:
-            cursor = self.connection.get_connection().cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            cursor.close()
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query)
+                    rows = cursor.fetchall()
 
-            return [
-                Funcion(
-                    id=row[0],
-                    fecha=str(row[1]) if row[1] else None,
-                    hora=row[2],
-                    precio_entrada=float(row[3]) if row[3] else None,
-                    estado_funcion=row[4],
-                    observaciones=row[5],
-                    id_sede=row[6],
-                )
-                for row in rows
-            ]
-        except Exception as e:
-            print(f"Error fetching funciones: {e}")
+            return [self._map_row(row) for row in rows]
+        except Exception:
+            logger.exception("Error fetching funciones")
             return []
 
+    def get_where(self, predicate: Predicate) -> List[Funcion]:
+        """Retrieve the functions matching ``predicate``, in ``get_all`` order."""
+        if not self.connection:
+            return []
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self.connection.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT {self.SELECT_COLUMNS} FROM funcion WHERE {where} ORDER BY fecha DESC, hora ASC",
+                    binds,
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(row) for row in rows]
+
+    def count_where(self, predicate: Predicate) -> int:
+        """Count the functions matching ``predicate`` without fetching them."""
+        if not self.connection:
+            return 0
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self.connection.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM funcion WHERE {where}", binds)
+                row = cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    def delete_where(self, predicate: Predicate) -> int:
+        """Delete every function matching ``predicate`` in one statement.
+
+        Returns the number of rows deleted; database errors (e.g. rows still
+        referenced by proyeccion/asistencia) are raised, nothing is deleted.
+        """
+        if not self.connection:
+            return 0
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self.connection.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"DELETE FROM funcion WHERE {where}", binds)
+                deleted = cursor.rowcount
+            conn.commit()
+        return deleted
+
     def get_by_id(self, funcion_id: int) -> Optional[Funcion]:
         """Retrieve a single function by ID.
 
@@ -70,10 +121,10 @@ class FuncionRepository:
             WHERE id_funcion = :id
         """
         try:
-            cursor = self.connection.get_connection().cursor()
-            cursor.execute(query, {"id": funcion_id})
-            row = cursor.fetchone()
-            cursor.close()
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, {"id": funcion_id})
+                    row = cursor.fetchone()
 
             if row:
                 return Funcion(
@@ -86,46 +137,53 @@ class FuncionRepository:
                     id_sede=row[6],
                 )
             return None
-        except Exception as e:
-            print(f"Error fetching funcion by id: {e}")
+        except Exception:
+            logger.exception("Error fetching funcion by id")
             return None
 
-    def add(self, funcion: Funcion) -> bool:
+    def add(self, funcion: Funcion) -> Optional[int]:
         """Add a new function to the database.
 
         Args:
             funcion: Funcion object to insert.
 
         Returns:
-            True if successful, False otherwise.
+            The generated id_funcion (so related rows can be written in the
+            same unit of work), or None if the insert failed.
         """
         if not self.connection or funcion.id is not None:
-            return False
+            return None
 
         query = """
             INSERT INTO funcion (fecha, hora, precio_entrada, estado_funcion, observaciones, id_sede)
             VALUES (:fecha, :hora, :precio_entrada, :estado_funcion, :observaciones, :id_sede)
+            RETURNING id_funcion INTO :new_id
         """
         try:
-            conn = self.connection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                query,
-                {
-                    "fecha": funcion.fecha,
-                    "hora": funcion.hora,
-                    "precio_entrada": funcion.precio_entrada,
-                    "estado_funcion": funcion.estado_funcion,
-                    "observaciones": funcion.observaciones,
-                    "id_sede": funcion.id_sede,
-                },
-            )
-            conn.commit()
-            cursor.close()
-            return True
-        except Exception as e:
-            print(f"Error adding funcion: {e}")
-            return False
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    id_var = cursor.var(int)
+                    cursor.execute(
+                        query,
+                        {
+                            "fecha": funcion.fecha,
+                            "hora": funcion.hora,
+                            "precio_entrada": funcion.precio_entrada,
+                            "estado_funcion": funcion.estado_funcion,
+                            "observaciones": funcion.observaciones,
+                            "id_sede": funcion.id_sede,
+                            "new_id": id_var,
+                        },
+                    )
+                    # `id_var.getvalue()` can return a single value or a sequence
+                    raw = id_var.getvalue()
+                conn.commit()
+            if isinstance(raw, (list, tuple)):
+                raw = raw[0]
+            return int(raw)
+        except Exception:
+            logger.exception("Error adding funcion")
+            return None
 
     def update(self, funcion: Funcion) -> bool:
         """Update an existing function.
@@ -147,25 +205,25 @@ class FuncionRepository:
             WHERE id_funcion = :id
         """
         try:
-            conn = self.connection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                query,
-                {
-                    "fecha": funcion.fecha,
-                    "hora": funcion.hora,
-                    "precio_entrada": funcion.precio_entrada,
-                    "estado_funcion": funcion.estado_funcion,
-                    "observaciones": funcion.observaciones,
-                    "id_sede": funcion.id_sede,
-                    "id": funcion.id,
-                },
-            )
-            conn.commit()
-            cursor.close()
-            return cursor.rowcount > 0
-        except Exception as e:
-            print(f"Error updating funcion: {e}")
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(
+                        query,
+                        {
+                            "fecha": funcion.fecha,
+                            "hora": funcion.hora,
+                            "precio_entrada": funcion.precio_entrada,
+                            "estado_funcion": funcion.estado_funcion,
+                            "observaciones": funcion.observaciones,
+                            "id_sede": funcion.id_sede,
+                            "id": funcion.id,
+                        },
+                    )
+                    updated = cursor.rowcount > 0
+                conn.commit()
+            return updated
+        except Exception:
+            logger.exception("Error updating funcion")
             return False
 
     def delete(self, funcion_id: int) -> bool:
@@ -182,15 +240,14 @@ class FuncionRepository:
 
         query = "DELETE FROM funcion WHERE id_funcion = :id"
         try:
-            conn = self.connection.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(query, {"id": funcion_id})
-            conn.commit()
-            result = cursor.rowcount > 0
-            cursor.close()
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, {"id": funcion_id})
+                    result = cursor.rowcount > 0
+                conn.commit()
             return result
-        except Exception as e:
-            print(f"Error deleting funcion: {e}")
+        except Exception:
+            logger.exception("Error deleting funcion")
             return False
 
     def delete_many(self, funcion_ids: List[int]) -> bool:
@@ -206,13 +263,57 @@ class FuncionRepository:
             return False
 
         try:
-            conn = self.connection.get_connection()
-            cursor = conn.cursor()
-            for funcion_id in funcion_ids:
-                cursor.execute("DELETE FROM funcion WHERE id_funcion = :id", {"id": funcion_id})
-            conn.commit()
-            cursor.close()
+            with self.connection.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    for funcion_id in funcion_ids:
+                        cursor.execute("DELETE FROM funcion WHERE id_funcion = :id", {"id": funcion_id})
+                conn.commit()
             return True
-        except Exception as e:
-            print(f"Error deleting multiple funciones: {e}")
+        except Exception:
+            logger.exception("Error deleting multiple funciones")
             return False
+
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `funcion` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self.connection,
+            "SELECT id_funcion, fecha, hora, precio_entrada, estado_funcion, observaciones, id_sede FROM funcion",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `funcion`."""
+        return count_rows(self.connection, "funcion")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `funcion` in one round trip."""
+        return fetch_change_token(self.connection, "funcion")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `funcion` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self.connection, "funcion", rows)
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> List[LookupItem]:
+        """Functions whose ID starts with ``text``, for the FK pickers."""
+        if not self.connection:
+            return []
+        return search_prefix(
+            self.connection,
+            "SELECT id_funcion, fecha, hora, estado_funcion, CAST(id_funcion AS VARCHAR2(20)) FROM funcion",
+            "CAST(id_funcion AS VARCHAR2(20))",
+            text,
+            limit,
+            lambda row: f"#{row[0]} — {str(row[1])[:10] if row[1] else ''} {row[2] or ''} ({row[3]})",
+        )
+
+    @staticmethod
+    def _map_row(row: Sequence) -> Funcion:
+        return Funcion(
+            id=row[0],
+            fecha=str(row[1]) if row[1] else None,
+            hora=row[2],
+            precio_entrada=float(row[3]) if row[3] else None,
+            estado_funcion=row[4],
+            observaciones=row[5],
+            id_sede=row[6],
+        )
@@ -1,17 +1,33 @@
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.domain.models.jurado import Jurado
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.local_mirror import LocalMirror
+from app.infrastructure.repositories.bulk import BatchErrors, insert_screened
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
+from app.infrastructure.repositories.uniqueness import UniquenessIndex
 
 
 class JuradoRepository:
     """CRUD operations for jurado table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    MIRROR_COLUMNS = (
+        "id_jurado", "nombre", "correo", "especialidad", "pais_origen",
+        "experiencia_anos", "tipo_jurado", "biografia",
+    )
+
+    def __init__(self, connection_factory: ConnectionFactory, mirror: Optional[LocalMirror] = None) -> None:
         self._connection_factory = connection_factory
+        self._mirror = mirror
+        # correos already taken, (re)loaded by add_many when the table changed
+        self.unique_index = UniquenessIndex.for_table("jurado")
 
     def get_all(self) -> List[Jurado]:
         """Retrieve all jurados from the database."""
+        if self._mirror is not None:
+            rows = self._mirror.fetch("jurado", self.MIRROR_COLUMNS, self._connection_factory)
+            return [self._map_row(row) for row in rows]
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -25,6 +41,13 @@ class JuradoRepository:
                 rows = cursor.fetchall()
         return [self._map_row(row) for row in rows]
 
+    def get_cached(self) -> Optional[List[Jurado]]:
+        """Return the locally mirrored rows without touching the database (None if unavailable)."""
+        if self._mirror is None:
+            return None
+        rows = self._mirror.cached_rows("jurado", self.MIRROR_COLUMNS)
+        return None if rows is None else [self._map_row(row) for row in rows]
+
     def get_by_id(self, id_jurado: int) -> Jurado | None:
         """Retrieve a single jurado by ID."""
         with self._connection_factory.get_connection() as conn:
@@ -69,7 +92,8 @@ class JuradoRepository:
                 id_cursor.execute("SELECT MAX(id_jurado) FROM jurado")
                 result = id_cursor.fetchone()
                 new_id = result[0] if isinstance(result, (tuple, list)) else result
-                return new_id if new_id is not None else None
+        self.unique_index.add({"correo": jurado.correo}, new_id)
+        return new_id if new_id is not None else None
 
     def update(self, jurado: Jurado) -> bool:
         """Update an existing jurado."""
@@ -102,6 +126,7 @@ class JuradoRepository:
                         },
                     )
                 conn.commit()
+            self.unique_index.invalidate()
             return True
         except Exception:
             return False
@@ -118,10 +143,35 @@ class JuradoRepository:
                         {f"id{i}": id_val for i, id_val in enumerate(ids)},
                     )
                 conn.commit()
+            self.unique_index.invalidate()
             return True
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `jurado` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_jurado, nombre, correo, especialidad, pais_origen, experiencia_anos, tipo_jurado, biografia FROM jurado",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `jurado`."""
+        return count_rows(self._connection_factory, "jurado")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `jurado` in one round trip."""
+        return fetch_change_token(self._connection_factory, "jurado")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]], on_duplicate: str = "reject") -> BatchErrors:
+        """Insert validated `jurado` rows in one batch; returns rejected ``(offset, message)``.
+
+        Rows whose correo already exists are screened out before the round
+        trip (``on_duplicate="merge"`` updates the existing jurado).
+        """
+        return insert_screened(self._connection_factory, self.unique_index, rows, on_duplicate)
+
     def _map_row(self, row: tuple) -> Jurado:
         """Map a database row to a Jurado object."""
         return Jurado(
@@ -0,0 +1,289 @@
+"""Assigns jurados to funciones without time clashes, balancing the load, and bulk-inserts the result.
+
+Each funcion occupies ``[fecha + hora, + duration)``, the duration being the
+sum of ``duracion_minutos`` of its proyecciones (``DEFAULT_DURATION_MINUTES``
+when it has none). A jurado can take two funciones when ``gap_minutes`` (time
+to move between sedes) separate them.
+
+:func:`schedule` is a greedy interval-partitioning pass with two heaps::
+
+    for funcion in funciones by start:
+        move jurados whose last funcion ended (busy heap, by free time) to the free heap
+        pop the least-loaded free jurados (free heap, by load), skipping clashes
+        take ``per_funcion`` of them, preferring especialidades not yet on the panel
+        push them to the busy heap until their new funcion ends (+ gap)
+
+so every pick costs ``O(log J)`` and the whole plan ``O((F * k + J) log J)``
+for ``F`` funciones, ``J`` jurados and ``k`` per funcion. Participaciones
+already in ``participacion_jurado`` are kept: they count towards the load,
+block their time slot and fill their funcion's panel. Among the new panel
+members of a funcion without a moderator, the best ranked ``tipo_jurado``
+(Permanente, then Honorario, then Invitado) becomes "Moderador".
+
+:class:`JuryAssigner` reads funciones, jurados and participaciones in three
+queries and writes the plan with one ``insert_many``.
+"""
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+
+DEFAULT_DURATION_MINUTES = 120
+DEFAULT_GAP_MINUTES = 30
+DEFAULT_PER_FUNCION = 3
+# funciones that still take new jurados
+DEFAULT_ESTADOS: Tuple[str, ...] = ("Programada",)
+# moderator preference (lower first)
+TIPO_RANK: Mapping[str, int] = {"Permanente": 0, "Honorario": 1, "Invitado": 2}
+# extra free jurados examined per funcion to find distinct especialidades
+LOOKAHEAD = 8
+COMENTARIO = "Asignación automática"
+
+
+@dataclass(frozen=True)
+class Slot:
+    id_funcion: int
+    inicio: datetime
+    fin: datetime
+    id_sede: int
+
+
+@dataclass(frozen=True)
+class Juror:
+    id_jurado: int
+    tipo_jurado: str
+    especialidad: str
+
+
+@dataclass
+class AssignmentPlan:
+    """New ``participacion_jurado`` rows, and what could not be covered."""
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    # id_funcion -> jurados still missing
+    short: Dict[int, int] = field(default_factory=dict)
+    # id_jurado -> funciones (existing and new)
+    load: Dict[int, int] = field(default_factory=dict)
+    # funciones left out because their hora could not be read
+    skipped: List[int] = field(default_factory=list)
+    # rows the database rejected on write
+    errors: BatchErrors = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def spread(self) -> Tuple[int, int]:
+        """Lowest and highest load over the jurados."""
+        if not self.load:
+            return 0, 0
+        return min(self.load.values()), max(self.load.values())
+
+
+def parse_hora(value: Any) -> Optional[time]:
+    """``"HH:MM"`` / ``"HH:MM:SS"`` (as typed in the funcion dialog), or None."""
+    parts = str(value or "").strip().split(":")
+    if not 2 <= len(parts) <= 3:
+        return None
+    try:
+        return time(*(int(part) for part in parts))
+    except ValueError:
+        return None
+
+
+def slot_of(id_funcion: int, fecha: Any, hora: Any, id_sede: int, minutes: Optional[float]) -> Optional[Slot]:
+    """The interval of a funcion row (None when ``fecha`` or ``hora`` is unusable)."""
+    start = parse_hora(hora)
+    if start is None or fecha is None:
+        return None
+    day = fecha.date() if isinstance(fecha, datetime) else fecha
+    if not isinstance(day, date):
+        return None
+    inicio = datetime.combine(day, start)
+    return Slot(id_funcion, inicio, inicio + timedelta(minutes=float(minutes or DEFAULT_DURATION_MINUTES)), id_sede)
+
+
+class _Blocked:
+    """A jurado's existing participaciones as merged, gap-padded intervals."""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, intervals: Iterable[Tuple[datetime, datetime]]) -> None:
+        self.starts: List[datetime] = []
+        self.ends: List[datetime] = []
+        for start, end in sorted(intervals):
+            if self.ends and start < self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def clashes(self, slot: Slot) -> bool:
+        i = bisect_left(self.starts, slot.fin)
+        return i > 0 and self.ends[i - 1] > slot.inicio
+
+
+def schedule(
+    slots: Sequence[Slot],
+    jurors: Sequence[Juror],
+    existing: Iterable[Tuple[int, int, str]] = (),
+    known: Optional[Mapping[int, Slot]] = None,
+    per_funcion: int = DEFAULT_PER_FUNCION,
+    gap_minutes: float = DEFAULT_GAP_MINUTES,
+    max_per_jurado: Optional[int] = None,
+) -> AssignmentPlan:
+    """Clash-free, load-balanced panels for ``slots``.
+
+    ``existing`` holds ``(id_jurado, id_funcion, rol_participacion)`` rows
+    already written; ``known`` maps every funcion they reference to its slot
+    (funciones missing from it do not block time).
+    """
+    gap = timedelta(minutes=gap_minutes)
+    known = known or {}
+    by_id = {juror.id_jurado: juror for juror in jurors}
+    load: Counter = Counter({juror.id_jurado: 0 for juror in jurors})
+    panels: Dict[int, Set[int]] = {}
+    moderated: Set[int] = set()
+    taken: Dict[int, List[Tuple[datetime, datetime]]] = {}
+    for id_jurado, id_funcion, rol in existing:
+        panels.setdefault(id_funcion, set()).add(id_jurado)
+        if rol == "Moderador":
+            moderated.add(id_funcion)
+        if id_jurado not in by_id:
+            continue
+        load[id_jurado] += 1
+        slot = known.get(id_funcion)
+        if slot is not None:
+            taken.setdefault(id_jurado, []).append((slot.inicio - gap, slot.fin + gap))
+    blocked = {id_jurado: _Blocked(intervals) for id_jurado, intervals in taken.items()}
+
+    plan = AssignmentPlan()
+    free: List[Tuple[int, int]] = [(load[j.id_jurado], j.id_jurado) for j in jurors]
+    heapq.heapify(free)
+    busy: List[Tuple[datetime, int]] = []
+    for slot in sorted(slots, key=lambda s: (s.inicio, s.id_funcion)):
+        panel = panels.setdefault(slot.id_funcion, set())
+        need = per_funcion - len(panel)
+        if need <= 0:
+            continue
+        while busy and busy[0][0] <= slot.inicio:
+            _, id_jurado = heapq.heappop(busy)
+            heapq.heappush(free, (load[id_jurado], id_jurado))
+
+        candidates: List[Tuple[int, int]] = []
+        unfit: List[Tuple[int, int]] = []
+        while free and len(candidates) < need + LOOKAHEAD:
+            entry = heapq.heappop(free)
+            id_jurado = entry[1]
+            at_cap = max_per_jurado is not None and load[id_jurado] >= max_per_jurado
+            clash = id_jurado in blocked and blocked[id_jurado].clashes(slot)
+            (unfit if at_cap or clash or id_jurado in panel else candidates).append(entry)
+
+        especialidades = {by_id[j].especialidad for j in panel if j in by_id}
+        chosen: List[int] = []
+        for _ in range(min(need, len(candidates))):
+            best = min(candidates, key=lambda e: (e[0], by_id[e[1]].especialidad in especialidades, e[1]))
+            candidates.remove(best)
+            chosen.append(best[1])
+            especialidades.add(by_id[best[1]].especialidad)
+        for entry in candidates + unfit:
+            heapq.heappush(free, entry)
+
+        moderator = None
+        if chosen and slot.id_funcion not in moderated:
+            moderator = min(chosen, key=lambda j: (TIPO_RANK.get(by_id[j].tipo_jurado, len(TIPO_RANK)), load[j], j))
+        for id_jurado in chosen:
+            load[id_jurado] += 1
+            panel.add(id_jurado)
+            heapq.heappush(busy, (slot.fin + gap, id_jurado))
+            plan.rows.append({
+                "id_jurado": id_jurado,
+                "id_funcion": slot.id_funcion,
+                "rol_participacion": "Moderador" if id_jurado == moderator else "Evaluador",
+                "comentarios": COMENTARIO,
+            })
+        if len(chosen) < need:
+            plan.short[slot.id_funcion] = need - len(chosen)
+    plan.load = dict(load)
+    return plan
+
+
+class JuryAssigner:
+    """Plans jurado panels for the open funciones and writes them to ``participacion_jurado``."""
+
+    def __init__(
+        self,
+        connection_factory: ConnectionFactory,
+        per_funcion: int = DEFAULT_PER_FUNCION,
+        gap_minutes: float = DEFAULT_GAP_MINUTES,
+        max_per_jurado: Optional[int] = None,
+        estados: Sequence[str] = DEFAULT_ESTADOS,
+    ) -> None:
+        if per_funcion < 1:
+            raise ValueError("Se requiere al menos un jurado por función")
+        if gap_minutes < 0:
+            raise ValueError("El descanso entre funciones no puede ser negativo")
+        self._connection_factory = connection_factory
+        self.per_funcion = per_funcion
+        self.gap_minutes = gap_minutes
+        self.max_per_jurado = max_per_jurado
+        self.estados = tuple(estados)
+
+    def _load(self) -> Tuple[List[Tuple[Any, ...]], List[Juror], List[Tuple[int, int, str]]]:
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT f.id_funcion, f.fecha, f.hora, f.id_sede, f.estado_funcion, SUM(p.duracion_minutos) "
+                    "FROM funcion f "
+                    "LEFT JOIN proyeccion pr ON pr.id_funcion = f.id_funcion "
+                    "LEFT JOIN pelicula p ON p.id_pelicula = pr.id_pelicula "
+                    "GROUP BY f.id_funcion, f.fecha, f.hora, f.id_sede, f.estado_funcion"
+                )
+                funciones = cursor.fetchall()
+                cursor.execute("SELECT id_jurado, tipo_jurado, especialidad FROM jurado")
+                jurors = [Juror(int(row[0]), row[1], row[2]) for row in cursor.fetchall()]
+                cursor.execute("SELECT id_jurado, id_funcion, rol_participacion FROM participacion_jurado")
+                existing = [(int(row[0]), int(row[1]), row[2]) for row in cursor.fetchall()]
+        return funciones, jurors, existing
+
+    def plan(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> AssignmentPlan:
+        """Panels for the funciones in ``estados`` dated from ``desde`` to before ``hasta``."""
+        funciones, jurors, existing = self._load()
+        known: Dict[int, Slot] = {}
+        open_slots: List[Slot] = []
+        skipped: List[int] = []
+        for id_funcion, fecha, hora, id_sede, estado, minutes in funciones:
+            slot = slot_of(int(id_funcion), fecha, hora, id_sede, minutes)
+            in_scope = estado in self.estados
+            if slot is None:
+                if in_scope:
+                    skipped.append(int(id_funcion))
+                continue
+            known[slot.id_funcion] = slot
+            day = slot.inicio.date()
+            if in_scope and (desde is None or day >= desde) and (hasta is None or day < hasta):
+                open_slots.append(slot)
+        plan = schedule(
+            open_slots,
+            jurors,
+            existing,
+            known,
+            per_funcion=self.per_funcion,
+            gap_minutes=self.gap_minutes,
+            max_per_jurado=self.max_per_jurado,
+        )
+        plan.skipped = skipped
+        return plan
+
+    def assign(self, desde: Optional[date] = None, hasta: Optional[date] = None, dry_run: bool = False) -> AssignmentPlan:
+        """Plan and bulk-insert the new participaciones (one ``executemany``, one commit)."""
+        plan = self.plan(desde, hasta)
+        plan.dry_run = dry_run
+        if not dry_run and plan.rows:
+            plan.errors = insert_many(self._connection_factory, "participacion_jurado", plan.rows)
+        return plan
@@ -0,0 +1,120 @@
+"""Incremental foreign-key lookup: prefix searches plus a shared result cache.
+
+Repositories that can be picked as a foreign key expose
+``search(text, limit)`` returning :class:`LookupItem` rows whose ``match``
+starts with ``text`` (case-insensitive), ``limit`` at most. The SQL is a
+``LOWER(col) LIKE 'abc%'`` over a function-based index (see
+``sql/script.sql``), so each keystroke costs one index range scan.
+
+:class:`LookupCache` sits in front of those calls. Results are kept per
+``(source, prefix)`` in an LRU, and a longer prefix is answered locally when a
+shorter one already returned fewer than ``limit`` rows: that answer was
+complete, so filtering it gives exactly what the server would return.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.predicate import like_prefix
+
+SEARCH_LIMIT = 20
+DEFAULT_CACHE_SIZE = 256
+# entries older than this are re-queried (rows added by other users show up)
+DEFAULT_CACHE_TTL = 120.0
+
+
+class LookupItem(NamedTuple):
+    key: int
+    label: str
+    # lower-cased text the prefix is matched against
+    match: str
+
+
+def search_prefix(
+    connection_factory: ConnectionFactory,
+    select: str,
+    match_expression: str,
+    text: str,
+    limit: int,
+    format_label: Callable[[Sequence[Any]], str],
+) -> List[LookupItem]:
+    """Run ``select WHERE match_expression LIKE :prefix`` for at most ``limit`` rows.
+
+    ``select`` must yield the key first; ``format_label`` builds the label from
+    the whole row and the match text is read back from the last column.
+    """
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"{select} WHERE {match_expression} LIKE :prefix ESCAPE '\\' "
+                f"ORDER BY {match_expression} FETCH FIRST {int(limit)} ROWS ONLY",
+                {"prefix": like_prefix(text)},
+            )
+            rows = cursor.fetchall()
+    return [LookupItem(int(row[0]), format_label(row), str(row[-1])) for row in rows]
+
+
+class LookupCache:
+    """Thread-safe LRU of lookup results keyed by ``(source, prefix)``."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE, ttl: float = DEFAULT_CACHE_TTL) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, List[LookupItem]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cached(self, source: str, text: str, limit: int = SEARCH_LIMIT) -> Optional[List[LookupItem]]:
+        """Return the answer for ``text`` without a query, or None if one is needed."""
+        prefix = text.strip().lower()
+        now = time.monotonic()
+        with self._lock:
+            for length in range(len(prefix), -1, -1):
+                key = (source, prefix[:length])
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                stored_at, items = entry
+                if now - stored_at > self._ttl:
+                    del self._entries[key]
+                    continue
+                if length == len(prefix):
+                    self._entries.move_to_end(key)
+                    return list(items)
+                if len(items) < limit:
+                    self._entries.move_to_end(key)
+                    return [item for item in items if item.match.startswith(prefix)]
+        return None
+
+    def store(self, source: str, text: str, items: List[LookupItem]) -> None:
+        with self._lock:
+            key = (source, text.strip().lower())
+            self._entries[key] = (time.monotonic(), list(items))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def search(
+        self, source: str, text: str, fetch: Callable[[str, int], List[LookupItem]], limit: int = SEARCH_LIMIT
+    ) -> List[LookupItem]:
+        """Answer from the cache, else call ``fetch(text, limit)`` and remember the result."""
+        items = self.cached(source, text, limit)
+        if items is None:
+            items = fetch(text, limit)
+            self.store(source, text, items)
+        return items
+
+    def invalidate(self, source: Optional[str] = None) -> None:
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == source]:
+                    del self._entries[key]
+
+
+# one cache for every picker in the process
+LOOKUP_CACHE = LookupCache()
@@ -1,13 +1,16 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 from app.domain.models.participacion_jurado import ParticipacionJurado
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class ParticipacionJuradoRepository:
     """CRUD operations for participacion_jurado table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
 
     def get_all(self) -> List[ParticipacionJurado]:
@@ -107,6 +110,37 @@ class ParticipacionJuradoRepository:
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `participacion_jurado` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_jurado, id_funcion, rol_participacion, comentarios FROM participacion_jurado",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `participacion_jurado`."""
+        return count_rows(self._connection_factory, "participacion_jurado")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `participacion_jurado` in one round trip."""
+        return fetch_change_token(self._connection_factory, "participacion_jurado")
+
+    def get_changed_since(self, scn: int) -> List[ParticipacionJurado]:
+        """Return the rows whose ``ORA_ROWSCN`` is newer than ``scn`` (inserts and updates)."""
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id_jurado, id_funcion, rol_participacion, comentarios FROM participacion_jurado WHERE ORA_ROWSCN > :scn",
+                    {"scn": scn},
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(row) for row in rows]
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `participacion_jurado` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "participacion_jurado", rows)
+
     def _map_row(self, row: tuple) -> ParticipacionJurado:
         """Map a database row to a ParticipacionJurado object."""
         return ParticipacionJurado(
@@ -1,20 +1,34 @@
 """Repository for Pelicula entity."""
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.domain.models.pelicula import Pelicula
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.local_mirror import LocalMirror
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.lookup import SEARCH_LIMIT, LookupItem, search_prefix
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class PeliculaRepository:
     """CRUD operations for pelicula table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    MIRROR_COLUMNS = (
+        "id_pelicula", "titulo", "pais_origen", "director", "duracion_minutos",
+        "genero", "clasificacion", "sinopsis",
+    )
+
+    def __init__(self, connection_factory: ConnectionFactory, mirror: Optional[LocalMirror] = None) -> None:
         self._connection_factory = connection_factory
+        self._mirror = mirror
 
     def get_all(self) -> List[Pelicula]:
         """Retrieve all peliculas from the database."""
+        if self._mirror is not None:
+            rows = self._mirror.fetch("pelicula", self.MIRROR_COLUMNS, self._connection_factory)
+            return [self._map_row(row) for row in rows]
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -28,6 +42,13 @@ class PeliculaRepository:
                 rows = cursor.fetchall()
         return [self._map_row(row) for row in rows]
 
+    def get_cached(self) -> Optional[List[Pelicula]]:
+        """Return the locally mirrored rows without touching the database (None if unavailable)."""
+        if self._mirror is None:
+            return None
+        rows = self._mirror.cached_rows("pelicula", self.MIRROR_COLUMNS)
+        return None if rows is None else [self._map_row(row) for row in rows]
+
     def get_by_id(self, id_pelicula: int) -> Pelicula | None:
         """Retrieve a single pelicula by ID."""
         with self._connection_factory.get_connection() as conn:
@@ -126,6 +147,37 @@ class PeliculaRepository:
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `pelicula` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_pelicula, titulo, pais_origen, director, duracion_minutos, genero, clasificacion, sinopsis FROM pelicula",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `pelicula`."""
+        return count_rows(self._connection_factory, "pelicula")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `pelicula` in one round trip."""
+        return fetch_change_token(self._connection_factory, "pelicula")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `pelicula` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "pelicula", rows)
+
+    def search(self, text: str, limit: int = SEARCH_LIMIT) -> List[LookupItem]:
+        """Peliculas whose title starts with ``text`` (case-insensitive), for the FK pickers."""
+        return search_prefix(
+            self._connection_factory,
+            "SELECT id_pelicula, titulo, LOWER(titulo) FROM pelicula",
+            "LOWER(titulo)",
+            text,
+            limit,
+            lambda row: f"{row[1]} (#{row[0]})",
+        )
+
     def _map_row(self, row: tuple) -> Pelicula:
         """Map a database row to a Pelicula object."""
         return Pelicula(
@@ -0,0 +1,98 @@
+"""Row predicates that repositories turn into set-based ``WHERE`` clauses.
+
+A :class:`Predicate` is what a grid filter and a "select all matching"
+selection share: the grid loads ``get_where(predicate)``, the selection keeps
+the same predicate instead of materialising every key, and the delete runs as
+one ``DELETE ... WHERE`` on the server.
+
+Column names never come from user input: repositories pass the mapping of
+filterable columns (name -> SQL expression) and unknown names are rejected;
+values are always bound.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+OPERATORS = {"=": "=", "!=": "<>", "<": "<", "<=": "<=", ">": ">", ">=": ">=", "contains": "LIKE"}
+
+
+@dataclass(frozen=True)
+class Condition:
+    """``column op value``; ``contains`` is a case-insensitive substring match."""
+
+    column: str
+    op: str
+    value: Any
+
+    def __post_init__(self) -> None:
+        if self.op not in OPERATORS:
+            raise ValueError(f"Operador no soportado: {self.op}")
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """AND of terms, each term an OR of conditions, minus explicitly excluded keys.
+
+    The empty predicate matches every row.
+    """
+
+    terms: Tuple[Tuple[Condition, ...], ...] = ()
+    excluded_keys: Tuple[Tuple[Any, ...], ...] = ()
+
+    def where(self, column: str, op: str, value: Any) -> "Predicate":
+        return Predicate(self.terms + ((Condition(column, op, value),),), self.excluded_keys)
+
+    def matching_text(self, columns: Sequence[str], text: str) -> "Predicate":
+        """Add "``text`` appears in any of ``columns``"; blank text adds nothing."""
+        text = text.strip()
+        if not text:
+            return self
+        return Predicate(self.terms + (tuple(Condition(c, "contains", text) for c in columns),), self.excluded_keys)
+
+    def excluding(self, keys: Sequence[Tuple[Any, ...]]) -> "Predicate":
+        """Return the predicate without the rows whose primary key is in ``keys``."""
+        return Predicate(self.terms, self.excluded_keys + tuple(tuple(k) for k in keys))
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.terms and not self.excluded_keys
+
+    def to_sql(self, columns: Mapping[str, str], key_columns: Sequence[str]) -> Tuple[str, Dict[str, Any]]:
+        """Return ``(where_clause, binds)``; ``columns`` maps allowed names to SQL expressions."""
+        clauses = []
+        binds: Dict[str, Any] = {}
+        for term in self.terms:
+            alternatives = []
+            for condition in term:
+                try:
+                    expression = columns[condition.column]
+                except KeyError:
+                    raise ValueError(f"Columna no filtrable: {condition.column}") from None
+                name = f"p{len(binds)}"
+                if condition.op == "contains":
+                    alternatives.append(f"LOWER({expression}) LIKE :{name} ESCAPE '\\'")
+                    binds[name] = f"%{_escape_like(str(condition.value).lower())}%"
+                else:
+                    alternatives.append(f"{expression} {OPERATORS[condition.op]} :{name}")
+                    binds[name] = condition.value
+            clauses.append(alternatives[0] if len(alternatives) == 1 else f"({' OR '.join(alternatives)})")
+        for key in self.excluded_keys:
+            if len(key) != len(key_columns):
+                raise ValueError("Clave excluida con número de columnas incorrecto")
+            parts = []
+            for column, value in zip(key_columns, key):
+                name = f"p{len(binds)}"
+                parts.append(f"{column} = :{name}")
+                binds[name] = value
+            clauses.append(f"NOT ({' AND '.join(parts)})")
+        return (" AND ".join(clauses) if clauses else "1 = 1"), binds
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def like_prefix(text: str) -> str:
+    """Lower-cased ``LIKE`` pattern matching values that start with ``text`` (use ``ESCAPE '\\'``)."""
+    return f"{_escape_like(text.strip().lower())}%"
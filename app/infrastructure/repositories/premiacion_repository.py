@@ -1,14 +1,17 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 from datetime import date
 
 from app.domain.models.premiacion import Premiacion
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class PremiacionRepository:
     """CRUD operations for premiacion table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
 
     def get_all(self) -> List[Premiacion]:
@@ -110,6 +113,37 @@ class PremiacionRepository:
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `premiacion` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_premio, id_pelicula, categoria, edicion, posicion, descripcion, fecha_premiacion FROM premiacion",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `premiacion`."""
+        return count_rows(self._connection_factory, "premiacion")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `premiacion` in one round trip."""
+        return fetch_change_token(self._connection_factory, "premiacion")
+
+    def get_changed_since(self, scn: int) -> List[Premiacion]:
+        """Return the rows whose ``ORA_ROWSCN`` is newer than ``scn`` (inserts and updates)."""
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id_premio, id_pelicula, categoria, edicion, posicion, descripcion, fecha_premiacion FROM premiacion WHERE ORA_ROWSCN > :scn",
+                    {"scn": scn},
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(row) for row in rows]
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `premiacion` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "premiacion", rows)
+
     def _map_row(self, row: tuple) -> Premiacion:
         if row is None:
             return None
@@ -1,13 +1,27 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 from app.domain.models.proyeccion import Proyeccion
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.predicate import Predicate
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class ProyeccionRepository:
     """CRUD operations for proyeccion table (composite PK: id_funcion, id_pelicula)."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    # columns a Predicate may reference (name -> SQL expression)
+    FILTER_COLUMNS = {
+        "id_funcion": "id_funcion",
+        "id_pelicula": "id_pelicula",
+        "orden_proyeccion": "orden_proyeccion",
+        "comentarios": "comentarios",
+    }
+    TEXT_COLUMNS = ("comentarios",)
+    KEY_COLUMNS = ("id_funcion", "id_pelicula")
+
+    def __init__(self, connection_factory: ConnectionFactory) -> None:
         self._connection_factory = connection_factory
 
     def get_all(self) -> List[Proyeccion]:
@@ -24,6 +38,38 @@ class ProyeccionRepository:
 
         return [self._map_row(r) for r in rows]
 
+    def get_where(self, predicate: Predicate) -> List[Proyeccion]:
+        """Return the rows matching ``predicate``, in ``get_all`` order."""
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id_funcion, id_pelicula, orden_proyeccion, comentarios "
+                    f"FROM proyeccion WHERE {where} ORDER BY id_funcion, id_pelicula",
+                    binds,
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(r) for r in rows]
+
+    def count_where(self, predicate: Predicate) -> int:
+        """Count the rows matching ``predicate`` without fetching them."""
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT COUNT(*) FROM proyeccion WHERE {where}", binds)
+                row = cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    def delete_where(self, predicate: Predicate) -> int:
+        """Delete every row matching ``predicate`` in one statement; returns the count."""
+        where, binds = predicate.to_sql(self.FILTER_COLUMNS, self.KEY_COLUMNS)
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"DELETE FROM proyeccion WHERE {where}", binds)
+                deleted = cursor.rowcount
+            conn.commit()
+        return deleted
+
     def get_by_id(self, id_) -> Proyeccion | None:
         # id_ expected to be (id_funcion, id_pelicula)
         if not (isinstance(id_, (list, tuple)) and len(id_) == 2):
@@ -107,6 +153,37 @@ class ProyeccionRepository:
         except Exception:
             return False
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `proyeccion` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_funcion, id_pelicula, orden_proyeccion, comentarios FROM proyeccion",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `proyeccion`."""
+        return count_rows(self._connection_factory, "proyeccion")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `proyeccion` in one round trip."""
+        return fetch_change_token(self._connection_factory, "proyeccion")
+
+    def get_changed_since(self, scn: int) -> List[Proyeccion]:
+        """Return the rows whose ``ORA_ROWSCN`` is newer than ``scn`` (inserts and updates)."""
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id_funcion, id_pelicula, orden_proyeccion, comentarios FROM proyeccion WHERE ORA_ROWSCN > :scn",
+                    {"scn": scn},
+                )
+                rows = cursor.fetchall()
+        return [self._map_row(row) for row in rows]
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `proyeccion` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "proyeccion", rows)
+
     def _map_row(self, row: tuple) -> Proyeccion:
         if row is None:
             return None
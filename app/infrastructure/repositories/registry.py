@@ -0,0 +1,45 @@
+"""Maps entity keys (as used by the UI menu) to their repository classes.
+
+Kept free of Qt imports so command line tools can build repositories without
+loading the GUI stack.
+"""
+from __future__ import annotations
+
+from typing import Dict
+
+from app.infrastructure.repositories.asistencia_repository import AsistenciaRepository
+from app.infrastructure.repositories.asistente_repository import AsistenteRepository
+from app.infrastructure.repositories.ciudad_repository import CiudadRepository
+from app.infrastructure.repositories.evaluacion_repository import EvaluacionRepository
+from app.infrastructure.repositories.funcion_repository import FuncionRepository
+from app.infrastructure.repositories.jurado_repository import JuradoRepository
+from app.infrastructure.repositories.participacion_jurado_repository import ParticipacionJuradoRepository
+from app.infrastructure.repositories.pelicula_repository import PeliculaRepository
+from app.infrastructure.repositories.premiacion_repository import PremiacionRepository
+from app.infrastructure.repositories.proyeccion_repository import ProyeccionRepository
+from app.infrastructure.repositories.sede_repository import SedeRepository
+
+REPOSITORY_CLASSES: Dict[str, type] = {
+    "ciudad": CiudadRepository,
+    "sede": SedeRepository,
+    "pelicula": PeliculaRepository,
+    "funcion": FuncionRepository,
+    "proyeccion": ProyeccionRepository,
+    "asistente": AsistenteRepository,
+    "asistencia": AsistenciaRepository,
+    "jurado": JuradoRepository,
+    "participacion_jurado": ParticipacionJuradoRepository,
+    "evaluacion": EvaluacionRepository,
+    "premiacion": PremiacionRepository,
+}
+
+ENTITY_KEYS = tuple(REPOSITORY_CLASSES)
+
+
+def create_repository(entity: str, connection_factory):
+    """Instantiate the repository registered for ``entity``."""
+    try:
+        repository_cls = REPOSITORY_CLASSES[entity]
+    except KeyError:
+        raise ValueError(f"Unknown entity: {entity}") from None
+    return repository_cls(connection_factory)
@@ -1,19 +1,29 @@
 """Repository layer for Sede entity (wraps `sede` table)."""
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from app.domain.models.sede import Sede
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.local_mirror import LocalMirror
+from app.infrastructure.repositories.bulk import BatchErrors, insert_many
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE, RowStream, count_rows
 
 
 class SedeRepository:
     """Handles CRUD operations over `sede` table."""
 
-    def __init__(self, connection_factory: OracleConnection) -> None:
+    MIRROR_COLUMNS = ("id_sede", "nombre", "direccion", "capacidad_maxima", "tipo_sede", "id_ciudad", "estado")
+
+    def __init__(self, connection_factory: ConnectionFactory, mirror: Optional[LocalMirror] = None) -> None:
         self._connection_factory = connection_factory
+        self._mirror = mirror
 
     def get_all(self) -> List[Sede]:
+        if self._mirror is not None:
+            rows = self._mirror.fetch("sede", self.MIRROR_COLUMNS, self._connection_factory)
+            return [self._map_row(row) for row in rows]
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
@@ -24,6 +34,13 @@ class SedeRepository:
 
         return [self._map_row(row) for row in rows]
 
+    def get_cached(self) -> Optional[List[Sede]]:
+        """Return the locally mirrored rows without touching the database (None if unavailable)."""
+        if self._mirror is None:
+            return None
+        rows = self._mirror.cached_rows("sede", self.MIRROR_COLUMNS)
+        return None if rows is None else [self._map_row(row) for row in rows]
+
     def get_by_id(self, sede_id: int) -> Optional[Sede]:
         with self._connection_factory.get_connection() as conn:
             with conn.cursor() as cursor:
@@ -92,6 +109,26 @@ class SedeRepository:
                     cursor.execute("DELETE FROM sede WHERE id_sede = :id", {"id": sede_id})
                 conn.commit()
 
+    def stream_rows(self, batch_size: int = DEFAULT_BATCH_SIZE) -> RowStream:
+        """Stream raw `sede` rows in ``fetchmany`` batches (no domain mapping)."""
+        return RowStream(
+            self._connection_factory,
+            "SELECT id_sede, nombre, direccion, capacidad_maxima, tipo_sede, id_ciudad, estado FROM sede",
+            batch_size=batch_size,
+        )
+
+    def count(self) -> int:
+        """Return the number of rows in `sede`."""
+        return count_rows(self._connection_factory, "sede")
+
+    def change_token(self) -> ChangeToken:
+        """Return the `ChangeToken` of `sede` in one round trip."""
+        return fetch_change_token(self._connection_factory, "sede")
+
+    def add_many(self, rows: Sequence[Dict[str, Any]]) -> BatchErrors:
+        """Insert validated `sede` rows in one batch; returns rejected ``(offset, message)``."""
+        return insert_many(self._connection_factory, "sede", rows)
+
     @staticmethod
     def _map_row(row: Sequence) -> Sede:
         return Sede(
@@ -0,0 +1,88 @@
+"""Cursor-level helpers to stream table rows without building domain objects."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class RowStream:
+    """Iterates the result of a SELECT in ``fetchmany`` batches.
+
+    The connection stays open while the stream is in use, so it must be used as
+    a context manager::
+
+        with repository.stream_rows() as stream:
+            for batch in stream.batches():
+                ...
+
+    Rows are yielded as the raw tuples returned by the driver.
+    """
+
+    def __init__(
+        self,
+        connection_factory,
+        query: str,
+        binds: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser mayor a 0")
+        self._connection_factory = connection_factory
+        self._query = query
+        self._binds = binds or {}
+        self._batch_size = batch_size
+        self._conn = None
+        self._cursor = None
+        self.columns: List[str] = []
+
+    def __enter__(self) -> "RowStream":
+        if self._connection_factory is None:
+            raise ConnectionError("No hay conexión configurada para exportar")
+        self._conn = self._connection_factory.get_connection()
+        try:
+            self._cursor = self._conn.cursor()
+            # arraysize drives how many rows the driver brings per round trip
+            self._cursor.arraysize = self._batch_size
+            self._cursor.execute(self._query, self._binds)
+            self.columns = [desc[0].lower() for desc in self._cursor.description]
+        except Exception:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def batches(self) -> Iterator[List[tuple]]:
+        """Yield lists of at most ``batch_size`` rows until the cursor is exhausted."""
+        if self._cursor is None:
+            raise RuntimeError("RowStream debe abrirse con 'with' antes de iterar")
+        while True:
+            rows = self._cursor.fetchmany(self._batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            finally:
+                self._cursor = None
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            finally:
+                self._conn = None
+
+
+def count_rows(connection_factory, table: str) -> int:
+    """Return ``COUNT(*)`` for ``table`` in a single round trip."""
+    if connection_factory is None:
+        return 0
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            row = cursor.fetchone()
+    return int(row[0]) if row else 0
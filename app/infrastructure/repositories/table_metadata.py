@@ -0,0 +1,127 @@
+"""Column lists, ordering, keys and row mappers of each table, without any connection.
+
+The synchronous repositories own these (their SELECT lists and ``_map_row``);
+this module collects them in one place so the async repositories and the
+:class:`~app.infrastructure.repositories.aggregate_loader.AggregateLoader`
+can build their own SELECTs and map rows to the same domain objects without
+instantiating a repository.
+
+``evaluacion`` is not listed: depending on the schema its película FK is
+``ID_FUNCION`` or ``ID_PELICULA`` and its date column ``FECHA``,
+``FECHA_EVALUACION`` or ``FECHA_REGISTRO`` (or none). Queries on it resolve
+the actual names with :func:`resolve_evaluacion_columns`, the same lookup
+``EvaluacionRepository`` does, instead of assuming the script's names
+(ORA-00904 otherwise).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from app.infrastructure.repositories.asistencia_repository import AsistenciaRepository
+from app.infrastructure.repositories.asistente_repository import AsistenteRepository
+from app.infrastructure.repositories.ciudad_repository import CiudadRepository
+from app.infrastructure.repositories.funcion_repository import FuncionRepository
+from app.infrastructure.repositories.jurado_repository import JuradoRepository
+from app.infrastructure.repositories.participacion_jurado_repository import ParticipacionJuradoRepository
+from app.infrastructure.repositories.pelicula_repository import PeliculaRepository
+from app.infrastructure.repositories.premiacion_repository import PremiacionRepository
+from app.infrastructure.repositories.proyeccion_repository import ProyeccionRepository
+from app.infrastructure.repositories.sede_repository import SedeRepository
+
+# first present wins, like EvaluacionRepository._ensure_fk_column / _ensure_fecha_column
+EVALUACION_FK_CANDIDATES: Tuple[str, ...] = ("ID_FUNCION", "ID_PELICULA")
+EVALUACION_FECHA_CANDIDATES: Tuple[str, ...] = ("FECHA", "FECHA_EVALUACION", "FECHA_REGISTRO")
+
+
+@dataclass(frozen=True)
+class TableMetadata:
+    """What a read path needs to know about one table."""
+
+    table: str
+    columns: Tuple[str, ...]
+    order_by: str
+    key_columns: Tuple[str, ...]
+    repository: type
+    # columns a Predicate may reference; None: every selected column
+    filter_columns: Optional[Mapping[str, str]] = None
+
+    @property
+    def row_mapper(self) -> Any:
+        # the raw class attribute keeps staticmethod / plain-method semantics intact
+        return vars(self.repository)["_map_row"]
+
+    def map_row(self, row: Sequence) -> Any:
+        mapper = self.row_mapper
+        if isinstance(mapper, staticmethod):
+            return mapper.__func__(row)
+        # the plain-method mappers only read ``row``
+        return mapper(None, row)
+
+
+TABLE_METADATA: Dict[str, TableMetadata] = {
+    "ciudad": TableMetadata("ciudad", CiudadRepository.MIRROR_COLUMNS, "id_ciudad", ("id_ciudad",), CiudadRepository),
+    "sede": TableMetadata("sede", SedeRepository.MIRROR_COLUMNS, "id_sede", ("id_sede",), SedeRepository),
+    "pelicula": TableMetadata(
+        "pelicula", PeliculaRepository.MIRROR_COLUMNS, "id_pelicula", ("id_pelicula",), PeliculaRepository
+    ),
+    "funcion": TableMetadata(
+        "funcion",
+        tuple(c.strip() for c in FuncionRepository.SELECT_COLUMNS.split(",")),
+        "fecha DESC, hora ASC",
+        FuncionRepository.KEY_COLUMNS,
+        FuncionRepository,
+        FuncionRepository.FILTER_COLUMNS,
+    ),
+    "proyeccion": TableMetadata(
+        "proyeccion",
+        ("id_funcion", "id_pelicula", "orden_proyeccion", "comentarios"),
+        "id_funcion, id_pelicula",
+        ProyeccionRepository.KEY_COLUMNS,
+        ProyeccionRepository,
+        ProyeccionRepository.FILTER_COLUMNS,
+    ),
+    "asistente": TableMetadata(
+        "asistente",
+        ("id_asistente", "nombre", "correo", "telefono", "edad", "ciudad_residencia", "tipo_asistente"),
+        "id_asistente",
+        ("id_asistente",),
+        AsistenteRepository,
+    ),
+    "asistencia": TableMetadata(
+        "asistencia",
+        ("id_funcion", "id_asistente", "entradas", "fecha_compra", "metodo_pago", "comentarios"),
+        "fecha_compra DESC",
+        ("id_funcion", "id_asistente"),
+        AsistenciaRepository,
+    ),
+    "jurado": TableMetadata("jurado", JuradoRepository.MIRROR_COLUMNS, "id_jurado", ("id_jurado",), JuradoRepository),
+    "participacion_jurado": TableMetadata(
+        "participacion_jurado",
+        ("id_jurado", "id_funcion", "rol_participacion", "comentarios"),
+        "id_jurado, id_funcion",
+        ("id_jurado", "id_funcion"),
+        ParticipacionJuradoRepository,
+    ),
+    "premiacion": TableMetadata(
+        "premiacion",
+        ("id_premio", "id_pelicula", "categoria", "edicion", "posicion", "descripcion", "fecha_premiacion"),
+        "id_premio",
+        ("id_premio",),
+        PremiacionRepository,
+    ),
+}
+
+
+def pick_evaluacion_columns(present: Iterable[str]) -> Tuple[str, Optional[str]]:
+    """``(fk, fecha)`` of ``evaluacion`` (lower case) among the column names ``present``."""
+    names = {str(name).upper() for name in present}
+    fk = next((c for c in EVALUACION_FK_CANDIDATES if c in names), "ID_PELICULA")
+    fecha = next((c for c in EVALUACION_FECHA_CANDIDATES if c in names), None)
+    return fk.lower(), fecha.lower() if fecha else None
+
+
+def resolve_evaluacion_columns(cursor: Any) -> Tuple[str, Optional[str]]:
+    """Look up ``evaluacion``'s FK and date column names with one dictionary query on ``cursor``."""
+    cursor.execute("SELECT column_name FROM user_tab_columns WHERE table_name = :table", {"table": "EVALUACION"})
+    return pick_evaluacion_columns(row[0] for row in cursor.fetchall())
@@ -0,0 +1,189 @@
+"""Client-side hash index of a table's UNIQUE keys, to pre-screen bulk inserts.
+
+``asistente`` enforces ``uq_asistente_correo`` / ``uq_asistente_telefono`` and
+``jurado`` ``uq_jurado_correo``. Without an index, a duplicate in a
+registration file only shows up as an ORA-00001 batch error after the round
+trip (and on SQLite it forces the row-by-row retry of the whole batch).
+
+:class:`UniquenessIndex` loads every existing key once (one ``SELECT`` of the
+primary key and the unique columns) into one dict per constraint, mapping the
+key to the id of the row that owns it, and remembers the table's
+:class:`ChangeToken` it was loaded under. Every bulk call probes the token
+first and reloads the index when it moved, so rows written or deleted by
+another repository, a cascade delete or another session are seen before any
+row is screened. Rows the call inserts itself are added; the token is then
+taken again and kept only when the row count moved by exactly those rows
+(otherwise the index is dropped and the next call reloads it). Updates and
+deletes through the repository drop the index too. The database remains the
+authority; a row another session inserts between the probe and the insert
+is still rejected by the constraint and reported as before.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.infrastructure.database.backend import ConnectionFactory
+from app.infrastructure.database.schema import Schema, load_schema
+from app.infrastructure.repositories.change_token import ChangeToken, fetch_change_token
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+# constraint name -> id of the row holding the key (None: inserted by a bulk call, id unknown)
+Conflicts = Dict[str, Optional[int]]
+
+
+def _key(row: Mapping[str, Any], columns: Tuple[str, ...]) -> Any:
+    # single-column keys are stored bare: no tuple per row on the hot path
+    if len(columns) == 1:
+        return row.get(columns[0])
+    key = tuple(row.get(c) for c in columns)
+    return None if None in key else key
+
+
+class UniquenessIndex:
+    """Existing values of the UNIQUE constraints of ``table``, keyed by constraint name."""
+
+    def __init__(self, table: str, keys: Mapping[str, Tuple[str, ...]], id_column: str) -> None:
+        self.table = table
+        self.keys = dict(keys)
+        self.id_column = id_column
+        self._index: Optional[Dict[str, Dict[Any, Optional[int]]]] = None
+        # token of the table the index reflects
+        self.token: Optional[ChangeToken] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_table(cls, table: str, schema: Optional[Schema] = None) -> "UniquenessIndex":
+        definition = (schema or load_schema()).table(table)
+        return cls(definition.name, definition.unique, definition.primary_key[0])
+
+    @property
+    def loaded(self) -> bool:
+        return self._index is not None
+
+    @property
+    def key_columns(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(column for columns in self.keys.values() for column in columns))
+
+    def load(
+        self,
+        connection_factory: ConnectionFactory,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        token: Optional[ChangeToken] = None,
+    ) -> None:
+        """(Re)build the index from the table in one streamed query.
+
+        ``token`` is the table's token taken just before (probed when omitted).
+        """
+        if token is None:
+            token = fetch_change_token(connection_factory, self.table)
+        columns = self.key_columns
+        index: Dict[str, Dict[Any, Optional[int]]] = {name: {} for name in self.keys}
+        positions = {name: tuple(1 + columns.index(c) for c in key) for name, key in self.keys.items()}
+        with connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT {self.id_column}, {', '.join(columns)} FROM {self.table}")
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for name, where in positions.items():
+                        values = index[name]
+                        if len(where) == 1:
+                            (i,) = where
+                            values.update((row[i], row[0]) for row in rows if row[i] is not None)
+                            continue
+                        for row in rows:
+                            key = tuple(row[i] for i in where)
+                            if None not in key:
+                                values[key] = row[0]
+        with self._lock:
+            self._index = index
+            self.token = token
+
+    def refresh(self, connection_factory: ConnectionFactory) -> bool:
+        """Reload the index unless the table's token is the one it was loaded under.
+
+        Returns True when it was (re)loaded.
+        """
+        token = fetch_change_token(connection_factory, self.table)
+        if self._index is not None and token == self.token:
+            return False
+        self.load(connection_factory, token=token)
+        return True
+
+    def settle(self, connection_factory: ConnectionFactory, inserted: int) -> None:
+        """Take the token after a bulk call that inserted ``inserted`` rows.
+
+        The index already holds those rows; any other change in the count
+        means someone else wrote meanwhile, and the index is dropped.
+        """
+        before = self.token
+        token = fetch_change_token(connection_factory, self.table)
+        with self._lock:
+            if before is None or self._index is None or token.count != before.count + inserted:
+                self._index = None
+                self.token = None
+            else:
+                self.token = token
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._index = None
+            self.token = None
+
+    def _keys_of(self, row: Mapping[str, Any]) -> List[Tuple[str, Any]]:
+        keys = []
+        for name, columns in self.keys.items():
+            key = _key(row, columns)
+            if key is not None:
+                keys.append((name, key))
+        return keys
+
+    def conflicts(self, row: Mapping[str, Any]) -> Conflicts:
+        """Constraints ``row`` would violate, with the id of the row already holding each key."""
+        index = self._index
+        if index is None:
+            return {}
+        return {name: index[name][key] for name, key in self._keys_of(row) if key in index[name]}
+
+    def claim(self, row: Mapping[str, Any]) -> Conflicts:
+        """Record the keys of ``row`` about to be inserted, unless one is taken.
+
+        Returns the conflicts (empty when the keys were recorded): one pass
+        of :meth:`conflicts` and :meth:`add` for the bulk path.
+        """
+        with self._lock:
+            index = self._index
+            if index is None:
+                return {}
+            keys = self._keys_of(row)
+            conflicts = {name: index[name][key] for name, key in keys if key in index[name]}
+            if not conflicts:
+                for name, key in keys:
+                    index[name][key] = None
+            return conflicts
+
+    def add(self, row: Mapping[str, Any], row_id: Optional[int] = None) -> None:
+        """Record the keys of a row written to the table (no-op while not loaded)."""
+        with self._lock:
+            if self._index is None:
+                return
+            for name, key in self._keys_of(row):
+                self._index[name][key] = row_id
+
+    def discard(self, row: Mapping[str, Any]) -> None:
+        """Forget keys recorded by :meth:`add` / :meth:`claim` for a row that was not written."""
+        with self._lock:
+            if self._index is None:
+                return
+            for name, key in self._keys_of(row):
+                self._index[name].pop(key, None)
+
+    @staticmethod
+    def describe(conflicts: Conflicts, row: Mapping[str, Any], keys: Mapping[str, Tuple[str, ...]]) -> str:
+        parts = []
+        for name, owner in conflicts.items():
+            values = ", ".join(f"{c}={row.get(c)!r}" for c in keys[name])
+            parts.append(f"{name}: ya existe ({values})" + (f" en {owner}" if owner is not None else ""))
+        return "; ".join(parts)
@@ -0,0 +1,64 @@
+"""Export any festival table to CSV or JSON Lines from the command line.
+
+Usage (from the project root):
+    python -m app.scripts.export_table asistencia asistencias.csv
+    python -m app.scripts.export_table funcion funciones.jsonl --batch-size 5000
+
+Press Ctrl+C to cancel; the partial file is discarded.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from app.infrastructure.database.backend import create_connection_factory
+from app.infrastructure.export.table_exporter import EXPORT_FORMATS, export_table
+from app.infrastructure.repositories.registry import ENTITY_KEYS, create_repository
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+
+def build_parser() -> argparse.ArgumentParser:
+    return add_arguments(argparse.ArgumentParser(description="Exporta una tabla a CSV o JSONL"))
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Declare this command's options on ``parser`` (shared with ``app.cli``)."""
+    parser.add_argument("entity", choices=ENTITY_KEYS, help="Tabla a exportar")
+    parser.add_argument("output", type=Path, help="Archivo de salida (.csv o .jsonl)")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default=None, help="Formato (por defecto según extensión)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Filas por fetchmany")
+    parser.add_argument("--settings", type=Path, default=Path("config/settings.json"))
+    return parser
+
+
+def main(argv=None) -> int:
+    return run(build_parser().parse_args(argv))
+
+
+def run(args: argparse.Namespace) -> int:
+    connection = create_connection_factory(args.settings)
+    repository = create_repository(args.entity, connection)
+
+    def report(done: int, total: int) -> None:
+        suffix = f"/{total}" if total else ""
+        print(f"\r{args.entity}: {done}{suffix} filas", end="", file=sys.stderr, flush=True)
+
+    try:
+        result = export_table(
+            repository,
+            args.output,
+            fmt=args.format,
+            batch_size=args.batch_size,
+            progress=report,
+        )
+    except KeyboardInterrupt:
+        print("\nExportación cancelada", file=sys.stderr)
+        return 130
+    print(file=sys.stderr)
+    print(f"[OK] {result.rows} filas exportadas a {result.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""Bulk-load a CSV or JSON Lines file into any festival table.
+
+Usage (from the project root):
+    python -m app.scripts.import_table asistente asistentes.csv
+    python -m app.scripts.import_table funcion funciones.jsonl --batch-size 5000
+    python -m app.scripts.import_table asistente inscritos.csv --on-duplicate merge
+
+Rows are validated against `sql/script.sql` before they are sent; rejected
+rows are written to `<archivo>.errors.<ext>` with the reason. Ctrl+C stops
+the run; batches already committed are kept.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from app.infrastructure.database.backend import create_connection_factory
+from app.infrastructure.importer.bulk_importer import IMPORT_FORMATS, import_table
+from app.infrastructure.repositories.bulk import DUPLICATE_POLICIES
+from app.infrastructure.repositories.registry import ENTITY_KEYS, create_repository
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+
+def build_parser() -> argparse.ArgumentParser:
+    return add_arguments(argparse.ArgumentParser(description="Importa un archivo CSV o JSONL a una tabla"))
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Declare this command's options on ``parser`` (shared with ``app.cli``)."""
+    parser.add_argument("entity", choices=ENTITY_KEYS, help="Tabla de destino")
+    parser.add_argument("input", type=Path, help="Archivo de entrada (.csv o .jsonl)")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Formato (por defecto según extensión)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Filas por executemany/commit")
+    parser.add_argument("--errors", type=Path, default=None, help="Archivo de filas rechazadas")
+    parser.add_argument("--keep-ids", action="store_true", help="Conservar los valores de columnas IDENTITY")
+    parser.add_argument(
+        "--on-duplicate",
+        choices=DUPLICATE_POLICIES,
+        default=None,
+        help="asistente / jurado: rechazar (por defecto) o fusionar filas cuyo correo/teléfono ya existe",
+    )
+    parser.add_argument("--settings", type=Path, default=Path("config/settings.json"))
+    return parser
+
+
+def main(argv=None) -> int:
+    return run(build_parser().parse_args(argv))
+
+
+def run(args: argparse.Namespace) -> int:
+    connection = create_connection_factory(args.settings)
+    repository = create_repository(args.entity, connection)
+
+    def report(read: int, inserted: int, rejected: int) -> None:
+        print(
+            f"\r{args.entity}: {read} leídas, {inserted} insertadas, {rejected} rechazadas",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    try:
+        result = import_table(
+            repository,
+            args.entity,
+            args.input,
+            fmt=args.format,
+            batch_size=args.batch_size,
+            errors_path=args.errors,
+            keep_ids=args.keep_ids,
+            progress=report,
+            on_duplicate=args.on_duplicate,
+        )
+    except KeyboardInterrupt:
+        print("\nImportación interrumpida; los lotes ya confirmados se conservan", file=sys.stderr)
+        return 130
+    print(file=sys.stderr)
+    print(f"[OK] {result.inserted} filas insertadas en {args.entity} ({result.rejected} rechazadas)")
+    if result.errors_path:
+        print(f"Filas rechazadas: {result.errors_path}")
+    return 0 if not result.rejected else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,7 +6,7 @@ from pathlib import Path
 from datetime import date, timedelta
 import traceback
 
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import create_connection_factory
 from app.infrastructure.repositories.ciudad_repository import CiudadRepository
 from app.infrastructure.repositories.sede_repository import SedeRepository
 from app.infrastructure.repositories.pelicula_repository import PeliculaRepository
@@ -63,9 +63,8 @@ def _add_and_get_id(repo, add_fn_name, obj, id_attr_names):
     return None
 
 
-def main():
-    settings = Path('config/settings.json')
-    conn = OracleConnection.from_settings(settings)
+def main(settings: Path = Path('config/settings.json')):
+    conn = create_connection_factory(settings)
 
     ciudad_repo = CiudadRepository(conn)
     sede_repo = SedeRepository(conn)
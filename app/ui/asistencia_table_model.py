@@ -1,6 +1,10 @@
+from operator import attrgetter
+
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor
 from app.domain.models.asistencia import Asistencia
+from app.ui.column_store import ColumnStore
+from app.ui.numeric_columns import FooterAggregate, NumericColumns
 
 
 class AsistenciaTableModel(QAbstractTableModel):
@@ -14,11 +18,21 @@ class AsistenciaTableModel(QAbstractTableModel):
     METODO_PAGO_COLUMN = 5
     COMENTARIOS_COLUMN = 6
     ACTION_COLUMN = 7
+    CATEGORICAL_COLUMNS = ("metodo_pago",)
+    FOOTER = (
+        FooterAggregate("Entradas", "sum", "entradas"),
+        FooterAggregate("Recaudación", "sum", "recaudacion", prefix="$"),
+    )
+    FOOTER_CATEGORIES = ("metodo_pago",)
 
     def __init__(self):
         super().__init__()
         self.asistencias = []
         self.selected_rows = set()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
+        self.numbers = NumericColumns({"entradas": attrgetter("entradas"), "id_funcion": attrgetter("id_funcion")})
+        # id_funcion -> precio_entrada, for the revenue total
+        self._precios = {}
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.asistencias)
@@ -50,7 +64,7 @@ class AsistenciaTableModel(QAbstractTableModel):
             elif index.column() == self.FECHA_COMPRA_COLUMN:
                 return str(asistencia.fecha_compra)
             elif index.column() == self.METODO_PAGO_COLUMN:
-                return asistencia.metodo_pago
+                return self.categories.value("metodo_pago", index.row())
             elif index.column() == self.COMENTARIOS_COLUMN:
                 return asistencia.comentarios
             elif index.column() == self.ACTION_COLUMN:
@@ -79,9 +93,21 @@ class AsistenciaTableModel(QAbstractTableModel):
         """Actualiza la lista de asistencias en la tabla."""
         self.beginResetModel()
         self.asistencias = asistencias
+        self.categories.encode(asistencias)
+        self.numbers.load(asistencias)
+        self.numbers.lookup("precio_entrada", "id_funcion", self._precios)
+        self.numbers.product("recaudacion", "entradas", "precio_entrada")
         self.selected_rows.clear()
         self.endResetModel()
 
+    def set_precios(self, precios: dict):
+        """Precios por función para la recaudación; se aplican en la próxima actualización."""
+        self._precios = precios
+
+    def footer_mask(self):
+        """Filas marcadas para el pie de tabla, o None para todas."""
+        return sorted(self.selected_rows) if self.selected_rows else None
+
     def get_selected_ids(self) -> list:
         """Retorna lista de tuplas (id_funcion, id_asistente) seleccionadas."""
         return [(self.asistencias[row].id_funcion, self.asistencias[row].id_asistente) for row in self.selected_rows]
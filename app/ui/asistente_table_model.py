@@ -6,6 +6,7 @@ from typing import List, Sequence, Set
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
 
 from app.domain.models.asistente import Asistente
+from app.ui.column_store import ColumnStore
 
 
 class AsistenteTableModel(QAbstractTableModel):
@@ -23,11 +24,14 @@ class AsistenteTableModel(QAbstractTableModel):
     )
     SELECT_COLUMN = 0
     ACTION_COLUMN = len(HEADERS) - 1
+    CATEGORICAL_COLUMNS = ("tipo_asistente",)
 
     def __init__(self, asistentes: List[Asistente] | None = None) -> None:
         super().__init__()
         self._asistentes: List[Asistente] = asistentes or []
         self._selected_ids: Set[int] = set()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
+        self.categories.encode(self._asistentes)
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         return len(self._asistentes)
@@ -58,7 +62,7 @@ class AsistenteTableModel(QAbstractTableModel):
             3: asistente.telefono,
             4: asistente.edad,
             5: asistente.ciudad_residencia,
-            6: asistente.tipo_asistente,
+            6: self.categories.value("tipo_asistente", index.row()),
             self.ACTION_COLUMN: "Detalle",
         }
         value = values.get(column, "")
@@ -111,6 +115,7 @@ class AsistenteTableModel(QAbstractTableModel):
 
         self.beginResetModel()
         self._asistentes = asistentes
+        self.categories.encode(asistentes)
         current_ids = {asistente.id for asistente in asistentes if asistente.id is not None}
         self._selected_ids.intersection_update(current_ids)
         self.endResetModel()
@@ -0,0 +1,83 @@
+"""Categorical columns of the table models: interned strings plus one integer code per row.
+
+Columns such as ``estado_funcion`` or ``metodo_pago`` take a handful of
+values (the ``CHECK ... IN (...)`` lists of ``sql/script.sql``), yet the
+driver allocates a new string for every row. ``ColumnStore.encode`` keeps one
+value table per column and points each row's attribute back at the shared
+value, so 100 000 funciones hold four ``estado_funcion`` strings instead of
+100 000. The models' ``data()`` reads the cell through :meth:`ColumnStore.value`,
+backed by a compact ``array`` of codes (one byte per row up to 256 distinct
+values). :meth:`ColumnStore.counts` tallies those codes, integers rather than
+strings, for the per-value counts of the footer (``FOOTER_CATEGORIES``)::
+
+    store = ColumnStore(("estado_funcion",))
+    store.encode(funciones)
+    store.value("estado_funcion", 3)   # "Programada", the shared instance
+    store.counts("estado_funcion")     # [("Programada", 812), ("Finalizada", 150), ...]
+"""
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# widest code needed for a value table of n entries: 1, 2 or 4 bytes per row
+_TYPECODES = ((1 << 8, "B"), (1 << 16, "H"), (1 << 32, "L"))
+
+
+class CategoricalColumn:
+    """One column as a value table plus one code per row."""
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = []
+        self.codes = array("B")
+        self._code_of: Dict[Optional[str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.values[self.codes[row]]
+
+    def append(self, value: Optional[str]) -> Optional[str]:
+        """Add a row and return the shared instance of ``value``."""
+        code = self._code_of.get(value)
+        if code is None:
+            code = len(self.values)
+            self._code_of[value] = code
+            self.values.append(value)
+            self._widen(len(self.values))
+        self.codes.append(code)
+        return self.values[code]
+
+    def _widen(self, distinct: int) -> None:
+        for limit, typecode in _TYPECODES:
+            if distinct <= limit:
+                if self.codes.typecode != typecode:
+                    self.codes = array(typecode, self.codes)
+                return
+
+
+class ColumnStore:
+    """Categorical columns of a table model, rebuilt on every ``encode``."""
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        self.columns = tuple(columns)
+        self._columns: Dict[str, CategoricalColumn] = {name: CategoricalColumn() for name in self.columns}
+
+    def encode(self, rows: Iterable[Any]) -> None:
+        """Encode the ``columns`` attributes of ``rows``, sharing one string per distinct value."""
+        self._columns = {name: CategoricalColumn() for name in self.columns}
+        encoded = [(name, self._columns[name]) for name in self.columns]
+        for row in rows:
+            for name, column in encoded:
+                setattr(row, name, column.append(getattr(row, name, None)))
+
+    def value(self, name: str, row: int) -> Optional[str]:
+        return self._columns[name][row]
+
+    def counts(self, name: str, rows: Optional[Sequence[int]] = None) -> List[Tuple[Optional[str], int]]:
+        """Rows per value of ``name`` (over ``rows`` when given), most frequent first."""
+        column = self._columns[name]
+        codes = column.codes if rows is None else (column.codes[row] for row in rows)
+        return [(column.values[code], count) for code, count in Counter(codes).most_common()]
@@ -1,22 +1,73 @@
 """Custom delegates for table interactions."""
 from __future__ import annotations
 
-from PyQt6.QtCore import QEvent, QModelIndex, QPoint, pyqtSignal
-from PyQt6.QtGui import QMouseEvent
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import QEvent, QModelIndex, QPoint, QRect, Qt, pyqtSignal
+from PyQt6.QtGui import QMouseEvent, QPainter, QPixmap
 from PyQt6.QtWidgets import QApplication, QStyle, QStyleOptionButton, QStyledItemDelegate
 
+# (width, height, hovered, palette key, device pixel ratio, style)
+_CacheKey = Tuple[int, int, bool, int, float, int]
+
 
 class DetailButtonDelegate(QStyledItemDelegate):
-    """Renders a push button on a table cell and emits clicks."""
+    """Renders a push button on a table cell and emits clicks.
+
+    Every "Detalle" cell looks the same for a given size, hover state and
+    palette, so the native style draw happens once per combination into a
+    QPixmap that later repaints just blit.
+    """
 
     clicked = pyqtSignal(int)
 
+    TEXT = "Detalle"
+    # a handful of row heights x hover states; cleared wholesale when exceeded
+    CACHE_LIMIT = 32
+
+    def __init__(self, parent=None, use_cache: bool = True) -> None:
+        super().__init__(parent)
+        self._use_cache = use_cache
+        self._pixmaps: Dict[_CacheKey, QPixmap] = {}
+
     def paint(self, painter, option, index):  # type: ignore[override]
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        if not self._use_cache:
+            self._draw_button(painter, rect, hovered, option.palette)
+            return
+
+        style = QApplication.style()
+        ratio = painter.device().devicePixelRatioF()
+        key = (rect.width(), rect.height(), hovered, option.palette.cacheKey(), ratio, id(style))
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            if len(self._pixmaps) >= self.CACHE_LIMIT:
+                self._pixmaps.clear()
+            pixmap = QPixmap(round(rect.width() * ratio), round(rect.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap_painter = QPainter(pixmap)
+            try:
+                self._draw_button(pixmap_painter, QRect(0, 0, rect.width(), rect.height()), hovered, option.palette)
+            finally:
+                pixmap_painter.end()
+            self._pixmaps[key] = pixmap
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    def clear_cache(self) -> None:
+        """Drop cached renderings (e.g. after a style change)."""
+        self._pixmaps.clear()
+
+    def _draw_button(self, painter, rect: QRect, hovered: bool, palette) -> None:
         button_option = QStyleOptionButton()
-        button_option.rect = option.rect.adjusted(4, 4, -4, -4)
-        button_option.text = "Detalle"
+        button_option.rect = rect
+        button_option.text = self.TEXT
+        button_option.palette = palette
         button_option.state = QStyle.StateFlag.State_Enabled
-        if option.state & QStyle.StateFlag.State_MouseOver:
+        if hovered:
             button_option.state |= QStyle.StateFlag.State_MouseOver
         QApplication.style().drawControl(QStyle.ControlElement.CE_PushButton, button_option, painter)
 
@@ -2,17 +2,22 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional
 
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QComboBox,
     QDialog,
     QDialogButtonBox,
     QFormLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMessageBox,
     QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QTabWidget,
     QVBoxLayout,
 )
 
@@ -27,10 +32,46 @@ from app.domain.models.participacion_jurado import ParticipacionJurado
 from app.domain.models.premiacion import Premiacion
 from app.domain.models.proyeccion import Proyeccion
 from app.domain.models.proyeccion import Proyeccion
+from app.infrastructure.database.row_validator import check_record
+from app.infrastructure.repositories.aggregate_loader import Aggregate
+from app.ui.fk_picker import ForeignKeyPicker, LookupSearch
 
 EMAIL_REGEX = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
+def _child_tabs(aggregate: Aggregate) -> QTabWidget:
+    """One read-only table per child collection of ``aggregate``."""
+    tabs = QTabWidget()
+    for child in aggregate.children.values():
+        table = QTableWidget(len(child.rows), len(child.headers))
+        table.setHorizontalHeaderLabels(list(child.headers))
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        for r, values in enumerate(child.rows):
+            for c, value in enumerate(values):
+                table.setItem(r, c, QTableWidgetItem("" if value is None else str(value)))
+        tabs.addTab(table, f"{child.title} ({len(child.rows)})")
+    return tabs
+
+
+def _ddl_error(table: str, data: Mapping[str, object]) -> Optional[str]:
+    """Constraints of ``table`` in sql/script.sql that ``data`` breaks, one per line (None if it passes)."""
+    errors = check_record(table, data)
+    return "\n".join(errors) if errors else None
+
+
+def _key_input(entity: str, lookups: Optional[Mapping[str, LookupSearch]]):
+    """A :class:`ForeignKeyPicker` over ``lookups[entity]``, else a plain ID spin box."""
+    search = (lookups or {}).get(entity)
+    if search is not None:
+        return ForeignKeyPicker(entity, search)
+    spin = QSpinBox()
+    spin.setRange(1, 999999)
+    return spin
+
+
 class ClienteFormDialog(QDialog):
     """Dialog to capture a new asistente entry (keeps class name for compatibility)."""
 
@@ -72,7 +113,7 @@ class ClienteFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("asistente", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -184,7 +225,7 @@ class EvaluacionFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("evaluacion", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -284,6 +325,10 @@ class CiudadFormDialog(QDialog):
         if not self.pais_input.text().strip():
             QMessageBox.warning(self, "Validación", "El país es obligatorio.")
             return
+        error = _ddl_error("ciudad", self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validación", error)
+            return
         self.accept()
 
     def get_data(self) -> Dict[str, object]:
@@ -374,6 +419,10 @@ class SedeFormDialog(QDialog):
         if not self.direccion_input.text().strip():
             QMessageBox.warning(self, "Validación", "La dirección es obligatoria.")
             return
+        error = _ddl_error("sede", self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validación", error)
+            return
         self.accept()
 
     def get_data(self) -> Dict[str, object]:
@@ -474,6 +523,10 @@ class PeliculaFormDialog(QDialog):
         if not self.pais_input.text().strip():
             QMessageBox.warning(self, "Validación", "El país de origen es obligatorio.")
             return
+        error = _ddl_error("pelicula", self.get_data())
+        if error:
+            QMessageBox.warning(self, "Validación", error)
+            return
         self.accept()
 
     def get_data(self) -> Dict[str, object]:
@@ -491,9 +544,10 @@ class PeliculaFormDialog(QDialog):
 class PeliculaDetailDialog(QDialog):
     """Displays persisted information for a pelicula."""
 
-    def __init__(self, pelicula: Pelicula, parent=None) -> None:
+    def __init__(self, pelicula: Pelicula, parent=None, aggregate: Optional[Aggregate] = None) -> None:
         super().__init__(parent)
         self._pelicula = pelicula
+        self._aggregate = aggregate
         self.setWindowTitle("Detalle de Película")
         self._build_ui()
 
@@ -514,6 +568,8 @@ class PeliculaDetailDialog(QDialog):
         add_row("Sinopsis", self._pelicula.sinopsis)
 
         layout.addLayout(form_layout)
+        if self._aggregate is not None:
+            layout.addWidget(_child_tabs(self._aggregate))
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
@@ -563,10 +619,22 @@ class FuncionFormDialog(QDialog):
         button_box = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
         )
-        button_box.accepted.connect(self.accept)
+        button_box.accepted.connect(self._on_accept)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def _on_accept(self) -> None:
+        try:
+            data = self.get_data()
+        except ValueError:
+            QMessageBox.warning(self, "Validación", "El precio y el ID de sede deben ser numéricos.")
+            return
+        error = _ddl_error("funcion", data)
+        if error:
+            QMessageBox.warning(self, "Validación", error)
+            return
+        self.accept()
+
     def get_data(self) -> Dict[str, any]:
         """Return form data as a dictionary."""
         return {
@@ -582,10 +650,11 @@ class FuncionFormDialog(QDialog):
 class FuncionDetailDialog(QDialog):
     """Dialog to display función details (read-only)."""
 
-    def __init__(self, funcion: Funcion, parent=None) -> None:
+    def __init__(self, funcion: Funcion, parent=None, aggregate: Optional[Aggregate] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle(f"Detalle de Función {funcion.id}")
         self._funcion = funcion
+        self._aggregate = aggregate
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -604,6 +673,8 @@ class FuncionDetailDialog(QDialog):
         add_row("ID Sede", str(self._funcion.id_sede or ""))
 
         layout.addLayout(form_layout)
+        if self._aggregate is not None:
+            layout.addWidget(_child_tabs(self._aggregate))
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
@@ -613,23 +684,26 @@ class FuncionDetailDialog(QDialog):
 
 
 class AsistenciaFormDialog(QDialog):
-    """Dialog to capture a new asistencia entry."""
+    """Dialog to capture a new asistencia entry.
 
-    def __init__(self, parent=None) -> None:
+    ``lookups`` maps a referenced entity to its ``search`` so the key is
+    picked by name; entities without one keep a numeric ID field.
+    """
+
+    def __init__(self, parent=None, lookups: Optional[Mapping[str, LookupSearch]] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Nueva Asistencia")
+        self._lookups = lookups
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
-        self.id_funcion_input = QSpinBox()
-        self.id_funcion_input.setRange(1, 999999)
+        self.id_funcion_input = _key_input("funcion", self._lookups)
         form_layout.addRow("ID Función", self.id_funcion_input)
 
-        self.id_asistente_input = QSpinBox()
-        self.id_asistente_input.setRange(1, 999999)
+        self.id_asistente_input = _key_input("asistente", self._lookups)
         form_layout.addRow("ID Asistente", self.id_asistente_input)
 
         self.entradas_input = QSpinBox()
@@ -657,7 +731,7 @@ class AsistenciaFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("asistencia", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -778,7 +852,7 @@ class JuradoFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("jurado", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -813,10 +887,11 @@ class JuradoFormDialog(QDialog):
 class JuradoDetailDialog(QDialog):
     """Dialog to display jurado details (read-only)."""
 
-    def __init__(self, jurado: Jurado, parent=None) -> None:
+    def __init__(self, jurado: Jurado, parent=None, aggregate: Optional[Aggregate] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle(f"Detalle de Jurado {jurado.id}")
         self._jurado = jurado
+        self._aggregate = aggregate
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -836,6 +911,8 @@ class JuradoDetailDialog(QDialog):
         add_row("Biografía", self._jurado.biografia or "")
 
         layout.addLayout(form_layout)
+        if self._aggregate is not None:
+            layout.addWidget(_child_tabs(self._aggregate))
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         button_box.rejected.connect(self.reject)
@@ -880,7 +957,7 @@ class ParticipacionJuradoFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("participacion_jurado", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -936,19 +1013,23 @@ class ParticipacionJuradoDetailDialog(QDialog):
 
 
 class PremiacionFormDialog(QDialog):
-    """Dialog to capture a new premiacion entry."""
+    """Dialog to capture a new premiacion entry.
 
-    def __init__(self, parent=None) -> None:
+    ``lookups`` maps a referenced entity to its ``search`` so the key is
+    picked by name; entities without one keep a numeric ID field.
+    """
+
+    def __init__(self, parent=None, lookups: Optional[Mapping[str, LookupSearch]] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Nueva Premiación")
+        self._lookups = lookups
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
-        self.id_pelicula_input = QSpinBox()
-        self.id_pelicula_input.setRange(1, 999999)
+        self.id_pelicula_input = _key_input("pelicula", self._lookups)
         form_layout.addRow("ID Película", self.id_pelicula_input)
 
         self.categoria_input = QLineEdit()
@@ -977,7 +1058,7 @@ class PremiacionFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("premiacion", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -1054,23 +1135,26 @@ class PremiacionDetailDialog(QDialog):
 
 
 class ProyeccionFormDialog(QDialog):
-    """Dialog to capture a new proyeccion entry."""
+    """Dialog to capture a new proyeccion entry.
 
-    def __init__(self, parent=None) -> None:
+    ``lookups`` maps a referenced entity to its ``search`` so the key is
+    picked by name; entities without one keep a numeric ID field.
+    """
+
+    def __init__(self, parent=None, lookups: Optional[Mapping[str, LookupSearch]] = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Nueva Proyección")
+        self._lookups = lookups
         self._build_ui()
 
     def _build_ui(self) -> None:
         layout = QVBoxLayout(self)
         form_layout = QFormLayout()
 
-        self.id_funcion_input = QSpinBox()
-        self.id_funcion_input.setRange(1, 999999)
+        self.id_funcion_input = _key_input("funcion", self._lookups)
         form_layout.addRow("ID Función", self.id_funcion_input)
 
-        self.id_pelicula_input = QSpinBox()
-        self.id_pelicula_input.setRange(1, 999999)
+        self.id_pelicula_input = _key_input("pelicula", self._lookups)
         form_layout.addRow("ID Película", self.id_pelicula_input)
 
         self.orden_input = QSpinBox()
@@ -1090,7 +1174,7 @@ class ProyeccionFormDialog(QDialog):
         layout.addWidget(self.button_box)
 
     def _on_accept(self) -> None:
-        error = self._validate_inputs()
+        error = self._validate_inputs() or _ddl_error("proyeccion", self.get_data())
         if error:
             QMessageBox.warning(self, "Validación", error)
             return
@@ -1,7 +1,11 @@
+from operator import attrgetter
+
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor
 
 from app.domain.models.evaluacion import Evaluacion
+from app.ui.column_store import ColumnStore
+from app.ui.numeric_columns import FooterAggregate, NumericColumns
 
 
 class EvaluacionTableModel(QAbstractTableModel):
@@ -13,11 +17,15 @@ class EvaluacionTableModel(QAbstractTableModel):
     FECHA_COLUMN = 5
     CATEGORIA_COLUMN = 6
     ACTION_COLUMN = 7
+    CATEGORICAL_COLUMNS = ("categoria_evaluada",)
+    FOOTER = (FooterAggregate("Puntuación media", "mean", "puntuacion", fmt=".2f"),)
 
     def __init__(self):
         super().__init__()
         self.evaluaciones: list[Evaluacion] = []
         self.selected_rows = set()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
+        self.numbers = NumericColumns({"puntuacion": attrgetter("puntuacion")})
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.evaluaciones)
@@ -49,7 +57,7 @@ class EvaluacionTableModel(QAbstractTableModel):
             elif index.column() == self.FECHA_COLUMN:
                 return str(ev.fecha or "")
             elif index.column() == self.CATEGORIA_COLUMN:
-                return getattr(ev, 'categoria_evaluada', "")
+                return self.categories.value("categoria_evaluada", index.row()) or ""
             elif index.column() == self.ACTION_COLUMN:
                 return "Detalle"
         elif role == Qt.ItemDataRole.BackgroundRole and index.row() in self.selected_rows:
@@ -74,9 +82,14 @@ class EvaluacionTableModel(QAbstractTableModel):
     def update_evaluaciones(self, evaluaciones: list[Evaluacion]):
         self.beginResetModel()
         self.evaluaciones = evaluaciones
+        self.categories.encode(evaluaciones)
+        self.numbers.load(evaluaciones)
         self.selected_rows.clear()
         self.endResetModel()
 
+    def footer_mask(self):
+        return sorted(self.selected_rows) if self.selected_rows else None
+
     def get_selected_ids(self) -> list:
         # return list of composite keys as tuples (id_jurado, id_pelicula)
         return [(self.evaluaciones[row].id_jurado, self.evaluaciones[row].id_pelicula) for row in self.selected_rows]
@@ -0,0 +1,45 @@
+"""Background worker that runs a table export off the UI thread."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from app.infrastructure.export.table_exporter import export_table
+
+
+class ExportWorker(QObject):
+    """Streams a repository to disk and reports progress through signals.
+
+    Meant to be moved to a ``QThread``; ``cancel`` is thread-safe and can be
+    called directly from the UI thread.
+    """
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, repository, destination: Path, fmt: str | None = None) -> None:
+        super().__init__()
+        self._repository = repository
+        self._destination = destination
+        self._fmt = fmt
+        self._cancel_event = threading.Event()
+
+    def run(self) -> None:
+        try:
+            result = export_table(
+                self._repository,
+                self._destination,
+                fmt=self._fmt,
+                progress=self.progress.emit,
+                is_cancelled=self._cancel_event.is_set,
+            )
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit(result)
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
@@ -0,0 +1,95 @@
+"""Foreign-key input that searches the referenced table as the user types."""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QStringListModel, Qt, QTimer
+from PyQt6.QtWidgets import QCompleter, QLineEdit
+
+from app.infrastructure.repositories.lookup import LOOKUP_CACHE, SEARCH_LIMIT, LookupCache, LookupItem
+from app.viewmodels.background_loader import BackgroundLoader
+
+DEBOUNCE_MS = 250
+
+# ``repository.search``: (text, limit) -> items whose match text starts with ``text``
+LookupSearch = Callable[[str, int], List[LookupItem]]
+
+
+class ForeignKeyPicker(QLineEdit):
+    """Line edit completing a key of ``source`` through ``search``.
+
+    Keystrokes are debounced; each settled prefix is answered by the shared
+    :data:`LOOKUP_CACHE` or by one ``search`` call on a background thread, so
+    the referenced table is never loaded whole. ``value()`` / ``setValue()``
+    mirror ``QSpinBox``: the chosen key, or a typed ID, or 0 when empty.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        search: LookupSearch,
+        parent=None,
+        cache: LookupCache = LOOKUP_CACHE,
+    ) -> None:
+        super().__init__(parent)
+        self._source = source
+        self._search = search
+        self._cache = cache
+        self._keys: Dict[str, int] = {}
+        self._request = 0
+        self._loaders: Dict[int, BackgroundLoader] = {}
+
+        self._model = QStringListModel(self)
+        completer = QCompleter(self._model, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.setCompleter(completer)
+        self.setPlaceholderText("Escriba para buscar o ingrese el ID")
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(DEBOUNCE_MS)
+        self._timer.timeout.connect(self._lookup)
+        self.textEdited.connect(lambda _text: self._timer.start())
+
+    def value(self) -> int:
+        text = self.text().strip()
+        if text in self._keys:
+            return self._keys[text]
+        digits = text.lstrip("#")
+        return int(digits) if digits.isdigit() else 0
+
+    def setValue(self, key: int) -> None:
+        self.setText(str(key) if key else "")
+
+    def _lookup(self) -> None:
+        text = self.text().strip()
+        if text in self._keys:
+            return
+        self._request += 1
+        request = self._request
+        items = self._cache.cached(self._source, text)
+        if items is not None:
+            self._show(request, items)
+            return
+        loader = BackgroundLoader()
+        loader.loaded.connect(lambda result: self._show(request, result))
+        loader.failed.connect(lambda message: self._failed(request, message))
+        self._loaders[request] = loader
+        loader.start(lambda: self._cache.search(self._source, text, self._search, SEARCH_LIMIT))
+
+    def _show(self, request: int, items: Optional[List[LookupItem]]) -> None:
+        self._loaders.pop(request, None)
+        # an answer for a prefix the user has typed past is dropped
+        if request != self._request:
+            return
+        self.setToolTip("")
+        self._keys = {item.label: item.key for item in items or []}
+        self._model.setStringList(list(self._keys))
+        if self._keys and self.hasFocus():
+            self.completer().complete()
+
+    def _failed(self, request: int, message: str) -> None:
+        self._loaders.pop(request, None)
+        if request == self._request:
+            self.setToolTip(f"Búsqueda no disponible: {message}")
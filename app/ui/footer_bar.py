@@ -0,0 +1,63 @@
+"""Totals shown under the grid for table models that declare ``FOOTER``."""
+from __future__ import annotations
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QLabel
+
+FOOTER_SEPARATOR = "  ·  "
+
+
+class FooterBar(QLabel):
+    """Label with the model's ``FOOTER`` aggregates over its checked rows, or over every row.
+
+    Models opt in with ``FOOTER`` (a sequence of ``FooterAggregate``),
+    ``numbers`` (``NumericColumns`` loaded with the rows) and
+    ``footer_mask()`` (checked row indices, or None). ``FOOTER_CATEGORIES``
+    adds the rows per value of those ``categories`` columns. Resets and
+    checkbox changes are coalesced into one recompute per event-loop pass.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._model = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def bind(self, model) -> None:
+        """Follow ``model`` (None or a model without ``FOOTER`` hides the bar)."""
+        if self._model is not None:
+            for signal in (self._model.modelReset, self._model.dataChanged):
+                try:
+                    signal.disconnect(self._schedule)
+                except TypeError:
+                    pass
+        self._model = model if getattr(model, "FOOTER", None) else None
+        if self._model is None:
+            self.hide()
+            return
+        self._model.modelReset.connect(self._schedule)
+        self._model.dataChanged.connect(self._schedule)
+        self.refresh()
+        self.show()
+
+    def _schedule(self, *args) -> None:
+        self._timer.start()
+
+    def refresh(self) -> None:
+        model = self._model
+        if model is None:
+            return
+        mask = model.footer_mask()
+        if mask:
+            parts = [f"{len(mask)} seleccionadas"]
+        else:
+            mask = None
+            parts = [f"{model.rowCount()} filas"]
+        parts.extend(model.numbers.footer(model.FOOTER, mask))
+        for name in getattr(model, "FOOTER_CATEGORIES", ()):
+            counts = model.categories.counts(name, mask)
+            parts.append(", ".join(f"{value or 'Sin valor'} {count}" for value, count in counts))
+        self.setText(FOOTER_SEPARATOR.join(parts))
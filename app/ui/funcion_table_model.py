@@ -1,7 +1,14 @@
 """Table model for Funcion (Función)."""
+from operator import attrgetter
+
 from PyQt6.QtCore import Qt, QAbstractTableModel, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
 
 from app.domain.models.funcion import Funcion
+from app.infrastructure.repositories.predicate import Predicate
+from app.ui.column_store import ColumnStore
+from app.ui.numeric_columns import FooterAggregate, NumericColumns
+from app.ui.range_selection import RangeSelection
 
 
 class FuncionTableModel(QAbstractTableModel):
@@ -9,12 +16,17 @@ class FuncionTableModel(QAbstractTableModel):
 
     SELECT_COLUMN = 0
     ACTION_COLUMN = 8  # Detalle button column
+    CATEGORICAL_COLUMNS = ("estado_funcion",)
+    FOOTER = (FooterAggregate("Precio medio", "mean", "precio_entrada", prefix="$"),)
+    FOOTER_CATEGORIES = ("estado_funcion",)
 
     def __init__(self):
         """Initialize FuncionTableModel."""
         super().__init__()
         self._funciones: list[Funcion] = []
-        self._selected_ids: set = set()
+        self.selection = RangeSelection()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
+        self.numbers = NumericColumns({"precio_entrada": attrgetter("precio_entrada")})
 
     def rowCount(self, parent=None) -> int:
         """Return number of rows."""
@@ -51,7 +63,7 @@ class FuncionTableModel(QAbstractTableModel):
         # Checkbox column
         if col == self.SELECT_COLUMN:
             if role == Qt.ItemDataRole.CheckStateRole and funcion.id:
-                return Qt.CheckState.Checked if funcion.id in self._selected_ids else Qt.CheckState.Unchecked
+                return Qt.CheckState.Checked if index.row() in self.selection else Qt.CheckState.Unchecked
             return None
 
         # Display columns
@@ -63,7 +75,7 @@ class FuncionTableModel(QAbstractTableModel):
             elif col == 3:
                 return f"${funcion.precio_entrada:,.0f}" if funcion.precio_entrada else "$0"
             elif col == 4:
-                return funcion.estado_funcion or ""
+                return self.categories.value("estado_funcion", index.row()) or ""
             elif col == 5:
                 return (funcion.observaciones[:30] + "...") if funcion.observaciones and len(funcion.observaciones) > 30 else funcion.observaciones or ""
             elif col == 6:
@@ -85,10 +97,13 @@ class FuncionTableModel(QAbstractTableModel):
             if not funcion.id:
                 return False
 
-            if value == Qt.CheckState.Checked:
-                self._selected_ids.add(funcion.id)
-            else:
-                self._selected_ids.discard(funcion.id)
+            checked = Qt.CheckState(value) == Qt.CheckState.Checked
+            if QGuiApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier:
+                # shift-click: apply to every row from the previous click
+                first, last = self.selection.set_range_to(index.row(), checked)
+                self.dataChanged.emit(self.index(first, col), self.index(last, col))
+                return True
+            self.selection.set_row(index.row(), checked)
 
             self.dataChanged.emit(index, index)
             return True
@@ -111,27 +126,54 @@ class FuncionTableModel(QAbstractTableModel):
         Args:
             funciones: List of Funcion objects.
         """
-        # Preserve selected IDs that still exist in the new list
-        new_ids = {f.id for f in funciones if f.id}
-        self._selected_ids &= new_ids
+        # Preserve selected IDs that still exist in the new list ("select all
+        # matching" is tied to the rows it was made on and does not survive)
+        selected_ids = set(self.get_selected_ids()) if not self.selection.is_all_matching else set()
+        self.selection.replace_rows([row for row, f in enumerate(funciones) if f.id in selected_ids])
 
         self.beginResetModel()
         self._funciones = funciones
+        self.categories.encode(funciones)
+        self.numbers.load(funciones)
         self.endResetModel()
 
     def clear_selection(self) -> None:
         """Clear all checkbox selections."""
-        self._selected_ids.clear()
-        # Emit dataChanged for all rows to refresh checkboxes visually
+        span = self.selection.span(self.rowCount())
+        self.selection.clear()
+        # repaint only the rows that could have been checked
+        if span is not None:
+            self.dataChanged.emit(self.index(span[0], self.SELECT_COLUMN), self.index(span[1], self.SELECT_COLUMN))
+
+    def select_all_matching(self, predicate: Predicate, total: int) -> None:
+        """Check every row matching ``predicate`` (``total`` rows server-side)."""
+        self.selection.select_all_matching(predicate, total)
         if self.rowCount() > 0:
             self.dataChanged.emit(
                 self.index(0, self.SELECT_COLUMN),
                 self.index(self.rowCount() - 1, self.SELECT_COLUMN),
             )
 
+    def selection_predicate(self) -> Predicate | None:
+        """Predicate of an "all matching" selection minus unchecked rows, else None."""
+        predicate = self.selection.predicate
+        if predicate is None:
+            return None
+        excluded = [(self._funciones[row].id,) for row in self.selection.excluded_rows if row < len(self._funciones)]
+        return predicate.excluding(excluded)
+
+    def _checked_rows(self) -> list[int]:
+        if self.selection.is_all_matching:
+            return [row for row in range(len(self._funciones)) if row in self.selection]
+        return [row for row in self.selection.rows() if row < len(self._funciones)]
+
+    def footer_mask(self) -> list[int] | None:
+        """Checked loaded rows for the footer totals, or None for every row."""
+        return self._checked_rows() or None
+
     def get_selected_ids(self) -> list:
-        """Get list of selected function IDs."""
-        return list(self._selected_ids)
+        """Get list of selected function IDs (loaded rows only in "all matching" mode)."""
+        return [self._funciones[row].id for row in self._checked_rows() if self._funciones[row].id]
 
     def funcion_at(self, row: int) -> Funcion | None:
         """Get funcion at given row."""
@@ -2,6 +2,7 @@ from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor
 
 from app.domain.models.jurado import Jurado
+from app.ui.column_store import ColumnStore
 
 
 class JuradoTableModel(QAbstractTableModel):
@@ -16,11 +17,13 @@ class JuradoTableModel(QAbstractTableModel):
     EXPERIENCIA_COLUMN = 6
     TIPO_COLUMN = 7
     ACTION_COLUMN = 8
+    CATEGORICAL_COLUMNS = ("tipo_jurado",)
 
     def __init__(self):
         super().__init__()
         self.jurados = []
         self.selected_rows = set()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.jurados)
@@ -56,7 +59,7 @@ class JuradoTableModel(QAbstractTableModel):
             elif index.column() == self.EXPERIENCIA_COLUMN:
                 return str(jurado.experiencia_anos)
             elif index.column() == self.TIPO_COLUMN:
-                return jurado.tipo_jurado
+                return self.categories.value("tipo_jurado", index.row())
             elif index.column() == self.ACTION_COLUMN:
                 return "Detalle"
         elif role == Qt.ItemDataRole.BackgroundRole and index.row() in self.selected_rows:
@@ -83,6 +86,7 @@ class JuradoTableModel(QAbstractTableModel):
         """Update the jurados list in the table."""
         self.beginResetModel()
         self.jurados = jurados
+        self.categories.encode(jurados)
         self.selected_rows.clear()
         self.endResetModel()
 
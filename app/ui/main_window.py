@@ -1,13 +1,18 @@
 """Main window for the Cliente management UI."""
 from __future__ import annotations
 
+import logging
+from datetime import date, timedelta
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread
 from PyQt6.QtWidgets import (
     QAbstractItemView,
+    QFileDialog,
+    QInputDialog,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
     QTableView,
     QToolBar,
@@ -16,6 +21,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QGridLayout,
     QLabel,
+    QLineEdit,
     QSizePolicy,
 )
 try:
@@ -35,7 +41,16 @@ from app.domain.models.participacion_jurado import ParticipacionJurado
 from app.domain.models.evaluacion import Evaluacion
 from app.domain.models.premiacion import Premiacion
 from app.domain.models.proyeccion import Proyeccion
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.async_backend import AsyncPool, create_async_pool
+from app.infrastructure.database.backend import create_connection_factory, dialect_of
+from app.infrastructure.database.instrumentation import (
+    InstrumentedConnectionFactory,
+    configure_slow_query_log,
+    instrument_repository,
+)
+from app.infrastructure.database.local_mirror import LocalMirror
+from app.infrastructure.database.query_cache import CachingConnectionFactory, configure_query_cache
+from app.infrastructure.diagnostics.profiler import PROFILER, profiled
 from app.infrastructure.repositories.asistente_repository import AsistenteRepository
 from app.infrastructure.repositories.ciudad_repository import CiudadRepository
 from app.infrastructure.repositories.sede_repository import SedeRepository
@@ -47,6 +62,15 @@ from app.infrastructure.repositories.participacion_jurado_repository import Part
 from app.infrastructure.repositories.evaluacion_repository import EvaluacionRepository
 from app.infrastructure.repositories.premiacion_repository import PremiacionRepository
 from app.infrastructure.repositories.proyeccion_repository import ProyeccionRepository
+from app.infrastructure.repositories.awards import AwardsEngine
+from app.infrastructure.repositories.festival_scheduler import FestivalScheduler
+from app.infrastructure.repositories.jury_assignment import JuryAssigner
+from app.infrastructure.repositories.aggregate_loader import Aggregate, AggregateLoader
+from app.infrastructure.repositories.async_repositories import create_async_repository
+from app.infrastructure.repositories.cascade_delete import CascadeDeletePlanner
+from app.infrastructure.repositories.lookup import LOOKUP_CACHE
+from app.infrastructure.repositories.registry import create_repository
+from app.infrastructure.repositories.table_metadata import TABLE_METADATA
 from app.ui.asistente_table_model import AsistenteTableModel
 from app.ui.ciudad_table_model import CiudadTableModel
 from app.ui.sede_table_model import SedeTableModel
@@ -59,6 +83,9 @@ from app.ui.evaluacion_table_model import EvaluacionTableModel
 from app.ui.premiacion_table_model import PremiacionTableModel
 from app.ui.proyeccion_table_model import ProyeccionTableModel
 from app.ui.delegates import DetailButtonDelegate
+from app.ui.export_worker import ExportWorker
+from app.ui.footer_bar import FooterBar
+from app.ui.metrics_panel import MetricsDock
 from app.ui.dialogs import (
     ClienteDetailDialog,
     ClienteFormDialog,
@@ -83,6 +110,9 @@ from app.ui.dialogs import (
     ProyeccionFormDialog,
     ProyeccionDetailDialog,
 )
+from app.viewmodels.async_bridge import AsyncBridge, AsyncCall
+from app.viewmodels.background_loader import BackgroundLoader
+from app.viewmodels.prefetcher import Prefetcher, SeededRepository, UsageStats
 from app.viewmodels.asistente_viewmodel import AsistenteViewModel
 from app.viewmodels.ciudad_viewmodel import CiudadViewModel
 from app.viewmodels.sede_viewmodel import SedeViewModel
@@ -95,6 +125,8 @@ from app.viewmodels.evaluacion_viewmodel import EvaluacionViewModel
 from app.viewmodels.premiacion_viewmodel import PremiacionViewModel
 from app.viewmodels.proyeccion_viewmodel import ProyeccionViewModel
 
+logger = logging.getLogger(__name__)
+
 
 class MainWindow(QMainWindow):
     """Application's main window."""
@@ -110,6 +142,29 @@ class MainWindow(QMainWindow):
         self._entity: str | None = None
         self._viewmodel = None
         self._model = None
+        self._repository = None
+        self._export_thread: QThread | None = None
+        self._export_worker: ExportWorker | None = None
+        # SQLite copy of the reference tables, opened on first use
+        self._mirror: LocalMirror | None = None
+        # shared (cached, instrumented) connection factory, created on first use
+        self._connection_factory: CachingConnectionFactory | None = None
+        # speculative loads while the menu is shown, ordered by usage
+        self._usage = UsageStats.for_settings(settings_path)
+        self._prefetcher: Prefetcher | None = None
+        self._revalidator: BackgroundLoader | None = None
+        self._revalidate_token = None
+        # row counts on the menu buttons, all queried at once on the asyncio loop
+        self._async_bridge: AsyncBridge | None = None
+        self._async_pool: AsyncPool | None = None
+        self._menu_counts: AsyncCall | None = None
+        self._menu_buttons: dict[str, tuple[QPushButton, str]] = {}
+        # statements over `slow_query_ms` go to config/slow_queries.log
+        configure_slow_query_log(settings_path)
+        # repeated SELECTs answered in memory ("query_cache_mb", 0 disables it)
+        configure_query_cache(settings_path)
+        # opt-in cProfile/tracemalloc reports ("profile" / FESTIVAL_PROFILE)
+        PROFILER.configure(settings_path)
 
         self._setup_ui()
         # Show table selection menu instead of loading a default table
@@ -129,6 +184,8 @@ class MainWindow(QMainWindow):
         self._table.setEditTriggers(QAbstractItemView.EditTrigger.AllEditTriggers)
         self._table.setAlternatingRowColors(True)
         self._table.horizontalHeader().setStretchLastSection(True)
+        # sums / averages under the grid (models declaring FOOTER)
+        self._footer = FooterBar()
 
         toolbar = QToolBar("Acciones", self)
         toolbar.setMovable(False)
@@ -146,6 +203,38 @@ class MainWindow(QMainWindow):
         self._delete_action.triggered.connect(self._handle_delete_selected)
         toolbar.addAction(self._delete_action)
 
+        self._export_action = QAction("Exportar", self)
+        self._export_action.triggered.connect(self._handle_export)
+        toolbar.addAction(self._export_action)
+
+        # Server-side filter and "select every matching row" (entities whose
+        # viewmodel supports predicates)
+        self._filter_edit = QLineEdit()
+        self._filter_edit.setPlaceholderText("Filtrar…")
+        self._filter_edit.setClearButtonEnabled(True)
+        self._filter_edit.setMaximumWidth(240)
+        self._filter_edit.returnPressed.connect(self._apply_filter)
+        self._filter_action = toolbar.addWidget(self._filter_edit)
+
+        self._select_all_action = QAction("Seleccionar todo", self)
+        self._select_all_action.triggered.connect(self._select_all_matching)
+        toolbar.addAction(self._select_all_action)
+
+        # Podiums of an edition from the evaluations (premiacion only)
+        self._awards_action = QAction("Calcular premios", self)
+        self._awards_action.triggered.connect(self._compute_awards)
+        toolbar.addAction(self._awards_action)
+
+        # Clash-free jurado panels for the open funciones (participacion_jurado only)
+        self._assign_jury_action = QAction("Asignar jurados", self)
+        self._assign_jury_action.triggered.connect(self._assign_jurados)
+        toolbar.addAction(self._assign_jury_action)
+
+        # Funciones and proyecciones packed into the active sedes' days (funcion only)
+        self._program_action = QAction("Generar programación", self)
+        self._program_action.triggered.connect(self._generate_program)
+        toolbar.addAction(self._program_action)
+
         # Spacer to push the back button to the right
         spacer = QWidget()
         spacer.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -162,8 +251,22 @@ class MainWindow(QMainWindow):
         self._refresh_action.setVisible(False)
         self._new_action.setVisible(False)
         self._delete_action.setVisible(False)
+        self._export_action.setVisible(False)
+        self._filter_action.setVisible(False)
+        self._select_all_action.setVisible(False)
+        self._awards_action.setVisible(False)
+        self._assign_jury_action.setVisible(False)
+        self._program_action.setVisible(False)
         self._back_action.setVisible(False)
 
+        # Debug panel with the slowest statements / repository calls (F12)
+        self._metrics_dock = MetricsDock(self)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._metrics_dock)
+        self._metrics_dock.hide()
+        metrics_action = self._metrics_dock.toggleViewAction()
+        metrics_action.setShortcut("F12")
+        self.addAction(metrics_action)
+
         # We no longer show a top-level "Tabla" menu here — selection is via the visual menu
         self.statusBar().showMessage("Seleccione una tabla para comenzar")
 
@@ -214,6 +317,7 @@ class MainWindow(QMainWindow):
         ]
 
         # Smaller buttons so the 12-button grid fits nicely
+        self._menu_buttons = {}
         for tabla_nombre, entity_key, row, col in tables:
             btn = QPushButton(tabla_nombre)
             btn.setMinimumSize(180, 80)
@@ -224,6 +328,7 @@ class MainWindow(QMainWindow):
             btn.setFont(btn_font)
             btn.clicked.connect(lambda checked, ek=entity_key: self._set_entity(ek))
             button_layout.addWidget(btn, row, col)
+            self._menu_buttons[entity_key] = (btn, tabla_nombre)
 
         # Add the symmetric 12th button: CERRAR APP (red background, white text)
         close_btn = QPushButton("CERRAR APP")
@@ -254,9 +359,21 @@ class MainWindow(QMainWindow):
             self._new_action.setVisible(False)
         if hasattr(self, "_delete_action"):
             self._delete_action.setVisible(False)
+        if hasattr(self, "_export_action"):
+            self._export_action.setVisible(False)
+        if hasattr(self, "_filter_action"):
+            self._filter_action.setVisible(False)
+            self._select_all_action.setVisible(False)
+        if hasattr(self, "_awards_action"):
+            self._awards_action.setVisible(False)
+            self._assign_jury_action.setVisible(False)
+            self._program_action.setVisible(False)
         if hasattr(self, "_back_action"):
             self._back_action.setVisible(False)
 
+        self._load_menu_counts()
+        self._start_prefetch()
+
     def _show_table_view(self) -> None:
         """Switch from menu view to table view."""
         # Clear the main container (table is never deleted, just hidden and removed)
@@ -265,6 +382,7 @@ class MainWindow(QMainWindow):
         # Add table view back to layout and show it
         self._main_layout.addWidget(self._table)
         self._table.show()
+        self._main_layout.addWidget(self._footer)
 
     def _clear_main_container(self) -> None:
         """Remove all widgets from the main layout.
@@ -280,6 +398,9 @@ class MainWindow(QMainWindow):
                 # Never delete the table; just remove it from layout and hide
                 self._main_layout.removeWidget(self._table)
                 self._table.hide()
+            elif w is self._footer:
+                self._main_layout.removeWidget(self._footer)
+                self._footer.hide()
             else:
                 w.setParent(None)
                 w.deleteLater()
@@ -289,37 +410,38 @@ class MainWindow(QMainWindow):
         try:
             if self._entity == 'asistente':
                 self._viewmodel.asistentes_changed.connect(self._model.update_asistentes)
-                refresh_action = getattr(self._viewmodel, 'load_asistentes', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_asistentes', None)
             elif self._entity == 'ciudad':
                 self._viewmodel.ciudades_changed.connect(self._model.update_ciudades)
-                refresh_action = getattr(self._viewmodel, 'load_ciudades', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_ciudades', None)
             elif self._entity == 'sede':
                 self._viewmodel.sedes_changed.connect(self._model.update_sedes)
-                refresh_action = getattr(self._viewmodel, 'load_sedes', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_sedes', None)
             elif self._entity == 'pelicula':
                 self._viewmodel.peliculas_changed.connect(self._model.update_peliculas)
-                refresh_action = getattr(self._viewmodel, 'load_peliculas', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_peliculas', None)
             elif self._entity == 'funcion':
                 self._viewmodel.funciones_changed.connect(self._model.update_funciones)
-                refresh_action = getattr(self._viewmodel, 'load_funciones', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_funciones', None)
             elif self._entity == 'asistencia':
+                self._viewmodel.precios_changed.connect(self._model.set_precios)
                 self._viewmodel.asistencias_changed.connect(self._model.update_asistencias)
-                refresh_action = getattr(self._viewmodel, 'load_asistencias', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_asistencias', None)
             elif self._entity == 'jurado':
                 self._viewmodel.jurados_changed.connect(self._model.update_jurados)
-                refresh_action = getattr(self._viewmodel, 'load_jurados', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_jurados', None)
             elif self._entity == 'participacion_jurado':
                 self._viewmodel.participaciones_changed.connect(self._model.update_participaciones)
-                refresh_action = getattr(self._viewmodel, 'load_participaciones', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_participaciones', None)
             elif self._entity == 'evaluacion':
                 self._viewmodel.evaluaciones_changed.connect(self._model.update_evaluaciones)
-                refresh_action = getattr(self._viewmodel, 'load_evaluaciones', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_evaluaciones', None)
             elif self._entity == 'premiacion':
                 self._viewmodel.premiaciones_changed.connect(self._model.update_premiaciones)
-                refresh_action = getattr(self._viewmodel, 'load_premiaciones', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_premiaciones', None)
             elif self._entity == 'proyeccion':
                 self._viewmodel.proyecciones_changed.connect(self._model.update_proyecciones)
-                refresh_action = getattr(self._viewmodel, 'load_proyecciones', None)
+                refresh_action = getattr(self._viewmodel, 'refresh_proyecciones', None)
             else:
                 refresh_action = None
         except AttributeError:
@@ -340,7 +462,15 @@ class MainWindow(QMainWindow):
                 self._refresh_action.triggered.disconnect()
             except Exception:
                 pass
-            self._refresh_action.triggered.connect(refresh_action)
+            # lambda drops `checked`: viewmodel methods may be wrapped by the profiler
+            self._refresh_action.triggered.connect(lambda checked=False: self._reload(refresh_action))
+
+    def _reload(self, load) -> None:
+        """Recargar: forget the cached results of the current table (other sessions may have
+        changed it), then load it again."""
+        if self._connection_factory is not None and self._entity is not None:
+            self._connection_factory.cache.invalidate(self._entity)
+        load()
 
     def _show_error(self, message: str) -> None:
         QMessageBox.critical(self, "Error", message)
@@ -455,7 +585,7 @@ class MainWindow(QMainWindow):
                 self._model.clear_selection()
                 self.statusBar().showMessage("Función creada correctamente", 5000)
         elif self._entity == 'asistencia':
-            dialog = AsistenciaFormDialog(self)
+            dialog = AsistenciaFormDialog(self, lookups=self._lookups())
             if dialog.exec() != dialog.DialogCode.Accepted:
                 return
             data = dialog.get_data()
@@ -534,7 +664,7 @@ class MainWindow(QMainWindow):
                 self._model.clear_selection()
                 self.statusBar().showMessage("Evaluación creada correctamente", 5000)
         elif self._entity == 'premiacion':
-            dialog = PremiacionFormDialog(self)
+            dialog = PremiacionFormDialog(self, lookups=self._lookups())
             if dialog.exec() != dialog.DialogCode.Accepted:
                 return
             data = dialog.get_data()
@@ -555,7 +685,7 @@ class MainWindow(QMainWindow):
                 self._model.clear_selection()
                 self.statusBar().showMessage("Premiación creada correctamente", 5000)
         elif self._entity == 'proyeccion':
-            dialog = ProyeccionFormDialog(self)
+            dialog = ProyeccionFormDialog(self, lookups=self._lookups())
             if dialog.exec() != dialog.DialogCode.Accepted:
                 return
             data = dialog.get_data()
@@ -572,12 +702,151 @@ class MainWindow(QMainWindow):
             if created:
                 self._model.clear_selection()
                 self.statusBar().showMessage("Proyección creada correctamente", 5000)
+        # new rows must be findable from the FK pickers right away
+        LOOKUP_CACHE.invalidate(self._entity)
+
+    def _apply_filter(self) -> None:
+        if self._viewmodel is None or not hasattr(self._viewmodel, "set_filter_text"):
+            return
+        self._model.clear_selection()
+        self._viewmodel.set_filter_text(self._filter_edit.text())
+
+    def _select_all_matching(self) -> None:
+        """Select every row matching the current filter without materialising their keys."""
+        if self._viewmodel is None or not hasattr(self._viewmodel, "count_matching"):
+            return
+        total = self._viewmodel.count_matching()
+        self._model.select_all_matching(self._viewmodel.filter, total)
+        self.statusBar().showMessage(f"{total} elemento(s) seleccionados", 5000)
+
+    def _compute_awards(self) -> None:
+        """Preview the podiums of an edition, then write them to premiacion on confirmation."""
+        if self._viewmodel is None or not hasattr(self._viewmodel, "compute_awards"):
+            return
+        edicion, ok = QInputDialog.getInt(
+            self, "Calcular premios", "Edición (año de las evaluaciones):", date.today().year, 1, 9999
+        )
+        if not ok:
+            return
+        awards = self._viewmodel.preview_awards(edicion)
+        if not awards:
+            QMessageBox.information(self, "Calcular premios", f"No hay evaluaciones para la edición {edicion}.")
+            return
+        podium = "\n".join(
+            f"{award.categoria} #{award.posicion}: película {award.id_pelicula} "
+            f"({award.puntaje:.2f}, {award.evaluaciones} evaluaciones)"
+            for award in awards
+        )
+        confirm = QMessageBox.question(
+            self,
+            "Calcular premios",
+            f"{podium}\n\n¿Guardar estos {len(awards)} premios en la edición {edicion}?",
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        result = self._viewmodel.compute_awards(edicion)
+        if result is not None:
+            self.statusBar().showMessage(
+                f"Edición {edicion}: {result.written} premios guardados, {result.removed} eliminados", 5000
+            )
+
+    def _assign_jurados(self) -> None:
+        """Show the planned jurado panels, then bulk-insert them on confirmation."""
+        if self._viewmodel is None or not hasattr(self._viewmodel, "assign_jurados"):
+            return
+        plan = self._viewmodel.plan_assignments()
+        if plan is None:
+            return
+        if not plan.rows:
+            QMessageBox.information(self, "Asignar jurados", "Todas las funciones programadas tienen jurados.")
+            return
+        low, high = plan.spread
+        summary = [
+            f"{len(plan.rows)} participaciones nuevas en {len({row['id_funcion'] for row in plan.rows})} funciones.",
+            f"Funciones por jurado: {low} a {high}.",
+        ]
+        if plan.short:
+            summary.append(f"{len(plan.short)} funciones quedan sin jurados suficientes (no hay jurados libres a esa hora).")
+        if plan.skipped:
+            summary.append(f"{len(plan.skipped)} funciones se omiten por hora ilegible.")
+        confirm = QMessageBox.question(self, "Asignar jurados", "\n".join(summary) + "\n\n¿Guardar las asignaciones?")
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        result = self._viewmodel.assign_jurados()
+        if result is not None:
+            self.statusBar().showMessage(
+                f"{len(result.rows) - len(result.errors)} participaciones de jurado creadas", 5000
+            )
+
+    def _generate_program(self) -> None:
+        """Ask for the festival days, show the planned programme and write it on confirmation."""
+        if self._viewmodel is None or not hasattr(self._viewmodel, "plan_program"):
+            return
+        today = date.today()
+        text, ok = QInputDialog.getText(
+            self,
+            "Generar programación",
+            "Días del festival (desde y hasta, AAAA-MM-DD):",
+            text=f"{today.isoformat()} {(today + timedelta(days=9)).isoformat()}",
+        )
+        if not ok:
+            return
+        try:
+            desde, hasta = (date.fromisoformat(part) for part in text.split())
+        except ValueError:
+            QMessageBox.warning(self, "Generar programación", "Ingrese dos fechas AAAA-MM-DD separadas por un espacio.")
+            return
+        plan = self._viewmodel.plan_program(desde, hasta)
+        if plan is None:
+            return
+        if not plan.screenings:
+            QMessageBox.information(self, "Generar programación", "No hay funciones nuevas que programar en esos días.")
+            return
+        summary = [
+            f"{len(plan.screenings)} funciones nuevas del {desde:%d/%m} al {hasta:%d/%m}, "
+            f"ocupación de las sedes {plan.utilization:.0%}.",
+        ]
+        if plan.unscheduled:
+            summary.append(
+                f"{sum(plan.unscheduled.values())} funciones de {len(plan.unscheduled)} películas no caben en el horario."
+            )
+        confirm = QMessageBox.question(
+            self, "Generar programación", "\n".join(summary) + "\n\n¿Crear las funciones y sus proyecciones?"
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        result = self._viewmodel.write_program(plan)
+        if result is not None:
+            self.statusBar().showMessage(f"{result.funciones_written} funciones programadas", 5000)
+        LOOKUP_CACHE.invalidate(self._entity)
+
+    def _delete_matching(self, count: int) -> None:
+        confirm = QMessageBox.question(
+            self,
+            "Eliminar",
+            f"¿Eliminar los {count} elemento(s) que coinciden con el filtro?",
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+        predicate = self._model.selection_predicate()
+        if self._cascade_delete(predicate=predicate):
+            return
+        self._model.clear_selection()
+        deleted = self._viewmodel.delete_matching(predicate)
+        if deleted:
+            self.statusBar().showMessage(f"{deleted} elemento(s) eliminados", 5000)
+        LOOKUP_CACHE.invalidate(self._entity)
 
     def _handle_delete_selected(self) -> None:
         if self._entity is None or self._viewmodel is None or self._model is None:
             QMessageBox.warning(self, "Información", "Seleccione una tabla primero.")
             return
 
+        selection = getattr(self._model, "selection", None)
+        if selection is not None and selection.is_all_matching:
+            self._delete_matching(len(selection))
+            return
+
         selected_ids = self._model.get_selected_ids()
         if not selected_ids:
             QMessageBox.information(self, "Eliminar", "Debe seleccionar al menos un elemento.")
@@ -590,6 +859,8 @@ class MainWindow(QMainWindow):
         )
         if confirm != QMessageBox.StandardButton.Yes:
             return
+        if self._cascade_delete(selected_ids):
+            return
 
         if self._entity == 'asistente':
             if getattr(self._viewmodel, "delete_asistentes", None):
@@ -679,6 +950,127 @@ class MainWindow(QMainWindow):
             if ok:
                 self._model.clear_selection()
                 self.statusBar().showMessage("Proyecciones eliminadas", 5000)
+        LOOKUP_CACHE.invalidate(self._entity)
+
+    def _cascade_delete(self, selected_ids=(), predicate=None) -> bool:
+        """Offer to delete the rows that reference the selection too; True if handled here.
+
+        The selection is ``selected_ids`` or, for "Seleccionar todo", the
+        rows matching ``predicate``. Returns False (plain delete) when nothing
+        references the selection.
+        """
+        planner = CascadeDeletePlanner(self._connection())
+        if not planner.has_dependents(self._entity):
+            return False
+        if predicate is not None:
+            metadata = TABLE_METADATA[self._entity]
+            filter_columns = metadata.filter_columns or {column: column for column in metadata.columns}
+            where, binds = predicate.to_sql(filter_columns, metadata.key_columns)
+
+            def run(dry_run):
+                return planner.delete_where(self._entity, where, binds, dry_run=dry_run)
+        else:
+            def run(dry_run):
+                return planner.delete(self._entity, selected_ids, dry_run=dry_run)
+        try:
+            preview = run(True)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self._show_error(f"No se pudieron contar los registros relacionados: {exc}")
+            return True
+        if not preview.dependent_rows:
+            return False
+        confirm = QMessageBox.question(
+            self,
+            "Eliminar registros relacionados",
+            "Los elementos seleccionados tienen registros relacionados.\n"
+            f"Se eliminarán en total: {preview.summary()}.\n¿Continuar?",
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return True
+        try:
+            result = run(False)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self._show_error(f"No se pudo eliminar (no se borró nada): {exc}")
+            return True
+        for table in result.rows:
+            LOOKUP_CACHE.invalidate(table)
+            if self._prefetcher is not None:
+                self._prefetcher.invalidate(table)
+        self._model.clear_selection()
+        self._refresh_action.trigger()
+        self.statusBar().showMessage(f"Eliminados: {result.summary()}", 5000)
+        return True
+
+    def _handle_export(self) -> None:
+        """Stream the current table to a CSV/JSONL file in a background thread."""
+        if self._entity is None or self._repository is None:
+            QMessageBox.warning(self, "Información", "Seleccione una tabla primero.")
+            return
+        if self._export_thread is not None:
+            QMessageBox.information(self, "Exportar", "Ya hay una exportación en curso.")
+            return
+
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            "Exportar tabla",
+            f"{self._entity}.csv",
+            "CSV (*.csv);;JSON Lines (*.jsonl)",
+        )
+        if not path:
+            return
+        destination = Path(path)
+        if not destination.suffix:
+            destination = destination.with_suffix(".jsonl" if "jsonl" in selected_filter else ".csv")
+
+        progress_dialog = QProgressDialog(f"Exportando {self._entity}...", "Cancelar", 0, 0, self)
+        progress_dialog.setWindowTitle("Exportar")
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.setMinimumDuration(0)
+
+        thread = QThread(self)
+        worker = ExportWorker(self._repository, destination)
+        worker.moveToThread(thread)
+
+        def on_progress(done: int, total: int) -> None:
+            if total and progress_dialog.maximum() != total:
+                progress_dialog.setMaximum(total)
+            progress_dialog.setValue(min(done, total) if total else 0)
+            progress_dialog.setLabelText(f"Exportando {self._entity}: {done} filas")
+
+        def on_finished(result) -> None:
+            progress_dialog.close()
+            if result.cancelled:
+                self.statusBar().showMessage("Exportación cancelada", 5000)
+            else:
+                self.statusBar().showMessage(f"{result.rows} filas exportadas a {result.path}", 5000)
+
+        def on_failed(message: str) -> None:
+            progress_dialog.close()
+            self._show_error(f"Error al exportar: {message}")
+
+        def cleanup() -> None:
+            self._export_thread = None
+            self._export_worker = None
+
+        thread.started.connect(worker.run)
+        worker.progress.connect(on_progress)
+        worker.finished.connect(on_finished)
+        worker.failed.connect(on_failed)
+        # queued to the export thread while its event loop still runs, then quit it
+        worker.finished.connect(worker.deleteLater)
+        worker.failed.connect(worker.deleteLater)
+        worker.finished.connect(thread.quit)
+        worker.failed.connect(thread.quit)
+        thread.finished.connect(cleanup)
+        thread.finished.connect(thread.deleteLater)
+        # cancel() only sets a thread-safe flag, so call it directly from the UI thread
+        progress_dialog.canceled.connect(lambda: worker.cancel())
+
+        self._export_thread = thread
+        self._export_worker = worker
+        thread.start()
 
     def _show_detail_for_row(self, row: int) -> None:
         if self._entity is None or self._model is None:
@@ -706,13 +1098,15 @@ class MainWindow(QMainWindow):
             pelicula = self._model.pelicula_at(row)
             if not pelicula:
                 return
-            dialog = PeliculaDetailDialog(pelicula, self)
+            aggregate = self._load_aggregate('pelicula', pelicula.id)
+            dialog = PeliculaDetailDialog(aggregate.root if aggregate and aggregate.root else pelicula, self, aggregate)
             dialog.exec()
         elif self._entity == 'funcion':
             funcion = self._model.funcion_at(row)
             if not funcion:
                 return
-            dialog = FuncionDetailDialog(funcion, self)
+            aggregate = self._load_aggregate('funcion', funcion.id)
+            dialog = FuncionDetailDialog(aggregate.root if aggregate and aggregate.root else funcion, self, aggregate)
             dialog.exec()
         elif self._entity == 'asistencia':
             asistencia = self._model.asistencia_at(row)
@@ -724,7 +1118,8 @@ class MainWindow(QMainWindow):
             jurado = self._model.jurado_at(row)
             if not jurado:
                 return
-            dialog = JuradoDetailDialog(jurado, self)
+            aggregate = self._load_aggregate('jurado', jurado.id)
+            dialog = JuradoDetailDialog(aggregate.root if aggregate and aggregate.root else jurado, self, aggregate)
             dialog.exec()
         elif self._entity == 'participacion_jurado':
             participacion = self._model.participacion_at(row)
@@ -751,67 +1146,173 @@ class MainWindow(QMainWindow):
             dialog = ProyeccionDetailDialog(proy, self)
             dialog.exec()
 
+    def _load_aggregate(self, entity: str, key) -> Aggregate | None:
+        """Root row plus child lists for the detail dialog; None (row-only dialog) on error."""
+        try:
+            return AggregateLoader(self._connection()).load(entity, key)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.statusBar().showMessage(f"No se pudieron cargar los datos relacionados: {exc}", 5000)
+            return None
+
+    def _lookups(self) -> dict:
+        """``search`` of each entity the form dialogs pick by name (see ``ForeignKeyPicker``)."""
+        connection = self._connection()
+        return {
+            entity: instrument_repository(create_repository(entity, connection)).search
+            for entity in ("funcion", "pelicula", "asistente")
+        }
+
+    def _local_mirror(self, connection) -> LocalMirror | None:
+        """Return the reference-table mirror stored next to the settings file.
+
+        Not used with the SQLite backend, which is already local.
+        """
+        if dialect_of(connection) == "sqlite":
+            return None
+        if self._mirror is None:
+            self._mirror = LocalMirror.for_settings(self._settings_path)
+        return self._mirror
+
+    def _connection(self) -> CachingConnectionFactory:
+        if self._connection_factory is None:
+            # the cache sits above the instrumentation: metrics only count statements that reach the database
+            self._connection_factory = CachingConnectionFactory(
+                InstrumentedConnectionFactory(create_connection_factory(self._settings_path))
+            )
+        return self._connection_factory
+
+    def _load_menu_counts(self) -> None:
+        """Count every table concurrently on the async pool and show it on the menu buttons."""
+        try:
+            if self._async_bridge is None:
+                self._async_pool = create_async_pool(self._settings_path)
+                self._async_bridge = AsyncBridge()
+            counts = [create_async_repository(entity, self._async_pool).count() for entity in self._menu_buttons]
+            self._menu_counts = self._async_bridge.gather(
+                *counts, finished=self._on_menu_counts, failed=self._on_menu_counts_failed
+            )
+        except Exception as exc:  # pragma: no cover - depends on settings / DB
+            logger.info("Menu counts not loaded: %s", exc)
+
+    def _on_menu_counts(self, counts) -> None:
+        if self._menu_counts is None or self.sender() is not self._menu_counts:
+            # the menu was left (or rebuilt) before the counts arrived
+            return
+        self._menu_counts = None
+        for (button, tabla_nombre), count in zip(self._menu_buttons.values(), counts):
+            button.setText(f"{tabla_nombre}\n{count} filas")
+
+    def _on_menu_counts_failed(self, message: str) -> None:
+        if self.sender() is self._menu_counts:
+            self._menu_counts = None
+            logger.info("Menu counts not loaded: %s", message)
+
+    def _start_prefetch(self) -> None:
+        """Warm the connection and load the most used tables while the menu is shown."""
+        try:
+            if self._prefetcher is None:
+                connection = self._connection()
+                self._prefetcher = Prefetcher.from_settings(
+                    self._settings_path,
+                    connection,
+                    lambda entity: instrument_repository(create_repository(entity, connection)),
+                )
+            self._prefetcher.start(self._prefetcher.entities(self._usage))
+        except Exception as exc:  # pragma: no cover - depends on settings / DB
+            logger.info("Prefetch not started: %s", exc)
+
+    @staticmethod
+    def _seeded(repository, prefetched):
+        """Serve the first load of ``repository`` from a prefetched entry, if any."""
+        return SeededRepository(repository, prefetched) if prefetched is not None else repository
+
+    def _revalidate(self, token) -> None:
+        """Check off the GUI thread whether the prefetched table changed; Recargar if so."""
+        self._revalidate_token = token
+        self._revalidator = BackgroundLoader()
+        self._revalidator.loaded.connect(self._on_revalidated)
+        self._revalidator.start(self._repository.wrapped.change_token)
+
+    def _on_revalidated(self, token) -> None:
+        if self._revalidator is None or self.sender() is not self._revalidator:
+            # superseded by another table
+            return
+        self._revalidator = None
+        if token != self._revalidate_token:
+            self._refresh_action.trigger()
+
+    @profiled("MainWindow._set_entity", detail=lambda self, entity: entity)
     def _set_entity(self, entity: str) -> None:
         """Switch current managed entity to 'asistente', 'ciudad', 'sede', 'pelicula', 'funcion', 'asistencia', or 'jurado'."""
         self._entity = entity
-        connection = OracleConnection.from_settings(self._settings_path)
+        self._usage.record(entity)
+        if self._menu_counts is not None:
+            self._menu_counts.cancel()
+            self._menu_counts = None
+        prefetched = None
+        if self._prefetcher is not None:
+            prefetched = self._prefetcher.take(entity)
+            self._prefetcher.cancel()
+        self._revalidator = None
+        connection = self._connection()
         if entity == 'asistente':
-            repository = AsistenteRepository(connection)
+            repository = self._seeded(instrument_repository(AsistenteRepository(connection)), prefetched)
             self._viewmodel = AsistenteViewModel(repository)
             self._model = AsistenteTableModel()
             title_suffix = "Asistentes"
         elif entity == 'ciudad':
-            repository = CiudadRepository(connection)
+            repository = self._seeded(instrument_repository(CiudadRepository(connection, mirror=self._local_mirror(connection))), prefetched)
             self._viewmodel = CiudadViewModel(repository)
             self._model = CiudadTableModel()
             title_suffix = "Ciudades"
         elif entity == 'sede':
-            repository = SedeRepository(connection)
+            repository = self._seeded(instrument_repository(SedeRepository(connection, mirror=self._local_mirror(connection))), prefetched)
             self._viewmodel = SedeViewModel(repository)
             self._model = SedeTableModel()
             title_suffix = "Sedes"
         elif entity == 'pelicula':
-            repository = PeliculaRepository(connection)
+            repository = self._seeded(instrument_repository(PeliculaRepository(connection, mirror=self._local_mirror(connection))), prefetched)
             self._viewmodel = PeliculaViewModel(repository)
             self._model = PeliculaTableModel()
             title_suffix = "Películas"
         elif entity == 'funcion':
-            repository = FuncionRepository(connection)
-            self._viewmodel = FuncionViewModel(repository)
+            repository = self._seeded(instrument_repository(FuncionRepository(connection)), prefetched)
+            self._viewmodel = FuncionViewModel(repository, scheduler=FestivalScheduler(connection))
             self._model = FuncionTableModel()
             title_suffix = "Funciones"
         elif entity == 'asistencia':
-            repository = AsistenciaRepository(connection)
+            repository = self._seeded(instrument_repository(AsistenciaRepository(connection)), prefetched)
             self._viewmodel = AsistenciaViewModel(repository)
             self._model = AsistenciaTableModel()
             title_suffix = "Asistencias"
         elif entity == 'jurado':
-            repository = JuradoRepository(connection)
+            repository = self._seeded(instrument_repository(JuradoRepository(connection, mirror=self._local_mirror(connection))), prefetched)
             self._viewmodel = JuradoViewModel(repository)
             self._model = JuradoTableModel()
             title_suffix = "Jurados"
         elif entity == 'participacion_jurado':
-            repository = ParticipacionJuradoRepository(connection)
-            self._viewmodel = ParticipacionJuradoViewModel(repository)
+            repository = self._seeded(instrument_repository(ParticipacionJuradoRepository(connection)), prefetched)
+            self._viewmodel = ParticipacionJuradoViewModel(repository, assigner=JuryAssigner(connection))
             self._model = ParticipacionJuradoTableModel()
             title_suffix = "Participaciones de Jurado"
         elif entity == 'evaluacion':
-            repository = EvaluacionRepository(connection)
+            repository = self._seeded(instrument_repository(EvaluacionRepository(connection)), prefetched)
             self._viewmodel = EvaluacionViewModel(repository)
             self._model = EvaluacionTableModel()
             title_suffix = "Evaluaciones"
         elif entity == 'premiacion':
-            repository = PremiacionRepository(connection)
-            self._viewmodel = PremiacionViewModel(repository)
+            repository = self._seeded(instrument_repository(PremiacionRepository(connection)), prefetched)
+            self._viewmodel = PremiacionViewModel(repository, awards=AwardsEngine(connection))
             self._model = PremiacionTableModel()
             title_suffix = "Premiaciones"
         elif entity == 'proyeccion':
-            repository = ProyeccionRepository(connection)
+            repository = self._seeded(instrument_repository(ProyeccionRepository(connection)), prefetched)
             self._viewmodel = ProyeccionViewModel(repository)
             self._model = ProyeccionTableModel()
             title_suffix = "Proyecciones"
         else:
             raise ValueError(f"Unknown entity: {entity}")
+        self._repository = repository
 
         # Update window title
         self.setWindowTitle(f"Gestor de Festival de Cine - {title_suffix}")
@@ -821,6 +1322,7 @@ class MainWindow(QMainWindow):
 
         # attach model and delegate
         self._table.setModel(self._model)
+        self._footer.bind(self._model)
         try:
             self._table.setItemDelegateForColumn(self._model.ACTION_COLUMN, self._detail_delegate)
         except Exception:
@@ -895,18 +1397,48 @@ class MainWindow(QMainWindow):
             self._new_action.setVisible(True)
         if hasattr(self, "_delete_action"):
             self._delete_action.setVisible(True)
+        if hasattr(self, "_export_action"):
+            self._export_action.setVisible(True)
+        if hasattr(self, "_filter_action"):
+            filterable = hasattr(self._viewmodel, "set_filter_text")
+            self._filter_edit.clear()
+            self._filter_action.setVisible(filterable)
+            self._select_all_action.setVisible(filterable)
+        if hasattr(self, "_awards_action"):
+            self._awards_action.setVisible(hasattr(self._viewmodel, "compute_awards"))
+            self._assign_jury_action.setVisible(hasattr(self._viewmodel, "assign_jurados"))
+            self._program_action.setVisible(hasattr(self._viewmodel, "plan_program"))
         if hasattr(self, "_back_action"):
             try:
                 self._back_action.setVisible(True)
             except Exception:
                 pass
 
+        if prefetched is not None:
+            self._revalidate(prefetched.token)
+
+    def closeEvent(self, event) -> None:
+        """Stop a running export and the asyncio loop (after returning the async pool's connections)."""
+        if self._export_thread is not None:
+            # the exporter checks the flag per row and removes its .part file
+            self._export_worker.cancel()
+            self._export_thread.quit()
+            self._export_thread.wait()
+            self._export_thread = None
+            self._export_worker = None
+        if self._async_bridge is not None:
+            self._async_bridge.close(self._async_pool.close())
+            self._async_bridge = None
+        super().closeEvent(event)
+
     def _back_to_menu(self) -> None:
         """Return to the initial table selection menu."""
         # Clear current entity and viewmodel/model references
         self._entity = None
         self._viewmodel = None
         self._model = None
+        self._repository = None
+        self._footer.bind(None)
         # Reset title
         self.setWindowTitle("Gestor de Festival de Cine")
         # Show selection menu and hide toolbar actions
@@ -0,0 +1,125 @@
+"""Debug dock listing the slowest SQL statements and repository calls, and the query cache counters."""
+from __future__ import annotations
+
+from typing import Sequence
+
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import (
+    QDockWidget,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
+
+from app.infrastructure.database.instrumentation import METRICS, MetricsRegistry
+from app.infrastructure.database.query_cache import QUERY_CACHE, QueryCache
+
+REFRESH_INTERVAL_MS = 2000
+TOP_N = 25
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+class MetricsDock(QDockWidget):
+    """Shows ``MetricsRegistry`` top offenders; refreshes while visible."""
+
+    STATEMENT_HEADERS: Sequence[str] = (
+        "SQL id", "Ejecuciones", "Filas", "Round trips", "Binds",
+        "Ejecución ms", "Fetch ms", "Total ms", "Máx ms", "Lentas", "SQL",
+    )
+    CALL_HEADERS: Sequence[str] = (
+        "Llamada", "Veces", "Errores", "Filas", "Round trips",
+        "Conexión ms", "Ejecución ms", "Fetch ms", "Mapeo ms", "Total ms", "Máx ms",
+    )
+
+    def __init__(self, parent=None, registry: MetricsRegistry = METRICS, cache: QueryCache = QUERY_CACHE) -> None:
+        super().__init__("Métricas SQL", parent)
+        self.setObjectName("metrics_dock")
+        self._registry = registry
+        self._cache = cache
+
+        self._statements = self._make_table(self.STATEMENT_HEADERS)
+        self._calls = self._make_table(self.CALL_HEADERS)
+        tabs = QTabWidget()
+        tabs.addTab(self._statements, "Sentencias")
+        tabs.addTab(self._calls, "Repositorios")
+
+        self._threshold_label = QLabel()
+        self._cache_label = QLabel()
+        reset_button = QPushButton("Reiniciar")
+        reset_button.clicked.connect(self._reset)
+        header = QHBoxLayout()
+        header.addWidget(self._threshold_label)
+        header.addWidget(self._cache_label)
+        header.addStretch(1)
+        header.addWidget(reset_button)
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.addLayout(header)
+        layout.addWidget(tabs)
+        self.setWidget(container)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self.visibilityChanged.connect(self._on_visibility_changed)
+
+    @staticmethod
+    def _make_table(headers: Sequence[str]) -> QTableWidget:
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(list(headers))
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def _fill(table: QTableWidget, rows: Sequence[Sequence[object]], text_columns: Sequence[int]) -> None:
+        table.setRowCount(len(rows))
+        for r, values in enumerate(rows):
+            for c, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if c not in text_columns:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(r, c, item)
+
+    def refresh(self) -> None:
+        self._threshold_label.setText(f"Umbral de consulta lenta: {self._registry.slow_threshold * 1000:.0f} ms")
+        cache = self._cache.stats()
+        self._cache_label.setText(
+            f"Caché: {cache.hit_ratio:.0%} aciertos ({cache.hits}/{cache.hits + cache.misses}), "
+            f"{cache.entries} resultados, {cache.bytes / (1024 * 1024):.1f} MB, "
+            f"{cache.evictions} desalojos, {cache.invalidations} invalidados"
+        )
+        self._fill(self._statements, [
+            (s.sql_id, s.executions, s.rows, s.round_trips, s.binds, _ms(s.execute_time),
+             _ms(s.fetch_time), _ms(s.total_time), _ms(s.max_time), s.slow, s.sql)
+            for s in self._registry.top_statements(TOP_N)
+        ], text_columns=(0, 10))
+        self._fill(self._calls, [
+            (c.name, c.calls, c.errors, c.rows, c.round_trips, _ms(c.connect_time), _ms(c.execute_time),
+             _ms(c.fetch_time), _ms(c.mapping_time), _ms(c.total_time), _ms(c.max_time))
+            for c in self._registry.top_calls(TOP_N)
+        ], text_columns=(0,))
+
+    def _reset(self) -> None:
+        self._registry.reset()
+        self._cache.reset_stats()
+        self.refresh()
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        if visible:
+            self.refresh()
+            self._timer.start()
+        else:
+            self._timer.stop()
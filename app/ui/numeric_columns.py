@@ -0,0 +1,131 @@
+"""Numeric columns of a table model as flat arrays, for the grid footers.
+
+``NumericColumns.load`` copies the numeric attributes of the loaded rows once
+into one float array per column (``None`` becomes NaN). Footer sums, averages
+and counts are then computed over those arrays for the rows in a mask (the
+checked rows, or every loaded row) instead of walking the domain objects on
+every selection change.
+
+NumPy is listed in ``requirements.txt`` but stays optional: with it the
+arrays are ``float64`` ndarrays and each aggregate is one vectorized
+reduction; without it (or with ``use_numpy=False``, which the benchmarks use
+to compare both paths) they are ``array("d")`` and the same results come from
+plain loops::
+
+    columns = NumericColumns({"entradas": attrgetter("entradas")})
+    columns.load(asistencias)
+    columns.aggregate(FooterAggregate("Entradas", "sum", "entradas"), mask=[0, 4, 9])
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+HAS_NUMPY = np is not None
+
+# "sum", "mean" or "count" (non-null values)
+AGGREGATE_OPS = ("sum", "mean", "count")
+
+
+class FooterAggregate(NamedTuple):
+    label: str
+    op: str
+    column: str
+    # format spec of the value, e.g. ",.0f"
+    fmt: str = ",.0f"
+    prefix: str = ""
+
+    def format(self, value: Optional[float]) -> str:
+        if value is None:
+            return f"{self.label}: —"
+        return f"{self.label}: {self.prefix}{value:{self.fmt}}"
+
+
+def _number(value: Any) -> float:
+    if value is None or value == "":
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class NumericColumns:
+    """Float arrays for ``getters`` (column name -> row -> number), rebuilt by ``load``."""
+
+    def __init__(self, getters: Mapping[str, Callable[[Any], Any]], use_numpy: bool = True) -> None:
+        self._getters = dict(getters)
+        self.use_numpy = use_numpy and HAS_NUMPY
+        self._arrays: Dict[str, Any] = {}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def load(self, rows: Sequence[Any]) -> None:
+        self._rows = len(rows)
+        self._arrays = {}
+        for name, getter in self._getters.items():
+            values = array("d", (_number(getter(row)) for row in rows))
+            self._arrays[name] = np.frombuffer(values, dtype=np.float64) if self.use_numpy else values
+
+    def column(self, name: str) -> Any:
+        return self._arrays[name]
+
+    def product(self, name: str, left: str, right: str) -> None:
+        """Add column ``name`` = ``left`` * ``right`` row by row (NaN if either is missing)."""
+        a, b = self._arrays[left], self._arrays[right]
+        self._arrays[name] = a * b if self.use_numpy else array("d", (x * y for x, y in zip(a, b)))
+
+    def lookup(self, name: str, key_column: str, mapping: Mapping[Any, Any]) -> None:
+        """Add column ``name`` = ``mapping[key]`` for each row's ``key_column`` (NaN if absent)."""
+        keys = self._arrays[key_column]
+        if not self.use_numpy:
+            values = {float(key): _number(value) for key, value in mapping.items()}
+            self._arrays[name] = array("d", (values.get(key, math.nan) for key in keys))
+            return
+        if not mapping:
+            self._arrays[name] = np.full(self._rows, np.nan)
+            return
+        known = np.fromiter((float(key) for key in mapping), dtype=np.float64, count=len(mapping))
+        values = np.fromiter((_number(value) for value in mapping.values()), dtype=np.float64, count=len(mapping))
+        order = np.argsort(known)
+        known, values = known[order], values[order]
+        positions = np.minimum(np.searchsorted(known, keys), len(known) - 1)
+        self._arrays[name] = np.where(known[positions] == keys, values[positions], np.nan)
+
+    def aggregate(self, spec: FooterAggregate, mask: Optional[Sequence[int]] = None) -> Optional[float]:
+        """``spec.op`` over the rows in ``mask`` (every row when None); None if no value."""
+        if spec.op not in AGGREGATE_OPS:
+            raise ValueError(f"Operación desconocida: {spec.op}")
+        values = self._arrays.get(spec.column)
+        if values is None:
+            # nothing loaded yet (or a derived column not computed)
+            return 0.0 if spec.op == "count" else None
+        if self.use_numpy:
+            if mask is not None:
+                values = values[np.asarray(mask, dtype=np.intp)]
+            present = values[~np.isnan(values)]
+            if spec.op == "count":
+                return float(present.size)
+            if not present.size:
+                return None
+            return float(present.sum() if spec.op == "sum" else present.mean())
+
+        selected = values if mask is None else (values[row] for row in mask)
+        kept: List[float] = [value for value in selected if not math.isnan(value)]
+        if spec.op == "count":
+            return float(len(kept))
+        if not kept:
+            return None
+        total = math.fsum(kept)
+        return total if spec.op == "sum" else total / len(kept)
+
+    def footer(self, specs: Sequence[FooterAggregate], mask: Optional[Sequence[int]] = None) -> List[str]:
+        return [spec.format(self.aggregate(spec, mask)) for spec in specs]
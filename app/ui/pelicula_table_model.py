@@ -6,6 +6,7 @@ from typing import List, Sequence, Set
 from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QVariant
 
 from app.domain.models.pelicula import Pelicula
+from app.ui.column_store import ColumnStore
 
 
 class PeliculaTableModel(QAbstractTableModel):
@@ -24,11 +25,14 @@ class PeliculaTableModel(QAbstractTableModel):
     )
     SELECT_COLUMN = 0
     ACTION_COLUMN = len(HEADERS) - 1
+    CATEGORICAL_COLUMNS = ("genero", "clasificacion")
 
     def __init__(self, peliculas: List[Pelicula] | None = None) -> None:
         super().__init__()
         self._peliculas: List[Pelicula] = peliculas or []
         self._selected_ids: Set[int] = set()
+        self.categories = ColumnStore(self.CATEGORICAL_COLUMNS)
+        self.categories.encode(self._peliculas)
 
     def rowCount(self, parent: QModelIndex | None = None) -> int:  # noqa: N802
         return len(self._peliculas)
@@ -58,8 +62,8 @@ class PeliculaTableModel(QAbstractTableModel):
             2: pelicula.pais_origen,
             3: pelicula.director,
             4: pelicula.duracion_minutos,
-            5: pelicula.genero,
-            6: pelicula.clasificacion,
+            5: self.categories.value("genero", index.row()),
+            6: self.categories.value("clasificacion", index.row()),
             7: pelicula.sinopsis[:50] + "..." if len(pelicula.sinopsis) > 50 else pelicula.sinopsis,
             self.ACTION_COLUMN: "Detalle",
         }
@@ -113,6 +117,7 @@ class PeliculaTableModel(QAbstractTableModel):
 
         self.beginResetModel()
         self._peliculas = peliculas
+        self.categories.encode(peliculas)
         current_ids = {pelicula.id for pelicula in peliculas if pelicula.id is not None}
         self._selected_ids.intersection_update(current_ids)
         self.endResetModel()
@@ -1,7 +1,9 @@
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QGuiApplication
 
 from app.domain.models.proyeccion import Proyeccion
+from app.infrastructure.repositories.predicate import Predicate
+from app.ui.range_selection import RangeSelection
 
 
 class ProyeccionTableModel(QAbstractTableModel):
@@ -15,7 +17,7 @@ class ProyeccionTableModel(QAbstractTableModel):
     def __init__(self):
         super().__init__()
         self.proyecciones: list[Proyeccion] = []
-        self.selected_rows = set()
+        self.selection = RangeSelection()
 
     def rowCount(self, parent=QModelIndex()):
         return len(self.proyecciones)
@@ -46,16 +48,18 @@ class ProyeccionTableModel(QAbstractTableModel):
                 return p.comentarios
             elif index.column() == self.ACTION_COLUMN:
                 return "Detalle"
-        elif role == Qt.ItemDataRole.BackgroundRole and index.row() in self.selected_rows:
+        elif role == Qt.ItemDataRole.BackgroundRole and index.row() in self.selection:
             return QColor(200, 220, 255)
         return None
 
     def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
         if index.column() == self.SELECT_COLUMN and role == Qt.ItemDataRole.EditRole:
-            if value:
-                self.selected_rows.add(index.row())
-            else:
-                self.selected_rows.discard(index.row())
+            if QGuiApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier:
+                # shift: apply to every row from the previous one
+                first, last = self.selection.set_range_to(index.row(), bool(value))
+                self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+                return True
+            self.selection.set_row(index.row(), bool(value))
             self.dataChanged.emit(index, index)
             return True
         return False
@@ -68,11 +72,33 @@ class ProyeccionTableModel(QAbstractTableModel):
     def update_proyecciones(self, proyecciones: list[Proyeccion]):
         self.beginResetModel()
         self.proyecciones = proyecciones
-        self.selected_rows.clear()
+        self.selection.clear()
         self.endResetModel()
 
     def get_selected_ids(self) -> list:
-        return [(self.proyecciones[row].id_funcion, self.proyecciones[row].id_pelicula) for row in self.selected_rows]
+        if self.selection.is_all_matching:
+            rows = [row for row in range(len(self.proyecciones)) if row in self.selection]
+        else:
+            rows = [row for row in self.selection.rows() if row < len(self.proyecciones)]
+        return [(self.proyecciones[row].id_funcion, self.proyecciones[row].id_pelicula) for row in rows]
+
+    def select_all_matching(self, predicate: Predicate, total: int) -> None:
+        """Select every row matching ``predicate`` (``total`` rows server-side)."""
+        self.selection.select_all_matching(predicate, total)
+        if self.proyecciones:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self.proyecciones) - 1, self.columnCount() - 1))
+
+    def selection_predicate(self) -> Predicate | None:
+        """Predicate of an "all matching" selection minus unselected rows, else None."""
+        predicate = self.selection.predicate
+        if predicate is None:
+            return None
+        excluded = [
+            (self.proyecciones[row].id_funcion, self.proyecciones[row].id_pelicula)
+            for row in self.selection.excluded_rows
+            if row < len(self.proyecciones)
+        ]
+        return predicate.excluding(excluded)
 
     def proyeccion_at(self, row: int) -> Proyeccion:
         if 0 <= row < len(self.proyecciones):
@@ -80,6 +106,8 @@ class ProyeccionTableModel(QAbstractTableModel):
         return None
 
     def clear_selection(self):
-        if self.selected_rows:
-            self.selected_rows.clear()
-            self.dataChanged.emit(self.index(0, 0), self.index(len(self.proyecciones) - 1, self.columnCount() - 1))
+        span = self.selection.span(len(self.proyecciones))
+        self.selection.clear()
+        # repaint only the rows that could have been highlighted
+        if span is not None:
+            self.dataChanged.emit(self.index(span[0], 0), self.index(span[1], self.columnCount() - 1))
@@ -0,0 +1,161 @@
+"""Checkbox selection stored as row ranges, or as "every row matching a predicate".
+
+Table models used to keep one Python object per checked row and repaint the
+whole checkbox column on every clear. ``RangeSelection`` keeps sorted,
+disjoint half-open ``[start, end)`` row ranges (so shift-selecting 50 000 rows
+is one entry) and knows the span it covers, so only that span is repainted.
+
+In "all matching" mode nothing is materialised: the selection is the
+predicate the grid was loaded with plus the total reported by the server, and
+rows unchecked afterwards are remembered as exclusions. Deleting such a
+selection is a single ``DELETE ... WHERE`` (see ``Predicate``).
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterator, List, Optional, Set, Tuple
+
+from app.infrastructure.repositories.predicate import Predicate
+
+
+class RangeSelection:
+    """Selected rows of a table model (row indices into its current list)."""
+
+    def __init__(self) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._predicate: Optional[Predicate] = None
+        self._matching_total = 0
+        self._excluded: Set[int] = set()
+        # last row toggled, start of a shift-click range
+        self.anchor: Optional[int] = None
+
+    # -- queries -----------------------------------------------------------
+    def __contains__(self, row: int) -> bool:
+        if self._predicate is not None:
+            return row not in self._excluded
+        i = bisect_right(self._starts, row) - 1
+        return i >= 0 and row < self._ends[i]
+
+    def __len__(self) -> int:
+        if self._predicate is not None:
+            return max(self._matching_total - len(self._excluded), 0)
+        return sum(end - start for start, end in zip(self._starts, self._ends))
+
+    def __bool__(self) -> bool:
+        return self._predicate is not None or bool(self._starts)
+
+    @property
+    def is_all_matching(self) -> bool:
+        return self._predicate is not None
+
+    @property
+    def predicate(self) -> Optional[Predicate]:
+        return self._predicate
+
+    @property
+    def excluded_rows(self) -> Set[int]:
+        return set(self._excluded)
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def rows(self) -> Iterator[int]:
+        """Explicitly selected rows in ascending order (empty in "all matching" mode)."""
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+
+    def span(self, row_count: int) -> Optional[Tuple[int, int]]:
+        """First and last row (inclusive) whose checkbox may be drawn checked."""
+        if self._predicate is not None:
+            return (0, row_count - 1) if row_count else None
+        if not self._starts:
+            return None
+        return self._starts[0], min(self._ends[-1], row_count) - 1
+
+    # -- updates -----------------------------------------------------------
+    def set_row(self, row: int, selected: bool) -> None:
+        self.anchor = row
+        if self._predicate is not None:
+            if selected:
+                self._excluded.discard(row)
+            else:
+                self._excluded.add(row)
+            return
+        if selected:
+            self.add_range(row, row + 1)
+        else:
+            self.remove_range(row, row + 1)
+
+    def set_range_to(self, row: int, selected: bool) -> Tuple[int, int]:
+        """Apply ``selected`` from the anchor to ``row``; returns the inclusive span touched."""
+        anchor = row if self.anchor is None else self.anchor
+        first, last = min(anchor, row), max(anchor, row)
+        if self._predicate is not None:
+            for r in range(first, last + 1):
+                self.set_row(r, selected)
+        elif selected:
+            self.add_range(first, last + 1)
+        else:
+            self.remove_range(first, last + 1)
+        self.anchor = row
+        return first, last
+
+    def add_range(self, start: int, end: int) -> None:
+        if start >= end:
+            return
+        # absorb every range overlapping or touching [start, end)
+        i = bisect_right(self._ends, start - 1)
+        j = bisect_right(self._starts, end)
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+
+    def remove_range(self, start: int, end: int) -> None:
+        if start >= end:
+            return
+        i = bisect_right(self._ends, start)
+        j = bisect_right(self._starts, end - 1)
+        if i >= j:
+            return
+        new_starts, new_ends = [], []
+        if self._starts[i] < start:
+            new_starts.append(self._starts[i])
+            new_ends.append(start)
+        if self._ends[j - 1] > end:
+            new_starts.append(end)
+            new_ends.append(self._ends[j - 1])
+        self._starts[i:j] = new_starts
+        self._ends[i:j] = new_ends
+
+    def select_all_matching(self, predicate: Predicate, total: int) -> None:
+        """Select every row matching ``predicate`` (``total`` as counted by the server)."""
+        self.clear()
+        self._predicate = predicate
+        self._matching_total = total
+
+    def replace_rows(self, rows: List[int]) -> None:
+        """Reset to explicit ``rows`` (e.g. the same keys after a reload)."""
+        self.clear()
+        start = end = None
+        for row in sorted(rows):
+            if end is not None and row == end:
+                end += 1
+                continue
+            if start is not None:
+                self._starts.append(start)
+                self._ends.append(end)
+            start, end = row, row + 1
+        if start is not None:
+            self._starts.append(start)
+            self._ends.append(end)
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._ends.clear()
+        self._predicate = None
+        self._matching_total = 0
+        self._excluded.clear()
+        self.anchor = None
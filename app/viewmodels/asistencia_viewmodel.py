@@ -1,28 +1,54 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-from typing import List
+from typing import Dict, List
 from app.domain.models.asistencia import Asistencia
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.asistencia_repository import AsistenciaRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class AsistenciaViewModel(QObject):
     """ViewModel para gestionar la lógica de negocio de Asistencia."""
 
     asistencias_changed = pyqtSignal(list)  # Emitido cuando cambian las asistencias
     error_occurred = pyqtSignal(str)  # Emitido cuando ocurre un error
+    precios_changed = pyqtSignal(dict)  # id_funcion -> precio_entrada, antes de asistencias_changed
 
     def __init__(self, repository: AsistenciaRepository):
         super().__init__()
         self.repository = repository
+        self._tracker = ChangeTracker(repository)
         self.asistencias: List[Asistencia] = []
+        self.precios: Dict[int, float] = {}
 
     def load_asistencias(self):
         """Carga todas las asistencias desde la BD."""
         try:
-            self.asistencias = self.repository.get_all()
+            self.asistencias = self._tracker.load()
+            self._load_precios()
             self.asistencias_changed.emit(self.asistencias)
         except Exception as e:
             self.error_occurred.emit(f"Error al cargar asistencias: {str(e)}")
 
+    def refresh_asistencias(self) -> None:
+        """Recargar: refetch only if `asistencia` changed since the last load."""
+        try:
+            asistencias = self._tracker.refresh(self.asistencias)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error al cargar asistencias: {exc}")
+            return
+        if asistencias is not None:
+            self.asistencias = asistencias
+            try:
+                self._load_precios()
+            except Exception as exc:  # pragma: no cover - interacts with DB
+                self.error_occurred.emit(f"Error al cargar precios: {exc}")
+            self.asistencias_changed.emit(self.asistencias)
+
+    def _load_precios(self) -> None:
+        self.precios = self.repository.precios_por_funcion()
+        self.precios_changed.emit(self.precios)
+
     def add_asistencia(self, asistencia: Asistencia):
         """Añade una nueva asistencia."""
         try:
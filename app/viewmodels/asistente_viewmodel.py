@@ -6,9 +6,12 @@ from typing import List, Sequence
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.domain.models.asistente import Asistente
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.asistente_repository import AsistenteRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class AsistenteViewModel(QObject):
     """Coordinates UI updates for asistente data."""
 
@@ -18,15 +21,27 @@ class AsistenteViewModel(QObject):
     def __init__(self, repository: AsistenteRepository) -> None:
         super().__init__()
         self._repository = repository
+        self._tracker = ChangeTracker(repository, key=lambda a: a.id)
         self._asistentes: List[Asistente] = []
 
     def load_asistentes(self) -> None:
         try:
-            self._asistentes = self._repository.get_all()
+            self._asistentes = self._tracker.load()
             self.asistentes_changed.emit(self._asistentes)
         except Exception as exc:  # pragma: no cover - interacts with DB
             self.error_occurred.emit(str(exc))
 
+    def refresh_asistentes(self) -> None:
+        """Recargar: refetch only if `asistente` changed since the last load."""
+        try:
+            asistentes = self._tracker.refresh(self._asistentes)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(str(exc))
+            return
+        if asistentes is not None:
+            self._asistentes = asistentes
+            self.asistentes_changed.emit(self._asistentes)
+
     def add_asistente(self, asistente: Asistente) -> bool:
         try:
             self._repository.add(asistente)
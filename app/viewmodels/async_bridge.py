@@ -0,0 +1,103 @@
+"""Runs coroutines on one asyncio loop thread and reports back through Qt signals.
+
+Qt owns the GUI thread, so the loop runs on a dedicated daemon thread instead
+of replacing Qt's event loop. Any number of coroutines can be in flight on
+that single thread; each :class:`AsyncCall` emits ``finished`` / ``failed``
+from the loop thread and Qt queues the signal to the receiver's (GUI) thread,
+the same delivery path as :class:`BackgroundLoader`.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import CancelledError, Future
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class AsyncCall(QObject):
+    """Handle of one submitted coroutine."""
+
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._future: Optional[Future] = None
+
+    def cancel(self) -> bool:
+        """Cancel the coroutine; neither signal is emitted afterwards."""
+        return self._future.cancel() if self._future is not None else False
+
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def _attach(self, future: Future) -> None:
+        self._future = future
+        future.add_done_callback(self._report)
+
+    def _report(self, future: Future) -> None:
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.failed.emit(str(exc))
+            return
+        self.finished.emit(result)
+
+
+class AsyncBridge:
+    """Owns the asyncio loop used by the async repositories."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="asyncio-bridge", daemon=True)
+        self._thread.start()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def submit(
+        self,
+        coroutine: Coroutine[Any, Any, Any],
+        finished: Optional[Callable[[Any], None]] = None,
+        failed: Optional[Callable[[str], None]] = None,
+    ) -> AsyncCall:
+        """Schedule ``coroutine``; callbacks are connected before it can complete."""
+        call = AsyncCall()
+        if finished is not None:
+            call.finished.connect(finished)
+        if failed is not None:
+            call.failed.connect(failed)
+        call._attach(asyncio.run_coroutine_threadsafe(coroutine, self._loop))
+        return call
+
+    def gather(
+        self,
+        *awaitables: Awaitable[Any],
+        finished: Optional[Callable[[Any], None]] = None,
+        failed: Optional[Callable[[str], None]] = None,
+    ) -> AsyncCall:
+        """Run ``awaitables`` concurrently; ``finished`` receives the list of results."""
+
+        async def run_all() -> list:
+            return list(await asyncio.gather(*awaitables))
+
+        return self.submit(run_all(), finished, failed)
+
+    def run(self, coroutine: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """Block until ``coroutine`` finishes (for scripts and shutdown, not the GUI thread)."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def close(self, cleanup: Optional[Coroutine[Any, Any, Any]] = None) -> None:
+        """Run ``cleanup`` (e.g. ``pool.close()``), then stop the loop and its thread."""
+        if self._loop.is_closed():
+            return
+        if cleanup is not None:
+            self.run(cleanup)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
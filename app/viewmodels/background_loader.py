@@ -0,0 +1,25 @@
+"""Runs a repository call on a worker thread and reports back through Qt signals."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class BackgroundLoader(QObject):
+    """Fire-and-forget loader; results are delivered on the receiver's (GUI) thread."""
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def start(self, load: Callable[[], Any]) -> None:
+        threading.Thread(target=self._run, args=(load,), daemon=True).start()
+
+    def _run(self, load: Callable[[], Any]) -> None:
+        try:
+            result = load()
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.failed.emit(str(exc))
+            return
+        self.loaded.emit(result)
@@ -0,0 +1,75 @@
+"""Skips Recargar round trips when a table has not changed since the last load."""
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, List, Optional, Sequence
+
+from app.infrastructure.repositories.change_token import ChangeToken
+
+
+class ChangeTracker:
+    """Remembers the repository's change token as of the last full load.
+
+    ``refresh()`` costs one ``COUNT(*)/MAX(ORA_ROWSCN)`` query when nothing
+    changed. When the row count is the same, repositories that implement
+    ``get_changed_since(scn)`` are asked only for the rows whose SCN moved; the
+    merge is used if every one of them replaces an existing row (same count and
+    no new keys means nothing was deleted either). Otherwise ``get_all()`` runs.
+    """
+
+    def __init__(self, repository, key: Optional[Callable[[Any], Hashable]] = None) -> None:
+        self._repository = repository
+        self._key = key if hasattr(repository, "get_changed_since") else None
+        self._token: Optional[ChangeToken] = None
+        self._fetch: Optional[Callable[[], List[Any]]] = None
+
+    def set_fetch(self, fetch: Optional[Callable[[], List[Any]]]) -> None:
+        """Reload with ``fetch`` (e.g. a filtered query) instead of ``get_all()``; None restores it.
+
+        The delta merge is skipped while set: changed rows may no longer match.
+        """
+        self._fetch = fetch
+
+    def load(self) -> List[Any]:
+        """Full reload; the token is read first so concurrent writes are not missed."""
+        self._token = self._current_token()
+        return self._fetch_all()
+
+    def refresh(self, current: Optional[Sequence[Any]] = None) -> Optional[List[Any]]:
+        """Return the up-to-date rows, or None if the table is unchanged."""
+        previous, token = self._token, self._current_token()
+        if token is not None and token == previous:
+            return None
+        self._token = token
+        if (
+            current is not None
+            and self._key is not None
+            and self._fetch is None
+            and token is not None
+            and previous is not None
+            and previous.scn is not None
+            and token.count == previous.count
+        ):
+            merged = self._merge(current, self._repository.get_changed_since(previous.scn))
+            if merged is not None:
+                return merged
+        return self._fetch_all()
+
+    def _fetch_all(self) -> List[Any]:
+        return self._fetch() if self._fetch is not None else self._repository.get_all()
+
+    def _current_token(self) -> Optional[ChangeToken]:
+        try:
+            return self._repository.change_token()
+        except Exception:
+            # no token (e.g. missing privileges): behave like a plain reload
+            return None
+
+    def _merge(self, current: Sequence[Any], changed: Sequence[Any]) -> Optional[List[Any]]:
+        positions = {self._key(item): index for index, item in enumerate(current)}
+        merged = list(current)
+        for item in changed:
+            index = positions.get(self._key(item))
+            if index is None:
+                return None
+            merged[index] = item
+        return merged
@@ -6,9 +6,13 @@ from typing import List, Sequence
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.domain.models.ciudad import Ciudad
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.ciudad_repository import CiudadRepository
+from app.viewmodels.background_loader import BackgroundLoader
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class CiudadViewModel(QObject):
     """Coordinates UI updates for ciudad data."""
 
@@ -18,15 +22,38 @@ class CiudadViewModel(QObject):
     def __init__(self, repository: CiudadRepository) -> None:
         super().__init__()
         self._repository = repository
+        self._tracker = ChangeTracker(repository)
         self._ciudades: List[Ciudad] = []
+        self._loader = BackgroundLoader()
+        self._loader.loaded.connect(self._set_ciudades)
+        self._loader.failed.connect(self.error_occurred)
 
     def load_ciudades(self) -> None:
+        cached = self._repository.get_cached()
+        if cached is not None:
+            # show the local mirror right away and sync it from the database in the background
+            self._set_ciudades(cached)
+            self._loader.start(self._tracker.load)
+            return
         try:
-            self._ciudades = self._repository.get_all()
-            self.ciudades_changed.emit(self._ciudades)
+            self._set_ciudades(self._tracker.load())
         except Exception as exc:  # pragma: no cover - interacts with DB
             self.error_occurred.emit(str(exc))
 
+    def refresh_ciudades(self) -> None:
+        """Recargar: refetch only if `ciudad` changed since the last load."""
+        try:
+            ciudades = self._tracker.refresh(self._ciudades)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(str(exc))
+            return
+        if ciudades is not None:
+            self._set_ciudades(ciudades)
+
+    def _set_ciudades(self, ciudades) -> None:
+        self._ciudades = ciudades
+        self.ciudades_changed.emit(self._ciudades)
+
     def add_ciudad(self, ciudad: Ciudad) -> bool:
         try:
             self._repository.add(ciudad)
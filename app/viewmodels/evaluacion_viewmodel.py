@@ -2,9 +2,12 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from typing import List
 
 from app.domain.models.evaluacion import Evaluacion
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.evaluacion_repository import EvaluacionRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class EvaluacionViewModel(QObject):
     """ViewModel for managing Evaluacion business logic."""
 
@@ -14,15 +17,27 @@ class EvaluacionViewModel(QObject):
     def __init__(self, repository: EvaluacionRepository):
         super().__init__()
         self.repository = repository
+        self._tracker = ChangeTracker(repository)
         self.evaluaciones: List[Evaluacion] = []
 
     def load_evaluaciones(self):
         try:
-            self.evaluaciones = self.repository.get_all()
+            self.evaluaciones = self._tracker.load()
             self.evaluaciones_changed.emit(self.evaluaciones)
         except Exception as e:
             self.error_occurred.emit(f"Error loading evaluaciones: {str(e)}")
 
+    def refresh_evaluaciones(self) -> None:
+        """Recargar: refetch only if `evaluacion` changed since the last load."""
+        try:
+            evaluaciones = self._tracker.refresh(self.evaluaciones)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error loading evaluaciones: {exc}")
+            return
+        if evaluaciones is not None:
+            self.evaluaciones = evaluaciones
+            self.evaluaciones_changed.emit(self.evaluaciones)
+
     def add_evaluacion(self, evaluacion: Evaluacion):
         try:
             if self.repository.add(evaluacion):
@@ -1,33 +1,74 @@
 """ViewModel for Funcion (Función)."""
+from datetime import date
+from typing import Optional
+
 from PyQt6.QtCore import pyqtSignal, QObject
 
 from app.domain.models.funcion import Funcion
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
+from app.infrastructure.repositories.festival_scheduler import FestivalScheduler, ProgramPlan
 from app.infrastructure.repositories.funcion_repository import FuncionRepository
+from app.infrastructure.repositories.predicate import Predicate
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class FuncionViewModel(QObject):
     """ViewModel for Funcion entity."""
 
     funciones_changed = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, repository: FuncionRepository):
+    def __init__(self, repository: FuncionRepository, scheduler: Optional[FestivalScheduler] = None):
         """Initialize FuncionViewModel.
 
         Args:
             repository: FuncionRepository instance.
+            scheduler: Programme generator behind "Generar programación" (optional).
         """
         super().__init__()
         self.repository = repository
+        self.scheduler = scheduler
+        self._tracker = ChangeTracker(repository)
+        self._filter = Predicate()
+
+    @property
+    def filter(self) -> Predicate:
+        """Predicate the grid is currently loaded with (empty: every row)."""
+        return self._filter
+
+    def set_filter_text(self, text: str) -> None:
+        """Filter the grid server-side to functions whose text columns contain ``text``."""
+        self._filter = Predicate().matching_text(self.repository.TEXT_COLUMNS, text)
+        self._tracker.set_fetch(None if self._filter.is_empty else lambda: self.repository.get_where(self._filter))
+        self.load_funciones()
+
+    def count_matching(self) -> int:
+        """Number of functions matching the current filter, counted by the database."""
+        try:
+            return self.repository.count_where(self._filter)
+        except Exception as e:
+            self.error_occurred.emit(f"Error counting funciones: {str(e)}")
+            return 0
 
     def load_funciones(self) -> None:
         """Load all funciones from the repository."""
         try:
-            funciones = self.repository.get_all()
+            funciones = self._tracker.load()
             self.funciones_changed.emit(funciones)
         except Exception as e:
             self.error_occurred.emit(f"Error loading funciones: {str(e)}")
 
+    def refresh_funciones(self) -> None:
+        """Recargar: refetch only if `funcion` changed since the last load."""
+        try:
+            funciones = self._tracker.refresh()
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error loading funciones: {exc}")
+            return
+        if funciones is not None:
+            self.funciones_changed.emit(funciones)
+
     def add_funcion(self, funcion: Funcion) -> bool:
         """Add a new funcion.
 
@@ -81,3 +122,52 @@ class FuncionViewModel(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Error deleting funciones: {str(e)}")
             return False
+
+    def delete_matching(self, predicate: Predicate) -> int:
+        """Delete every funcion matching ``predicate`` in one statement.
+
+        Args:
+            predicate: Selection predicate (filter minus unchecked rows).
+
+        Returns:
+            Number of rows deleted (0 on error).
+        """
+        try:
+            deleted = self.repository.delete_where(predicate)
+            self.load_funciones()
+            return deleted
+        except Exception as e:
+            self.error_occurred.emit(f"Error deleting funciones: {str(e)}")
+            return 0
+
+    def plan_program(self, desde: date, hasta: date) -> Optional[ProgramPlan]:
+        """Screenings the scheduler would add from ``desde`` to ``hasta``, without writing them.
+
+        Returns:
+            The plan, or None without a scheduler or on error.
+        """
+        if self.scheduler is None:
+            return None
+        try:
+            return self.scheduler.plan(desde, hasta)
+        except Exception as e:
+            self.error_occurred.emit(f"Error planning programme: {str(e)}")
+            return None
+
+    def write_program(self, plan: ProgramPlan) -> Optional[ProgramPlan]:
+        """Write a plan from ``plan_program`` in batched transactions, then reload.
+
+        Returns:
+            The plan with the written counts, or None on error.
+        """
+        if self.scheduler is None:
+            return None
+        try:
+            plan = self.scheduler.write(plan)
+        except Exception as e:
+            self.error_occurred.emit(f"Error writing programme: {str(e)}")
+            return None
+        if plan.error:
+            self.error_occurred.emit(f"Error writing programme: {plan.error}")
+        self.load_funciones()
+        return plan
@@ -2,9 +2,13 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from typing import List
 
 from app.domain.models.jurado import Jurado
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.jurado_repository import JuradoRepository
+from app.viewmodels.background_loader import BackgroundLoader
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class JuradoViewModel(QObject):
     """ViewModel for managing Jurado business logic."""
 
@@ -14,16 +18,39 @@ class JuradoViewModel(QObject):
     def __init__(self, repository: JuradoRepository):
         super().__init__()
         self.repository = repository
+        self._tracker = ChangeTracker(repository)
         self.jurados: List[Jurado] = []
+        self._loader = BackgroundLoader()
+        self._loader.loaded.connect(self._set_jurados)
+        self._loader.failed.connect(lambda message: self.error_occurred.emit(f"Error al cargar jurados: {message}"))
 
     def load_jurados(self):
         """Load all jurados from the database."""
+        cached = self.repository.get_cached()
+        if cached is not None:
+            # show the local mirror right away and sync it from the database in the background
+            self._set_jurados(cached)
+            self._loader.start(self._tracker.load)
+            return
         try:
-            self.jurados = self.repository.get_all()
-            self.jurados_changed.emit(self.jurados)
+            self._set_jurados(self._tracker.load())
         except Exception as e:
             self.error_occurred.emit(f"Error al cargar jurados: {str(e)}")
 
+    def refresh_jurados(self) -> None:
+        """Recargar: refetch only if `jurado` changed since the last load."""
+        try:
+            jurados = self._tracker.refresh(self.jurados)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error al cargar jurados: {exc}")
+            return
+        if jurados is not None:
+            self._set_jurados(jurados)
+
+    def _set_jurados(self, jurados) -> None:
+        self.jurados = jurados
+        self.jurados_changed.emit(self.jurados)
+
     def add_jurado(self, jurado: Jurado):
         """Add a new jurado."""
         try:
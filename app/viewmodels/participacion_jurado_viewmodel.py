@@ -1,18 +1,26 @@
+from typing import Optional
+
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.domain.models.participacion_jurado import ParticipacionJurado
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
+from app.infrastructure.repositories.jury_assignment import AssignmentPlan, JuryAssigner
 from app.infrastructure.repositories.participacion_jurado_repository import ParticipacionJuradoRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class ParticipacionJuradoViewModel(QObject):
     """ViewModel for participacion_jurado entity."""
 
     participaciones_changed = pyqtSignal(list)  # emit list of participaciones
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, repository: ParticipacionJuradoRepository) -> None:
+    def __init__(self, repository: ParticipacionJuradoRepository, assigner: Optional[JuryAssigner] = None) -> None:
         super().__init__()
         self._repository = repository
+        self.assigner = assigner
+        self._tracker = ChangeTracker(repository, key=lambda p: (p.id_jurado, p.id_funcion))
         self._participaciones: list[ParticipacionJurado] = []
 
     @property
@@ -22,11 +30,22 @@ class ParticipacionJuradoViewModel(QObject):
     def load_participaciones(self) -> None:
         """Load all participaciones from repository and emit them."""
         try:
-            self._participaciones = self._repository.get_all()
+            self._participaciones = self._tracker.load()
             self.participaciones_changed.emit(self._participaciones)
         except Exception as e:
             self.error_occurred.emit(f"Error loading participaciones: {str(e)}")
 
+    def refresh_participaciones(self) -> None:
+        """Recargar: refetch only if `participacion_jurado` changed since the last load."""
+        try:
+            participaciones = self._tracker.refresh(self._participaciones)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error loading participaciones: {exc}")
+            return
+        if participaciones is not None:
+            self._participaciones = participaciones
+            self.participaciones_changed.emit(self._participaciones)
+
     def add_participacion(self, participacion: ParticipacionJurado) -> bool:
         """Add a new participacion."""
         try:
@@ -59,3 +78,27 @@ class ParticipacionJuradoViewModel(QObject):
         except Exception as e:
             self.error_occurred.emit(f"Error deleting participaciones: {str(e)}")
             return False
+
+    def plan_assignments(self) -> Optional[AssignmentPlan]:
+        """Jurado panels for the open funciones, without writing them."""
+        if self.assigner is None:
+            return None
+        try:
+            return self.assigner.plan()
+        except Exception as e:
+            self.error_occurred.emit(f"Error planning assignments: {str(e)}")
+            return None
+
+    def assign_jurados(self) -> Optional[AssignmentPlan]:
+        """Plan and bulk-insert the panels, then reload."""
+        if self.assigner is None:
+            return None
+        try:
+            plan = self.assigner.assign()
+        except Exception as e:
+            self.error_occurred.emit(f"Error assigning jurados: {str(e)}")
+            return None
+        if plan.errors:
+            self.error_occurred.emit(f"{len(plan.errors)} assignments rejected: {plan.errors[0][1]}")
+        self.load_participaciones()
+        return plan
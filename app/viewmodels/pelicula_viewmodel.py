@@ -6,9 +6,13 @@ from typing import List
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.domain.models.pelicula import Pelicula
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.pelicula_repository import PeliculaRepository
+from app.viewmodels.background_loader import BackgroundLoader
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class PeliculaViewModel(QObject):
     """ViewModel for managing peliculas."""
 
@@ -18,16 +22,39 @@ class PeliculaViewModel(QObject):
     def __init__(self, repository: PeliculaRepository) -> None:
         super().__init__()
         self._repository = repository
+        self._tracker = ChangeTracker(repository)
         self._peliculas: List[Pelicula] = []
+        self._loader = BackgroundLoader()
+        self._loader.loaded.connect(self._set_peliculas)
+        self._loader.failed.connect(lambda message: self.error_occurred.emit(f"Error cargando peliculas: {message}"))
 
     def load_peliculas(self) -> None:
         """Load all peliculas from repository and emit signal."""
+        cached = self._repository.get_cached()
+        if cached is not None:
+            # show the local mirror right away and sync it from the database in the background
+            self._set_peliculas(cached)
+            self._loader.start(self._tracker.load)
+            return
         try:
-            self._peliculas = self._repository.get_all()
-            self.peliculas_changed.emit(self._peliculas)
+            self._set_peliculas(self._tracker.load())
         except Exception as e:
             self.error_occurred.emit(f"Error cargando peliculas: {str(e)}")
 
+    def refresh_peliculas(self) -> None:
+        """Recargar: refetch only if `pelicula` changed since the last load."""
+        try:
+            peliculas = self._tracker.refresh(self._peliculas)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error cargando peliculas: {exc}")
+            return
+        if peliculas is not None:
+            self._set_peliculas(peliculas)
+
+    def _set_peliculas(self, peliculas) -> None:
+        self._peliculas = peliculas
+        self.peliculas_changed.emit(self._peliculas)
+
     def add_pelicula(self, pelicula: Pelicula) -> bool:
         """Add a new pelicula and reload data."""
         try:
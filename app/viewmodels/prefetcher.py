@@ -0,0 +1,221 @@
+"""Speculative loading of the most-used entities while the table menu is shown.
+
+``Prefetcher.start()`` runs on a daemon thread: it warms the connection (the
+Oracle session pool, see ``OracleConnection.warm_up``) and then, for each
+entity in order, reads its change token and ``get_all()`` rows. Opening a
+table consumes its entry through :class:`SeededRepository`, so the
+viewmodel's ``load_*`` shows the rows without a round trip; the caller then
+compares the stored token with a fresh one in the background and runs
+Recargar if the table moved.
+
+Which entities are prefetched comes from ``"prefetch_entities"`` in
+``settings.json`` or, by default, the ``"prefetch_count"`` (3) most opened
+ones recorded in :class:`UsageStats`. Tables with more than
+``"prefetch_max_rows"`` rows are skipped: the grids load whole tables, so
+there is no cheaper "first page" to warm.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.infrastructure.repositories.change_token import ChangeToken
+
+DEFAULT_PREFETCH_COUNT = 3
+DEFAULT_MAX_ROWS = 50_000
+# entries older than this are dropped rather than shown
+DEFAULT_TTL = 300.0
+USAGE_FILENAME = "usage.json"
+
+logger = logging.getLogger(__name__)
+
+
+class UsageStats:
+    """How many times each entity was opened, persisted next to ``settings.json``."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        self._counts: Dict[str, int] = {}
+        try:
+            with self._path.open("r", encoding="utf-8") as file:
+                self._counts = {str(k): int(v) for k, v in json.load(file).items()}
+        except (OSError, ValueError, AttributeError):
+            self._counts = {}
+
+    @classmethod
+    def for_settings(cls, settings_path: Path) -> "UsageStats":
+        return cls(Path(settings_path).parent / USAGE_FILENAME)
+
+    def record(self, entity: str) -> None:
+        self._counts[entity] = self._counts.get(entity, 0) + 1
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("w", encoding="utf-8") as file:
+                json.dump(self._counts, file, indent=2, sort_keys=True)
+        except OSError as exc:
+            logger.warning("Could not save usage stats to %s: %s", self._path, exc)
+
+    def top(self, n: int) -> List[str]:
+        ranked = sorted(self._counts.items(), key=lambda item: (-item[1], item[0]))
+        return [entity for entity, _ in ranked[:n]]
+
+
+@dataclass
+class PrefetchEntry:
+    rows: List[Any]
+    token: Optional[ChangeToken]
+    fetched_at: float
+
+
+class Prefetcher:
+    """Background cache of ``get_all()`` results keyed by entity."""
+
+    def __init__(
+        self,
+        connection_factory: Any,
+        create_repository: Callable[[str], Any],
+        max_rows: int = DEFAULT_MAX_ROWS,
+        ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self._connection_factory = connection_factory
+        self._create_repository = create_repository
+        self._max_rows = max_rows
+        self._ttl = ttl
+        self._entries: Dict[str, PrefetchEntry] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._warmed = False
+        self.explicit_entities: Optional[List[str]] = None
+        self.prefetch_count = DEFAULT_PREFETCH_COUNT
+
+    @classmethod
+    def from_settings(
+        cls, settings_path: Path, connection_factory: Any, create_repository: Callable[[str], Any]
+    ) -> "Prefetcher":
+        """Read ``prefetch_entities`` / ``prefetch_count`` / ``prefetch_max_rows`` from ``settings_path``."""
+        data: Dict[str, Any] = {}
+        settings_path = Path(settings_path)
+        if settings_path.exists():
+            with settings_path.open("r", encoding="utf-8") as file:
+                data = json.load(file)
+        prefetcher = cls(connection_factory, create_repository, int(data.get("prefetch_max_rows", DEFAULT_MAX_ROWS)))
+        explicit = data.get("prefetch_entities")
+        if explicit is not None:
+            prefetcher.explicit_entities = [str(entity) for entity in explicit]
+        prefetcher.prefetch_count = int(data.get("prefetch_count", DEFAULT_PREFETCH_COUNT))
+        return prefetcher
+
+    def entities(self, usage: UsageStats) -> List[str]:
+        """Entities to prefetch: the configured list, else the most opened ones."""
+        if self.explicit_entities is not None:
+            return list(self.explicit_entities)
+        return usage.top(self.prefetch_count)
+
+    def start(self, entities: Sequence[str]) -> None:
+        """Prefetch ``entities`` in order on a daemon thread (replaces any earlier run)."""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            pending = [e for e in entities if not self._is_fresh(self._entries.get(e))]
+        if not pending and self._warmed:
+            return
+        threading.Thread(
+            target=self._run, args=(generation, pending), name="prefetcher", daemon=True
+        ).start()
+
+    def cancel(self) -> None:
+        """Stop after the entity currently being fetched (its result is discarded)."""
+        with self._lock:
+            self._generation += 1
+
+    def take(self, entity: str) -> Optional[PrefetchEntry]:
+        """Remove and return the entry for ``entity`` if it is ready and not expired."""
+        with self._lock:
+            entry = self._entries.pop(entity, None)
+        return entry if self._is_fresh(entry) else None
+
+    def invalidate(self, entity: Optional[str] = None) -> None:
+        with self._lock:
+            if entity is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(entity, None)
+
+    def _is_fresh(self, entry: Optional[PrefetchEntry]) -> bool:
+        return entry is not None and time.monotonic() - entry.fetched_at <= self._ttl
+
+    def _current(self, generation: int) -> bool:
+        with self._lock:
+            return generation == self._generation
+
+    def _run(self, generation: int, entities: List[str]) -> None:
+        try:
+            if not self._warmed:
+                self._warm_up()
+                self._warmed = True
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            logger.info("Connection warm-up failed: %s", exc)
+            return
+        for entity in entities:
+            if not self._current(generation):
+                return
+            try:
+                repository = self._create_repository(entity)
+                token = repository.change_token()
+                if token.count > self._max_rows:
+                    continue
+                rows = repository.get_all()
+            except Exception as exc:  # pragma: no cover - interacts with DB
+                logger.info("Prefetch of %s failed: %s", entity, exc)
+                continue
+            with self._lock:
+                if generation != self._generation:
+                    return
+                self._entries[entity] = PrefetchEntry(rows, token, time.monotonic())
+
+    def _warm_up(self) -> None:
+        warm_up = getattr(self._connection_factory, "warm_up", None)
+        if warm_up is not None:
+            warm_up()
+            return
+        with self._connection_factory.get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM DUAL")
+                cursor.fetchone()
+
+
+class SeededRepository:
+    """Repository proxy whose first ``change_token()`` / ``get_all()`` return a prefetched entry.
+
+    Everything else (and every later call) goes to the wrapped repository, so
+    the viewmodel's first load costs no round trip and Recargar behaves as usual.
+    """
+
+    def __init__(self, repository: Any, entry: PrefetchEntry) -> None:
+        self._repository = repository
+        self._token: Optional[ChangeToken] = entry.token
+        self._rows: Optional[List[Any]] = entry.rows
+        self._token_pending = True
+
+    @property
+    def wrapped(self) -> Any:
+        return self._repository
+
+    def change_token(self) -> Optional[ChangeToken]:
+        if self._token_pending:
+            self._token_pending = False
+            if self._token is not None:
+                return self._token
+        return self._repository.change_token()
+
+    def get_all(self) -> List[Any]:
+        rows, self._rows = self._rows, None
+        return rows if rows is not None else self._repository.get_all()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
@@ -1,26 +1,43 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-from typing import List
+from typing import List, Optional
 
 from app.domain.models.premiacion import Premiacion
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
+from app.infrastructure.repositories.awards import Award, AwardsEngine, AwardsResult
 from app.infrastructure.repositories.premiacion_repository import PremiacionRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class PremiacionViewModel(QObject):
     premiaciones_changed = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, repository: PremiacionRepository):
+    def __init__(self, repository: PremiacionRepository, awards: Optional[AwardsEngine] = None):
         super().__init__()
         self.repository = repository
+        self.awards = awards
+        self._tracker = ChangeTracker(repository, key=lambda p: p.id_premio)
         self.premiaciones: List[Premiacion] = []
 
     def load_premiaciones(self):
         try:
-            self.premiaciones = self.repository.get_all()
+            self.premiaciones = self._tracker.load()
             self.premiaciones_changed.emit(self.premiaciones)
         except Exception as e:
             self.error_occurred.emit(f"Error loading premiaciones: {str(e)}")
 
+    def refresh_premiaciones(self) -> None:
+        """Recargar: refetch only if `premiacion` changed since the last load."""
+        try:
+            premiaciones = self._tracker.refresh(self.premiaciones)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error loading premiaciones: {exc}")
+            return
+        if premiaciones is not None:
+            self.premiaciones = premiaciones
+            self.premiaciones_changed.emit(self.premiaciones)
+
     def add_premiacion(self, premiacion: Premiacion):
         try:
             if self.repository.add(premiacion):
@@ -41,3 +58,25 @@ class PremiacionViewModel(QObject):
                 self.load_premiaciones()
         except Exception as e:
             self.error_occurred.emit(f"Error deleting premiaciones: {str(e)}")
+
+    def preview_awards(self, edicion: int) -> List[Award]:
+        """Podiums the evaluations of ``edicion`` give, without writing them."""
+        if self.awards is None:
+            return []
+        try:
+            return self.awards.rank(edicion)
+        except Exception as e:
+            self.error_occurred.emit(f"Error computing awards: {str(e)}")
+            return []
+
+    def compute_awards(self, edicion: int) -> Optional[AwardsResult]:
+        """Write the podiums of ``edicion`` to premiacion and reload."""
+        if self.awards is None:
+            return None
+        try:
+            result = self.awards.award(edicion)
+        except Exception as e:
+            self.error_occurred.emit(f"Error computing awards: {str(e)}")
+            return None
+        self.load_premiaciones()
+        return result
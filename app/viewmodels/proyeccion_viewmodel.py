@@ -2,9 +2,13 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from typing import List
 
 from app.domain.models.proyeccion import Proyeccion
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
+from app.infrastructure.repositories.predicate import Predicate
 from app.infrastructure.repositories.proyeccion_repository import ProyeccionRepository
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class ProyeccionViewModel(QObject):
     proyecciones_changed = pyqtSignal(list)
     error_occurred = pyqtSignal(str)
@@ -12,15 +16,46 @@ class ProyeccionViewModel(QObject):
     def __init__(self, repository: ProyeccionRepository):
         super().__init__()
         self.repository = repository
+        self._tracker = ChangeTracker(repository, key=lambda p: (p.id_funcion, p.id_pelicula))
         self.proyecciones: List[Proyeccion] = []
+        self._filter = Predicate()
+
+    @property
+    def filter(self) -> Predicate:
+        """Predicate the grid is currently loaded with (empty: every row)."""
+        return self._filter
+
+    def set_filter_text(self, text: str) -> None:
+        """Filter the grid server-side to rows whose comments contain ``text``."""
+        self._filter = Predicate().matching_text(self.repository.TEXT_COLUMNS, text)
+        self._tracker.set_fetch(None if self._filter.is_empty else lambda: self.repository.get_where(self._filter))
+        self.load_proyecciones()
+
+    def count_matching(self) -> int:
+        try:
+            return self.repository.count_where(self._filter)
+        except Exception as e:
+            self.error_occurred.emit(f"Error counting proyecciones: {str(e)}")
+            return 0
 
     def load_proyecciones(self):
         try:
-            self.proyecciones = self.repository.get_all()
+            self.proyecciones = self._tracker.load()
             self.proyecciones_changed.emit(self.proyecciones)
         except Exception as e:
             self.error_occurred.emit(f"Error loading proyecciones: {str(e)}")
 
+    def refresh_proyecciones(self) -> None:
+        """Recargar: refetch only if `proyeccion` changed since the last load."""
+        try:
+            proyecciones = self._tracker.refresh(self.proyecciones)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(f"Error loading proyecciones: {exc}")
+            return
+        if proyecciones is not None:
+            self.proyecciones = proyecciones
+            self.proyecciones_changed.emit(self.proyecciones)
+
     def add_proyeccion(self, p: Proyeccion):
         try:
             if self.repository.add(p):
@@ -41,3 +76,13 @@ class ProyeccionViewModel(QObject):
                 self.load_proyecciones()
         except Exception as e:
             self.error_occurred.emit(f"Error deleting proyecciones: {str(e)}")
+
+    def delete_matching(self, predicate: Predicate) -> int:
+        """Delete every proyeccion matching ``predicate`` with one ``DELETE ... WHERE``."""
+        try:
+            deleted = self.repository.delete_where(predicate)
+            self.load_proyecciones()
+            return deleted
+        except Exception as e:
+            self.error_occurred.emit(f"Error deleting proyecciones: {str(e)}")
+            return 0
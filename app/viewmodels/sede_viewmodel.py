@@ -6,9 +6,13 @@ from typing import List, Sequence
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from app.domain.models.sede import Sede
+from app.infrastructure.diagnostics.profiler import VIEWMODEL_ACTIONS, profile_actions
 from app.infrastructure.repositories.sede_repository import SedeRepository
+from app.viewmodels.background_loader import BackgroundLoader
+from app.viewmodels.change_tracker import ChangeTracker
 
 
+@profile_actions(*VIEWMODEL_ACTIONS)
 class SedeViewModel(QObject):
     """Coordinates UI updates for sede data."""
 
@@ -18,15 +22,38 @@ class SedeViewModel(QObject):
     def __init__(self, repository: SedeRepository) -> None:
         super().__init__()
         self._repository = repository
+        self._tracker = ChangeTracker(repository)
         self._sedes: List[Sede] = []
+        self._loader = BackgroundLoader()
+        self._loader.loaded.connect(self._set_sedes)
+        self._loader.failed.connect(self.error_occurred)
 
     def load_sedes(self) -> None:
+        cached = self._repository.get_cached()
+        if cached is not None:
+            # show the local mirror right away and sync it from the database in the background
+            self._set_sedes(cached)
+            self._loader.start(self._tracker.load)
+            return
         try:
-            self._sedes = self._repository.get_all()
-            self.sedes_changed.emit(self._sedes)
+            self._set_sedes(self._tracker.load())
         except Exception as exc:
             self.error_occurred.emit(str(exc))
 
+    def refresh_sedes(self) -> None:
+        """Recargar: refetch only if `sede` changed since the last load."""
+        try:
+            sedes = self._tracker.refresh(self._sedes)
+        except Exception as exc:  # pragma: no cover - interacts with DB
+            self.error_occurred.emit(str(exc))
+            return
+        if sedes is not None:
+            self._set_sedes(sedes)
+
+    def _set_sedes(self, sedes) -> None:
+        self._sedes = sedes
+        self.sedes_changed.emit(self._sedes)
+
     def add_sede(self, sede: Sede) -> bool:
         try:
             self._repository.add(sede)
@@ -0,0 +1,372 @@
+"""Repository benchmarks: get_all, add, delete_many, row mapping, units of work, bulk registration, DDL validation, awards, jury assignment and programme scheduling."""
+from __future__ import annotations
+
+import itertools
+from datetime import date, timedelta
+
+from app.domain.models.asistente import Asistente
+from app.domain.models.ciudad import Ciudad
+from app.domain.models.funcion import Funcion
+from app.domain.models.proyeccion import Proyeccion
+from app.infrastructure.database.row_validator import RowValidationError, RowValidator, check_rows
+from app.infrastructure.database.schema import load_schema
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.repositories.awards import AwardsEngine
+from app.infrastructure.repositories.asistencia_repository import AsistenciaRepository
+from app.infrastructure.repositories.asistente_repository import AsistenteRepository
+from app.infrastructure.repositories.ciudad_repository import CiudadRepository
+from app.infrastructure.repositories.funcion_repository import FuncionRepository
+from app.infrastructure.repositories.bulk import insert_many
+from app.infrastructure.repositories.festival_scheduler import FestivalScheduler
+from app.infrastructure.repositories.jury_assignment import JuryAssigner
+from app.infrastructure.repositories.proyeccion_repository import ProyeccionRepository
+from app.infrastructure.repositories.streaming import DEFAULT_BATCH_SIZE
+
+from benchmarks.harness import BenchmarkRun, measure
+from benchmarks.synthetic import SCALES
+
+WRITE_ROWS = 100
+# funciones written per unit-of-work benchmark, each with PROYECCIONES_PER_FUNCION children
+UOW_FUNCIONES = 20
+PROYECCIONES_PER_FUNCION = 3
+# bulk registration file: REGISTRATION_PER_ROW rows per asistencia row of the scale (100k: 100 000),
+# one in DUPLICATE_EVERY reusing an existing correo/telefono
+REGISTRATION_PER_ROW = 1
+DUPLICATE_EVERY = 20
+# rows checked by the compiled DDL validation per asistencia row of the scale (100k: 1 000 000),
+# cycling over VALIDATION_DISTINCT dicts, one in INVALID_EVERY breaking ck_entradas_positivas
+VALIDATION_PER_ROW = 10
+VALIDATION_DISTINCT = 1_000
+INVALID_EVERY = 100
+# benchmarks/synthetic.py dates every evaluation in this edition
+AWARDS_EDICION = 2025
+# festival days programmed by the scheduler benchmark (after the synthetic funciones)
+PROGRAM_DESDE = date(2026, 3, 1)
+PROGRAM_DAYS = 10
+_serial = itertools.count(1)
+
+
+def _new_asistente() -> Asistente:
+    n = next(_serial)
+    return Asistente(
+        id=None,
+        nombre=f"Bench {n}",
+        correo=f"bench{n}@write.bench.cl",
+        telefono=f"8{n:08d}",
+        edad=30,
+        ciudad_residencia="Santiago",
+        tipo_asistente="General",
+    )
+
+
+class _RoundTripCounter:
+    """Connection factory proxy counting connects, executes and commits (one round trip each).
+
+    It also counts the rows the database rejected in ``executemany`` batches:
+    on Oracle each is an ORA-00001 raised, undone and sent back server-side.
+    """
+
+    def __init__(self, factory) -> None:
+        self._factory = factory
+        self.round_trips = 0
+        self.db_errors = 0
+
+    def __getattr__(self, name: str):
+        return getattr(self._factory, name)
+
+    def get_connection(self):
+        self.round_trips += 1
+        return _CountingConnection(self._factory.get_connection(), self)
+
+
+class _CountingConnection:
+    def __init__(self, connection, counter: _RoundTripCounter) -> None:
+        self._connection = connection
+        self._counter = counter
+
+    def __getattr__(self, name: str):
+        return getattr(self._connection, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._connection.close()
+
+    def cursor(self):
+        return _CountingCursor(self._connection.cursor(), self._counter)
+
+    def commit(self) -> None:
+        self._counter.round_trips += 1
+        self._connection.commit()
+
+
+class _CountingCursor:
+    def __init__(self, cursor, counter: _RoundTripCounter) -> None:
+        self._cursor = cursor
+        self._counter = counter
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._cursor.close()
+
+    def execute(self, *args, **kwargs):
+        self._counter.round_trips += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self._counter.round_trips += 1
+        return self._cursor.executemany(*args, **kwargs)
+
+    def getbatcherrors(self):
+        errors = self._cursor.getbatcherrors()
+        self._counter.db_errors += len(errors)
+        return errors
+
+
+def _write_funciones(connection_factory, pelicula_ids: list, created: list) -> None:
+    """Create UOW_FUNCIONES funciones, each with its proyecciones, through ``connection_factory``."""
+    funciones = FuncionRepository(connection_factory)
+    proyecciones = ProyeccionRepository(connection_factory)
+    for _ in range(UOW_FUNCIONES):
+        id_funcion = funciones.add(Funcion(fecha="2025-12-01", hora="18:00", precio_entrada=4000,
+                                           estado_funcion="Programada", observaciones="Benchmark", id_sede=1))
+        for orden, id_pelicula in enumerate(pelicula_ids, start=1):
+            proyecciones.add(Proyeccion(id_funcion, id_pelicula, orden))
+        created.append(id_funcion)
+
+
+def _bench_unit_of_work(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """Funcion + proyecciones written call by call vs. inside one UnitOfWork."""
+    pelicula_ids = list(range(1, PROYECCIONES_PER_FUNCION + 1))
+    rows = UOW_FUNCIONES * (1 + PROYECCIONES_PER_FUNCION)
+    created: list = []
+
+    def per_call() -> None:
+        _write_funciones(counter, pelicula_ids, created)
+
+    def unit_of_work() -> None:
+        with UnitOfWork(counter) as uow:
+            _write_funciones(uow, pelicula_ids, created)
+
+    for name, func in (("autocommit", per_call), ("unit_of_work", unit_of_work)):
+        counter = _RoundTripCounter(connection_factory)
+        measurement = measure(f"repository.funcion_proyecciones.{name}", func, repeat, rows)
+        measurement.round_trips = counter.round_trips // repeat
+        bench.add(measurement)
+
+    ProyeccionRepository(connection_factory).delete_many(
+        [(id_funcion, id_pelicula) for id_funcion in created for id_pelicula in pelicula_ids]
+    )
+    FuncionRepository(connection_factory).delete_many(created)
+
+
+def _registration_rows(connection_factory, count: int) -> list:
+    """``count`` validated asistente rows, one in DUPLICATE_EVERY already registered."""
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT correo, telefono FROM asistente")
+            existing = cursor.fetchall()
+    rows = []
+    for n in range(count):
+        if existing and n % DUPLICATE_EVERY == 0:
+            correo, telefono = existing[(n // DUPLICATE_EVERY) % len(existing)]
+        else:
+            correo, telefono = f"registro{n}@bulk.bench.cl", f"7{n:08d}"
+        rows.append({"nombre": f"Registro {n}", "correo": correo, "telefono": telefono, "edad": 30,
+                     "ciudad_residencia": "Santiago", "tipo_asistente": "General"})
+    return rows
+
+
+def _bench_registration(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """A registration file loaded in DEFAULT_BATCH_SIZE batches, with and without the uniqueness pre-screen.
+
+    Each run is rolled back (a UnitOfWork defers the batch commits), so every
+    run starts from the same table and the index is rebuilt (its load is timed).
+    """
+    rows = _registration_rows(connection_factory, SCALES[bench.scale] * REGISTRATION_PER_ROW)
+    batches = [rows[start:start + DEFAULT_BATCH_SIZE] for start in range(0, len(rows), DEFAULT_BATCH_SIZE)]
+    state: dict = {}
+
+    def begin() -> None:
+        if "uow" in state:
+            state["uow"].rollback()
+            state["uow"].close()
+        state["uow"] = UnitOfWork(state["counter"])
+
+    def unscreened() -> None:
+        for batch in batches:
+            insert_many(state["uow"], "asistente", batch)
+
+    def screened() -> None:
+        repository = AsistenteRepository(state["uow"])
+        for batch in batches:
+            repository.add_many(batch)
+
+    for name, func in (("unscreened", unscreened), ("prescreened", screened)):
+        state["counter"] = _RoundTripCounter(connection_factory)
+        measurement = measure(f"repository.asistente_registration.{name}", func, repeat, len(rows), setup=begin)
+        measurement.round_trips = state["counter"].round_trips // repeat
+        measurement.db_errors = state["counter"].db_errors // repeat
+        bench.add(measurement)
+        begin()
+        state.pop("uow").close()
+
+
+def _bench_validation(bench: BenchmarkRun, repeat: int) -> None:
+    """``check_rows`` over an asistencia batch, and ``RowValidator`` over text records, sized from the scale."""
+    today = date.today()
+    distinct = [
+        {"id_funcion": 1 + n % 50, "id_asistente": 1 + n, "entradas": 0 if n % INVALID_EVERY == 0 else 1 + n % 4,
+         "fecha_compra": today, "metodo_pago": ("Efectivo", "Tarjeta", "Transferencia")[n % 3],
+         "comentarios": "Sin comentarios"}
+        for n in range(VALIDATION_DISTINCT)
+    ]
+    rows = [distinct[n % VALIDATION_DISTINCT] for n in range(SCALES[bench.scale] * VALIDATION_PER_ROW)]
+    bench.add(measure("validation.asistencia.check_rows", lambda: check_rows("asistencia", rows), repeat, len(rows)))
+
+    # what an import file looks like: every value a string, coerced on the way (and distinct keys)
+    text = [{key: str(value) for key, value in row.items()} for row in distinct]
+    # one record per asistencia row of the scale
+    records = [dict(text[n % VALIDATION_DISTINCT], id_asistente=str(1 + n)) for n in range(SCALES[bench.scale])]
+    table = load_schema().table("asistencia")
+
+    def validate_records() -> None:
+        validator = RowValidator(table)
+        for record in records:
+            try:
+                validator.validate(record)
+            except RowValidationError:
+                pass
+
+    bench.add(measure("validation.asistencia.row_validator", validate_records, repeat, len(records)))
+
+
+def _bench_awards(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """Ranking the edition's evaluations, and ranking plus the premiacion upsert (rolled back per run)."""
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM evaluacion")
+            (evaluations,) = cursor.fetchone()
+    engine = AwardsEngine(connection_factory)
+    bench.add(measure("awards.rank", lambda: engine.rank(AWARDS_EDICION), repeat, evaluations))
+
+    state: dict = {}
+
+    def begin() -> None:
+        if "uow" in state:
+            state["uow"].rollback()
+            state["uow"].close()
+        state["uow"] = UnitOfWork(connection_factory)
+
+    bench.add(measure(
+        "awards.award",
+        lambda: AwardsEngine(state["uow"]).award(AWARDS_EDICION),
+        repeat,
+        evaluations,
+        setup=begin,
+    ))
+    begin()
+    state.pop("uow").close()
+
+
+def _bench_jury_assignment(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """Planning jurado panels for every open funcion (three reads and the heap schedule, nothing written)."""
+    assigner = JuryAssigner(connection_factory)
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM funcion")
+            (funciones,) = cursor.fetchone()
+    bench.add(measure("jury_assignment.plan", assigner.plan, repeat, funciones))
+
+
+def _bench_program(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """Planning two screenings of every película over PROGRAM_DAYS in the active sedes (nothing written)."""
+    scheduler = FestivalScheduler(connection_factory)
+    hasta = PROGRAM_DESDE + timedelta(days=PROGRAM_DAYS - 1)
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM pelicula")
+            (peliculas,) = cursor.fetchone()
+    bench.add(measure("festival_scheduler.plan", lambda: scheduler.plan(PROGRAM_DESDE, hasta), repeat, peliculas))
+
+
+def run(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    asistentes = AsistenteRepository(connection_factory)
+    asistencias = AsistenciaRepository(connection_factory)
+    funciones = FuncionRepository(connection_factory)
+    ciudades = CiudadRepository(connection_factory)
+    n_asistentes = asistentes.count()
+    n_asistencias = asistencias.count()
+
+    bench.add(measure("repository.asistente.get_all", asistentes.get_all, repeat, n_asistentes))
+    bench.add(measure("repository.asistencia.get_all", asistencias.get_all, repeat, n_asistencias))
+    bench.add(measure("repository.funcion.get_all", funciones.get_all, repeat, funciones.count()))
+    bench.add(measure("repository.ciudad.get_all", ciudades.get_all, repeat, ciudades.count()))
+
+    with connection_factory.get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT id_asistente, nombre, correo, telefono, edad, ciudad_residencia, tipo_asistente "
+                "FROM asistente"
+            )
+            raw_rows = cursor.fetchall()
+    map_row = AsistenteRepository._map_row
+    bench.add(measure(
+        "mapping.asistente._map_row",
+        lambda: [map_row(row) for row in raw_rows],
+        repeat,
+        len(raw_rows),
+    ))
+
+    written: list = []
+
+    def add_batch() -> None:
+        written.extend(asistentes.add(_new_asistente()) for _ in range(WRITE_ROWS))
+
+    bench.add(measure("repository.asistente.add", add_batch, repeat, WRITE_ROWS))
+
+    pending: list = []
+
+    def stage_delete() -> None:
+        # rows created by add_batch first, then fresh ones (untimed)
+        pending[:] = written[:WRITE_ROWS]
+        del written[:WRITE_ROWS]
+        while len(pending) < WRITE_ROWS:
+            pending.append(asistentes.add(_new_asistente()))
+
+    bench.add(measure(
+        "repository.asistente.delete_many",
+        lambda: asistentes.delete_many(pending),
+        repeat,
+        WRITE_ROWS,
+        setup=stage_delete,
+    ))
+    if written:
+        asistentes.delete_many(written)
+
+    # Ciudad exercises the mirror-less path of a reference repository
+    ciudad_ids: list = []
+    bench.add(measure(
+        "repository.ciudad.add",
+        lambda: ciudad_ids.extend(
+            ciudades.add(Ciudad(id=None, nombre=f"Bench {next(_serial)}", region="Bench",
+                                pais="Chile", observaciones="Benchmark"))
+            for _ in range(WRITE_ROWS)
+        ),
+        repeat,
+        WRITE_ROWS,
+    ))
+    ciudades.delete_many(ciudad_ids)
+
+    _bench_unit_of_work(connection_factory, bench, repeat)
+    _bench_registration(connection_factory, bench, repeat)
+    _bench_validation(bench, repeat)
+    _bench_awards(connection_factory, bench, repeat)
+    _bench_jury_assignment(connection_factory, bench, repeat)
+    _bench_program(connection_factory, bench, repeat)
@@ -0,0 +1,129 @@
+"""UI benchmarks under an offscreen QApplication (skipped when PyQt6 is missing).
+
+Covers ``AsistenteViewModel.load_asistentes``, a full scroll over
+``AsistenteTableModel.data()``, ``DetailButtonDelegate.paint`` with and
+without its pixmap cache, page-by-page repaints of a tall QTableView, and the
+Asistencias footer totals over ``NumericColumns`` with NumPy and with the
+``array("d")`` fallback.
+"""
+from __future__ import annotations
+
+import os
+
+from benchmarks.harness import BenchmarkRun, measure
+
+MAX_PAINTS = 10_000
+MAX_PAGES = 200
+ROW_HEIGHT = 30
+VIEW_SIZE = (1100, 1600)
+
+
+def run(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtCore import QRect, Qt
+        from PyQt6.QtGui import QImage, QPainter
+        from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem, QTableView
+    except ImportError as exc:
+        bench.skipped["ui"] = f"PyQt6 no disponible ({exc})"
+        return
+
+    from app.infrastructure.repositories.asistente_repository import AsistenteRepository
+    from app.ui.asistente_table_model import AsistenteTableModel
+    from app.ui.delegates import DetailButtonDelegate
+    from app.viewmodels.asistente_viewmodel import AsistenteViewModel
+
+    app = QApplication.instance() or QApplication([])
+
+    viewmodel = AsistenteViewModel(AsistenteRepository(connection_factory))
+    loaded: list = []
+    viewmodel.asistentes_changed.connect(lambda rows: loaded.__setitem__(slice(None), rows))
+    bench.add(measure("ui.asistente.viewmodel_load", viewmodel.load_asistentes, repeat))
+    asistentes = list(loaded)
+
+    model = AsistenteTableModel()
+    model.update_asistentes(asistentes)
+    roles = (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.CheckStateRole)
+
+    def scroll() -> None:
+        data, index = model.data, model.index
+        for row in range(model.rowCount()):
+            for column in range(model.columnCount()):
+                cell = index(row, column)
+                for role in roles:
+                    data(cell, role)
+
+    cells = model.rowCount() * model.columnCount()
+    bench.add(measure("ui.asistente.table_model_scroll", scroll, repeat, cells))
+
+    paints = min(MAX_PAINTS, max(model.rowCount(), 1))
+    image = QImage(120, ROW_HEIGHT * 40, QImage.Format.Format_ARGB32_Premultiplied)
+    option = QStyleOptionViewItem()
+    cell = model.index(0, model.ACTION_COLUMN)
+
+    def paint_column(delegate: DetailButtonDelegate) -> None:
+        painter = QPainter(image)
+        try:
+            for i in range(paints):
+                # a visible viewport of 40 rows, repainted while scrolling
+                option.rect = QRect(0, (i % 40) * ROW_HEIGHT, 120, ROW_HEIGHT)
+                delegate.paint(painter, option, cell)
+        finally:
+            painter.end()
+
+    for suffix, use_cache in (("", True), ("_uncached", False)):
+        delegate = DetailButtonDelegate(use_cache=use_cache)
+        bench.add(measure(f"ui.detail_delegate.paint{suffix}", lambda d=delegate: paint_column(d), repeat, paints))
+
+    view = QTableView()
+    view.resize(*VIEW_SIZE)
+    view.setModel(model)
+    view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+    scrollbar = view.verticalScrollBar()
+
+    def scroll_view() -> None:
+        # one full-viewport repaint per page; grab() paints synchronously offscreen
+        scrollbar.setValue(0)
+        for _ in range(pages):
+            view.viewport().grab()
+            if scrollbar.value() >= scrollbar.maximum():
+                break
+            scrollbar.setValue(scrollbar.value() + scrollbar.pageStep())
+
+    for suffix, use_cache in (("", True), ("_uncached", False)):
+        view.setItemDelegateForColumn(model.ACTION_COLUMN, DetailButtonDelegate(view, use_cache=use_cache))
+        view.viewport().grab()  # layout and first paint outside the timing
+        pages = min(MAX_PAGES, scrollbar.maximum() // max(scrollbar.pageStep(), 1) + 1)
+        bench.add(measure(f"ui.table_view.scroll_paint{suffix}", scroll_view, repeat, pages))
+    app.processEvents()
+
+    _bench_footer(connection_factory, bench, repeat)
+
+
+def _bench_footer(connection_factory, bench: BenchmarkRun, repeat: int) -> None:
+    """Asistencias footer recomputed over every row and over half of them checked."""
+    from app.infrastructure.repositories.asistencia_repository import AsistenciaRepository
+    from app.ui.asistencia_table_model import AsistenciaTableModel
+    from app.ui.numeric_columns import HAS_NUMPY
+
+    repository = AsistenciaRepository(connection_factory)
+    asistencias = repository.get_all()
+    precios = repository.precios_por_funcion()
+    mask = list(range(0, len(asistencias), 2))
+    if not HAS_NUMPY:
+        bench.skipped["ui.asistencia.footer"] = "NumPy no disponible"
+
+    for suffix, use_numpy in (("", True), ("_fallback", False)):
+        if use_numpy and not HAS_NUMPY:
+            continue
+        model = AsistenciaTableModel()
+        model.numbers.use_numpy = use_numpy
+        model.set_precios(precios)
+        model.update_asistencias(asistencias)
+
+        def footer(numbers=model.numbers) -> None:
+            numbers.footer(AsistenciaTableModel.FOOTER)
+            numbers.footer(AsistenciaTableModel.FOOTER, mask)
+
+        rows = len(asistencias) + len(mask)
+        bench.add(measure(f"ui.asistencia.footer{suffix}", footer, repeat, rows))
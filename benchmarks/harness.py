@@ -0,0 +1,132 @@
+"""Timing, JSON results and baseline comparison for the benchmark suite."""
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_THRESHOLD = 0.25
+# sub-millisecond benchmarks jitter by more than 25%; ignore slowdowns below this
+NOISE_FLOOR = 0.0005
+
+
+@dataclass
+class Measurement:
+    """Wall-clock timings of one benchmark (seconds)."""
+
+    name: str
+    median: float
+    best: float
+    repeat: int
+    rows: int = 0
+    # connects + executes + commits per run, where the benchmark counts them
+    round_trips: int = 0
+    # rows the database rejected per run (batch errors), where the benchmark counts them
+    db_errors: int = 0
+
+    @property
+    def rows_per_second(self) -> Optional[float]:
+        return self.rows / self.median if self.rows and self.median else None
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 5,
+    rows: int = 0,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Measurement:
+    """Run ``func`` ``repeat`` times (``setup`` untimed before each) and keep median/best."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return Measurement(name, statistics.median(timings), min(timings), repeat, rows)
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+@dataclass
+class BenchmarkRun:
+    """All measurements for one scale, serialisable to JSON."""
+
+    scale: str
+    measurements: List[Measurement] = field(default_factory=list)
+    skipped: Dict[str, str] = field(default_factory=dict)
+
+    def add(self, measurement: Measurement) -> None:
+        self.measurements.append(measurement)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "scale": self.scale,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "results": {m.name: asdict(m) for m in self.measurements},
+            "skipped": self.skipped,
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_json(), indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def compare(self, baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Regression]:
+        """Benchmarks whose median grew more than ``threshold`` (and ``NOISE_FLOOR``) over the baseline."""
+        reference = baseline.get(self.scale, {})
+        regressions = []
+        for m in self.measurements:
+            previous = reference.get(m.name)
+            if previous and m.median > previous * (1 + threshold) and m.median - previous > NOISE_FLOOR:
+                regressions.append(Regression(m.name, previous, m.median))
+        return regressions
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def update_baseline(path: Path, run: BenchmarkRun) -> None:
+    """Store the medians of ``run`` as the baseline for its scale (other scales are kept)."""
+    baseline = load_baseline(path)
+    baseline[run.scale] = {m.name: round(m.median, 6) for m in run.measurements}
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def format_table(run: BenchmarkRun, baseline: Dict[str, Any]) -> str:
+    reference = baseline.get(run.scale, {})
+    lines = [f"{'benchmark':<44}{'median':>12}{'best':>12}{'rows/s':>14}{'trips':>8}{'db err':>8}{'vs base':>10}"]
+    for m in run.measurements:
+        rate = f"{m.rows_per_second:,.0f}" if m.rows_per_second else "-"
+        trips = str(m.round_trips) if m.round_trips else "-"
+        db_errors = str(m.db_errors) if m.db_errors else "-"
+        previous = reference.get(m.name)
+        delta = f"{(m.median / previous - 1) * 100:+.0f}%" if previous else "-"
+        lines.append(
+            f"{m.name:<44}{m.median * 1000:>10.2f}ms{m.best * 1000:>10.2f}ms{rate:>14}{trips:>8}{db_errors:>8}{delta:>10}"
+        )
+    for name, reason in run.skipped.items():
+        lines.append(f"{name:<44}skipped: {reason}")
+    return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""Run the benchmark suite against a synthetic festival.
+
+Usage (from the project root):
+    python benchmarks/run.py --scale 1k
+    python benchmarks/run.py --scale 100k --layers repository --db /tmp/festival-100k.sqlite3
+    python benchmarks/run.py --scale 1k --update-baseline
+
+The festival is generated into the embedded SQLite backend (in memory unless
+``--db`` is given; an existing ``--db`` file is reused as is). Results are
+written as JSON and compared with ``benchmarks/baseline.json``: any benchmark
+whose median is more than ``--threshold`` slower than the baseline is reported
+and the exit code is 1.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.infrastructure.database.sqlite_connection import SqliteConnection  # noqa: E402
+from app.infrastructure.repositories.streaming import count_rows  # noqa: E402
+from benchmarks import bench_repositories, bench_ui  # noqa: E402
+from benchmarks.harness import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    BenchmarkRun,
+    format_table,
+    load_baseline,
+    update_baseline,
+)
+from benchmarks.synthetic import SCALES, FestivalSize, populate  # noqa: E402
+
+LAYERS = {"repository": bench_repositories.run, "ui": bench_ui.run}
+BENCH_DIR = Path(__file__).resolve().parent
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmarks de repositorios y UI con datos sintéticos")
+    parser.add_argument("--scale", choices=SCALES, default="1k", help="Filas de asistencia a generar")
+    parser.add_argument("--layers", nargs="+", choices=LAYERS, default=list(LAYERS))
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por benchmark (se usa la mediana)")
+    parser.add_argument("--db", type=Path, default=None, help="Archivo SQLite a generar o reutilizar")
+    parser.add_argument("--output", type=Path, default=None, help="JSON de resultados")
+    parser.add_argument("--baseline", type=Path, default=BENCH_DIR / "baseline.json")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Regresión tolerada sobre la mediana base (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Guardar estos resultados como base")
+    return parser
+
+
+def prepare_database(scale: str, db_path: Path | None) -> SqliteConnection:
+    connection = SqliteConnection(db_path) if db_path else SqliteConnection()
+    if count_rows(connection, "asistencia"):
+        print(f"Reutilizando {db_path}", file=sys.stderr)
+        return connection
+
+    size = FestivalSize.for_rows(SCALES[scale])
+    started = time.perf_counter()
+
+    def report(table: str, rows: int) -> None:
+        print(f"\rGenerando {table}: {rows} filas", end="", file=sys.stderr, flush=True)
+
+    written = populate(connection, size, progress=report)
+    elapsed = time.perf_counter() - started
+    print(f"\rFestival sintético: {sum(written.values())} filas en {elapsed:.1f}s", file=sys.stderr)
+    return connection
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    connection = prepare_database(args.scale, args.db)
+
+    bench = BenchmarkRun(args.scale)
+    for layer in args.layers:
+        LAYERS[layer](connection, bench, args.repeat)
+
+    output = args.output or BENCH_DIR / "results" / f"{args.scale}.json"
+    bench.write(output)
+    baseline = load_baseline(args.baseline)
+    print(format_table(bench, baseline))
+    print(f"Resultados en {output}")
+
+    if args.update_baseline:
+        update_baseline(args.baseline, bench)
+        print(f"Base actualizada en {args.baseline}")
+        return 0
+
+    regressions = bench.compare(baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"[REGRESIÓN] {regression.name}: {regression.current * 1000:.2f}ms "
+            f"(base {regression.baseline * 1000:.2f}ms, x{regression.ratio:.2f})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+"""Synthetic festival data for the benchmarks.
+
+``SCALES`` maps a name to the number of `asistencia` rows (the largest table);
+the other tables are sized from it so foreign keys and unique constraints hold.
+Rows are written through ``insert_many`` so any backend can be populated.
+"""
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from app.infrastructure.repositories.bulk import insert_many
+
+SCALES: Dict[str, int] = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+CHUNK_SIZE = 20_000
+
+_FESTIVAL_START = date(2025, 11, 1)
+
+
+@dataclass(frozen=True)
+class FestivalSize:
+    """Row counts for one synthetic festival."""
+
+    ciudades: int
+    sedes: int
+    peliculas: int
+    funciones: int
+    asistentes: int
+    asistencias: int
+    jurados: int
+
+    @classmethod
+    def for_rows(cls, rows: int) -> "FestivalSize":
+        return cls(
+            ciudades=20,
+            sedes=50,
+            peliculas=max(50, rows // 1_000),
+            funciones=max(10, rows // 100),
+            asistentes=max(100, rows // 10),
+            asistencias=rows,
+            jurados=30,
+        )
+
+    @property
+    def total(self) -> int:
+        # proyeccion and participacion_jurado: one per funcion; evaluacion: one per pelicula
+        return (
+            self.ciudades + self.sedes + 2 * self.peliculas + 3 * self.funciones
+            + self.asistentes + self.asistencias + self.jurados + min(self.peliculas, 300)
+        )
+
+
+def _ciudades(size: FestivalSize) -> Iterator[dict]:
+    for i in range(1, size.ciudades + 1):
+        yield {"id_ciudad": i, "nombre": f"Ciudad {i}", "region": f"Region {i % 16 + 1}",
+               "pais": "Chile", "observaciones": "Sintetica"}
+
+
+def _sedes(size: FestivalSize) -> Iterator[dict]:
+    for i in range(1, size.sedes + 1):
+        yield {"id_sede": i, "nombre": f"Sede {i}", "direccion": f"Calle {i} #100",
+               "capacidad_maxima": 80 + (i % 10) * 40, "tipo_sede": "Cine convencional",
+               "id_ciudad": i % size.ciudades + 1, "estado": "Activa"}
+
+
+def _peliculas(size: FestivalSize) -> Iterator[dict]:
+    clasificaciones = ("TE", "+7", "+14", "+18")
+    generos = ("Drama", "Comedia", "Documental", "Animacion", "Thriller")
+    for i in range(1, size.peliculas + 1):
+        yield {"id_pelicula": i, "titulo": f"Pelicula {i}", "pais_origen": "Chile",
+               "director": f"Director {i % 97}", "duracion_minutos": 70 + i % 80,
+               "genero": generos[i % len(generos)], "clasificacion": clasificaciones[i % 4],
+               "sinopsis": "Sinopsis sintetica"}
+
+
+def _funciones(size: FestivalSize) -> Iterator[dict]:
+    estados = ("Programada", "Finalizada", "En curso")
+    for i in range(1, size.funciones + 1):
+        yield {"id_funcion": i, "fecha": _FESTIVAL_START + timedelta(days=i % 10),
+               "hora": f"{10 + i % 12:02d}:00", "precio_entrada": 3000 + (i % 5) * 500,
+               "estado_funcion": estados[i % 3], "observaciones": "Sin observaciones",
+               "id_sede": i % size.sedes + 1}
+
+
+def _proyecciones(size: FestivalSize) -> Iterator[dict]:
+    for i in range(1, size.funciones + 1):
+        yield {"id_funcion": i, "id_pelicula": i % size.peliculas + 1,
+               "orden_proyeccion": 1, "comentarios": "Sin comentarios"}
+
+
+def _asistentes(size: FestivalSize) -> Iterator[dict]:
+    tipos = ("General", "Estudiante", "Profesional", "Prensa")
+    for i in range(1, size.asistentes + 1):
+        yield {"id_asistente": i, "nombre": f"Asistente {i}", "correo": f"asistente{i}@bench.cl",
+               "telefono": f"9{i:08d}", "edad": 18 + i % 60, "ciudad_residencia": f"Ciudad {i % 20 + 1}",
+               "tipo_asistente": tipos[i % 4]}
+
+
+def _asistencias(size: FestivalSize) -> Iterator[dict]:
+    metodos = ("Efectivo", "Tarjeta", "Transferencia")
+    for i in range(size.asistencias):
+        # (funcion, asistente) pairs stay unique while i < funciones * asistentes
+        yield {"id_funcion": i % size.funciones + 1,
+               "id_asistente": (i // size.funciones) % size.asistentes + 1,
+               "entradas": 1 + i % 4, "fecha_compra": _FESTIVAL_START - timedelta(days=i % 30),
+               "metodo_pago": metodos[i % 3], "comentarios": "Sin comentarios"}
+
+
+def _jurados(size: FestivalSize) -> Iterator[dict]:
+    tipos = ("Invitado", "Permanente", "Honorario")
+    for i in range(1, size.jurados + 1):
+        yield {"id_jurado": i, "nombre": f"Jurado {i}", "correo": f"jurado{i}@bench.cl",
+               "especialidad": "Direccion", "pais_origen": "Chile", "experiencia_anos": i % 30,
+               "tipo_jurado": tipos[i % 3], "biografia": "Sin biografia disponible"}
+
+
+def _participaciones(size: FestivalSize) -> Iterator[dict]:
+    for i in range(1, size.funciones + 1):
+        yield {"id_jurado": i % size.jurados + 1, "id_funcion": i,
+               "rol_participacion": "Evaluador", "comentarios": "Sin comentarios"}
+
+
+def _evaluaciones(size: FestivalSize) -> Iterator[dict]:
+    categorias = ("General", "Direccion", "Actuacion", "Guion", "Fotografia", "Sonido")
+    for i in range(1, size.peliculas + 1):
+        yield {"id_jurado": i % size.jurados + 1, "id_pelicula": i, "puntuacion": 1 + i % 10,
+               "comentario": "Sin comentarios", "fecha_evaluacion": _FESTIVAL_START,
+               "categoria_evaluada": categorias[i % 6]}
+
+
+def _premiaciones(size: FestivalSize) -> Iterator[dict]:
+    categorias = ("Mejor pelicula", "Mejor direccion", "Mejor guion", "Mejor actuacion", "Publico")
+    for i in range(min(size.peliculas, 300)):
+        # i -> (categoria, edicion, posicion) is injective, so the UNIQUE key holds
+        yield {"id_premio": i + 1, "id_pelicula": i + 1, "categoria": categorias[i % 5],
+               "edicion": i // 15 + 1, "posicion": (i // 5) % 3 + 1,
+               "descripcion": "Sin descripcion", "fecha_premiacion": _FESTIVAL_START}
+
+
+# parents before children
+GENERATORS: Dict[str, Callable[[FestivalSize], Iterable[dict]]] = {
+    "ciudad": _ciudades,
+    "sede": _sedes,
+    "pelicula": _peliculas,
+    "funcion": _funciones,
+    "proyeccion": _proyecciones,
+    "asistente": _asistentes,
+    "asistencia": _asistencias,
+    "jurado": _jurados,
+    "participacion_jurado": _participaciones,
+    "evaluacion": _evaluaciones,
+    "premiacion": _premiaciones,
+}
+
+
+def populate(
+    connection_factory,
+    size: FestivalSize,
+    progress: Optional[Callable[[str, int], None]] = None,
+) -> Dict[str, int]:
+    """Insert a synthetic festival; returns the number of rows written per table."""
+    written: Dict[str, int] = {}
+    for table, generator in GENERATORS.items():
+        rows = iter(generator(size))
+        count = 0
+        while True:
+            chunk: List[dict] = list(itertools.islice(rows, CHUNK_SIZE))
+            if not chunk:
+                break
+            errors = insert_many(connection_factory, table, chunk)
+            if errors:
+                offset, message = errors[0]
+                raise RuntimeError(f"{table}: fila sintética rechazada ({offset}): {message}")
+            count += len(chunk)
+            if progress is not None:
+                progress(table, count)
+        written[table] = count
+    return written
@@ -1,5 +1,6 @@
 """Entry point for the PyQt6 MVVM application."""
 from __future__ import annotations
+import logging
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
@@ -9,6 +10,7 @@ from app.ui.main_window import MainWindow
 def main() -> int:
     """Run the desktop application."""
 
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     app = QApplication(sys.argv)
     settings_path = Path(__file__).parent / "config" / "settings.json"
     window = MainWindow(settings_path)
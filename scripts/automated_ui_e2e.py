@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import QApplication, QPushButton, QMessageBox, QDialogButto
 from PyQt6.QtCore import Qt
 from PyQt6.QtTest import QTest
 
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import create_connection_factory
 from app.infrastructure.repositories.asistente_repository import AsistenteRepository
 from app.ui.main_window import MainWindow
 from app.ui.dialogs import ClienteFormDialog
@@ -40,7 +40,7 @@ def find_button_by_text(window, text):
 
 def main():
     settings = Path("config/settings.json")
-    conn = OracleConnection.from_settings(settings)
+    conn = create_connection_factory(settings)
     repo = AsistenteRepository(conn)
 
     app = QApplication(sys.argv)
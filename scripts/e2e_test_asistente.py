@@ -7,7 +7,7 @@ from pathlib import Path
 import sys
 import traceback
 
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import create_connection_factory
 from app.infrastructure.repositories.asistente_repository import AsistenteRepository
 from app.domain.models.asistente import Asistente
 import uuid
@@ -18,8 +18,8 @@ def main() -> None:
     print(f"Using settings file: {settings.resolve()}")
 
     try:
-        conn = OracleConnection.from_settings(settings)
-        print("OracleConnection created from settings.")
+        conn = create_connection_factory(settings)
+        print("Connection factory created from settings.")
         with conn.get_connection() as c:
             # print a minimal connection detail
             ver = getattr(c, "version", None)
@@ -8,7 +8,7 @@ import sys
 import traceback
 import uuid
 
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import create_connection_factory
 from app.infrastructure.repositories.ciudad_repository import CiudadRepository
 from app.domain.models.ciudad import Ciudad
 
@@ -18,8 +18,8 @@ def main() -> None:
     print(f"Using settings file: {settings.resolve()}")
 
     try:
-        conn = OracleConnection.from_settings(settings)
-        print("OracleConnection created from settings.")
+        conn = create_connection_factory(settings)
+        print("Connection factory created from settings.")
         with conn.get_connection() as c:
             ver = getattr(c, "version", None)
             print("Connection opened. Connection object:", type(c).__name__, "version=", ver)
@@ -7,14 +7,14 @@ from datetime import datetime
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.domain.models.pelicula import Pelicula
-from app.infrastructure.database.oracle_connection import OracleConnection
+from app.infrastructure.database.backend import create_connection_factory
 from app.infrastructure.repositories.pelicula_repository import PeliculaRepository
 
 
 def test_pelicula_crud():
     """Test create, read, list, and delete operations for Pelicula."""
     settings_path = Path(__file__).parent.parent / "config" / "settings.json"
-    connection = OracleConnection.from_settings(settings_path)
+    connection = create_connection_factory(settings_path)
     repo = PeliculaRepository(connection)
 
     # Use timestamp for unique titles
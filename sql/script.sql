@@ -148,5 +148,11 @@ CREATE TABLE ciudad (
         CONSTRAINT ck_posicion_valida CHECK (posicion >= 1 AND posicion <= 3)
     );
 
+    -- Prefix lookups of the foreign-key pickers (LOWER(col) LIKE 'abc%')
+    CREATE INDEX ix_pelicula_titulo_lower ON pelicula (LOWER(titulo));
+    CREATE INDEX ix_asistente_correo_lower ON asistente (LOWER(correo));
+    -- (CAST(id_funcion AS VARCHAR2(20)) LIKE '12%'): the funcion picker searches by ID text
+    CREATE INDEX ix_funcion_id_text ON funcion (CAST(id_funcion AS VARCHAR2(20)));
+
     -- (Remaining INSERTs omitted for brevity in file)
 /
\ No newline at end of file